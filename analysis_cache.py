@@ -0,0 +1,223 @@
+"""
+폴더 분석 결과 영구 캐시 (SQLite)
+- 폴더 서명(수정 시각 + 항목 수)이 같으면 목록 조회/패턴 분석을 모두 생략
+- 파일명별 분석 결과는 폴더와 관계없이 재사용 (새 파일만 분석)
+"""
+import os
+import sqlite3
+import threading
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from file_system import get_cache_dir, get_files_in_folder, file_signature
+from models import FilePattern, FileInfo, FileInfoStore, PatternCluster
+from pattern_analyzer import extract_pattern, cluster_pattern_groups, make_group_key, PARSER_VERSION
+
+
+# SQLite IN (...) 절 하나에 넣는 최대 개수
+QUERY_CHUNK_SIZE = 500
+
+_PATTERN_COLUMNS = "prefix, title, number, suffix, extension, padding_width"
+
+
+def _pattern_from_row(row: Sequence) -> FilePattern:
+    return FilePattern(
+        prefix=row[0], title=row[1], number=row[2],
+        suffix=row[3], extension=row[4], padding_width=row[5]
+    )
+
+
+def _pattern_to_row(pattern: FilePattern) -> tuple:
+    return (pattern.prefix, pattern.title, pattern.number,
+            pattern.suffix, pattern.extension, pattern.padding_width)
+
+
+class AnalysisCache:
+    """폴더별 분석 결과 + 파일명별 분석 결과 캐시"""
+
+    def __init__(self, db_path: Optional[str] = None):
+        if db_path is None:
+            db_path = os.path.join(get_cache_dir(), "analysis_cache.db")
+
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS parsed_names (
+                name TEXT NOT NULL,
+                parser_version TEXT NOT NULL,
+                prefix TEXT,
+                title TEXT,
+                number TEXT,
+                suffix TEXT,
+                extension TEXT,
+                padding_width INTEGER,
+                PRIMARY KEY (name, parser_version)
+            );
+            CREATE TABLE IF NOT EXISTS folders (
+                folder TEXT PRIMARY KEY,
+                mtime_ns INTEGER NOT NULL,
+                entry_count INTEGER NOT NULL,
+                parser_version TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS folder_entries (
+                folder TEXT NOT NULL,
+                position INTEGER NOT NULL,
+                name TEXT NOT NULL,
+                group_key TEXT NOT NULL,
+                PRIMARY KEY (folder, position)
+            );
+        """)
+        self._conn.commit()
+
+    def get_patterns(self, names: List[str]) -> List[FilePattern]:
+        """
+        파일명 목록의 패턴 반환
+        캐시에 있는 이름은 그대로 사용하고, 없는 이름만 extract_pattern으로 분석 후 저장
+        """
+        cached: Dict[str, FilePattern] = {}
+        unique_names = list(dict.fromkeys(names))
+
+        with self._lock:
+            for start in range(0, len(unique_names), QUERY_CHUNK_SIZE):
+                chunk = unique_names[start:start + QUERY_CHUNK_SIZE]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    f"SELECT name, {_PATTERN_COLUMNS} FROM parsed_names "
+                    f"WHERE parser_version = ? AND name IN ({placeholders})",
+                    [PARSER_VERSION, *chunk]
+                ).fetchall()
+                for row in rows:
+                    cached[row[0]] = _pattern_from_row(row[1:])
+
+        new_rows = []
+        for name in unique_names:
+            if name not in cached:
+                pattern = extract_pattern(name)
+                cached[name] = pattern
+                new_rows.append((name, PARSER_VERSION, *_pattern_to_row(pattern)))
+
+        if new_rows:
+            with self._lock:
+                self._conn.executemany(
+                    f"INSERT OR REPLACE INTO parsed_names (name, parser_version, {_PATTERN_COLUMNS}) "
+                    f"VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    new_rows
+                )
+                self._conn.commit()
+
+        # 같은 이름이 여러 번 나와도 각자 별도 객체 사용 (편집 시 서로 영향 없도록)
+        return [FilePattern(**vars(cached[name])) for name in names]
+
+    def get_folder(self, folder: str, fingerprint: Tuple[int, int]) -> Optional[Tuple[List[str], List[FilePattern], List[str]]]:
+        """
+        폴더 서명이 같으면 저장된 (파일명 목록, 패턴 목록, 그룹 키 목록) 반환
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT mtime_ns, entry_count, parser_version FROM folders WHERE folder = ?",
+                (folder,)
+            ).fetchone()
+            if row is None or (row[0], row[1]) != tuple(fingerprint) or row[2] != PARSER_VERSION:
+                return None
+
+            rows = self._conn.execute(
+                f"SELECT e.name, e.group_key, {', '.join('p.' + c for c in _PATTERN_COLUMNS.split(', '))} "
+                f"FROM folder_entries e JOIN parsed_names p "
+                f"ON p.name = e.name AND p.parser_version = ? "
+                f"WHERE e.folder = ? ORDER BY e.position",
+                (PARSER_VERSION, folder)
+            ).fetchall()
+
+        names = [r[0] for r in rows]
+        group_keys = [r[1] for r in rows]
+        patterns = [_pattern_from_row(r[2:]) for r in rows]
+        return names, patterns, group_keys
+
+    def store_folder(self, folder: str, fingerprint: Tuple[int, int],
+                     names: List[str], group_keys: List[str]):
+        """폴더 분석 결과 저장 (파일명별 패턴은 get_patterns에서 이미 저장됨)"""
+        with self._lock:
+            self._conn.execute("DELETE FROM folder_entries WHERE folder = ?", (folder,))
+            self._conn.executemany(
+                "INSERT INTO folder_entries (folder, position, name, group_key) VALUES (?, ?, ?, ?)",
+                [(folder, i, name, key) for i, (name, key) in enumerate(zip(names, group_keys))]
+            )
+            self._conn.execute(
+                "INSERT OR REPLACE INTO folders (folder, mtime_ns, entry_count, parser_version) "
+                "VALUES (?, ?, ?, ?)",
+                (folder, fingerprint[0], fingerprint[1], PARSER_VERSION)
+            )
+            self._conn.commit()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+_analysis_cache: Optional[AnalysisCache] = None
+_init_lock = threading.Lock()
+
+
+def get_analysis_cache() -> AnalysisCache:
+    """공용 분석 캐시 (프로세스당 하나)"""
+    global _analysis_cache
+    with _init_lock:
+        if _analysis_cache is None:
+            _analysis_cache = AnalysisCache()
+        return _analysis_cache
+
+
+def _build_results(file_paths: List[str], patterns: List[FilePattern],
+                   group_keys: List[str]) -> Tuple[FileInfoStore, List[PatternCluster]]:
+    """패턴 목록으로 파일 정보(열 단위 저장)와 클러스터 생성 (그룹 키는 저장된 값 사용)"""
+    file_infos = FileInfoStore()
+    groups: Dict[str, List[FileInfo]] = {}
+    for row, (path, pattern, group_key) in enumerate(zip(file_paths, patterns, group_keys)):
+        name = os.path.basename(path)
+        file_infos.append_row(path, name, name, pattern)
+        groups.setdefault(group_key, []).append(file_infos[row])
+
+    return file_infos, cluster_pattern_groups(groups)
+
+
+def analyze_folder(folder_path: str) -> Tuple[List[str], FileInfoStore, List[PatternCluster]]:
+    """
+    폴더의 파일 목록 + 패턴 분석 (캐시 사용)
+
+    Returns:
+        (파일 경로 목록, 파일 정보 (FileInfoStore), 패턴 클러스터 목록)
+    """
+    cache = get_analysis_cache()
+    folder_key = os.path.abspath(folder_path)
+
+    # 목록을 읽기 전에 서명을 계산 (읽는 도중 바뀌면 다음에 다시 분석됨)
+    fingerprint = file_signature(folder_key)
+
+    if fingerprint is not None:
+        cached = cache.get_folder(folder_key, fingerprint)
+        if cached is not None:
+            names, patterns, group_keys = cached
+            file_paths = [os.path.join(folder_path, name) for name in names]
+            file_infos, clusters = _build_results(file_paths, patterns, group_keys)
+            return file_paths, file_infos, clusters
+
+    file_paths = get_files_in_folder(folder_path)
+    names = [os.path.basename(path) for path in file_paths]
+    patterns = cache.get_patterns(names)
+    group_keys = [make_group_key(pattern) for pattern in patterns]
+
+    if fingerprint is not None:
+        cache.store_folder(folder_key, fingerprint, names, group_keys)
+
+    file_infos, clusters = _build_results(file_paths, patterns, group_keys)
+    return file_paths, file_infos, clusters
+
+
+def analyze_paths(file_paths: List[str]) -> Tuple[FileInfoStore, List[PatternCluster]]:
+    """
+    드롭된 파일 목록 분석 (파일명별 캐시만 사용)
+    """
+    names = [os.path.basename(path) for path in file_paths]
+    patterns = get_analysis_cache().get_patterns(names)
+    return _build_results(file_paths, patterns, [make_group_key(p) for p in patterns])
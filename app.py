@@ -3,15 +3,48 @@
 메인 애플리케이션 진입점
 Version: 0.9
 """
+import argparse
+import multiprocessing
 import sys
-from PyQt5.QtWidgets import QApplication
-from main_window import MainWindow
 
 __version__ = "0.9"
 
 
+def parse_args():
+    parser = argparse.ArgumentParser(description="파일명 일괄 변경 프로그램")
+    parser.add_argument("--watch", nargs="+", metavar="폴더",
+                        help="GUI 없이 폴더를 감시하며 새 파일 이름을 자동 변경")
+    parser.add_argument("--recipe", metavar="이름",
+                        help="감시 모드에서 적용할 레시피 (기본: 가장 파일이 많은 패턴으로 통일)")
+    parser.add_argument("--prewarm", metavar="폴더",
+                        help="GUI 없이 라이브러리 폴더 아래 모든 압축 파일의 표지 썸네일을 미리 생성")
+    parser.add_argument("--workers", type=int, metavar="N",
+                        help="썸네일 미리 생성 프로세스 수 (기본: CPU 코어 수 - 1)")
+    parser.add_argument("--rate", type=float, default=0, metavar="N",
+                        help="썸네일 미리 생성 시 초당 최대 파일 수 (기본: 제한 없음)")
+    return parser.parse_args()
+
+
 def main():
     """메인 함수"""
+    # 단독 실행 파일(PyInstaller)에서 무결성 검사/썸네일 생성 프로세스 풀 사용을 위해 필요
+    multiprocessing.freeze_support()
+
+    args = parse_args()
+
+    if args.watch:
+        # 감시 모드 (GUI 없음)
+        from folder_watcher import run_watch_mode
+        sys.exit(run_watch_mode(args.watch, args.recipe))
+
+    if args.prewarm:
+        # 썸네일 미리 생성 (GUI 없음)
+        from thumbnail_prewarm import run_prewarm, DEFAULT_WORKERS
+        sys.exit(run_prewarm(args.prewarm, args.workers or DEFAULT_WORKERS, args.rate))
+
+    from PyQt5.QtWidgets import QApplication
+    from main_window import MainWindow
+
     app = QApplication(sys.argv)
 
     # 메인 윈도우 생성 및 표시
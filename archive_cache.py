@@ -0,0 +1,377 @@
+"""
+압축 파일 인덱스 / 표지 썸네일 캐시
+모든 압축 형식(ZIP, RAR, 7Z, 이미지 폴더)이 같은 캐시를 사용
+"""
+import hashlib
+import os
+import sqlite3
+import threading
+from collections import OrderedDict
+from io import BytesIO
+from typing import Iterable, Optional, Tuple
+
+from PIL import Image
+
+from file_system import get_cache_dir
+
+
+# 메모리 썸네일 캐시 최대 개수
+MEMORY_CACHE_SIZE = 64
+
+
+def _to_signed64(value: int) -> int:
+    """SQLite INTEGER(부호 있는 64비트)에 저장하기 위한 변환"""
+    return value - (1 << 64) if value >= (1 << 63) else value
+
+
+def _from_signed64(value: int) -> int:
+    return value + (1 << 64) if value < 0 else value
+
+
+class ArchiveIndexCache:
+    """
+    압축 파일별 표지 항목 이름, 표지 해시, ComicInfo, 무결성 검사 결과, 페이지 수/해상도,
+    내용 해시(중복 파일 검사)를 저장하는 영구 캐시 (SQLite)
+    파일 서명(수정 시각, 크기)이 바뀌면 자동으로 무효화
+    """
+
+    def __init__(self, db_path: Optional[str] = None):
+        if db_path is None:
+            db_path = os.path.join(get_cache_dir(), "archive_index.db")
+
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS archive_index (
+                path TEXT PRIMARY KEY,
+                mtime_ns INTEGER NOT NULL,
+                size INTEGER NOT NULL,
+                cover_member TEXT
+            )
+        """)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS cover_hash (
+                path TEXT PRIMARY KEY,
+                mtime_ns INTEGER NOT NULL,
+                size INTEGER NOT NULL,
+                phash INTEGER NOT NULL
+            )
+        """)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS comic_info (
+                path TEXT PRIMARY KEY,
+                mtime_ns INTEGER NOT NULL,
+                size INTEGER NOT NULL,
+                data TEXT NOT NULL
+            )
+        """)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS verify_result (
+                path TEXT PRIMARY KEY,
+                mtime_ns INTEGER NOT NULL,
+                size INTEGER NOT NULL,
+                ok INTEGER NOT NULL,
+                message TEXT NOT NULL
+            )
+        """)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS archive_stats (
+                path TEXT PRIMARY KEY,
+                mtime_ns INTEGER NOT NULL,
+                size INTEGER NOT NULL,
+                page_count INTEGER NOT NULL,
+                width INTEGER NOT NULL,
+                height INTEGER NOT NULL
+            )
+        """)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS content_hash (
+                path TEXT PRIMARY KEY,
+                mtime_ns INTEGER NOT NULL,
+                size INTEGER NOT NULL,
+                sample TEXT NOT NULL,
+                full TEXT NOT NULL
+            )
+        """)
+        self._conn.commit()
+
+    def get_cover_member(self, path: str, signature: Tuple[int, int]) -> Optional[str]:
+        """캐시된 표지 항목 이름 반환 (없거나 오래되었으면 None)"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT mtime_ns, size, cover_member FROM archive_index WHERE path = ?",
+                (path,)
+            ).fetchone()
+
+        if row is None or (row[0], row[1]) != tuple(signature):
+            return None
+        return row[2]
+
+    def set_cover_member(self, path: str, signature: Tuple[int, int], cover_member: str):
+        """표지 항목 이름 저장"""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO archive_index (path, mtime_ns, size, cover_member) "
+                "VALUES (?, ?, ?, ?)",
+                (path, signature[0], signature[1], cover_member)
+            )
+            self._conn.commit()
+
+    def set_cover_members(self, entries: Iterable[Tuple[str, Tuple[int, int], str]]):
+        """(경로, 서명, 표지 항목 이름) 여러 개를 한 트랜잭션으로 저장"""
+        rows = [(path, signature[0], signature[1], cover_member)
+                for path, signature, cover_member in entries]
+        if not rows:
+            return
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO archive_index (path, mtime_ns, size, cover_member) "
+                "VALUES (?, ?, ?, ?)",
+                rows
+            )
+            self._conn.commit()
+
+    def get_cover_hash(self, path: str, signature: Tuple[int, int]) -> Optional[int]:
+        """캐시된 표지 해시 반환 (없거나 오래되었으면 None)"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT mtime_ns, size, phash FROM cover_hash WHERE path = ?",
+                (path,)
+            ).fetchone()
+
+        if row is None or (row[0], row[1]) != tuple(signature):
+            return None
+        return _from_signed64(row[2])
+
+    def set_cover_hashes(self, entries: Iterable[Tuple[str, Tuple[int, int], int]]):
+        """(경로, 서명, 해시) 여러 개를 한 트랜잭션으로 저장"""
+        rows = [(path, signature[0], signature[1], _to_signed64(phash))
+                for path, signature, phash in entries]
+        if not rows:
+            return
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO cover_hash (path, mtime_ns, size, phash) VALUES (?, ?, ?, ?)",
+                rows
+            )
+            self._conn.commit()
+
+    def get_comic_info(self, path: str, signature: Tuple[int, int]) -> Optional[str]:
+        """
+        캐시된 ComicInfo 데이터(JSON 문자열) 반환
+        없거나 오래되었으면 None, ComicInfo.xml이 없는 파일이면 빈 문자열
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT mtime_ns, size, data FROM comic_info WHERE path = ?",
+                (path,)
+            ).fetchone()
+
+        if row is None or (row[0], row[1]) != tuple(signature):
+            return None
+        return row[2]
+
+    def set_comic_infos(self, entries: Iterable[Tuple[str, Tuple[int, int], str]]):
+        """(경로, 서명, JSON 문자열) 여러 개를 한 트랜잭션으로 저장"""
+        rows = [(path, signature[0], signature[1], data) for path, signature, data in entries]
+        if not rows:
+            return
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO comic_info (path, mtime_ns, size, data) VALUES (?, ?, ?, ?)",
+                rows
+            )
+            self._conn.commit()
+
+    def get_verify_result(self, path: str, signature: Tuple[int, int]) -> Optional[Tuple[bool, str]]:
+        """캐시된 무결성 검사 결과 (정상 여부, 메시지) 반환 (없거나 오래되었으면 None)"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT mtime_ns, size, ok, message FROM verify_result WHERE path = ?",
+                (path,)
+            ).fetchone()
+
+        if row is None or (row[0], row[1]) != tuple(signature):
+            return None
+        return bool(row[2]), row[3]
+
+    def set_verify_results(self, entries: Iterable[Tuple[str, Tuple[int, int], bool, str]]):
+        """(경로, 서명, 정상 여부, 메시지) 여러 개를 한 트랜잭션으로 저장"""
+        rows = [(path, signature[0], signature[1], int(ok), message)
+                for path, signature, ok, message in entries]
+        if not rows:
+            return
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO verify_result (path, mtime_ns, size, ok, message) VALUES (?, ?, ?, ?, ?)",
+                rows
+            )
+            self._conn.commit()
+
+    def get_archive_stats(self, path: str, signature: Tuple[int, int]) -> Optional[Tuple[int, int, int]]:
+        """캐시된 (페이지 수, 첫 페이지 너비, 높이) 반환 (없거나 오래되었으면 None)"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT mtime_ns, size, page_count, width, height FROM archive_stats WHERE path = ?",
+                (path,)
+            ).fetchone()
+
+        if row is None or (row[0], row[1]) != tuple(signature):
+            return None
+        return row[2], row[3], row[4]
+
+    def set_archive_stats(self, entries: Iterable[Tuple[str, Tuple[int, int], int, int, int]]):
+        """(경로, 서명, 페이지 수, 너비, 높이) 여러 개를 한 트랜잭션으로 저장"""
+        rows = [(path, signature[0], signature[1], page_count, width, height)
+                for path, signature, page_count, width, height in entries]
+        if not rows:
+            return
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO archive_stats (path, mtime_ns, size, page_count, width, height) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                rows
+            )
+            self._conn.commit()
+
+    def get_content_hash(self, path: str, signature: Tuple[int, int]) -> Optional[Tuple[str, str]]:
+        """
+        캐시된 (부분 해시, 전체 해시) 반환 (없거나 오래되었으면 None)
+        전체 해시를 계산하지 않은 파일은 전체 해시가 빈 문자열
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT mtime_ns, size, sample, full FROM content_hash WHERE path = ?",
+                (path,)
+            ).fetchone()
+
+        if row is None or (row[0], row[1]) != tuple(signature):
+            return None
+        return row[2], row[3]
+
+    def set_content_hashes(self, entries: Iterable[Tuple[str, Tuple[int, int], str, str]]):
+        """(경로, 서명, 부분 해시, 전체 해시) 여러 개를 한 트랜잭션으로 저장"""
+        rows = [(path, signature[0], signature[1], sample, full)
+                for path, signature, sample, full in entries]
+        if not rows:
+            return
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO content_hash (path, mtime_ns, size, sample, full) VALUES (?, ?, ?, ?, ?)",
+                rows
+            )
+            self._conn.commit()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+class ThumbnailCache:
+    """
+    표지 썸네일 캐시
+    메모리(LRU) → 디스크(JPEG 파일) 순서로 조회
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None, memory_size: int = MEMORY_CACHE_SIZE):
+        if cache_dir is None:
+            cache_dir = os.path.join(get_cache_dir(), "thumbnails")
+        os.makedirs(cache_dir, exist_ok=True)
+
+        self.cache_dir = cache_dir
+        self.memory_size = memory_size
+        self._memory: "OrderedDict[str, Image.Image]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(path: str, signature: Tuple[int, int], max_size: tuple) -> str:
+        """경로 + 서명 + 크기로 캐시 키 생성"""
+        raw = f"{os.path.abspath(path)}|{signature[0]}|{signature[1]}|{max_size[0]}x{max_size[1]}"
+        return hashlib.sha1(raw.encode('utf-8')).hexdigest()
+
+    def _disk_path(self, key: str) -> str:
+        # 한 폴더에 파일이 너무 많아지지 않도록 앞 2글자로 분산
+        return os.path.join(self.cache_dir, key[:2], f"{key}.jpg")
+
+    def get(self, key: str) -> Optional[Image.Image]:
+        """썸네일 조회 (없으면 None)"""
+        with self._lock:
+            img = self._memory.get(key)
+            if img is not None:
+                self._memory.move_to_end(key)
+                return img
+
+        disk_path = self._disk_path(key)
+        if not os.path.exists(disk_path):
+            return None
+
+        try:
+            with open(disk_path, 'rb') as f:
+                img = Image.open(BytesIO(f.read()))
+                img.load()
+        except (OSError, ValueError):
+            return None
+
+        self._remember(key, img)
+        return img
+
+    def contains(self, key: str) -> bool:
+        """썸네일 존재 여부 (이미지를 읽지 않음)"""
+        with self._lock:
+            if key in self._memory:
+                return True
+        return os.path.exists(self._disk_path(key))
+
+    def put(self, key: str, img: Image.Image, remember: bool = True):
+        """
+        썸네일 저장 (메모리 + 디스크)
+        remember=False면 디스크에만 저장 (대량 미리 생성 시 메모리 캐시를 밀어내지 않도록)
+        """
+        if remember:
+            self._remember(key, img)
+
+        disk_path = self._disk_path(key)
+        os.makedirs(os.path.dirname(disk_path), exist_ok=True)
+
+        # 임시 파일에 쓴 후 교체 (다른 스레드가 쓰다 만 파일을 읽지 않도록)
+        temp_path = f"{disk_path}.{threading.get_ident()}.tmp"
+        try:
+            img.save(temp_path, format='JPEG', quality=90)
+            os.replace(temp_path, disk_path)
+        except OSError as e:
+            print(f"썸네일 캐시 저장 실패: {e}")
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+
+    def _remember(self, key: str, img: Image.Image):
+        with self._lock:
+            self._memory[key] = img
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.memory_size:
+                self._memory.popitem(last=False)
+
+
+_index_cache: Optional[ArchiveIndexCache] = None
+_thumbnail_cache: Optional[ThumbnailCache] = None
+_init_lock = threading.Lock()
+
+
+def get_index_cache() -> ArchiveIndexCache:
+    """공용 인덱스 캐시 (프로세스당 하나)"""
+    global _index_cache
+    with _init_lock:
+        if _index_cache is None:
+            _index_cache = ArchiveIndexCache()
+        return _index_cache
+
+
+def get_thumbnail_cache() -> ThumbnailCache:
+    """공용 썸네일 캐시 (프로세스당 하나)"""
+    global _thumbnail_cache
+    with _init_lock:
+        if _thumbnail_cache is None:
+            _thumbnail_cache = ThumbnailCache()
+        return _thumbnail_cache
+
@@ -0,0 +1,436 @@
+"""
+압축 파일 내부 이미지(페이지) 이름 정리 (ZIP/CBZ)
+- 페이지 이름을 자연 정렬 순서대로 번호를 다시 매기거나, 번호 자릿수만 통일
+  ("scan_1 copy.jpg", "scan_10.jpg" → "001.jpg", "010.jpg")
+- 압축 데이터는 풀지 않고 그대로 복사하며 로컬 헤더/중앙 디렉토리의 이름만 바꿔 씀
+- 임시 파일에 기록한 뒤 원본과 교체 (중간에 실패해도 원본 유지)
+- 여러 압축 파일을 프로세스 풀에서 동시에 처리
+"""
+import os
+import re
+import shutil
+import struct
+import zipfile
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from dataclasses import dataclass
+from typing import BinaryIO, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from archive_reader import ArchiveError, is_cover_candidate, natural_sort_key
+from file_renamer import render_template
+from file_system import validate_filename
+
+
+MODE_RENUMBER = "renumber"   # 자연 정렬 순서대로 1부터 번호 다시 매기기
+MODE_PADDING = "padding"     # 이름은 유지하고 마지막 번호의 자릿수만 통일
+
+# 기본 동시 처리 수 (압축 해제 없이 복사만 하므로 디스크 속도가 병목 - HDD는 1~2 권장)
+DEFAULT_WORKERS = 2
+# 압축 데이터를 복사할 때 한 번에 읽는 크기
+COPY_CHUNK_SIZE = 1024 * 1024
+
+# ZIP 구조 (archive_reader와 같은 APPNOTE 기준, 이름을 바꿔 쓰기 위해 모든 필드를 읽음)
+# 로컬 파일 헤더: 시그니처, 필요 버전, 플래그, 압축 방식, 시각, 날짜, CRC, 압축/원본 크기, 이름/추가 필드 길이
+_LOCAL_HEADER = struct.Struct("<4s5H3L2H")
+_LOCAL_HEADER_SIGNATURE = b"PK\x03\x04"
+# 중앙 디렉토리 항목: 시그니처, 만든 버전, 필요 버전, 플래그, 압축 방식, 시각, 날짜, CRC, 압축/원본 크기,
+# 이름/추가 필드/주석 길이, 디스크 번호, 내부/외부 속성, 로컬 헤더 위치
+_CENTRAL_HEADER = struct.Struct("<4s6H3L5H2L")
+_CENTRAL_HEADER_SIGNATURE = b"PK\x01\x02"
+_END_RECORD = struct.Struct("<4s4H2LH")
+_END_RECORD_SIGNATURE = b"PK\x05\x06"
+_ZIP64_LOCATOR_SIGNATURE = b"PK\x06\x07"
+_ZIP64_LOCATOR_SIZE = 20
+_DATA_DESCRIPTOR_SIGNATURE = b"PK\x07\x08"
+_MAX_COMMENT_SIZE = 0xFFFF
+_MAX_OFFSET = 0xFFFFFFFF
+_FLAG_ENCRYPTED = 0x1
+_FLAG_DATA_DESCRIPTOR = 0x8
+_FLAG_UTF8_NAME = 0x800
+# Info-ZIP 유니코드 경로 추가 필드 (예전 이름이 들어 있으므로 이름을 바꾼 항목에서는 제거)
+_UNICODE_PATH_EXTRA_ID = 0x7075
+
+# 패딩 모드에서 자릿수를 맞출 번호 (확장자 앞 이름의 마지막 숫자)
+_LAST_NUMBER_PATTERN = re.compile(r'(\d+)(?!.*\d)')
+
+
+@dataclass
+class MemberRenameOptions:
+    """압축 내부 이름 정리 옵션"""
+    mode: str = MODE_RENUMBER
+    template: str = "{number}"     # 번호 다시 매기기 모드의 이름 템플릿 (확장자 제외, 예: "page_{number}")
+    padding_width: int = 3         # 최소 자릿수 (페이지 수가 더 많으면 그 자릿수로 늘림)
+
+
+class _CentralEntry(NamedTuple):
+    """중앙 디렉토리 항목 (이름을 제외한 필드는 그대로 다시 기록)"""
+    fields: tuple       # _CENTRAL_HEADER 필드 (시그니처 포함)
+    raw_name: bytes
+    extra: bytes
+    comment: bytes
+    name: str           # archive_reader와 같은 방식으로 해석한 이름
+
+    @property
+    def flags(self) -> int:
+        return self.fields[3]
+
+    @property
+    def compress_size(self) -> int:
+        return self.fields[8]
+
+    @property
+    def header_offset(self) -> int:
+        return self.fields[16]
+
+
+def _decode_name(raw_name: bytes, flags: int) -> str:
+    """zipfile과 같은 이름 해석 (UTF-8 플래그가 없으면 cp437)"""
+    name = raw_name.decode('utf-8' if flags & _FLAG_UTF8_NAME else 'cp437')
+    return name.split('\x00', 1)[0]
+
+
+def _split_member_name(name: str) -> Tuple[str, str, str]:
+    """항목 이름을 (폴더 부분, 확장자 앞 이름, 확장자)로 분리 - 폴더 부분은 '/'로 끝남"""
+    folder, _, base_name = name.rpartition('/')
+    stem, dot, extension = base_name.rpartition('.')
+    if not dot:
+        stem, extension = base_name, ""
+    return (folder + '/' if folder else ""), stem, extension
+
+
+def plan_member_renames(member_names: List[str], options: MemberRenameOptions) -> Dict[str, str]:
+    """
+    압축 내부 항목 중 이미지의 새 이름 계산 (이미지가 아닌 항목과 __MACOSX/숨김 파일은 그대로)
+    폴더마다 따로 처리하며, 새 이름의 자연 정렬 순서는 원래 자연 정렬 순서와 같음
+
+    Returns:
+        {원래 이름: 새 이름} - 이름이 바뀌는 항목만
+
+    Raises:
+        ArchiveError: 새 이름이 잘못되었거나 다른 항목과 겹치는 경우
+    """
+    pages_by_folder: Dict[str, List[str]] = {}
+    for name in member_names:
+        if is_cover_candidate(name):
+            pages_by_folder.setdefault(_split_member_name(name)[0], []).append(name)
+
+    renames: Dict[str, str] = {}
+    for folder, pages in pages_by_folder.items():
+        pages.sort(key=natural_sort_key)
+
+        if options.mode == MODE_PADDING:
+            numbers = [_LAST_NUMBER_PATTERN.search(_split_member_name(name)[1]) for name in pages]
+            width = max([options.padding_width] + [len(str(int(m.group(1)))) for m in numbers if m])
+            for name, match in zip(pages, numbers):
+                if match is None:
+                    continue
+                _, stem, extension = _split_member_name(name)
+                new_stem = stem[:match.start()] + str(int(match.group(1))).zfill(width) + stem[match.end():]
+                renames[name] = folder + new_stem + (f".{extension}" if extension else "")
+        else:
+            width = max(options.padding_width, len(str(len(pages))))
+            for number, name in enumerate(pages, start=1):
+                new_stem = render_template(options.template, {"number": str(number).zfill(width)})
+                if new_stem is None:
+                    raise ArchiveError(f"템플릿에 사용할 수 없는 필드가 있습니다: {options.template}")
+                extension = _split_member_name(name)[2]
+                renames[name] = folder + new_stem + (f".{extension}" if extension else "")
+
+    renames = {old: new for old, new in renames.items() if old != new}
+
+    for new_name in set(renames.values()):
+        valid, error_msg = validate_filename(new_name.rpartition('/')[2])
+        if not valid:
+            raise ArchiveError(f"잘못된 이름 {new_name}: {error_msg}")
+
+    # 압축을 풀 때 겹치지 않도록 대소문자 구분 없이 비교 (Windows 기준)
+    final_names = Counter(renames.get(name, name).lower() for name in member_names)
+    duplicates = [name for name, count in final_names.items() if count > 1]
+    if duplicates:
+        raise ArchiveError(f"이름 충돌: {', '.join(sorted(duplicates)[:3])}")
+
+    return renames
+
+
+def _read_central_directory(source: BinaryIO) -> Tuple[List[_CentralEntry], bytes]:
+    """
+    중앙 디렉토리 전체 읽기
+
+    Returns:
+        (항목 목록, 압축 파일 주석)
+
+    Raises:
+        ArchiveError: ZIP이 아니거나, ZIP64/앞에 다른 데이터가 붙은 ZIP처럼 바꿔 쓸 수 없는 형식
+    """
+    source.seek(0, os.SEEK_END)
+    file_size = source.tell()
+    tail_size = min(file_size, _END_RECORD.size + _MAX_COMMENT_SIZE + _ZIP64_LOCATOR_SIZE)
+    source.seek(file_size - tail_size)
+    tail = source.read(tail_size)
+
+    end_position = tail.rfind(_END_RECORD_SIGNATURE)
+    if end_position < 0 or end_position + _END_RECORD.size > len(tail):
+        raise ArchiveError("BadZipFile: File is not a zip file")
+    if tail[max(0, end_position - _ZIP64_LOCATOR_SIZE):end_position].startswith(_ZIP64_LOCATOR_SIGNATURE):
+        raise ArchiveError("ZIP64 압축 파일은 지원하지 않습니다.")
+
+    (_, _, _, _, entry_count, directory_size, directory_offset,
+     comment_length) = _END_RECORD.unpack_from(tail, end_position)
+    comment_start = end_position + _END_RECORD.size
+    comment = tail[comment_start:comment_start + comment_length]
+
+    if directory_offset + directory_size != file_size - tail_size + end_position:
+        raise ArchiveError("앞에 다른 데이터가 붙었거나 손상된 ZIP은 지원하지 않습니다.")
+
+    source.seek(directory_offset)
+    directory = source.read(directory_size)
+    entries: List[_CentralEntry] = []
+    position = 0
+    for _ in range(entry_count):
+        if position + _CENTRAL_HEADER.size > len(directory):
+            raise ArchiveError("BadZipFile: 잘린 중앙 디렉토리")
+        fields = _CENTRAL_HEADER.unpack_from(directory, position)
+        if fields[0] != _CENTRAL_HEADER_SIGNATURE:
+            raise ArchiveError("BadZipFile: 잘못된 중앙 디렉토리 항목")
+        name_length, extra_length, comment_length = fields[10:13]
+        name_start = position + _CENTRAL_HEADER.size
+        extra_start = name_start + name_length
+        comment_start = extra_start + extra_length
+        raw_name = directory[name_start:extra_start]
+        entries.append(_CentralEntry(
+            fields, raw_name, directory[extra_start:comment_start],
+            directory[comment_start:comment_start + comment_length], _decode_name(raw_name, fields[3])
+        ))
+        position = comment_start + comment_length
+
+    return entries, comment
+
+
+def _strip_unicode_path(extra: bytes) -> bytes:
+    """추가 필드에서 유니코드 경로 필드 제거 (형식이 잘못된 추가 필드는 그대로)"""
+    parts = []
+    position = 0
+    while position + 4 <= len(extra):
+        field_id, size = struct.unpack_from("<2H", extra, position)
+        end = position + 4 + size
+        if end > len(extra):
+            return extra
+        if field_id != _UNICODE_PATH_EXTRA_ID:
+            parts.append(extra[position:end])
+        position = end
+    if position != len(extra):
+        return extra
+    return b"".join(parts)
+
+
+def _encode_new_name(entry: _CentralEntry, new_name: str) -> Tuple[bytes, int]:
+    """
+    새 이름의 바이트와 플래그
+    폴더 부분은 원래 바이트를 그대로 써서 UTF-8 플래그가 없는 ZIP(CP949 등)의 폴더 이름이 깨지지 않도록 함
+    """
+    base_name = new_name.rpartition('/')[2]
+    folder_bytes = entry.raw_name[:entry.raw_name.rfind(b'/') + 1]
+    flags = entry.flags
+    if base_name.isascii():
+        return folder_bytes + base_name.encode('ascii'), flags
+    if flags & _FLAG_UTF8_NAME or folder_bytes.isascii():
+        return folder_bytes + base_name.encode('utf-8'), flags | _FLAG_UTF8_NAME
+    raise ArchiveError(f"이름 인코딩을 알 수 없어 바꿀 수 없습니다: {entry.name}")
+
+
+def _copy_bytes(source: BinaryIO, target: BinaryIO, length: int, name: str):
+    """source의 현재 위치에서 length바이트를 그대로 복사"""
+    remaining = length
+    while remaining > 0:
+        chunk = source.read(min(COPY_CHUNK_SIZE, remaining))
+        if not chunk:
+            raise ArchiveError(f"잘린 파일: {name}")
+        target.write(chunk)
+        remaining -= len(chunk)
+
+
+def _rewrite_zip(source: BinaryIO, target: BinaryIO, entries: List[_CentralEntry],
+                 comment: bytes, renames: Dict[str, str]):
+    """
+    항목 이름만 바꾼 ZIP 기록 (압축 데이터, CRC, 시각, 속성, 암호화 헤더는 원본 그대로)
+    항목은 원본 파일에 들어 있던 순서대로 기록
+    """
+    new_names: Dict[int, Tuple[bytes, int]] = {}
+    for index, entry in enumerate(entries):
+        if entry.name in renames:
+            new_names[index] = _encode_new_name(entry, renames[entry.name])
+
+    new_offsets: Dict[int, int] = {}
+    for index in sorted(range(len(entries)), key=lambda i: entries[i].header_offset):
+        entry = entries[index]
+        source.seek(entry.header_offset)
+        header = source.read(_LOCAL_HEADER.size)
+        if len(header) < _LOCAL_HEADER.size:
+            raise ArchiveError(f"잘린 파일: {entry.name}")
+        fields = list(_LOCAL_HEADER.unpack(header))
+        if fields[0] != _LOCAL_HEADER_SIGNATURE:
+            raise ArchiveError(f"BadZipFile: 잘못된 로컬 헤더 ({entry.name})")
+        raw_name = source.read(fields[9])
+        extra = source.read(fields[10])
+
+        if index in new_names:
+            raw_name, fields[2] = new_names[index]
+            extra = _strip_unicode_path(extra)
+            fields[9], fields[10] = len(raw_name), len(extra)
+
+        new_offsets[index] = target.tell()
+        if new_offsets[index] > _MAX_OFFSET:
+            raise ArchiveError("ZIP64가 필요한 크기는 지원하지 않습니다.")
+        target.write(_LOCAL_HEADER.pack(*fields))
+        target.write(raw_name)
+        target.write(extra)
+        _copy_bytes(source, target, entry.compress_size, entry.name)
+
+        if entry.flags & _FLAG_DATA_DESCRIPTOR:
+            # 데이터 뒤의 CRC/크기 기록 (시그니처는 있을 수도 없을 수도 있음)
+            descriptor = source.read(16)
+            target.write(descriptor if descriptor[:4] == _DATA_DESCRIPTOR_SIGNATURE else descriptor[:12])
+
+    directory_offset = target.tell()
+    for index, entry in enumerate(entries):
+        fields = list(entry.fields)
+        raw_name, extra = entry.raw_name, entry.extra
+        if index in new_names:
+            raw_name, fields[3] = new_names[index]
+            extra = _strip_unicode_path(extra)
+        fields[10], fields[11] = len(raw_name), len(extra)
+        fields[16] = new_offsets[index]
+        target.write(_CENTRAL_HEADER.pack(*fields))
+        target.write(raw_name)
+        target.write(extra)
+        target.write(entry.comment)
+    directory_size = target.tell() - directory_offset
+    if directory_offset + directory_size > _MAX_OFFSET:
+        raise ArchiveError("ZIP64가 필요한 크기는 지원하지 않습니다.")
+
+    target.write(_END_RECORD.pack(_END_RECORD_SIGNATURE, 0, 0, len(entries), len(entries),
+                                  directory_size, directory_offset, len(comment)))
+    target.write(comment)
+
+
+def _check_rewritten(path: str, expected_names: List[str]):
+    """기록한 ZIP을 zipfile로 열어 항목 이름과 로컬 헤더 확인 (압축은 풀지 않음)"""
+    try:
+        with zipfile.ZipFile(path) as zip_file:
+            infos = zip_file.infolist()
+            if [info.filename for info in infos] != expected_names:
+                raise ArchiveError("기록한 항목 이름이 예상과 다릅니다.")
+            for info in infos:
+                if not info.flag_bits & _FLAG_ENCRYPTED:
+                    # 로컬 헤더 이름이 중앙 디렉토리와 다르면 BadZipFile
+                    with zip_file.open(info):
+                        pass
+    except (zipfile.BadZipFile, OSError) as e:
+        raise ArchiveError(f"기록한 파일 확인 실패: {e}")
+
+
+def rename_archive_members(path: str, options: MemberRenameOptions) -> Tuple[bool, int, str]:
+    """
+    압축 파일 하나의 내부 이미지 이름 정리 (프로세스 풀에서 실행되므로 모듈 최상위 함수)
+
+    Returns:
+        (성공 여부, 이름을 바꾼 항목 수, 메시지)
+    """
+    temp_path = path + ".renaming.tmp"
+    try:
+        with open(path, 'rb') as source:
+            entries, comment = _read_central_directory(source)
+            renames = plan_member_renames([entry.name for entry in entries], options)
+            if not renames:
+                return True, 0, ""
+
+            with open(temp_path, 'wb') as target:
+                _rewrite_zip(source, target, entries, comment, renames)
+
+        _check_rewritten(temp_path, [renames.get(entry.name, entry.name) for entry in entries])
+        shutil.copymode(path, temp_path)
+        # 수정 시각은 새로 기록 (같게 두면 파일 서명이 그대로여서 표지 항목 캐시가 예전 이름을 가리킴)
+        os.replace(temp_path, path)
+        return True, len(renames), ""
+    except ArchiveError as e:
+        return False, 0, str(e)
+    except Exception as e:
+        return False, 0, f"{type(e).__name__}: {e}"
+    finally:
+        if os.path.exists(temp_path):
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+
+
+def is_rewritable_archive(path: str) -> bool:
+    """내부 이름을 바꿔 쓸 수 있는 압축 파일인지 (ZIP 형식, 확장자가 CBR이어도 내용이 ZIP이면 가능)"""
+    try:
+        return os.path.isfile(path) and zipfile.is_zipfile(path)
+    except OSError:
+        return False
+
+
+def rename_members_in_archives(
+    paths: List[str],
+    options: MemberRenameOptions,
+    workers: int = DEFAULT_WORKERS,
+    progress: Optional[Callable[[int, int], None]] = None,
+    is_cancelled: Optional[Callable[[], bool]] = None
+) -> Dict[str, Tuple[bool, int, str]]:
+    """
+    여러 압축 파일의 내부 이미지 이름 정리 (ZIP 형식이 아닌 파일은 건너뜀)
+
+    Args:
+        paths: 압축 파일 경로 목록
+        options: 이름 정리 옵션
+        workers: 동시에 처리하는 파일 수
+        progress: progress(완료 수, 전체 수)
+        is_cancelled: 취소 여부 (취소되면 처리 중인 파일까지만 처리)
+
+    Returns:
+        {파일 경로: (성공 여부, 이름을 바꾼 항목 수, 메시지)} - 취소된 경우 처리한 파일만 포함
+    """
+    targets = [path for path in paths if is_rewritable_archive(path)]
+    results: Dict[str, Tuple[bool, int, str]] = {}
+
+    total = len(targets)
+    if progress:
+        progress(0, total)
+    if not targets:
+        return results
+
+    workers = max(1, workers)
+    pending = iter(targets)
+    running = {}
+    done_count = 0
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+
+        def submit_next():
+            path = next(pending, None)
+            if path is not None:
+                running[executor.submit(rename_archive_members, path, options)] = path
+
+        for _ in range(workers):
+            submit_next()
+
+        while running:
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                path = running.pop(future)
+                done_count += 1
+                try:
+                    results[path] = future.result()
+                except Exception as e:
+                    # 작업 프로세스가 비정상 종료된 경우 등
+                    results[path] = (False, 0, f"처리 실패: {e}")
+
+                if not (is_cancelled and is_cancelled()):
+                    submit_next()
+
+            if progress:
+                progress(done_count, total)
+
+    return results
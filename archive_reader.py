@@ -0,0 +1,854 @@
+"""
+압축 파일 형식별 리더 (플러그인 구조)
+ZIP/CBZ, RAR/CBR, 7Z/CB7, 이미지 폴더를 같은 인터페이스로 처리
+"""
+import mmap
+import os
+import re
+import shutil
+import struct
+import subprocess
+import sys
+import zipfile
+import zlib
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple, Type
+
+
+IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.gif', '.bmp', '.webp')
+
+# 외부 프로그램 실행 시간 제한 (초)
+SUBPROCESS_TIMEOUT = 60
+# 무결성 검사용 외부 프로그램 실행 시간 제한 (초, 큰 압축 파일 전체를 읽음)
+VERIFY_TIMEOUT = 3600
+# 무결성 검사 시 한 번에 읽는 크기
+VERIFY_CHUNK_SIZE = 1024 * 1024
+# 항목 앞부분만 읽을 때 한 번에 압축 해제하는 압축 데이터 크기
+HEAD_CHUNK_SIZE = 16 * 1024
+
+# 로컬 디스크의 ZIP은 메모리 매핑으로 읽음 (네트워크 드라이브는 항상 일반 읽기)
+USE_MEMORY_MAP = True
+# 네트워크 파일 시스템 종류 (Linux /proc/mounts 기준)
+NETWORK_FILESYSTEMS = (
+    "nfs", "nfs4", "cifs", "smb3", "smbfs", "9p", "afs", "ceph", "glusterfs",
+    "davfs", "fuse.sshfs", "fuse.rclone", "fuse.s3fs",
+)
+
+
+def natural_sort_key(filename: str):
+    """
+    자연스러운 정렬을 위한 키 생성
+    예: "001.jpg", "002.jpg", "010.jpg" 순서로 정렬
+    """
+    parts = re.split(r'(\d+)', filename)
+    return [int(part) if part.isdigit() else part.lower() for part in parts]
+
+
+def is_image_file(filename: str) -> bool:
+    """이미지 파일 여부 확인"""
+    return filename.lower().endswith(IMAGE_EXTENSIONS)
+
+
+def is_cover_candidate(member_name: str) -> bool:
+    """표지 후보가 될 수 있는 압축 내부 항목인지 확인"""
+    # 디렉토리 제외
+    if member_name.endswith('/'):
+        return False
+
+    # 숨김 파일 제외 (맥OS의 __MACOSX 등)
+    if '__MACOSX/' in member_name or os.path.basename(member_name).startswith('.'):
+        return False
+
+    # Thumbs.db 등 시스템 파일 제외
+    if 'Thumbs.db' in member_name or '.DS_Store' in member_name:
+        return False
+
+    return is_image_file(member_name)
+
+
+def is_image_folder(path: str) -> bool:
+    """이미지 파일이 바로 아래에 있는 폴더인지 확인 (한 권으로 취급, 첫 이미지를 찾으면 중단)"""
+    try:
+        with os.scandir(path) as entries:
+            return any(is_cover_candidate(entry.name) and entry.is_file() for entry in entries)
+    except OSError:
+        return False
+
+
+def pick_first_image(member_names: Iterable[str]) -> Optional[str]:
+    """
+    항목 이름을 차례로 받아 자연 정렬 기준 첫 번째 이미지 반환
+    전체 목록을 정렬하지 않고 한 번 훑으면서 최솟값만 유지
+    """
+    first_name = None
+    first_key = None
+
+    for name in member_names:
+        if not is_cover_candidate(name):
+            continue
+        key = natural_sort_key(name)
+        if first_key is None or key < first_key:
+            first_name = name
+            first_key = key
+
+    return first_name
+
+
+def find_executable(*names: str) -> Optional[str]:
+    """PATH 및 기본 설치 경로에서 외부 프로그램 찾기"""
+    for name in names:
+        found = shutil.which(name)
+        if found:
+            return found
+
+    if sys.platform == "win32":
+        program_dirs = [os.environ.get("ProgramFiles", r"C:\Program Files"),
+                        os.environ.get("ProgramFiles(x86)", r"C:\Program Files (x86)")]
+        for program_dir in program_dirs:
+            for sub_dir in ("7-Zip", "WinRAR"):
+                for name in names:
+                    candidate = os.path.join(program_dir, sub_dir, f"{name}.exe")
+                    if os.path.isfile(candidate):
+                        return candidate
+
+    return None
+
+
+def _subprocess_kwargs() -> dict:
+    """콘솔 창이 뜨지 않도록 하는 subprocess 옵션 (--noconsole 빌드 대응)"""
+    if sys.platform == "win32":
+        return {"creationflags": subprocess.CREATE_NO_WINDOW}
+    return {}
+
+
+class ArchiveError(Exception):
+    """압축 파일을 읽을 수 없을 때 발생"""
+
+
+class ArchiveReader:
+    """
+    압축 파일 리더 기본 클래스
+    새 형식은 이 클래스를 상속하고 register_reader로 등록
+    """
+
+    # 처리할 확장자 (소문자, 점 포함)
+    extensions: tuple = ()
+    # 로그 표시용 이름
+    name: str = ""
+
+    def __init__(self, path: str):
+        self.path = path
+
+    @classmethod
+    def is_available(cls) -> bool:
+        """필요한 라이브러리/외부 프로그램이 있는지 확인"""
+        return True
+
+    @classmethod
+    def can_open(cls, path: str) -> bool:
+        """이 리더가 처리할 수 있는 경로인지 확인"""
+        return path.lower().endswith(cls.extensions)
+
+    def iter_members(self) -> Iterator[str]:
+        """압축 내부 항목 이름을 순서대로 반환"""
+        raise NotImplementedError
+
+    def list_members(self) -> List[str]:
+        """압축 내부 항목 이름 목록"""
+        return list(self.iter_members())
+
+    def read_member(self, member_name: str) -> bytes:
+        """항목 하나의 데이터 읽기"""
+        raise NotImplementedError
+
+    def read_member_head(self, member_name: str, size: int) -> bytes:
+        """
+        항목 앞부분 최대 size바이트 (이미지 크기 등 헤더 확인용, CRC는 확인하지 않음)
+        기본 구현은 항목 전체를 읽은 뒤 자름 - 부분 읽기가 가능한 형식은 재정의
+        """
+        return self.read_member(member_name)[:size]
+
+    def first_image_member(self) -> Optional[str]:
+        """자연 정렬 기준 첫 번째 이미지 항목 이름"""
+        return pick_first_image(self.iter_members())
+
+    def verify(self):
+        """
+        전체 항목을 읽어 무결성(CRC) 확인
+        문제가 있으면 ArchiveError 발생 (기본 구현: 항목을 하나씩 모두 읽음)
+        """
+        for member_name in self.iter_members():
+            if not member_name.endswith('/'):
+                self.read_member(member_name)
+
+    def close(self):
+        """열린 자원 정리"""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+
+
+_READERS: List[Type[ArchiveReader]] = []
+
+
+def register_reader(reader_cls: Type[ArchiveReader]) -> Type[ArchiveReader]:
+    """
+    리더 등록 (데코레이터로 사용 가능)
+    나중에 등록된 리더가 같은 확장자에서 우선 사용됨
+    """
+    _READERS.insert(0, reader_cls)
+    return reader_cls
+
+
+@register_reader
+class FolderImageReader(ArchiveReader):
+    """이미지가 들어있는 폴더를 한 권으로 취급"""
+
+    name = "folder"
+
+    @classmethod
+    def can_open(cls, path: str) -> bool:
+        return os.path.isdir(path)
+
+    def iter_members(self) -> Iterator[str]:
+        try:
+            with os.scandir(self.path) as entries:
+                for entry in entries:
+                    if entry.is_file():
+                        yield entry.name
+        except OSError as e:
+            raise ArchiveError(str(e))
+
+    def read_member(self, member_name: str) -> bytes:
+        try:
+            with open(os.path.join(self.path, member_name), 'rb') as f:
+                return f.read()
+        except OSError as e:
+            raise ArchiveError(f"{type(e).__name__}: {e}")
+
+    def read_member_head(self, member_name: str, size: int) -> bytes:
+        try:
+            with open(os.path.join(self.path, member_name), 'rb') as f:
+                return f.read(size)
+        except OSError as e:
+            raise ArchiveError(f"{type(e).__name__}: {e}")
+
+    def verify(self):
+        # 일반 파일에는 검사할 체크섬이 없음
+        pass
+
+
+@register_reader
+class SevenZipArchiveReader(ArchiveReader):
+    """
+    7Z/CB7 리더
+    py7zr 라이브러리가 있으면 사용하고, 없으면 7z 실행 파일 사용
+    """
+
+    extensions = ('.7z', '.cb7')
+    name = "7z"
+
+    @classmethod
+    def _py7zr(cls):
+        try:
+            import py7zr
+            return py7zr
+        except ImportError:
+            return None
+
+    @classmethod
+    def _executable(cls) -> Optional[str]:
+        return find_executable("7z", "7zz", "7za")
+
+    @classmethod
+    def is_available(cls) -> bool:
+        return cls._py7zr() is not None or cls._executable() is not None
+
+    def iter_members(self) -> Iterator[str]:
+        py7zr = self._py7zr()
+        if py7zr is not None:
+            try:
+                with py7zr.SevenZipFile(self.path, 'r') as archive:
+                    names = archive.getnames()
+            except Exception as e:
+                raise ArchiveError(str(e))
+            yield from names
+            return
+
+        yield from _iter_7z_listing(self.path)
+
+    def read_member(self, member_name: str) -> bytes:
+        py7zr = self._py7zr()
+        if py7zr is not None:
+            try:
+                with py7zr.SevenZipFile(self.path, 'r') as archive:
+                    extracted = archive.read(targets=[member_name])
+            except Exception as e:
+                raise ArchiveError(str(e))
+            if member_name not in extracted:
+                raise ArchiveError(f"항목을 찾을 수 없습니다: {member_name}")
+            return extracted[member_name].read()
+
+        return _read_with_7z(self.path, member_name)
+
+    def verify(self):
+        py7zr = self._py7zr()
+        if py7zr is not None:
+            try:
+                with py7zr.SevenZipFile(self.path, 'r') as archive:
+                    bad_member = archive.testzip()
+            except Exception as e:
+                raise ArchiveError(str(e))
+            if bad_member is not None:
+                raise ArchiveError(f"CRC 오류: {bad_member}")
+            return
+
+        _test_with_7z(self.path)
+
+
+@register_reader
+class RarArchiveReader(ArchiveReader):
+    """
+    RAR/CBR 리더
+    rarfile 라이브러리 → unrar 실행 파일 → 7z 실행 파일 순서로 사용
+    """
+
+    extensions = ('.rar', '.cbr')
+    name = "rar"
+
+    @classmethod
+    def _rarfile(cls):
+        try:
+            import rarfile
+            return rarfile
+        except ImportError:
+            return None
+
+    @classmethod
+    def _unrar(cls) -> Optional[str]:
+        return find_executable("unrar", "UnRAR")
+
+    @classmethod
+    def is_available(cls) -> bool:
+        return (cls._rarfile() is not None or cls._unrar() is not None
+                or SevenZipArchiveReader._executable() is not None)
+
+    def iter_members(self) -> Iterator[str]:
+        rarfile = self._rarfile()
+        if rarfile is not None:
+            try:
+                with rarfile.RarFile(self.path) as archive:
+                    names = archive.namelist()
+            except Exception as e:
+                raise ArchiveError(str(e))
+            yield from names
+            return
+
+        unrar = self._unrar()
+        if unrar is not None:
+            yield from _iter_process_lines([unrar, "lb", "-p-", self.path])
+            return
+
+        yield from _iter_7z_listing(self.path)
+
+    def read_member(self, member_name: str) -> bytes:
+        rarfile = self._rarfile()
+        if rarfile is not None:
+            try:
+                with rarfile.RarFile(self.path) as archive:
+                    return archive.read(member_name)
+            except Exception as e:
+                raise ArchiveError(str(e))
+
+        unrar = self._unrar()
+        if unrar is not None:
+            return _run_for_output([unrar, "p", "-inul", "-p-", self.path, member_name])
+
+        return _read_with_7z(self.path, member_name)
+
+    def verify(self):
+        rarfile = self._rarfile()
+        if rarfile is not None:
+            try:
+                with rarfile.RarFile(self.path) as archive:
+                    archive.testrar()
+            except Exception as e:
+                raise ArchiveError(str(e))
+            return
+
+        unrar = self._unrar()
+        if unrar is not None:
+            _run_test([unrar, "t", "-inul", "-p-", self.path])
+            return
+
+        _test_with_7z(self.path)
+
+
+@register_reader
+class ZipArchiveReader(ArchiveReader):
+    """ZIP/CBZ 리더 (중앙 디렉토리만 읽어서 항목 목록 확인)"""
+
+    extensions = ('.zip', '.cbz')
+    name = "zip"
+
+    def __init__(self, path: str):
+        super().__init__(path)
+        self._zip_file: Optional[zipfile.ZipFile] = None
+
+    def _open(self) -> zipfile.ZipFile:
+        if self._zip_file is None:
+            try:
+                self._zip_file = zipfile.ZipFile(self.path, 'r')
+            except Exception as e:
+                # 손상된 파일은 BadZipFile, 읽을 수 없는 파일은 OSError
+                raise ArchiveError(f"{type(e).__name__}: {e}")
+        return self._zip_file
+
+    def iter_members(self) -> Iterator[str]:
+        return iter(self._open().namelist())
+
+    def read_member(self, member_name: str) -> bytes:
+        try:
+            return self._open().read(member_name)
+        except ArchiveError:
+            raise
+        except KeyError:
+            raise ArchiveError(f"항목을 찾을 수 없습니다: {member_name}")
+        except Exception as e:
+            # 손상된 데이터는 BadZipFile/zlib.error, 지원하지 않는 압축 방식은 NotImplementedError,
+            # 암호가 걸린 항목은 RuntimeError
+            raise ArchiveError(f"{type(e).__name__}: {e}")
+
+    def read_member_head(self, member_name: str, size: int) -> bytes:
+        # 필요한 만큼만 압축 해제
+        try:
+            with self._open().open(member_name) as member:
+                return member.read(size)
+        except ArchiveError:
+            raise
+        except KeyError:
+            raise ArchiveError(f"항목을 찾을 수 없습니다: {member_name}")
+        except Exception as e:
+            raise ArchiveError(f"{type(e).__name__}: {e}")
+
+    def verify(self):
+        """
+        항목을 VERIFY_CHUNK_SIZE씩 스트리밍으로 읽어 CRC 확인 (항목 전체를 메모리에 올리지 않음)
+        zipfile은 항목을 끝까지 읽으면 CRC를 비교하여 다르면 BadZipFile 발생
+        """
+        try:
+            zip_file = self._open()
+            for info in zip_file.infolist():
+                if info.is_dir():
+                    continue
+                with zip_file.open(info) as member:
+                    while member.read(VERIFY_CHUNK_SIZE):
+                        pass
+        except ArchiveError:
+            raise
+        except Exception as e:
+            # CRC 불일치는 BadZipFile, 잘린 파일은 EOFError, 손상된 압축 데이터는 zlib.error로 나타남
+            raise ArchiveError(f"{type(e).__name__}: {e}")
+
+    def close(self):
+        if self._zip_file is not None:
+            self._zip_file.close()
+            self._zip_file = None
+
+
+# ZIP 구조 (https://pkware.cachefly.net/webdocs/casestudies/APPNOTE.TXT)
+# 로컬 파일 헤더: 시그니처 + 고정 필드 + 이름 길이 + 추가 필드 길이
+_LOCAL_HEADER = struct.Struct("<4s22xHH")
+_LOCAL_HEADER_SIGNATURE = b"PK\x03\x04"
+# 중앙 디렉토리 항목: 시그니처, 플래그, 압축 방식, CRC, 압축 크기, 원본 크기,
+# 이름/추가 필드/주석 길이, 디스크 번호, 내부 속성, 로컬 헤더 위치
+_CENTRAL_HEADER = struct.Struct("<4s4x2H4x3L5H4xL")
+_CENTRAL_HEADER_SIGNATURE = b"PK\x01\x02"
+# 중앙 디렉토리 끝 레코드: 시그니처, 디스크 번호 2개, 항목 수 2개, 중앙 디렉토리 크기/위치, 주석 길이
+_END_RECORD = struct.Struct("<4s4H2LH")
+_END_RECORD_SIGNATURE = b"PK\x05\x06"
+_ZIP64_LOCATOR_SIGNATURE = b"PK\x06\x07"
+_ZIP64_LOCATOR_SIZE = 20
+_MAX_COMMENT_SIZE = 0xFFFF
+_FLAG_ENCRYPTED = 0x1
+_FLAG_UTF8_NAME = 0x800
+
+
+class _ZipEntry(NamedTuple):
+    """중앙 디렉토리 항목 중 읽기에 필요한 값"""
+    flags: int
+    method: int
+    crc: int
+    compress_size: int
+    file_size: int
+    header_offset: int
+
+
+class MappedZipArchiveReader(ZipArchiveReader):
+    """
+    메모리 매핑 ZIP 리더 (로컬 디스크 전용, get_reader가 선택)
+    - 중앙 디렉토리를 매핑된 메모리에서 바로 파싱 (ZipInfo 객체를 만들지 않고 필요한 값만 읽음)
+    - 저장(stored)/deflate 항목은 매핑에서 바로 잘라내거나 압축 해제 (파이썬 파일 객체 버퍼를 거치지 않음)
+    - ZIP64, 암호화/기타 압축 방식 항목과 무결성 검사는 기존처럼 zipfile로 처리
+    """
+
+    def __init__(self, path: str):
+        super().__init__(path)
+        self._file = None
+        self._map: Optional[mmap.mmap] = None
+        self._names: Optional[List[str]] = None
+        self._entries: Dict[str, _ZipEntry] = {}
+
+    def _mapping(self) -> mmap.mmap:
+        if self._map is None:
+            try:
+                self._file = open(self.path, 'rb')
+                self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError as e:
+                # 빈 파일은 매핑할 수 없음
+                self.close()
+                raise ArchiveError(f"BadZipFile: {e}")
+            except OSError as e:
+                self.close()
+                raise ArchiveError(f"{type(e).__name__}: {e}")
+        return self._map
+
+    def _find_end_record(self) -> int:
+        data = self._mapping()
+        position = len(data) - _END_RECORD.size
+        if position >= 0 and data[position:position + 4] == _END_RECORD_SIGNATURE:
+            return position
+        # 주석이 있는 경우 끝에서부터 검색
+        return data.rfind(_END_RECORD_SIGNATURE, max(0, position - _MAX_COMMENT_SIZE), max(0, position) + 4)
+
+    def _load_index(self) -> bool:
+        """
+        중앙 디렉토리 파싱. ZIP64 등 직접 처리하지 않는 형식이면 False (zipfile 사용)
+        이름 해석은 zipfile과 동일 (UTF-8 플래그가 없으면 cp437) - 캐시된 항목 이름과 호환
+        """
+        if self._names is not None:
+            return True
+
+        data = self._mapping()
+        end_position = self._find_end_record()
+        if end_position < 0:
+            raise ArchiveError("BadZipFile: File is not a zip file")
+        if data[max(0, end_position - _ZIP64_LOCATOR_SIZE):end_position].startswith(_ZIP64_LOCATOR_SIGNATURE):
+            return False
+
+        _, _, _, _, entry_count, directory_size, directory_offset, _ = _END_RECORD.unpack_from(data, end_position)
+        # 앞에 다른 데이터가 붙은 ZIP(자동 압축 풀림 등)은 위치 보정
+        concat = end_position - directory_size - directory_offset
+        if concat < 0:
+            raise ArchiveError("BadZipFile: 잘못된 중앙 디렉토리 위치")
+
+        names: List[str] = []
+        entries: Dict[str, _ZipEntry] = {}
+        position = directory_offset + concat
+        for _ in range(entry_count):
+            if position + _CENTRAL_HEADER.size > end_position:
+                raise ArchiveError("BadZipFile: 잘린 중앙 디렉토리")
+            (signature, flags, method, crc, compress_size, file_size,
+             name_length, extra_length, comment_length, _, _, header_offset) = _CENTRAL_HEADER.unpack_from(data, position)
+            if signature != _CENTRAL_HEADER_SIGNATURE:
+                raise ArchiveError("BadZipFile: 잘못된 중앙 디렉토리 항목")
+            if 0xFFFFFFFF in (compress_size, file_size, header_offset):
+                return False
+
+            name_start = position + _CENTRAL_HEADER.size
+            raw_name = data[name_start:name_start + name_length]
+            name = raw_name.decode('utf-8' if flags & _FLAG_UTF8_NAME else 'cp437')
+            name = name.split('\x00', 1)[0]
+            if os.sep != '/':
+                name = name.replace(os.sep, '/')
+
+            names.append(name)
+            entries[name] = _ZipEntry(flags, method, crc, compress_size, file_size, header_offset + concat)
+            position = name_start + name_length + extra_length + comment_length
+
+        self._names = names
+        self._entries = entries
+        return True
+
+    def iter_members(self) -> Iterator[str]:
+        if self._load_index():
+            return iter(self._names)
+        return super().iter_members()
+
+    def _entry(self, member_name: str) -> _ZipEntry:
+        try:
+            if self._load_index():
+                return self._entries[member_name]
+            info = self._open().getinfo(member_name)
+        except KeyError:
+            raise ArchiveError(f"항목을 찾을 수 없습니다: {member_name}")
+        return _ZipEntry(info.flag_bits, info.compress_type, info.CRC,
+                         info.compress_size, info.file_size, info.header_offset)
+
+    def _data_range(self, member_name: str, entry: _ZipEntry) -> Tuple[int, int]:
+        """로컬 헤더를 확인하고 압축 데이터의 (시작, 끝) 위치 반환"""
+        data = self._mapping()
+        header_end = entry.header_offset + _LOCAL_HEADER.size
+        if header_end > len(data):
+            raise ArchiveError(f"잘린 파일: {member_name}")
+        signature, name_length, extra_length = _LOCAL_HEADER.unpack_from(data, entry.header_offset)
+        if signature != _LOCAL_HEADER_SIGNATURE:
+            raise ArchiveError(f"BadZipFile: 잘못된 로컬 헤더 ({member_name})")
+        start = header_end + name_length + extra_length
+        end = start + entry.compress_size
+        if end > len(data):
+            raise ArchiveError(f"잘린 파일: {member_name}")
+        return start, end
+
+    def read_member(self, member_name: str) -> bytes:
+        entry = self._entry(member_name)
+        if entry.flags & _FLAG_ENCRYPTED or entry.method not in (zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED):
+            return super().read_member(member_name)
+
+        data = self._mapping()
+        start, end = self._data_range(member_name, entry)
+
+        if entry.method == zipfile.ZIP_STORED:
+            content = data[start:end]
+        else:
+            # 압축 데이터는 복사하지 않고 매핑에서 바로 압축 해제
+            with memoryview(data) as view, view[start:end] as compressed:
+                try:
+                    content = zlib.decompress(compressed, -zlib.MAX_WBITS, entry.file_size or zlib.DEF_BUF_SIZE)
+                except zlib.error as e:
+                    raise ArchiveError(f"zlib.error: {e} ({member_name})")
+
+        # zipfile과 같은 CRC 확인
+        if len(content) != entry.file_size or zlib.crc32(content) != entry.crc:
+            raise ArchiveError(f"BadZipFile: CRC 불일치 ({member_name})")
+        return content
+
+    def read_member_head(self, member_name: str, size: int) -> bytes:
+        entry = self._entry(member_name)
+        if entry.flags & _FLAG_ENCRYPTED or entry.method not in (zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED):
+            return super().read_member_head(member_name, size)
+
+        data = self._mapping()
+        start, end = self._data_range(member_name, entry)
+        if entry.method == zipfile.ZIP_STORED:
+            return data[start:min(end, start + size)]
+
+        # 압축 데이터를 조금씩 넣어 size바이트가 나올 때까지만 압축 해제
+        decompressor = zlib.decompressobj(-zlib.MAX_WBITS)
+        parts = []
+        produced = 0
+        with memoryview(data) as view:
+            while produced < size and start < end and not decompressor.eof:
+                with view[start:min(end, start + HEAD_CHUNK_SIZE)] as chunk:
+                    try:
+                        part = decompressor.decompress(chunk)
+                    except zlib.error as e:
+                        raise ArchiveError(f"zlib.error: {e} ({member_name})")
+                parts.append(part)
+                produced += len(part)
+                start += HEAD_CHUNK_SIZE
+        return b"".join(parts)[:size]
+
+    def close(self):
+        super().close()
+        self._names = None
+        self._entries = {}
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+@lru_cache(maxsize=1)
+def _network_mount_points() -> Tuple[str, ...]:
+    """Linux 네트워크 마운트 경로 목록 (긴 경로 우선)"""
+    mount_points = []
+    try:
+        with open("/proc/mounts", "r", encoding="utf-8", errors="replace") as f:
+            for line in f:
+                fields = line.split()
+                if len(fields) >= 3 and fields[2].lower() in NETWORK_FILESYSTEMS:
+                    # 공백은 \040으로 표시됨
+                    mount_points.append(fields[1].replace("\\040", " "))
+    except OSError:
+        pass
+    return tuple(sorted(mount_points, key=len, reverse=True))
+
+
+def is_local_disk(path: str) -> bool:
+    """경로가 로컬 디스크에 있는지 확인 (네트워크 드라이브/공유 폴더면 False)"""
+    path = os.path.abspath(path)
+
+    if sys.platform == "win32":
+        if path.startswith("\\\\"):
+            # UNC 경로 (\\서버\공유)
+            return False
+        import ctypes
+        drive = os.path.splitdrive(path)[0] + "\\"
+        drive_remote = 4
+        return ctypes.windll.kernel32.GetDriveTypeW(drive) != drive_remote
+
+    if sys.platform.startswith("linux"):
+        for mount_point in _network_mount_points():
+            if path == mount_point or path.startswith(mount_point.rstrip("/") + "/"):
+                return False
+        return True
+
+    # 파일 시스템 종류를 확인할 수 없는 플랫폼은 일반 읽기
+    return False
+
+
+def _zip_reader(path: str) -> ZipArchiveReader:
+    """로컬 디스크면 메모리 매핑 리더, 아니면 일반 ZIP 리더"""
+    if USE_MEMORY_MAP and is_local_disk(path):
+        return MappedZipArchiveReader(path)
+    return ZipArchiveReader(path)
+
+
+def get_reader(path: str) -> Optional[ArchiveReader]:
+    """
+    경로에 맞는 리더 생성
+    확장자가 CBR/CBZ라도 실제 내용이 ZIP이면 ZIP 리더 사용
+    """
+    lower_path = path.lower()
+    if lower_path.endswith(RarArchiveReader.extensions + SevenZipArchiveReader.extensions):
+        try:
+            if zipfile.is_zipfile(path):
+                return _zip_reader(path)
+        except OSError:
+            return None
+
+    for reader_cls in _READERS:
+        if reader_cls.can_open(path) and reader_cls.is_available():
+            if reader_cls is ZipArchiveReader:
+                return _zip_reader(path)
+            return reader_cls(path)
+
+    return None
+
+
+def get_supported_extensions() -> tuple:
+    """등록된 리더가 처리하는 확장자 목록"""
+    extensions = []
+    for reader_cls in _READERS:
+        for extension in reader_cls.extensions:
+            if extension not in extensions:
+                extensions.append(extension)
+    return tuple(extensions)
+
+
+def is_supported_archive(path: str) -> bool:
+    """표지를 추출할 수 있는 압축 파일(또는 이미지 폴더)인지 확인"""
+    if path.lower().endswith(get_supported_extensions()):
+        return True
+    return os.path.isdir(path)
+
+
+def _iter_process_lines(command: List[str]) -> Iterator[str]:
+    """외부 프로그램 출력을 한 줄씩 읽기 (전체 출력을 메모리에 모으지 않음)"""
+    try:
+        process = subprocess.Popen(
+            command,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            **_subprocess_kwargs()
+        )
+    except OSError as e:
+        raise ArchiveError(str(e))
+
+    try:
+        for raw_line in process.stdout:
+            line = raw_line.decode('utf-8', errors='replace').rstrip('\r\n')
+            if line:
+                yield line
+    finally:
+        process.stdout.close()
+        process.wait()
+
+
+def _run_for_output(command: List[str]) -> bytes:
+    """외부 프로그램을 실행하고 표준 출력 전체 반환"""
+    try:
+        result = subprocess.run(
+            command,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            timeout=SUBPROCESS_TIMEOUT,
+            **_subprocess_kwargs()
+        )
+    except (OSError, subprocess.TimeoutExpired) as e:
+        raise ArchiveError(str(e))
+
+    if result.returncode != 0 or not result.stdout:
+        raise ArchiveError(f"{os.path.basename(command[0])} 실행 실패 (코드 {result.returncode})")
+    return result.stdout
+
+
+def _run_test(command: List[str]):
+    """외부 프로그램의 테스트 명령 실행 (종료 코드가 0이 아니면 ArchiveError)"""
+    try:
+        result = subprocess.run(
+            command,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            timeout=VERIFY_TIMEOUT,
+            **_subprocess_kwargs()
+        )
+    except (OSError, subprocess.TimeoutExpired) as e:
+        raise ArchiveError(str(e))
+
+    if result.returncode != 0:
+        detail = result.stderr.decode('utf-8', errors='replace').strip().splitlines()
+        message = detail[-1] if detail else f"코드 {result.returncode}"
+        raise ArchiveError(f"{os.path.basename(command[0])} 검사 실패: {message}")
+
+
+def _test_with_7z(archive_path: str):
+    """7z 실행 파일로 압축 파일 전체 검사"""
+    executable = SevenZipArchiveReader._executable()
+    if executable is None:
+        raise ArchiveError("7z 실행 파일을 찾을 수 없습니다.")
+    _run_test([executable, "t", "-p-", archive_path])
+
+
+def _iter_7z_listing(archive_path: str) -> Iterator[str]:
+    """7z 기술 목록(-slt) 출력에서 파일 항목 이름만 추출"""
+    executable = SevenZipArchiveReader._executable()
+    if executable is None:
+        raise ArchiveError("7z 실행 파일을 찾을 수 없습니다.")
+
+    current_path = None
+    is_folder = False
+    command = [executable, "l", "-slt", "-ba", "-sccUTF-8", "-p-", archive_path]
+    for line in _iter_process_lines(command):
+        if line.startswith("Path = "):
+            if current_path is not None and not is_folder:
+                yield current_path
+            current_path = line[len("Path = "):].replace('\\', '/')
+            is_folder = False
+        elif line.startswith("Folder = "):
+            is_folder = line.endswith("+")
+        elif line.startswith("Attributes = ") and line[len("Attributes = "):].startswith("D"):
+            is_folder = True
+
+    if current_path is not None and not is_folder:
+        yield current_path
+
+
+def _read_with_7z(archive_path: str, member_name: str) -> bytes:
+    """7z 실행 파일로 항목 하나를 표준 출력으로 추출"""
+    executable = SevenZipArchiveReader._executable()
+    if executable is None:
+        raise ArchiveError("7z 실행 파일을 찾을 수 없습니다.")
+
+    # -spd: 와일드카드 해석 비활성화 (파일명의 [ ] * 등을 그대로 사용)
+    return _run_for_output([executable, "e", "-so", "-spd", "-p-", archive_path, member_name])
@@ -0,0 +1,99 @@
+"""
+압축 파일 통계 (페이지 수, 파일 크기, 첫 페이지 해상도)
+- 페이지 수는 항목 목록만으로 계산 (ZIP은 중앙 디렉토리만 읽음)
+- 해상도는 첫 페이지 앞부분의 이미지 헤더만 읽어 확인 (이미지 전체를 디코딩하지 않음)
+- 결과는 파일 서명과 함께 인덱스 캐시에 저장
+"""
+from dataclasses import dataclass
+from io import BytesIO
+from typing import Iterable, List, Optional, Tuple
+
+from PIL import Image
+
+from archive_cache import get_index_cache
+from archive_reader import ArchiveReader, get_reader, is_cover_candidate, pick_first_image
+from io_scheduler import PRIORITY_PREFETCH, io_slot
+
+
+# 이미지 헤더를 찾기 위해 읽는 크기 (대부분 앞부분에 있고, 큰 EXIF가 앞에 있는 JPEG만 더 읽음)
+HEADER_READ_SIZES = (64 * 1024, 1024 * 1024)
+
+
+@dataclass(frozen=True)
+class ArchiveStats:
+    """압축 파일 하나의 통계"""
+    page_count: int      # 이미지 수 (-1이면 압축 파일을 읽을 수 없음)
+    file_size: int       # 바이트
+    width: int = 0       # 첫 페이지 해상도 (알 수 없으면 0)
+    height: int = 0
+
+    @property
+    def readable(self) -> bool:
+        return self.page_count >= 0
+
+
+def format_file_size(size: int) -> str:
+    """사람이 읽기 쉬운 크기 (예: 123.4 MB)"""
+    value = float(size)
+    for unit in ("B", "KB", "MB", "GB"):
+        if value < 1024 or unit == "GB":
+            return f"{value:.0f} {unit}" if unit == "B" else f"{value:.1f} {unit}"
+        value /= 1024
+    return f"{value:.1f} TB"
+
+
+def read_image_size(reader: ArchiveReader, member_name: str) -> Tuple[int, int]:
+    """항목 앞부분의 이미지 헤더로 (너비, 높이) 확인 (알 수 없으면 (0, 0))"""
+    for read_size in HEADER_READ_SIZES:
+        head = reader.read_member_head(member_name, read_size)
+        try:
+            # Image.open은 헤더만 읽고 픽셀은 디코딩하지 않음
+            with Image.open(BytesIO(head)) as img:
+                return img.size
+        except Exception:
+            if len(head) < read_size:
+                # 항목 전체를 읽었는데도 헤더가 없음
+                break
+    return 0, 0
+
+
+def compute_archive_stats(path: str, file_size: int, priority: int = PRIORITY_PREFETCH) -> ArchiveStats:
+    """
+    압축 파일 하나의 통계 계산 (읽을 수 없으면 page_count가 -1)
+
+    Args:
+        priority: I/O 우선순위 (화면에 보이는 행은 io_scheduler.PRIORITY_VISIBLE)
+    """
+    reader = get_reader(path)
+    if reader is None:
+        return ArchiveStats(-1, file_size)
+
+    try:
+        with io_slot(path, priority), reader:
+            pages: List[str] = [name for name in reader.iter_members() if is_cover_candidate(name)]
+            first_page = pick_first_image(pages)
+            if first_page is None:
+                return ArchiveStats(len(pages), file_size)
+            width, height = read_image_size(reader, first_page)
+    except Exception as e:
+        print(f"압축 파일 통계 읽기 실패 {path}: {type(e).__name__}: {e}")
+        return ArchiveStats(-1, file_size)
+
+    return ArchiveStats(len(pages), file_size, width, height)
+
+
+def get_cached_stats(path: str, signature: Tuple[int, int]) -> Optional[ArchiveStats]:
+    """캐시된 통계 (없거나 파일이 바뀌었으면 None)"""
+    cached = get_index_cache().get_archive_stats(path, signature)
+    if cached is None:
+        return None
+    page_count, width, height = cached
+    return ArchiveStats(page_count, signature[1], width, height)
+
+
+def save_stats(entries: Iterable[Tuple[str, Tuple[int, int], ArchiveStats]]):
+    """(경로, 서명, 통계) 여러 개를 캐시에 저장"""
+    get_index_cache().set_archive_stats(
+        (path, signature, stats.page_count, stats.width, stats.height)
+        for path, signature, stats in entries
+    )
@@ -0,0 +1,141 @@
+"""
+압축 파일 무결성 검사 (CRC)
+- 파일마다 별도 프로세스에서 스트리밍으로 읽어 검사 (압축 해제 CPU 사용을 병렬화)
+- 동시에 검사하는 파일 수(I/O 동시성)를 제한하여 디스크 부하 조절
+- 전체 작업 I/O 우선순위로 칸을 받은 파일만 제출 (선택한 표지 등 급한 읽기가 먼저 시작)
+- 결과는 파일 서명과 함께 캐시에 저장 → 중단 후 다시 실행하면 남은 파일만 검사
+"""
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from typing import Callable, Dict, List, Optional, Tuple
+
+from archive_cache import get_index_cache
+from archive_reader import get_reader, is_supported_archive, ArchiveError
+from file_system import file_signature
+from io_scheduler import PRIORITY_BULK, get_io_scheduler
+
+
+# 기본 동시 검사 수 (HDD에서는 1~2, SSD에서는 더 높여도 됨)
+DEFAULT_IO_CONCURRENCY = 2
+# 이 개수만큼 결과가 모이면 캐시에 저장 (중단되어도 저장된 결과는 유지)
+SAVE_BATCH_SIZE = 32
+
+
+def verify_archive(path: str) -> Tuple[bool, str]:
+    """
+    압축 파일 하나 검사 (프로세스 풀에서 실행되므로 모듈 최상위 함수)
+
+    Returns:
+        (정상 여부, 메시지)
+    """
+    reader = get_reader(path)
+    if reader is None:
+        return False, "지원하지 않는 형식이거나 압축 프로그램이 없습니다."
+
+    try:
+        with reader:
+            reader.verify()
+    except ArchiveError as e:
+        return False, str(e)
+    except Exception as e:
+        return False, f"{type(e).__name__}: {e}"
+    return True, ""
+
+
+def verify_archives(
+    paths: List[str],
+    io_concurrency: int = DEFAULT_IO_CONCURRENCY,
+    progress: Optional[Callable[[int, int], None]] = None,
+    is_cancelled: Optional[Callable[[], bool]] = None
+) -> Dict[str, Tuple[bool, str]]:
+    """
+    여러 압축 파일 검사 (이전에 검사했고 바뀌지 않은 파일은 캐시 결과 사용)
+
+    Args:
+        paths: 검사할 파일 경로 목록
+        io_concurrency: 동시에 검사하는 파일 수
+        progress: progress(완료 수, 전체 수)
+        is_cancelled: 취소 여부 (취소되면 진행 중인 파일까지만 검사)
+
+    Returns:
+        {파일 경로: (정상 여부, 메시지)} - 취소된 경우 검사한 파일만 포함
+    """
+    index_cache = get_index_cache()
+    results: Dict[str, Tuple[bool, str]] = {}
+    missing: List[Tuple[str, Tuple[int, int]]] = []
+
+    for path in paths:
+        if not is_supported_archive(path):
+            continue
+        signature = file_signature(path)
+        if signature is None:
+            continue
+        cached = index_cache.get_verify_result(path, signature)
+        if cached is not None:
+            results[path] = cached
+        else:
+            missing.append((path, signature))
+
+    total = len(missing)
+    if progress:
+        progress(0, total)
+    if not missing:
+        return results
+
+    io_concurrency = max(1, io_concurrency)
+    unsaved: List[Tuple[str, Tuple[int, int], bool, str]] = []
+    done_count = 0
+    pending = iter(missing)
+    deferred: List[Tuple[str, Tuple[int, int]]] = []
+    running = {}
+    scheduler = get_io_scheduler()
+
+    try:
+        with ProcessPoolExecutor(max_workers=io_concurrency) as executor:
+
+            def submit_next() -> bool:
+                # I/O 칸을 받은 파일만 제출 (실행 중인 파일이 있으면 기다리지 않고 다음 완료 때 다시 시도)
+                item = deferred.pop() if deferred else next(pending, None)
+                if item is None:
+                    return False
+                ticket = scheduler.acquire(item[0], PRIORITY_BULK, blocking=not running)
+                if ticket is None:
+                    deferred.append(item)
+                    return False
+                running[executor.submit(verify_archive, item[0])] = (item, ticket)
+                return True
+
+            def fill():
+                # 대기 중인 파일을 동시성 수만큼만 제출 (수십만 개 파일도 메모리 일정, 취소 즉시 반영)
+                while len(running) < io_concurrency and not (is_cancelled and is_cancelled()) and submit_next():
+                    pass
+
+            fill()
+            while running:
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    (path, signature), ticket = running.pop(future)
+                    ticket.release()
+                    done_count += 1
+                    try:
+                        ok, message = future.result()
+                    except Exception as e:
+                        # 작업 프로세스가 비정상 종료된 경우 등 - 파일 문제가 아니므로 캐시하지 않음
+                        results[path] = (False, f"검사 실패: {e}")
+                    else:
+                        results[path] = (ok, message)
+                        unsaved.append((path, signature, ok, message))
+
+                    if len(unsaved) >= SAVE_BATCH_SIZE:
+                        index_cache.set_verify_results(unsaved)
+                        unsaved.clear()
+
+                fill()
+                if progress:
+                    progress(done_count, total)
+    finally:
+        for _, ticket in running.values():
+            ticket.release()
+        # 중단되거나 오류가 나도 검사한 결과는 저장 (다음 실행 때 이어서 검사)
+        index_cache.set_verify_results(unsaved)
+
+    return results
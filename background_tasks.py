@@ -0,0 +1,41 @@
+"""
+백그라운드 작업 실행 (UI가 멈추지 않도록 QThread에서 실행)
+"""
+from typing import Callable
+
+from PyQt5.QtCore import QThread, pyqtSignal
+
+
+class TaskThread(QThread):
+    """
+    함수 하나를 백그라운드 스레드에서 실행
+    task(progress, is_cancelled) 형태로 호출하며,
+    progress(완료 수, 전체 수)로 진행률을 알리고 is_cancelled()로 취소 여부 확인
+    """
+
+    progress_changed = pyqtSignal(int, int)
+    result_ready = pyqtSignal(object)
+    task_failed = pyqtSignal(str)
+
+    def __init__(self, task: Callable, parent=None):
+        super().__init__(parent)
+        self._task = task
+        self._cancelled = False
+
+    def cancel(self):
+        """작업 취소 요청 (작업 함수가 is_cancelled()를 확인해야 함)"""
+        self._cancelled = True
+
+    def is_cancelled(self) -> bool:
+        return self._cancelled
+
+    def _report_progress(self, done: int, total: int):
+        self.progress_changed.emit(done, total)
+
+    def run(self):
+        try:
+            result = self._task(self._report_progress, self.is_cancelled)
+        except Exception as e:
+            self.task_failed.emit(str(e))
+            return
+        self.result_ready.emit(result)
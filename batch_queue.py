@@ -0,0 +1,267 @@
+"""
+일괄 작업 대기열 (여러 폴더에 레시피 적용)
+- 대기열은 SQLite에 저장되어 프로그램을 다시 시작해도 이어서 실행
+- 동시에 실행하는 폴더 수를 제한하고, 폴더별 처리량/실패 내역 기록
+"""
+import json
+import os
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple
+
+from models import RenameRecipe
+from analysis_cache import analyze_folder
+from file_renamer import execute_rename
+from file_system import get_data_dir, check_conflicts, validate_filename
+from rename_recipe import apply_recipe, RecipeError
+
+
+# 동시에 처리하는 기본 폴더 수
+DEFAULT_MAX_WORKERS = 2
+
+STATUS_PENDING = "pending"
+STATUS_RUNNING = "running"
+STATUS_DONE = "done"
+STATUS_FAILED = "failed"
+
+STATUS_LABELS = {
+    STATUS_PENDING: "대기",
+    STATUS_RUNNING: "실행 중",
+    STATUS_DONE: "완료",
+    STATUS_FAILED: "실패",
+}
+
+
+@dataclass
+class BatchJob:
+    """대기열의 폴더 작업 하나"""
+    job_id: int
+    folder: str
+    recipe: RenameRecipe
+    status: str = STATUS_PENDING
+    message: str = ""
+    file_count: int = 0       # 분석된 파일 수
+    renamed_count: int = 0    # 실제로 이름이 바뀐 파일 수
+    elapsed: float = 0.0      # 처리 시간 (초)
+
+    @property
+    def throughput(self) -> float:
+        """초당 처리 파일 수"""
+        return self.file_count / self.elapsed if self.elapsed > 0 else 0.0
+
+
+class BatchQueue:
+    """SQLite에 저장되는 작업 대기열"""
+
+    def __init__(self, db_path: Optional[str] = None):
+        if db_path is None:
+            db_path = os.path.join(get_data_dir(), "batch_queue.db")
+
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS jobs (
+                job_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                folder TEXT NOT NULL,
+                recipe TEXT NOT NULL,
+                status TEXT NOT NULL,
+                message TEXT NOT NULL DEFAULT '',
+                file_count INTEGER NOT NULL DEFAULT 0,
+                renamed_count INTEGER NOT NULL DEFAULT 0,
+                elapsed REAL NOT NULL DEFAULT 0
+            )
+        """)
+        # 이전 실행 중에 종료된 작업은 다시 대기 상태로
+        self._conn.execute("UPDATE jobs SET status = ? WHERE status = ?", (STATUS_PENDING, STATUS_RUNNING))
+        self._conn.commit()
+
+    @staticmethod
+    def _job_from_row(row) -> BatchJob:
+        return BatchJob(
+            job_id=row[0], folder=row[1], recipe=RenameRecipe.from_dict(json.loads(row[2])),
+            status=row[3], message=row[4], file_count=row[5], renamed_count=row[6], elapsed=row[7]
+        )
+
+    def add_jobs(self, folders: List[str], recipe: RenameRecipe) -> int:
+        """
+        폴더들을 대기열에 추가 (이미 대기 중인 폴더는 건너뜀)
+
+        Returns:
+            추가된 작업 수
+        """
+        recipe_json = json.dumps(recipe.to_dict(), ensure_ascii=False)
+        with self._lock:
+            waiting = {row[0] for row in self._conn.execute(
+                "SELECT folder FROM jobs WHERE status IN (?, ?)", (STATUS_PENDING, STATUS_RUNNING)
+            )}
+            new_folders = []
+            for folder in folders:
+                folder = os.path.abspath(folder)
+                if folder not in waiting:
+                    waiting.add(folder)
+                    new_folders.append(folder)
+
+            self._conn.executemany(
+                "INSERT INTO jobs (folder, recipe, status) VALUES (?, ?, ?)",
+                [(folder, recipe_json, STATUS_PENDING) for folder in new_folders]
+            )
+            self._conn.commit()
+        return len(new_folders)
+
+    def jobs(self) -> List[BatchJob]:
+        """전체 작업 목록 (추가된 순서)"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT job_id, folder, recipe, status, message, file_count, renamed_count, elapsed "
+                "FROM jobs ORDER BY job_id"
+            ).fetchall()
+        return [self._job_from_row(row) for row in rows]
+
+    def pending_jobs(self) -> List[BatchJob]:
+        return [job for job in self.jobs() if job.status == STATUS_PENDING]
+
+    def mark_running(self, job_id: int):
+        with self._lock:
+            self._conn.execute("UPDATE jobs SET status = ? WHERE job_id = ?", (STATUS_RUNNING, job_id))
+            self._conn.commit()
+
+    def mark_finished(self, job: BatchJob):
+        """작업 결과 저장 (상태/메시지/파일 수/처리 시간)"""
+        with self._lock:
+            self._conn.execute(
+                "UPDATE jobs SET status = ?, message = ?, file_count = ?, renamed_count = ?, elapsed = ? "
+                "WHERE job_id = ?",
+                (job.status, job.message, job.file_count, job.renamed_count, job.elapsed, job.job_id)
+            )
+            self._conn.commit()
+
+    def retry_failed(self) -> int:
+        """실패한 작업을 다시 대기 상태로. 변경된 작업 수 반환"""
+        with self._lock:
+            cursor = self._conn.execute(
+                "UPDATE jobs SET status = ?, message = '' WHERE status = ?", (STATUS_PENDING, STATUS_FAILED)
+            )
+            self._conn.commit()
+            return cursor.rowcount
+
+    def remove_finished(self) -> int:
+        """완료된 작업 정리. 삭제된 작업 수 반환"""
+        with self._lock:
+            cursor = self._conn.execute("DELETE FROM jobs WHERE status = ?", (STATUS_DONE,))
+            self._conn.commit()
+            return cursor.rowcount
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+def run_job(folder: str, recipe: RenameRecipe) -> Tuple[int, int]:
+    """
+    폴더 하나에 레시피 적용: 분석 → 레시피 적용 → 유효성/충돌 검사 → 이름 변경
+
+    Returns:
+        (분석된 파일 수, 이름이 바뀐 파일 수)
+
+    Raises:
+        RecipeError: 분석/검사/이름 변경 중 문제가 있는 경우 (검사 실패 시 아무 파일도 바꾸지 않음)
+    """
+    if not os.path.isdir(folder):
+        raise RecipeError("폴더를 찾을 수 없습니다.")
+
+    file_paths, file_infos, pattern_clusters = analyze_folder(folder)
+    if not file_paths:
+        raise RecipeError("폴더에 파일이 없습니다.")
+
+    file_infos = apply_recipe(file_infos, pattern_clusters, recipe)
+
+    for file_info in file_infos:
+        valid, error_msg = validate_filename(file_info.new_name)
+        if not valid:
+            raise RecipeError(f"잘못된 파일명: {file_info.new_name} ({error_msg})")
+
+    no_conflict, conflicts = check_conflicts(file_infos)
+    if not no_conflict:
+        raise RecipeError("파일명 충돌: " + ", ".join(conflicts[:5]))
+
+    results = execute_rename(file_infos)
+    failures = [f"{name}: {msg}" for success, name, msg in results if not success]
+    renamed_count = sum(1 for info, (success, _, _) in zip(file_infos, results)
+                        if success and info.original_name != info.new_name)
+    if failures:
+        raise RecipeError(f"{len(failures)}개 실패 - " + "; ".join(failures[:3]))
+
+    return len(file_infos), renamed_count
+
+
+class BatchScheduler:
+    """
+    대기 중인 작업을 최대 max_workers개 폴더씩 동시에 실행
+    TaskThread의 작업 함수로 사용: scheduler.run(progress, is_cancelled)
+    """
+
+    def __init__(self, queue: BatchQueue, max_workers: int = DEFAULT_MAX_WORKERS):
+        self.queue = queue
+        self.max_workers = max(1, max_workers)
+
+    def _run_one(self, job: BatchJob, is_cancelled: Callable[[], bool]) -> Optional[BatchJob]:
+        # 취소되면 시작하지 않은 작업은 대기 상태로 남김
+        if is_cancelled():
+            return None
+
+        self.queue.mark_running(job.job_id)
+        start = time.perf_counter()
+        try:
+            job.file_count, job.renamed_count = run_job(job.folder, job.recipe)
+            job.status = STATUS_DONE
+            job.message = f"{job.renamed_count}개 변경"
+        except RecipeError as e:
+            job.status = STATUS_FAILED
+            job.message = str(e)
+        except Exception as e:
+            job.status = STATUS_FAILED
+            job.message = f"예기치 않은 오류: {e}"
+        job.elapsed = time.perf_counter() - start
+
+        self.queue.mark_finished(job)
+        return job
+
+    def run(
+        self,
+        progress: Optional[Callable[[int, int], None]] = None,
+        is_cancelled: Optional[Callable[[], bool]] = None
+    ) -> Dict[str, int]:
+        """
+        대기 중인 작업 전체 실행
+
+        Returns:
+            {"done": 완료 수, "failed": 실패 수, "skipped": 취소로 남은 수, "files": 처리 파일 수}
+        """
+        is_cancelled = is_cancelled or (lambda: False)
+        jobs = self.queue.pending_jobs()
+        summary = {"done": 0, "failed": 0, "skipped": 0, "files": 0}
+
+        total = len(jobs)
+        if progress:
+            progress(0, total)
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = [executor.submit(self._run_one, job, is_cancelled) for job in jobs]
+            for done, future in enumerate(as_completed(futures), start=1):
+                job = future.result()
+                if job is None:
+                    summary["skipped"] += 1
+                elif job.status == STATUS_DONE:
+                    summary["done"] += 1
+                    summary["files"] += job.file_count
+                else:
+                    summary["failed"] += 1
+                if progress:
+                    progress(done, total)
+
+        return summary
@@ -0,0 +1,206 @@
+"""
+일괄 작업 대기열 창
+저장된 레시피를 선택한 여러 폴더에 적용하고 진행 상황/처리량/실패 내역 표시
+"""
+import os
+from typing import Optional
+
+from PyQt5.QtWidgets import (
+    QDialog, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, QComboBox,
+    QSpinBox, QTableWidget, QTableWidgetItem, QHeaderView, QFileDialog, QMessageBox
+)
+from PyQt5.QtCore import Qt
+from PyQt5.QtGui import QColor
+
+from background_tasks import TaskThread
+from batch_queue import (
+    BatchQueue, BatchScheduler, DEFAULT_MAX_WORKERS,
+    STATUS_LABELS, STATUS_DONE, STATUS_FAILED, STATUS_RUNNING
+)
+from rename_recipe import load_recipes, describe_step
+
+
+STATUS_COLORS = {
+    STATUS_RUNNING: "#fff3cd",
+    STATUS_DONE: "#d4edda",
+    STATUS_FAILED: "#f8d7da",
+}
+
+
+class BatchQueueDialog(QDialog):
+    """일괄 작업 대기열 관리 창"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("일괄 작업 대기열")
+        self.resize(900, 500)
+
+        self.queue = BatchQueue()
+        self.task: Optional[TaskThread] = None
+        self.recipes = load_recipes()
+
+        self.init_ui()
+        self.refresh_jobs()
+
+    def init_ui(self):
+        layout = QVBoxLayout()
+
+        # 레시피 선택 + 동시 실행 수
+        option_layout = QHBoxLayout()
+        option_layout.addWidget(QLabel("레시피:"))
+        self.recipe_combo = QComboBox()
+        for name, recipe in self.recipes.items():
+            self.recipe_combo.addItem(name)
+            self.recipe_combo.setItemData(
+                self.recipe_combo.count() - 1,
+                "\n".join(describe_step(step) for step in recipe.steps),
+                Qt.ToolTipRole
+            )
+        option_layout.addWidget(self.recipe_combo, 1)
+
+        self.add_folders_button = QPushButton("폴더 추가")
+        self.add_folders_button.clicked.connect(self.add_folders)
+        option_layout.addWidget(self.add_folders_button)
+
+        option_layout.addWidget(QLabel("동시 실행:"))
+        self.workers_spin = QSpinBox()
+        self.workers_spin.setRange(1, 8)
+        self.workers_spin.setValue(DEFAULT_MAX_WORKERS)
+        option_layout.addWidget(self.workers_spin)
+        layout.addLayout(option_layout)
+
+        # 작업 목록
+        self.job_table = QTableWidget()
+        self.job_table.setColumnCount(6)
+        self.job_table.setHorizontalHeaderLabels(["폴더", "레시피", "상태", "파일 수", "처리량", "메시지"])
+        header = self.job_table.horizontalHeader()
+        header.setSectionResizeMode(0, QHeaderView.Stretch)
+        header.setSectionResizeMode(5, QHeaderView.Stretch)
+        self.job_table.setEditTriggers(QTableWidget.NoEditTriggers)
+        layout.addWidget(self.job_table, 1)
+
+        # 실행 버튼
+        button_layout = QHBoxLayout()
+        self.summary_label = QLabel("")
+        button_layout.addWidget(self.summary_label, 1)
+
+        self.retry_button = QPushButton("실패 항목 재시도")
+        self.retry_button.clicked.connect(self.retry_failed)
+        button_layout.addWidget(self.retry_button)
+
+        self.clear_button = QPushButton("완료 항목 정리")
+        self.clear_button.clicked.connect(self.clear_finished)
+        button_layout.addWidget(self.clear_button)
+
+        self.start_button = QPushButton("실행")
+        self.start_button.clicked.connect(self.start_jobs)
+        button_layout.addWidget(self.start_button)
+
+        self.stop_button = QPushButton("중지")
+        self.stop_button.setEnabled(False)
+        self.stop_button.clicked.connect(self.stop_jobs)
+        button_layout.addWidget(self.stop_button)
+        layout.addLayout(button_layout)
+
+        self.setLayout(layout)
+
+    def refresh_jobs(self):
+        """대기열 내용을 표에 반영"""
+        jobs = self.queue.jobs()
+        self.job_table.setRowCount(len(jobs))
+
+        for row, job in enumerate(jobs):
+            throughput = f"{job.throughput:.1f} 파일/초" if job.status == STATUS_DONE else ""
+            values = [
+                job.folder, job.recipe.name, STATUS_LABELS.get(job.status, job.status),
+                str(job.file_count) if job.file_count else "", throughput, job.message
+            ]
+            for column, value in enumerate(values):
+                item = QTableWidgetItem(value)
+                if job.status in STATUS_COLORS:
+                    item.setBackground(QColor(STATUS_COLORS[job.status]))
+                if column == 5 and value:
+                    item.setToolTip(value)
+                self.job_table.setItem(row, column, item)
+
+        counts = {}
+        for job in jobs:
+            counts[job.status] = counts.get(job.status, 0) + 1
+        self.summary_label.setText(" / ".join(
+            f"{label} {counts[status]}" for status, label in STATUS_LABELS.items() if counts.get(status)
+        ))
+
+    def add_folders(self):
+        """선택한 폴더의 하위 폴더들(또는 폴더 자체)을 대기열에 추가"""
+        name = self.recipe_combo.currentText()
+        if not name:
+            QMessageBox.warning(self, "경고", "저장된 레시피가 없습니다.\n메인 화면에서 작업 후 레시피로 저장하세요.")
+            return
+
+        folder = QFileDialog.getExistingDirectory(self, "폴더 선택 (하위 폴더가 있으면 하위 폴더 전체 추가)")
+        if not folder:
+            return
+
+        subfolders = sorted(
+            entry.path for entry in os.scandir(folder) if entry.is_dir()
+        )
+        added = self.queue.add_jobs(subfolders or [folder], self.recipes[name])
+        self.refresh_jobs()
+        QMessageBox.information(self, "완료", f"{added}개 폴더를 대기열에 추가했습니다.")
+
+    def start_jobs(self):
+        if self.task is not None and self.task.isRunning():
+            return
+
+        scheduler = BatchScheduler(self.queue, self.workers_spin.value())
+        self.task = TaskThread(scheduler.run, self)
+        self.task.progress_changed.connect(self.on_progress)
+        self.task.result_ready.connect(self.on_finished)
+        self.task.task_failed.connect(
+            lambda message: QMessageBox.warning(self, "경고", f"일괄 작업 실패: {message}")
+        )
+        self.task.finished.connect(lambda: self.set_running(False))
+        self.set_running(True)
+        self.task.start()
+
+    def stop_jobs(self):
+        """실행 중인 폴더는 끝까지 처리하고, 남은 작업은 대기 상태로 유지"""
+        if self.task is not None:
+            self.task.cancel()
+            self.stop_button.setEnabled(False)
+
+    def set_running(self, running: bool):
+        self.start_button.setEnabled(not running)
+        self.stop_button.setEnabled(running)
+        self.add_folders_button.setEnabled(not running)
+        self.retry_button.setEnabled(not running)
+        self.clear_button.setEnabled(not running)
+
+    def on_progress(self, done: int, total: int):
+        self.refresh_jobs()
+        self.setWindowTitle(f"일괄 작업 대기열 - {done}/{total}")
+
+    def on_finished(self, summary: dict):
+        self.refresh_jobs()
+        self.setWindowTitle("일괄 작업 대기열")
+        QMessageBox.information(
+            self, "완료",
+            f"완료: {summary['done']}개 폴더 ({summary['files']}개 파일)\n"
+            f"실패: {summary['failed']}개\n남은 작업: {summary['skipped']}개"
+        )
+
+    def retry_failed(self):
+        self.queue.retry_failed()
+        self.refresh_jobs()
+
+    def clear_finished(self):
+        self.queue.remove_finished()
+        self.refresh_jobs()
+
+    def done(self, result: int):
+        # 창을 닫으면 남은 작업을 취소하고 진행 중인 폴더가 끝날 때까지 대기
+        if self.task is not None and self.task.isRunning():
+            self.task.cancel()
+            self.task.wait()
+        self.queue.close()
+        super().done(result)
@@ -0,0 +1,301 @@
+"""
+파일명 일괄 변환 벡터화 경로 (NumPy)
+- 큰 FileInfoStore 전체에 텍스트 제거/추가, 자릿수 변경, 번호 템플릿을 적용할 때
+  행마다 파이썬 함수를 부르는 대신 파일명 열 전체를 NumPy 문자열 배열로 한 번에 처리
+- 패턴 필드는 같은 묶음(시리즈)마다 한 번만 계산하고, 번호는 정수 열에서 바로 0을 채움
+- 결과는 file_renamer의 행 단위 경로와 글자 하나까지 같음
+  (공백 정리가 필요한 드문 행만 행 단위로 처리)
+- file_renamer가 행 수가 BULK_MIN_ROWS 이상일 때 자동으로 사용
+- 속도 비교: python bulk_transforms.py [파일 수 ...] (기본 10000 100000 1000000)
+"""
+import sys
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from models import FileInfoStore, FilePattern
+from file_renamer import WHITESPACE_PATTERN, TEMPLATE_FIELD_PATTERN, render_template
+
+
+# 한 번에 처리할 행 수 (문자열 배열은 가장 긴 파일명 기준 고정 폭이므로 메모리를 제한)
+CHUNK_ROWS = 65536
+
+# 공백 정리(연속 공백 → 한 칸, 앞뒤 공백 제거)를 행 단위로 해야 하는 문자: 스페이스가 아닌 공백 문자
+_OTHER_WHITESPACE = np.array([code for code in range(0x3001) if chr(code).isspace() and code != 0x20],
+                             dtype=np.uint32)
+
+
+def _chunks(total: int):
+    for start in range(0, total, CHUNK_ROWS):
+        yield start, min(start + CHUNK_ROWS, total)
+
+
+def _split_extension(names: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """파일명을 (이름, 확장자)로 분리 (file_renamer._split_extension과 같은 규칙)"""
+    parts = np.char.rpartition(names, ".")
+    has_extension = parts[:, 1] != ""
+    return np.where(has_extension, parts[:, 0], parts[:, 2]), np.where(has_extension, parts[:, 2], "")
+
+
+def _join_name(name_parts: np.ndarray, extensions: np.ndarray) -> np.ndarray:
+    """
+    이름 부분의 공백을 정리하고 확장자를 붙임 (file_renamer._with_name과 같은 결과)
+    스페이스 외의 공백 문자나 연속 공백이 있는 행만 정규식으로 처리하고 나머지는 앞뒤 공백만 제거
+    """
+    codes = name_parts.view(np.uint32).reshape(len(name_parts), -1)
+    irregular = np.isin(codes, _OTHER_WHITESPACE).any(axis=1)
+    if codes.shape[1] > 1:
+        irregular |= ((codes[:, :-1] == 0x20) & (codes[:, 1:] == 0x20)).any(axis=1)
+
+    name_parts = np.char.strip(name_parts, " ")
+    if irregular.any():
+        name_parts = name_parts.astype(object)
+        for row in np.flatnonzero(irregular):
+            name_parts[row] = WHITESPACE_PATTERN.sub(" ", name_parts[row]).strip()
+        name_parts = name_parts.astype(str)
+
+    with_extension = np.char.add(np.char.add(name_parts, "."), extensions)
+    return np.where(extensions != "", with_extension, name_parts)
+
+
+def _map_shapes(
+    store: FileInfoStore,
+    shape_ids: np.ndarray,
+    convert: Callable[[Tuple[str, str, str, str, int]], Tuple[str, str, str, str, int]]
+) -> np.ndarray:
+    """패턴 필드 묶음마다 convert를 한 번만 적용한 새 묶음 번호 (패턴 없는 행은 -1 그대로)"""
+    unique_ids, inverse = np.unique(shape_ids, return_inverse=True)
+    mapped = np.array([
+        shape_id if shape_id < 0 else store.intern_pattern_shape(*convert(store.pattern_shape(shape_id)))
+        for shape_id in unique_ids.tolist()
+    ], dtype=np.int32)
+    return mapped[inverse]
+
+
+def _apply_name_transform(
+    store: FileInfoStore,
+    transform_name: Callable[[np.ndarray], np.ndarray],
+    convert_shape: Callable[[Tuple[str, str, str, str, int]], Tuple[str, str, str, str, int]]
+) -> FileInfoStore:
+    """이름 부분 변환 + 패턴 필드 변환을 모든 행에 적용 (제거/추가 공통)"""
+    updated = store.copy()
+    all_shapes = np.frombuffer(updated.pattern_shape_ids(), dtype=np.int32)
+
+    for start, stop in _chunks(len(store)):
+        names = np.array(updated.new_names(start, stop), dtype=str)
+        name_parts, extensions = _split_extension(names)
+        new_names = _join_name(transform_name(name_parts), extensions)
+
+        shapes = all_shapes[start:stop].copy()
+        new_shapes = _map_shapes(updated, shapes, convert_shape)
+        changed = np.flatnonzero((new_names != names) | (new_shapes != shapes))
+        if len(changed):
+            updated.set_new_names(start, new_names.tolist(), new_shapes.tolist(), changed.tolist())
+    return updated
+
+
+def bulk_remove_text(store: FileInfoStore, text_to_remove: str, position: str = "all") -> FileInfoStore:
+    """file_renamer.remove_text의 벡터화 경로"""
+    def remove_text(text: str) -> str:
+        if position == "front":
+            return text.replace(text_to_remove, "", 1)
+        if position == "back":
+            return "".join(text.rsplit(text_to_remove, 1))
+        return text.replace(text_to_remove, "")
+
+    def transform_name(name_parts: np.ndarray) -> np.ndarray:
+        if position == "front":
+            return np.char.replace(name_parts, text_to_remove, "", count=1)
+        if position == "back":
+            # 찾지 못하면 rpartition이 ("", "", 원래 문자열)을 돌려주므로 앞뒤를 이으면 그대로
+            parts = np.char.rpartition(name_parts, text_to_remove)
+            return np.char.add(parts[:, 0], parts[:, 2])
+        return np.char.replace(name_parts, text_to_remove, "")
+
+    def convert_shape(shape):
+        prefix, title, suffix, extension, padding_width = shape
+        return remove_text(prefix), remove_text(title), remove_text(suffix), extension, padding_width
+
+    return _apply_name_transform(store, transform_name, convert_shape)
+
+
+def bulk_add_text(store: FileInfoStore, text_to_add: str, position: str = "front") -> FileInfoStore:
+    """file_renamer.add_text의 벡터화 경로"""
+    def transform_name(name_parts: np.ndarray) -> np.ndarray:
+        if position == "front":
+            return np.char.add(text_to_add, name_parts)
+        return np.char.add(name_parts, text_to_add)
+
+    def convert_shape(shape):
+        prefix, title, suffix, extension, padding_width = shape
+        if position == "front":
+            return text_to_add + prefix, title, suffix, extension, padding_width
+        return prefix, title, suffix + text_to_add, extension, padding_width
+
+    return _apply_name_transform(store, transform_name, convert_shape)
+
+
+def _number_texts(store: FileInfoStore, start: int, stop: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    번호 열을 문자열로 (정수로 저장된 행만 벡터화, 나머지 행은 빈 문자열)
+
+    Returns:
+        (번호 문자열, 정수로 저장된 행 여부)
+    """
+    values, widths = store.number_columns()
+    values = np.frombuffer(values, dtype=np.int32)[start:stop]
+    widths = np.frombuffer(widths, dtype=np.int8)[start:stop]
+    numeric = widths > 0
+    texts = values.astype(str)
+    # 저장할 때의 자릿수로 앞자리 0 복원 ("007" → 7, 3 → "007"), 자릿수 종류는 보통 한두 개
+    for width in np.unique(widths[numeric]).tolist():
+        rows = widths == width
+        texts[rows] = np.char.zfill(texts[rows], width)
+    return np.where(numeric, texts, ""), numeric
+
+
+def bulk_change_padding_width(store: FileInfoStore, padding_width: int) -> FileInfoStore:
+    """file_renamer.change_padding_width의 벡터화 경로 (FilePattern.to_filename과 같은 결과)"""
+    updated = store.copy()
+    all_shapes = np.frombuffer(updated.pattern_shape_ids(), dtype=np.int32)
+    all_values, all_widths = updated.number_columns()
+    all_values = np.frombuffer(all_values, dtype=np.int32)
+    all_widths = np.frombuffer(all_widths, dtype=np.int8)
+
+    for start, stop in _chunks(len(store)):
+        shapes = all_shapes[start:stop]
+        numeric = (shapes >= 0) & (all_widths[start:stop] > 0)
+        old_names = np.array(updated.new_names(start, stop), dtype=str)
+        new_names = old_names.copy().astype(object)
+        new_shapes = shapes.copy()
+
+        # 정수 번호: 모양별 앞/뒤 문자열 + 0을 채운 번호
+        rows = np.flatnonzero(numeric)
+        if len(rows):
+            unique_ids, inverse = np.unique(shapes[rows], return_inverse=True)
+            heads, tails, padded_ids = [], [], []
+            for shape_id in unique_ids.tolist():
+                prefix, title, suffix, extension, _ = updated.pattern_shape(shape_id)
+                parts = []
+                if prefix:
+                    parts.append(prefix.strip())
+                if title:
+                    parts.append(title.strip())
+                heads.append(" ".join(parts) + (" " if parts else ""))
+                tails.append(suffix.rstrip() + (f".{extension}" if extension else ""))
+                padded_ids.append(updated.intern_pattern_shape(prefix, title, suffix, extension, padding_width))
+            numbers = np.char.zfill(all_values[start:stop][rows].astype(str), padding_width)
+            names = np.char.add(np.char.add(np.array(heads, dtype=str)[inverse], numbers),
+                                np.array(tails, dtype=str)[inverse])
+            new_names[rows] = names
+            new_shapes[rows] = np.array(padded_ids, dtype=np.int32)[inverse]
+
+        # 정수로 저장되지 않은 번호 (전각 숫자, "1-2" 등): 행 단위로 계산
+        for row in np.flatnonzero((shapes >= 0) & ~numeric).tolist():
+            number = updated.number_text(start + row)
+            if not number:
+                continue
+            prefix, title, suffix, extension, _ = updated.pattern_shape(int(shapes[row]))
+            new_names[row] = FilePattern(prefix, title, number, suffix, extension, padding_width).to_filename()
+            new_shapes[row] = updated.intern_pattern_shape(prefix, title, suffix, extension, padding_width)
+
+        new_names = new_names.astype(str)
+        changed = np.flatnonzero((new_names != old_names) | (new_shapes != shapes))
+        if len(changed):
+            updated.set_new_names(start, new_names.tolist(), new_shapes.tolist(), changed.tolist())
+    return updated
+
+
+def bulk_apply_template(store: FileInfoStore, pattern_template: str, include_unnumbered: bool = False) -> FileInfoStore:
+    """
+    file_renamer.apply_custom_pattern의 벡터화 경로 ({number} 필드만 쓰는 템플릿)
+    템플릿을 글자 조각과 번호 필드로 나눠 두고, 번호 열을 채워 이어 붙임
+    """
+    pieces: List[Tuple[str, Optional[int]]] = []   # (앞 글자, 번호 자릿수 - 0이면 그대로, None이면 필드 없음)
+    position = 0
+    for match in TEMPLATE_FIELD_PATTERN.finditer(pattern_template):
+        if match.group(1) != "number":
+            raise ValueError("메타데이터 필드가 있는 템플릿은 행 단위로 적용해야 합니다.")
+        pieces.append((pattern_template[position:match.start()], int(match.group(2) or 0)))
+        position = match.end()
+    tail = pattern_template[position:]
+
+    updated = store.copy()
+    all_shapes = np.frombuffer(updated.pattern_shape_ids(), dtype=np.int32)
+
+    for start, stop in _chunks(len(store)):
+        old_names = np.array(updated.new_names(start, stop), dtype=str)
+        numbers, numeric = _number_texts(updated, start, stop)
+        has_pattern = all_shapes[start:stop] >= 0
+        if not pieces:
+            # 필드가 없으면 모든 파일이 같은 이름 (번호가 없는 파일은 include_unnumbered일 때만)
+            new_names = np.full(stop - start, pattern_template).astype(object)
+            if include_unnumbered:
+                rendered = np.ones(stop - start, dtype=bool)
+            else:
+                rendered = has_pattern & numeric
+                for row in np.flatnonzero(has_pattern & ~numeric).tolist():
+                    rendered[row] = bool(updated.number_text(start + row))
+        else:
+            names = np.full(stop - start, tail)
+            for text, width in reversed(pieces):
+                field = np.char.zfill(numbers, width) if width else numbers
+                names = np.char.add(np.char.add(text, field), names)
+            new_names = names.astype(object)
+            rendered = has_pattern & numeric
+
+            # 정수로 저장되지 않은 번호: 행 단위로 렌더링 (번호가 없는 파일은 그대로)
+            for row in np.flatnonzero(has_pattern & ~numeric).tolist():
+                number = updated.number_text(start + row)
+                if number:
+                    new_names[row] = render_template(pattern_template, {"number": number})
+                    rendered[row] = True
+
+        new_names = new_names.astype(str)
+        changed = np.flatnonzero(rendered & (new_names != old_names))
+        if len(changed):
+            updated.set_new_names(start, new_names.tolist(), rows=changed.tolist())
+    return updated
+
+
+def run_benchmark(sizes: List[int]) -> int:
+    """행 단위 경로와 벡터화 경로의 속도 비교 및 결과 일치 확인"""
+    import file_renamer
+    from pattern_analyzer import extract_pattern
+
+    for size in sizes:
+        store = FileInfoStore()
+        for i in range(size):
+            name = f"[공금] 벤치마크 시리즈 {i // 200} {i % 200 + 1:02d}권.zip"
+            store.append_row(f"C:\\library\\{name}", name, name, extract_pattern(name))
+        every_row = range(size)
+
+        cases = [
+            ("텍스트 제거", lambda rows: file_renamer.remove_text(store, "[공금] ", "all", rows),
+             lambda: bulk_remove_text(store, "[공금] ", "all")),
+            ("텍스트 추가", lambda rows: file_renamer.add_text(store, "NEW ", "front", rows),
+             lambda: bulk_add_text(store, "NEW ", "front")),
+            ("자릿수 변경", lambda rows: file_renamer.change_padding_width(store, 3, rows),
+             lambda: bulk_change_padding_width(store, 3)),
+            ("템플릿", lambda rows: file_renamer.apply_custom_pattern(store, "제목 {number:03d}화.zip", rows=rows),
+             lambda: bulk_apply_template(store, "제목 {number:03d}화.zip")),
+        ]
+        for label, scalar, bulk in cases:
+            started = time.perf_counter()
+            expected = scalar(every_row)  # rows를 지정하면 행 단위 경로
+            scalar_time = time.perf_counter() - started
+            started = time.perf_counter()
+            result = bulk()
+            bulk_time = time.perf_counter() - started
+            same = result.new_names() == expected.new_names() and all(
+                result.pattern(row) == expected.pattern(row) for row in range(0, size, max(1, size // 1000)))
+            print(f"{size:>9,}개 {label}: 행 단위 {scalar_time:.2f}초 / 벡터화 {bulk_time:.2f}초 "
+                  f"({scalar_time / max(bulk_time, 1e-9):.1f}배) {'일치' if same else '불일치!'}", flush=True)
+            if not same:
+                return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(run_benchmark([int(arg) for arg in sys.argv[1:]] or [10000, 100000, 1000000]))
@@ -0,0 +1,165 @@
+"""
+ComicInfo.xml 메타데이터 읽기
+압축 파일에서 ComicInfo.xml 항목 하나만 읽어 시리즈/권/제목 정보를 가져옴
+(ZIP은 중앙 디렉토리로 위치를 찾아 해당 항목만 읽으므로 파일 크기와 관계없이 빠름)
+"""
+import json
+import os
+import xml.etree.ElementTree as ElementTree
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from archive_cache import get_index_cache
+from archive_reader import get_reader, is_supported_archive
+from file_system import file_signature
+from io_scheduler import PRIORITY_BULK, io_slot
+from models import ComicMetadata, FileInfo
+from numbering_analyzer import parse_volume_numbers
+
+
+COMIC_INFO_NAME = "comicinfo.xml"
+# 메타데이터 읽기 동시 작업 수
+READ_WORKERS = 8
+# 이보다 큰 ComicInfo.xml은 무시 (잘못된 파일)
+MAX_COMIC_INFO_SIZE = 1024 * 1024
+
+# XML 태그 → ComicMetadata 필드
+_TAG_FIELDS = {
+    "Series": "series",
+    "Volume": "volume",
+    "Number": "issue",
+    "Title": "title",
+    "Year": "year",
+    "Writer": "writer",
+    "Publisher": "publisher",
+}
+
+
+def find_comic_info_member(member_names: Iterable[str]) -> Optional[str]:
+    """항목 목록에서 ComicInfo.xml 찾기 (최상위에 있는 것 우선)"""
+    best = None
+    for name in member_names:
+        if os.path.basename(name.rstrip('/')).lower() != COMIC_INFO_NAME:
+            continue
+        if best is None or name.count('/') < best.count('/'):
+            best = name
+    return best
+
+
+def parse_comic_info(data: bytes) -> Optional[ComicMetadata]:
+    """ComicInfo.xml 내용 파싱 (형식이 잘못되었으면 None)"""
+    try:
+        root = ElementTree.fromstring(data)
+    except ElementTree.ParseError:
+        return None
+
+    metadata = ComicMetadata()
+    for child in root:
+        # 네임스페이스 제거 ({...}Series → Series)
+        tag = child.tag.rsplit('}', 1)[-1]
+        field_name = _TAG_FIELDS.get(tag)
+        if field_name and child.text:
+            setattr(metadata, field_name, child.text.strip())
+    return metadata
+
+
+def read_comic_info(path: str) -> Optional[ComicMetadata]:
+    """압축 파일 하나의 ComicInfo.xml 읽기 (없으면 None)"""
+    reader = get_reader(path)
+    if reader is None:
+        return None
+
+    try:
+        with io_slot(path, PRIORITY_BULK), reader:
+            member = find_comic_info_member(reader.iter_members())
+            if member is None:
+                return None
+            data = reader.read_member(member)
+    except Exception as e:
+        print(f"ComicInfo 읽기 실패 {path}: {type(e).__name__}: {e}")
+        return None
+
+    if len(data) > MAX_COMIC_INFO_SIZE:
+        return None
+    return parse_comic_info(data)
+
+
+def load_comic_metadata(
+    paths: List[str],
+    progress: Optional[Callable[[int, int], None]] = None,
+    is_cancelled: Optional[Callable[[], bool]] = None
+) -> Dict[str, ComicMetadata]:
+    """
+    여러 파일의 ComicInfo 읽기 (캐시된 값은 재사용, 나머지는 병렬로 읽음)
+
+    Returns:
+        {파일 경로: 메타데이터} - ComicInfo.xml이 있는 파일만 포함
+    """
+    index_cache = get_index_cache()
+    results: Dict[str, ComicMetadata] = {}
+    missing: List[Tuple[str, Tuple[int, int]]] = []
+
+    for path in paths:
+        if not is_supported_archive(path) or os.path.isdir(path):
+            continue
+        signature = file_signature(path)
+        if signature is None:
+            continue
+        cached = index_cache.get_comic_info(path, signature)
+        if cached is None:
+            missing.append((path, signature))
+        elif cached:
+            results[path] = ComicMetadata(**json.loads(cached))
+
+    total = len(missing)
+    if progress:
+        progress(0, total)
+    if not missing:
+        return results
+
+    entries = []
+    with ThreadPoolExecutor(max_workers=READ_WORKERS) as executor:
+        for done, ((path, signature), metadata) in enumerate(
+                zip(missing, executor.map(read_comic_info, [p for p, _ in missing])), start=1):
+            if metadata is not None:
+                results[path] = metadata
+                entries.append((path, signature, json.dumps(vars(metadata), ensure_ascii=False)))
+            else:
+                entries.append((path, signature, ""))
+            if progress:
+                progress(done, total)
+            if is_cancelled and is_cancelled():
+                executor.shutdown(wait=False, cancel_futures=True)
+                break
+
+    index_cache.set_comic_infos(entries)
+    return results
+
+
+def find_volume_mismatches(
+    file_infos: List[FileInfo],
+    metadata: Dict[str, ComicMetadata]
+) -> Dict[str, str]:
+    """
+    파일명 번호와 메타데이터 권수(Volume, 없으면 Number)가 다른 파일 찾기
+
+    Returns:
+        {파일 경로: 상태 메시지}
+    """
+    mismatches: Dict[str, str] = {}
+    for file_info in file_infos:
+        info = metadata.get(file_info.original_path)
+        if info is None or not file_info.pattern:
+            continue
+
+        metadata_number = info.volume or info.issue
+        metadata_values = parse_volume_numbers(metadata_number)
+        file_values = parse_volume_numbers(file_info.pattern.number)
+        if not metadata_values or not file_values:
+            continue
+
+        if metadata_values[0] not in file_values:
+            mismatches[file_info.original_path] = (
+                f"메타데이터 권수 불일치 (파일명 {file_info.pattern.number} / 메타데이터 {metadata_number})"
+            )
+    return mismatches
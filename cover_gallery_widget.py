@@ -0,0 +1,313 @@
+"""
+표지 갤러리 위젯 (폴더 전체 표지를 격자로 표시)
+화면에 보이는 칸의 썸네일만 백그라운드에서 디코딩
+"""
+import threading
+from collections import OrderedDict
+from typing import List, Optional
+
+from PyQt5.QtWidgets import QListView, QStyledItemDelegate, QStyle, QAbstractItemView
+from PyQt5.QtGui import QPixmap, QImage, QColor, QPen
+from PyQt5.QtCore import (
+    Qt, QAbstractListModel, QModelIndex, QSize, QRect, QTimer, QObject, pyqtSignal
+)
+
+from archive_reader import is_supported_archive
+from cover_image_widget import pil_to_qimage
+from image_loader import extract_cover
+from io_scheduler import PRIORITY_VISIBLE
+
+
+# 갤러리 썸네일 크기
+THUMBNAIL_SIZE = (140, 196)
+# 칸 크기 (썸네일 + 파일명 2줄)
+CELL_SIZE = QSize(160, 250)
+# 메모리에 유지할 최대 썸네일 개수 (폴더 크기와 무관하게 메모리 고정)
+PIXMAP_CACHE_SIZE = 300
+# 스크롤이 멈춘 뒤 디코딩을 요청하기까지 대기 시간 (ms)
+REQUEST_DELAY_MS = 40
+# 디코딩 스레드 개수
+DECODER_THREADS = 2
+
+
+class ThumbnailDecoder(QObject):
+    """
+    백그라운드 썸네일 디코더
+    요청이 들어오면 대기 목록 전체를 교체하므로,
+    빠르게 스크롤할 때 지나간 칸은 디코딩하지 않음
+    """
+
+    # (파일 경로, QImage 또는 None)
+    decoded = pyqtSignal(str, object)
+
+    def __init__(self, thread_count: int = DECODER_THREADS):
+        super().__init__()
+        self._pending: List[str] = []
+        self._in_progress = set()
+        self._condition = threading.Condition()
+        self._stopped = False
+
+        for _ in range(thread_count):
+            worker = threading.Thread(target=self._run, daemon=True)
+            worker.start()
+
+    def request(self, paths: List[str]):
+        """디코딩할 경로 목록 지정 (이전 대기 목록은 버림)"""
+        with self._condition:
+            self._pending = [p for p in paths if p not in self._in_progress]
+            # 목록 앞쪽부터 처리하도록 뒤집어서 pop() 사용
+            self._pending.reverse()
+            self._condition.notify_all()
+
+    def cancel_all(self):
+        """대기 중인 요청 모두 취소"""
+        with self._condition:
+            self._pending = []
+
+    def stop(self):
+        """디코딩 스레드 종료"""
+        with self._condition:
+            self._stopped = True
+            self._pending = []
+            self._condition.notify_all()
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while not self._pending and not self._stopped:
+                    self._condition.wait()
+                if self._stopped:
+                    return
+                path = self._pending.pop()
+                self._in_progress.add(path)
+
+            qimg = None
+            try:
+                pil_img = extract_cover(path, max_size=THUMBNAIL_SIZE, priority=PRIORITY_VISIBLE)
+                if pil_img is not None:
+                    qimg = pil_to_qimage(pil_img)
+            except Exception as e:
+                print(f"썸네일 디코딩 실패: {path}, {e}")
+            finally:
+                with self._condition:
+                    self._in_progress.discard(path)
+
+            self.decoded.emit(path, qimg)
+
+
+class CoverGalleryModel(QAbstractListModel):
+    """
+    갤러리 목록 모델
+    경로/라벨만 보관하고 썸네일은 크기가 제한된 LRU 캐시에 보관
+    """
+
+    # 썸네일이 없는 칸이 화면에 그려질 때 발생
+    thumbnail_wanted = pyqtSignal()
+
+    def __init__(self):
+        super().__init__()
+        self._paths: List[str] = []
+        self._labels: List[str] = []
+        self._pixmaps: "OrderedDict[str, Optional[QPixmap]]" = OrderedDict()
+        self._row_by_path = {}
+
+    def set_files(self, paths: List[str], labels: List[str]):
+        """표시할 파일 목록 교체"""
+        self.beginResetModel()
+        self._pixmaps.clear()
+        self._paths = list(paths)
+        self._labels = list(labels)
+        self._row_by_path = {path: row for row, path in enumerate(self._paths)}
+        self.endResetModel()
+
+    def set_labels(self, labels: List[str]):
+        """라벨만 갱신 (썸네일 유지)"""
+        if len(labels) != len(self._labels):
+            return
+        self._labels = list(labels)
+        if self._labels:
+            self.dataChanged.emit(self.index(0), self.index(len(self._labels) - 1), [Qt.DisplayRole])
+
+    def clear(self):
+        self.set_files([], [])
+
+    def path_at(self, row: int) -> str:
+        return self._paths[row]
+
+    def has_thumbnail(self, path: str) -> bool:
+        return path in self._pixmaps
+
+    def set_thumbnail(self, path: str, qimg: Optional[QImage]):
+        """디코딩된 썸네일 저장 (None은 '표지 없음'으로 기록)"""
+        self._pixmaps[path] = QPixmap.fromImage(qimg) if qimg is not None else None
+        self._pixmaps.move_to_end(path)
+        while len(self._pixmaps) > PIXMAP_CACHE_SIZE:
+            self._pixmaps.popitem(last=False)
+
+        row = self._row_by_path.get(path)
+        if row is not None:
+            index = self.index(row)
+            self.dataChanged.emit(index, index, [Qt.DecorationRole])
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self._paths)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+
+        row = index.row()
+        if role == Qt.DisplayRole:
+            return self._labels[row]
+        if role == Qt.ToolTipRole:
+            return self._labels[row]
+        if role == Qt.DecorationRole:
+            path = self._paths[row]
+            if path in self._pixmaps:
+                self._pixmaps.move_to_end(path)
+                return self._pixmaps[path]
+            if is_supported_archive(path):
+                # 직접 디코딩하지 않고 요청만 알림 (보이는 칸을 모아서 처리)
+                self.thumbnail_wanted.emit()
+            return None
+        return None
+
+
+class CoverGalleryDelegate(QStyledItemDelegate):
+    """썸네일 + 파일명을 그리는 델리게이트"""
+
+    def sizeHint(self, option, index):
+        return CELL_SIZE
+
+    def paint(self, painter, option, index):
+        painter.save()
+
+        rect = option.rect.adjusted(4, 4, -4, -4)
+        if option.state & QStyle.State_Selected:
+            painter.fillRect(rect, QColor("#d3e5f7"))
+            painter.setPen(QPen(QColor("#0078d4"), 2))
+            painter.drawRect(rect)
+
+        image_rect = QRect(rect.left(), rect.top() + 4, rect.width(), THUMBNAIL_SIZE[1])
+        pixmap = index.data(Qt.DecorationRole)
+        if isinstance(pixmap, QPixmap) and not pixmap.isNull():
+            x = image_rect.left() + (image_rect.width() - pixmap.width()) // 2
+            y = image_rect.top() + (image_rect.height() - pixmap.height()) // 2
+            painter.drawPixmap(x, y, pixmap)
+        else:
+            # 아직 로드되지 않았거나 표지가 없는 칸
+            painter.fillRect(image_rect.adjusted(10, 0, -10, 0), QColor("#eeeeee"))
+
+        text_rect = QRect(rect.left() + 2, image_rect.bottom() + 4,
+                          rect.width() - 4, rect.bottom() - image_rect.bottom() - 4)
+        painter.setPen(QColor("#212529"))
+        label = index.data(Qt.DisplayRole) or ""
+        painter.drawText(text_rect, Qt.AlignHCenter | Qt.AlignTop | Qt.TextWrapAnywhere, label)
+
+        painter.restore()
+
+
+class CoverGalleryWidget(QListView):
+    """
+    폴더 전체 표지를 격자로 표시하는 갤러리
+    균일한 칸 크기를 사용하여 보이는 칸만 배치/그리기
+    """
+
+    # 갤러리에서 선택된 행 (file_infos 인덱스와 동일)
+    row_selected = pyqtSignal(int)
+
+    def __init__(self):
+        super().__init__()
+
+        self.gallery_model = CoverGalleryModel()
+        self.setModel(self.gallery_model)
+        self.setItemDelegate(CoverGalleryDelegate(self))
+
+        self.setViewMode(QListView.IconMode)
+        self.setResizeMode(QListView.Adjust)
+        self.setMovement(QListView.Static)
+        self.setUniformItemSizes(True)
+        self.setGridSize(CELL_SIZE)
+        self.setSelectionMode(QAbstractItemView.SingleSelection)
+        self.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+        self.setMinimumWidth(180)
+
+        self.decoder = ThumbnailDecoder()
+        self.decoder.decoded.connect(self.gallery_model.set_thumbnail)
+
+        # 보이는 칸이 바뀔 때마다 타이머를 다시 시작 → 스크롤이 멈춘 뒤 한 번만 요청
+        self._request_timer = QTimer(self)
+        self._request_timer.setSingleShot(True)
+        self._request_timer.setInterval(REQUEST_DELAY_MS)
+        self._request_timer.timeout.connect(self.request_visible_thumbnails)
+
+        self.gallery_model.thumbnail_wanted.connect(self._schedule_request)
+        self.verticalScrollBar().valueChanged.connect(self._schedule_request)
+
+    def set_files(self, paths: List[str], labels: List[str]):
+        """갤러리에 표시할 파일 목록 설정"""
+        self.decoder.cancel_all()
+        self.gallery_model.set_files(paths, labels)
+        self._schedule_request()
+
+    def set_labels(self, labels: List[str]):
+        self.gallery_model.set_labels(labels)
+
+    def clear_files(self):
+        self.decoder.cancel_all()
+        self.gallery_model.clear()
+
+    def select_row(self, row: int):
+        """지정한 행을 선택하고 화면에 보이도록 스크롤"""
+        if 0 <= row < self.gallery_model.rowCount():
+            index = self.gallery_model.index(row)
+            self.setCurrentIndex(index)
+            self.scrollTo(index)
+
+    def _schedule_request(self, *_args):
+        self._request_timer.start()
+
+    def visible_rows(self) -> List[int]:
+        """현재 화면에 보이는 행 번호 목록"""
+        row_count = self.gallery_model.rowCount()
+        if row_count == 0:
+            return []
+
+        # 칸 크기가 모두 같으므로 스크롤 위치에서 바로 계산 (전체 행을 훑지 않음)
+        viewport_rect = self.viewport().rect()
+        columns = max(1, viewport_rect.width() // CELL_SIZE.width())
+        first_line = self.verticalScrollBar().value() // CELL_SIZE.height()
+        line_count = viewport_rect.height() // CELL_SIZE.height() + 2
+
+        first_row = first_line * columns
+        last_row = min(row_count, (first_line + line_count) * columns)
+        return list(range(first_row, last_row))
+
+    def request_visible_thumbnails(self):
+        """보이는 칸 중 썸네일이 없는 것만 디코더에 요청"""
+        if not self.isVisible():
+            return
+
+        paths = []
+        for row in self.visible_rows():
+            path = self.gallery_model.path_at(row)
+            if not self.gallery_model.has_thumbnail(path) and is_supported_archive(path):
+                paths.append(path)
+
+        self.decoder.request(paths)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self._schedule_request()
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._schedule_request()
+
+    def currentChanged(self, current, previous):
+        super().currentChanged(current, previous)
+        if current.isValid():
+            self.row_selected.emit(current.row())
+
@@ -5,7 +5,24 @@ from PyQt5.QtWidgets import QLabel
 from PyQt5.QtGui import QPixmap, QImage
 from PyQt5.QtCore import Qt
 from PIL import Image
-import io
+
+
+def pil_to_qimage(pil_img: Image.Image) -> QImage:
+    """
+    PIL Image를 QImage로 변환 (PNG 인코딩 없이 픽셀 직접 복사)
+    QPixmap과 달리 QImage는 작업 스레드에서도 생성 가능
+    """
+    if pil_img.mode == 'L':
+        data = pil_img.tobytes()
+        qimg = QImage(data, pil_img.width, pil_img.height, pil_img.width, QImage.Format_Grayscale8)
+    else:
+        if pil_img.mode != 'RGB':
+            pil_img = pil_img.convert('RGB')
+        data = pil_img.tobytes()
+        qimg = QImage(data, pil_img.width, pil_img.height, pil_img.width * 3, QImage.Format_RGB888)
+
+    # data 버퍼가 사라져도 안전하도록 복사본 반환
+    return qimg.copy()
 
 
 class CoverImageWidget(QLabel):
@@ -49,12 +66,7 @@ class CoverImageWidget(QLabel):
             return
 
         # PIL Image → QPixmap 변환
-        buffer = io.BytesIO()
-        pil_img.save(buffer, format='PNG')
-        buffer.seek(0)
-
-        qimg = QImage.fromData(buffer.read())
-        self.original_pixmap = QPixmap.fromImage(qimg)
+        self.original_pixmap = QPixmap.fromImage(pil_to_qimage(pil_img))
 
         # 현재 크기에 맞게 표시
         self.update_display()
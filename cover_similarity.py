@@ -0,0 +1,230 @@
+"""
+표지 유사도 분석 (지각 해시 + BK-트리)
+번호가 다른데 표지가 같은 파일(번호 오류 의심)과 중복 표지를 찾음
+"""
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+from PIL import Image
+
+from archive_cache import get_index_cache
+from archive_reader import is_supported_archive
+from file_system import file_signature
+from image_loader import extract_cover
+from io_scheduler import PRIORITY_BULK
+from models import FileInfo
+
+
+# 해시 계산용 표지 크기 (작게 디코딩하여 속도 확보)
+HASH_SOURCE_SIZE = (64, 64)
+# DCT 입력 크기 / 사용하는 저주파 영역 크기 (8x8 = 64비트)
+DCT_SIZE = 32
+HASH_SIZE = 8
+# 같은 표지로 판단하는 최대 해밍 거리
+DEFAULT_MAX_DISTANCE = 6
+# 표지 디코딩 동시 작업 수
+DECODE_WORKERS = 4
+
+
+def _dct_matrix(n: int) -> np.ndarray:
+    """DCT-II 변환 행렬 (정규화)"""
+    k = np.arange(n)[:, None]
+    i = np.arange(n)[None, :]
+    matrix = np.cos(np.pi * (2 * i + 1) * k / (2 * n)) * np.sqrt(2.0 / n)
+    matrix[0, :] = np.sqrt(1.0 / n)
+    return matrix.astype(np.float32)
+
+
+_DCT = _dct_matrix(DCT_SIZE)
+_BIT_WEIGHTS = np.left_shift(np.uint64(1), np.arange(HASH_SIZE * HASH_SIZE - 1, -1, -1, dtype=np.uint64))
+
+
+def image_to_hash_input(img: Image.Image) -> np.ndarray:
+    """표지 이미지를 32x32 흑백 배열로 변환"""
+    gray = img.convert('L').resize((DCT_SIZE, DCT_SIZE), Image.Resampling.BILINEAR)
+    return np.asarray(gray, dtype=np.float32)
+
+
+def compute_phashes(pixels: np.ndarray) -> List[int]:
+    """
+    여러 표지의 pHash를 한 번에 계산
+
+    Args:
+        pixels: (N, 32, 32) 흑백 배열
+
+    Returns:
+        64비트 해시 정수 리스트
+    """
+    if len(pixels) == 0:
+        return []
+
+    # 배치 2차원 DCT: D @ X @ D^T
+    coefficients = np.matmul(np.matmul(_DCT, pixels), _DCT.T)
+    low = coefficients[:, :HASH_SIZE, :HASH_SIZE].reshape(len(pixels), -1)
+
+    # DC 성분을 제외한 중앙값 기준으로 비트 결정
+    medians = np.median(low[:, 1:], axis=1, keepdims=True)
+    bits = (low > medians).astype(np.uint64)
+    hashes = (bits * _BIT_WEIGHTS).sum(axis=1, dtype=np.uint64)
+    return [int(h) for h in hashes]
+
+
+def hamming_distance(a: int, b: int) -> int:
+    """두 해시의 다른 비트 수"""
+    return bin(a ^ b).count("1")
+
+
+class BKTree:
+    """
+    해밍 거리용 BK-트리
+    전체 쌍을 비교하지 않고 거리 범위 안의 항목만 탐색
+    """
+
+    def __init__(self):
+        # 노드: [해시, 항목 리스트, {거리: 자식 노드}]
+        self._root = None
+
+    def add(self, hash_value: int, item):
+        if self._root is None:
+            self._root = [hash_value, [item], {}]
+            return
+
+        node = self._root
+        while True:
+            distance = hamming_distance(hash_value, node[0])
+            if distance == 0:
+                node[1].append(item)
+                return
+            child = node[2].get(distance)
+            if child is None:
+                node[2][distance] = [hash_value, [item], {}]
+                return
+            node = child
+
+    def search(self, hash_value: int, max_distance: int) -> List[Tuple[int, object]]:
+        """max_distance 이내의 (거리, 항목) 목록"""
+        results = []
+        if self._root is None:
+            return results
+
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            distance = hamming_distance(hash_value, node[0])
+            if distance <= max_distance:
+                results.extend((distance, item) for item in node[1])
+            # 삼각 부등식: |d - max| ~ d + max 범위의 자식만 탐색
+            for child_distance, child in node[2].items():
+                if distance - max_distance <= child_distance <= distance + max_distance:
+                    stack.append(child)
+        return results
+
+
+def compute_cover_hashes(
+    paths: List[str],
+    progress: Optional[Callable[[int, int], None]] = None,
+    is_cancelled: Optional[Callable[[], bool]] = None
+) -> Dict[str, int]:
+    """
+    파일들의 표지 해시 계산 (캐시된 값은 재사용)
+
+    Returns:
+        {파일 경로: 해시}
+    """
+    index_cache = get_index_cache()
+    hashes: Dict[str, int] = {}
+    missing: List[Tuple[str, Tuple[int, int]]] = []
+
+    for path in paths:
+        if not is_supported_archive(path):
+            continue
+        signature = file_signature(path)
+        if signature is None:
+            continue
+        cached = index_cache.get_cover_hash(path, signature)
+        if cached is not None:
+            hashes[path] = cached
+        else:
+            missing.append((path, signature))
+
+    total = len(missing)
+    if progress:
+        progress(0, total)
+    if not missing:
+        return hashes
+
+    def load_pixels(path: str) -> Optional[np.ndarray]:
+        img = extract_cover(path, max_size=HASH_SOURCE_SIZE, priority=PRIORITY_BULK)
+        return image_to_hash_input(img) if img is not None else None
+
+    decoded: List[Tuple[str, Tuple[int, int], np.ndarray]] = []
+    with ThreadPoolExecutor(max_workers=DECODE_WORKERS) as executor:
+        for done, ((path, signature), pixels) in enumerate(
+                zip(missing, executor.map(load_pixels, [p for p, _ in missing])), start=1):
+            if pixels is not None:
+                decoded.append((path, signature, pixels))
+            if progress:
+                progress(done, total)
+            if is_cancelled and is_cancelled():
+                executor.shutdown(wait=False, cancel_futures=True)
+                break
+
+    # 디코딩된 표지를 모아서 한 번에 해시 계산
+    new_hashes = compute_phashes(np.stack([pixels for _, _, pixels in decoded])) if decoded else []
+    entries = []
+    for (path, signature, _), hash_value in zip(decoded, new_hashes):
+        hashes[path] = hash_value
+        entries.append((path, signature, hash_value))
+    index_cache.set_cover_hashes(entries)
+
+    return hashes
+
+
+def find_cover_issues(
+    file_infos: List[FileInfo],
+    hashes: Dict[str, int],
+    max_distance: int = DEFAULT_MAX_DISTANCE
+) -> Dict[str, str]:
+    """
+    표지 해시로 의심 파일 찾기
+
+    Returns:
+        {파일 경로: 상태 메시지}
+        - "번호 오류 의심": 번호가 다른 파일과 표지가 같음
+        - "중복 표지": 같은 번호의 다른 파일과 표지가 같음
+    """
+    tree = BKTree()
+    info_by_path = {}
+    for file_info in file_infos:
+        path = file_info.original_path
+        if path in hashes:
+            info_by_path[path] = file_info
+            tree.add(hashes[path], path)
+
+    def number_of(info: FileInfo) -> Optional[str]:
+        if info.pattern and info.pattern.number:
+            number = info.pattern.number
+            return str(int(number)) if number.isdigit() else number
+        return None
+
+    issues: Dict[str, str] = {}
+    for path, file_info in info_by_path.items():
+        number = number_of(file_info)
+        matches = []
+        for distance, other_path in tree.search(hashes[path], max_distance):
+            if other_path == path:
+                continue
+            matches.append(other_path)
+
+        if not matches:
+            continue
+
+        names = ", ".join(os.path.basename(p) for p in matches[:3])
+        if any(number_of(info_by_path[p]) != number for p in matches):
+            issues[path] = f"번호 오류 의심 (표지 동일: {names})"
+        else:
+            issues[path] = f"중복 표지 ({names})"
+
+    return issues
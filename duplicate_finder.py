@@ -0,0 +1,225 @@
+"""
+내용이 같은 파일 찾기 (이름이 달라도 같은 권이 두 번 받아진 경우)
+1. 크기가 같은 파일끼리만 후보로 묶음 (파일을 읽지 않음)
+2. 후보는 앞/뒤 일부만 해시하여 다른 파일을 걸러냄
+3. 남은 후보만 전체 해시로 확인
+- 파일 읽기/해시는 스레드 풀에서 병렬 처리 (hashlib과 파일 읽기는 GIL을 놓음)
+  전체 작업 I/O 우선순위로 읽고, 큰 파일은 조각마다 표지 표시 등 더 급한 읽기에 양보
+- 해시는 파일 서명(수정 시각, 크기)과 함께 인덱스 캐시에 저장
+"""
+import hashlib
+import os
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+from archive_cache import get_index_cache
+from file_system import file_signature
+from io_scheduler import PRIORITY_BULK, IoTicket, io_slot
+from models import FileInfo
+
+
+# 부분 해시에 사용하는 앞/뒤 크기
+SAMPLE_SIZE = 64 * 1024
+# 전체 해시 시 한 번에 읽는 크기
+HASH_CHUNK_SIZE = 1024 * 1024
+# 동시에 읽는 파일 수 (HDD는 1~2 권장)
+DEFAULT_IO_CONCURRENCY = 4
+
+
+def _new_hash():
+    return hashlib.blake2b(digest_size=16)
+
+
+def sample_hash(path: str, size: int) -> str:
+    """
+    파일 앞/뒤 SAMPLE_SIZE바이트 해시 (크기 포함)
+    파일이 SAMPLE_SIZE의 2배 이하이면 파일 전체가 들어가므로 전체 해시와 같은 역할
+    """
+    digest = _new_hash()
+    digest.update(size.to_bytes(8, "little"))
+    with open(path, "rb") as f:
+        if size <= 2 * SAMPLE_SIZE:
+            digest.update(f.read())
+        else:
+            digest.update(f.read(SAMPLE_SIZE))
+            f.seek(-SAMPLE_SIZE, os.SEEK_END)
+            digest.update(f.read(SAMPLE_SIZE))
+    return digest.hexdigest()
+
+
+def full_hash(path: str, ticket: Optional[IoTicket] = None) -> str:
+    """
+    파일 전체 해시
+
+    Args:
+        ticket: 받아 둔 I/O 칸 (조각마다 더 높은 우선순위 요청에 양보)
+    """
+    digest = _new_hash()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+            if ticket is not None:
+                ticket.checkpoint()
+    return digest.hexdigest()
+
+
+def _hash_stage(
+    candidates: List[Tuple[str, Tuple[int, int]]],
+    hash_function: Callable[[str, Tuple[int, int], IoTicket], str],
+    io_concurrency: int,
+    on_done: Callable[[], bool]
+) -> Dict[str, str]:
+    """
+    후보 파일들을 병렬로 해시 (읽을 수 없는 파일은 결과에서 빠짐)
+
+    Args:
+        on_done: 파일 하나가 끝날 때마다 호출, True를 반환하면 중지
+    """
+    def run(item: Tuple[str, Tuple[int, int]]) -> Optional[str]:
+        path, signature = item
+        try:
+            with io_slot(path, PRIORITY_BULK) as ticket:
+                return hash_function(path, signature, ticket)
+        except OSError as e:
+            print(f"파일 해시 실패 {path}: {e}")
+            return None
+
+    results: Dict[str, str] = {}
+    with ThreadPoolExecutor(max_workers=max(1, io_concurrency)) as executor:
+        for (path, _), digest in zip(candidates, executor.map(run, candidates)):
+            if digest is not None:
+                results[path] = digest
+            if on_done():
+                executor.shutdown(wait=False, cancel_futures=True)
+                break
+    return results
+
+
+def _multi_groups(keys: Dict[str, object]) -> List[List[str]]:
+    """같은 키를 가진 경로가 2개 이상인 묶음 (입력 순서 유지)"""
+    groups: Dict[object, List[str]] = defaultdict(list)
+    for path, key in keys.items():
+        groups[key].append(path)
+    return [paths for paths in groups.values() if len(paths) > 1]
+
+
+def find_duplicates(
+    paths: List[str],
+    io_concurrency: int = DEFAULT_IO_CONCURRENCY,
+    progress: Optional[Callable[[int, int], None]] = None,
+    is_cancelled: Optional[Callable[[], bool]] = None
+) -> List[List[str]]:
+    """
+    내용이 같은 파일 묶음 찾기
+
+    Args:
+        paths: 검사할 파일 경로 (폴더는 제외)
+        io_concurrency: 동시에 읽는 파일 수
+        progress: progress(완료 수, 전체 수) - 부분 해시와 전체 해시를 할 파일 수 기준
+        is_cancelled: 취소 여부 (취소되면 그때까지 확인된 묶음만 반환)
+
+    Returns:
+        [[경로, ...], ...] - 묶음 안의 경로는 입력 순서
+    """
+    index_cache = get_index_cache()
+    cancelled = is_cancelled or (lambda: False)
+
+    # 1. 크기로 후보 묶기 (빈 파일은 제외)
+    signatures: Dict[str, Tuple[int, int]] = {}
+    for path in paths:
+        if os.path.isdir(path):
+            continue
+        signature = file_signature(path)
+        if signature is not None and signature[1] > 0:
+            signatures[path] = signature
+    size_groups = _multi_groups({path: signature[1] for path, signature in signatures.items()})
+    candidates = [path for group in size_groups for path in group]
+
+    cached = {path: index_cache.get_content_hash(path, signatures[path]) for path in candidates}
+    unsaved: Dict[str, List[object]] = {}
+
+    # 진행률: 부분 해시 대상 수 + (나중에 알게 되는) 전체 해시 대상 수
+    done = 0
+    total = sum(1 for path in candidates if cached[path] is None)
+
+    def on_done() -> bool:
+        nonlocal done
+        done += 1
+        if progress:
+            progress(done, total)
+        return cancelled()
+
+    if progress:
+        progress(0, total)
+
+    # 2. 부분 해시 (캐시에 없는 파일만 읽음)
+    samples = {path: cached[path][0] for path in candidates if cached[path] is not None}
+    missing = [(path, signatures[path]) for path in candidates if cached[path] is None]
+    new_samples = _hash_stage(missing, lambda path, signature, _: sample_hash(path, signature[1]),
+                              io_concurrency, on_done)
+    for path, digest in new_samples.items():
+        unsaved[path] = [digest, ""]
+    samples.update(new_samples)
+
+    sample_groups = [] if cancelled() else _multi_groups(
+        {path: (signatures[path][1], samples[path]) for path in candidates if path in samples}
+    )
+
+    # 3. 전체 해시 (앞/뒤에 파일 전체가 들어가는 작은 파일은 부분 해시가 곧 전체 해시)
+    fulls: Dict[str, str] = {}
+    missing = []
+    for path in (path for group in sample_groups for path in group):
+        if signatures[path][1] <= 2 * SAMPLE_SIZE:
+            fulls[path] = samples[path]
+        elif cached[path] is not None and cached[path][1]:
+            fulls[path] = cached[path][1]
+        else:
+            missing.append((path, signatures[path]))
+    total += len(missing)
+
+    new_fulls = _hash_stage(missing, lambda path, _, ticket: full_hash(path, ticket), io_concurrency, on_done)
+    for path, digest in new_fulls.items():
+        unsaved[path] = [samples[path], digest]
+    fulls.update(new_fulls)
+
+    index_cache.set_content_hashes(
+        (path, signatures[path], sample, full) for path, (sample, full) in unsaved.items()
+    )
+
+    # 전체 해시까지 확인한 파일만 묶음으로 인정
+    order = {path: position for position, path in enumerate(paths)}
+    groups = _multi_groups({path: (signatures[path][1], fulls[path]) for path in fulls})
+    return sorted((sorted(group, key=order.get) for group in groups), key=lambda group: order[group[0]])
+
+
+def duplicate_statuses(groups: List[List[str]]) -> Tuple[Dict[str, str], List[str]]:
+    """
+    중복 묶음을 상태 열 메시지로 변환 (묶음의 첫 파일을 남기고 나머지를 중복으로 표시)
+
+    Returns:
+        ({파일 경로: 상태 메시지}, 제외 후보 경로 목록)
+    """
+    statuses: Dict[str, str] = {}
+    extras: List[str] = []
+    for group in groups:
+        keep = group[0]
+        statuses[keep] = f"중복 파일 원본 ({len(group) - 1}개 중복)"
+        for path in group[1:]:
+            statuses[path] = f"중복 파일 (내용 동일: {os.path.basename(keep)})"
+            extras.append(path)
+    return statuses, extras
+
+
+def exclude_from_rename(file_infos: List[FileInfo], excluded: Set[str]) -> List[FileInfo]:
+    """
+    제외한 파일은 원래 이름을 유지하도록 바꾼 파일 정보 목록 (제외한 파일이 없으면 그대로)
+    목록에서 빼지 않고 원래 이름으로 남겨 두어야 다른 파일의 새 이름과 겹치는지 충돌 검사에 걸림
+    """
+    if not excluded:
+        return file_infos
+    return [
+        FileInfo(info.original_path, info.original_name, info.original_name, info.pattern)
+        if info.original_path in excluded else info
+        for info in file_infos
+    ]
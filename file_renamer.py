@@ -1,110 +1,200 @@
 """
 파일명 변경 로직
 """
-from typing import List
-from models import FilePattern, FileInfo
-import copy
+import os
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Union
+from models import FilePattern, FileInfo, FileInfoStore, ComicMetadata
+import re
 
 
-def apply_pattern(file_infos: List[FileInfo], template_pattern: FilePattern) -> List[FileInfo]:
+# 연속된 공백 (이름 정리용)
+WHITESPACE_PATTERN = re.compile(r'\s+')
+# 파일 수가 이 이상이고 전체 파일에 적용하면 벡터화 경로(bulk_transforms) 사용
+BULK_MIN_ROWS = 20000
+
+
+def _bulk_backend(file_infos: List[FileInfo], rows: Optional[Iterable[int]]):
+    """벡터화 경로를 쓸 수 있으면 bulk_transforms 모듈 (큰 FileInfoStore 전체 변환), 아니면 None"""
+    if rows is not None or not isinstance(file_infos, FileInfoStore) or len(file_infos) < BULK_MIN_ROWS:
+        return None
+    # NumPy는 큰 목록을 처음 변환할 때만 불러옴 (프로그램 시작 시간 단축)
+    import bulk_transforms
+    return bulk_transforms
+
+
+def _transform(
+    file_infos: List[FileInfo],
+    transform: Callable[[FileInfo], FileInfo],
+    rows: Optional[Iterable[int]] = None
+) -> List[FileInfo]:
     """
-    선택한 패턴을 모든 파일에 적용
-    각 파일의 번호는 유지하고, 나머지(prefix, title, suffix, extension)는 템플릿 것으로 대체
+    파일 정보마다 transform 적용
+    transform은 입력 객체를 수정하지 않고 바뀐 경우에만 새 객체를 반환하므로,
+    바뀌지 않은 파일(rows 밖의 행 포함)은 기존 객체를 그대로 공유 (deepcopy 없음)
+
+    FileInfoStore는 열을 복사한 새 목록에 바뀐 행만 기록 (행 객체 목록을 만들지 않음)
+
+    Args:
+        rows: 적용할 행 번호 (None이면 전체) - 선택한 파일/패턴 그룹에만 적용할 때 사용,
+              처리 시간은 선택한 행 수에 비례
     """
-    updated_infos = []
-
-    for file_info in file_infos:
-        new_info = copy.deepcopy(file_info)
-
-        if file_info.pattern:
-            # 새 패턴 생성 (번호만 기존 것 유지)
-            new_pattern = FilePattern(
-                prefix=template_pattern.prefix,
-                title=template_pattern.title,
-                number=file_info.pattern.number,  # 기존 번호 유지
-                suffix=template_pattern.suffix,
-                extension=template_pattern.extension,
-                padding_width=template_pattern.padding_width  # 템플릿의 패딩 유지
-            )
+    if isinstance(file_infos, FileInfoStore):
+        updated_store = file_infos.copy()
+        for row in (range(len(file_infos)) if rows is None else rows):
+            file_info = file_infos[row]
+            result = transform(file_info)
+            if result is not file_info:
+                updated_store[row] = result
+        return updated_store
+
+    if rows is None:
+        return [transform(file_info) for file_info in file_infos]
+
+    updated_infos = list(file_infos)
+    for row in rows:
+        updated_infos[row] = transform(updated_infos[row])
+    return updated_infos
 
-            new_info.pattern = new_pattern
-            new_info.new_name = new_pattern.to_filename()
 
-        updated_infos.append(new_info)
+def _split_extension(filename: str) -> Tuple[str, str]:
+    """파일명을 (이름, 확장자)로 분리 (확장자가 없으면 빈 문자열)"""
+    if '.' in filename:
+        name_part, ext_part = filename.rsplit('.', 1)
+        return name_part, ext_part
+    return filename, ""
+
+
+def _with_name(file_info: FileInfo, name_part: str, ext_part: str, pattern: Optional[FilePattern]) -> FileInfo:
+    """이름 부분을 정리(중복 공백 제거)하여 결합한 새 파일 정보 (바뀐 것이 없으면 기존 객체)"""
+    name_part = WHITESPACE_PATTERN.sub(' ', name_part).strip()
+    new_name = f"{name_part}.{ext_part}" if ext_part else name_part
+    if new_name == file_info.new_name and pattern is file_info.pattern:
+        return file_info
+    return FileInfo(file_info.original_path, file_info.original_name, new_name, pattern)
 
-    return updated_infos
 
+def _with_pattern_fields(pattern: Optional[FilePattern], prefix: str, title: str, suffix: str) -> Optional[FilePattern]:
+    """prefix/title/suffix가 바뀐 경우에만 새 패턴 생성"""
+    if pattern is None or (prefix, title, suffix) == (pattern.prefix, pattern.title, pattern.suffix):
+        return pattern
+    return FilePattern(prefix, title, pattern.number, suffix, pattern.extension, pattern.padding_width)
 
-def remove_text(file_infos: List[FileInfo], text_to_remove: str, position: str = "all") -> List[FileInfo]:
+
+def apply_pattern(
+    file_infos: List[FileInfo],
+    template_pattern: FilePattern,
+    rows: Optional[Iterable[int]] = None
+) -> List[FileInfo]:
+    """
+    선택한 패턴을 모든 파일(rows를 지정하면 해당 행만)에 적용
+    각 파일의 번호는 유지하고, 나머지(prefix, title, suffix, extension)는 템플릿 것으로 대체
+    """
+    def transform(file_info: FileInfo) -> FileInfo:
+        if not file_info.pattern:
+            return file_info
+
+        # 새 패턴 생성 (번호만 기존 것 유지)
+        new_pattern = FilePattern(
+            prefix=template_pattern.prefix,
+            title=template_pattern.title,
+            number=file_info.pattern.number,  # 기존 번호 유지
+            suffix=template_pattern.suffix,
+            extension=template_pattern.extension,
+            padding_width=template_pattern.padding_width  # 템플릿의 패딩 유지
+        )
+        new_name = new_pattern.to_filename()
+        if new_pattern == file_info.pattern and new_name == file_info.new_name:
+            return file_info
+        return FileInfo(file_info.original_path, file_info.original_name, new_name, new_pattern)
+
+    return _transform(file_infos, transform, rows)
+
+
+def remove_text(
+    file_infos: List[FileInfo],
+    text_to_remove: str,
+    position: str = "all",
+    rows: Optional[Iterable[int]] = None
+) -> List[FileInfo]:
     """
-    모든 파일명에서 특정 텍스트 제거
+    모든 파일명(rows를 지정하면 해당 행만)에서 특정 텍스트 제거
     사용자가 입력한 공백도 포함하여 정확히 제거
 
     Args:
         file_infos: 파일 정보 리스트
         text_to_remove: 제거할 텍스트
         position: "all" (모든 문구), "front" (첫 번째만), "back" (마지막만)
+        rows: 적용할 행 번호 (None이면 전체)
     """
     if not text_to_remove:
         return file_infos
 
-    updated_infos = []
+    bulk = _bulk_backend(file_infos, rows)
+    if bulk is not None:
+        return bulk.bulk_remove_text(file_infos, text_to_remove, position)
 
-    for file_info in file_infos:
-        new_info = copy.deepcopy(file_info)
-
-        # 확장자 분리
-        if '.' in new_info.new_name:
-            name_part, ext_part = new_info.new_name.rsplit('.', 1)
-        else:
-            name_part = new_info.new_name
-            ext_part = ""
-
-        # 위치에 따라 텍스트 제거
+    def remove(text: str) -> str:
         if position == "front":
             # 첫 번째 문구만 제거
-            name_part = name_part.replace(text_to_remove, "", 1)
-        elif position == "back":
+            return text.replace(text_to_remove, "", 1)
+        if position == "back":
             # 마지막 문구만 제거
-            parts = name_part.rsplit(text_to_remove, 1)
-            name_part = "".join(parts)
-        else:  # "all"
-            # 모든 문구 제거 (기존 동작)
-            name_part = name_part.replace(text_to_remove, "")
-
-        # 중복 공백 제거 (연속된 공백을 하나로)
-        import re
-        name_part = re.sub(r'\s+', ' ', name_part).strip()
-
-        # 파일명 재결합
-        if ext_part:
-            new_info.new_name = f"{name_part}.{ext_part}"
-        else:
-            new_info.new_name = name_part
+            return "".join(text.rsplit(text_to_remove, 1))
+        # 모든 문구 제거 (기존 동작)
+        return text.replace(text_to_remove, "")
+
+    def transform(file_info: FileInfo) -> FileInfo:
+        name_part, ext_part = _split_extension(file_info.new_name)
 
         # 패턴도 업데이트 (position에 따라)
-        if new_info.pattern:
-            if position == "front":
-                new_info.pattern.prefix = new_info.pattern.prefix.replace(text_to_remove, "", 1)
-                new_info.pattern.title = new_info.pattern.title.replace(text_to_remove, "", 1)
-                new_info.pattern.suffix = new_info.pattern.suffix.replace(text_to_remove, "", 1)
-            elif position == "back":
-                new_info.pattern.prefix = "".join(new_info.pattern.prefix.rsplit(text_to_remove, 1))
-                new_info.pattern.title = "".join(new_info.pattern.title.rsplit(text_to_remove, 1))
-                new_info.pattern.suffix = "".join(new_info.pattern.suffix.rsplit(text_to_remove, 1))
-            else:  # "all"
-                new_info.pattern.prefix = new_info.pattern.prefix.replace(text_to_remove, "")
-                new_info.pattern.title = new_info.pattern.title.replace(text_to_remove, "")
-                new_info.pattern.suffix = new_info.pattern.suffix.replace(text_to_remove, "")
-
-        updated_infos.append(new_info)
+        pattern = file_info.pattern
+        if pattern:
+            pattern = _with_pattern_fields(pattern, remove(pattern.prefix), remove(pattern.title), remove(pattern.suffix))
+
+        return _with_name(file_info, remove(name_part), ext_part, pattern)
+
+    return _transform(file_infos, transform, rows)
+
+
+# {number}, {number:02d}, {series}, {volume:03d} 등 템플릿 필드
+TEMPLATE_FIELD_PATTERN = re.compile(r'\{(\w+)(?::0(\d)d)?\}')
 
-    return updated_infos
 
+def template_uses_metadata(pattern_template: str) -> bool:
+    """템플릿에 {number} 외의 메타데이터 필드가 있는지 확인"""
+    return any(match.group(1) != "number" for match in TEMPLATE_FIELD_PATTERN.finditer(pattern_template))
 
-def apply_custom_pattern(file_infos: List[FileInfo], pattern_template: str) -> List[FileInfo]:
+
+def render_template(pattern_template: str, values: Dict[str, str]) -> Optional[str]:
+    """템플릿 필드를 값으로 채운 파일명 (값이 없는 필드가 있으면 None)"""
+    missing = False
+
+    def replace_field(match):
+        nonlocal missing
+        value = values.get(match.group(1))
+        if value is None:
+            missing = True
+            return match.group(0)
+        padding = match.group(2)
+        if padding and value.isdigit():
+            # {number:02d} 형식
+            return value.zfill(int(padding))
+        return value
+
+    new_name = TEMPLATE_FIELD_PATTERN.sub(replace_field, pattern_template)
+    return None if missing else new_name
+
+
+def apply_custom_pattern(
+    file_infos: List[FileInfo],
+    pattern_template: str,
+    metadata: Optional[Dict[str, ComicMetadata]] = None,
+    rows: Optional[Iterable[int]] = None,
+    include_unnumbered: bool = False
+) -> List[FileInfo]:
     """
-    사용자 정의 패턴을 모든 파일에 적용
+    사용자 정의 패턴을 모든 파일(rows를 지정하면 해당 행만)에 적용
+    파일명에서 번호를 찾지 못한 파일은 건너뜀 (include_unnumbered를 켜면 메타데이터 필드만으로도 변경)
 
     Args:
         file_infos: 파일 정보 리스트
@@ -112,94 +202,124 @@ def apply_custom_pattern(file_infos: List[FileInfo], pattern_template: str) -> L
                          {number}: 권수
                          {number:02d}: 2자리 패딩 권수
                          {number:03d}: 3자리 패딩 권수
+                         {series}, {volume}, {issue}, {title}, {year}, {writer}, {publisher}:
+                         ComicInfo.xml 메타데이터 값 ({volume:02d}처럼 숫자 패딩도 가능)
+        metadata: {파일 경로: 메타데이터} - 메타데이터 필드를 쓸 때 필요
+        rows: 적용할 행 번호 (None이면 전체)
+        include_unnumbered: 번호가 없는 파일에도 적용 (필드가 없는 템플릿이면 모두 같은 이름이 되므로 사용자가 직접 선택)
 
     Returns:
         업데이트된 파일 정보 리스트
+        (템플릿의 값 중 하나라도 없는 파일은 그대로 유지)
     """
-    import re
-
     if not pattern_template:
         return file_infos
 
-    # {number} 또는 {number:XXd} 패턴 찾기
-    number_pattern = re.compile(r'\{number(?::0(\d)d)?\}')
-
-    updated_infos = []
-
-    for file_info in file_infos:
-        new_info = copy.deepcopy(file_info)
+    bulk = _bulk_backend(file_infos, rows)
+    if bulk is not None and not template_uses_metadata(pattern_template):
+        return bulk.bulk_apply_template(file_infos, pattern_template, include_unnumbered)
 
-        # 권수 추출
-        if new_info.pattern and new_info.pattern.number:
-            number_str = new_info.pattern.number
-        else:
-            # 패턴이 없으면 스킵
-            updated_infos.append(new_info)
-            continue
+    metadata = metadata or {}
 
-        # 패턴 템플릿에서 {number} 치환
-        def replace_number(match):
-            padding = match.group(1)
-            if padding:
-                # {number:02d} 형식
-                return number_str.zfill(int(padding))
-            else:
-                # {number} 형식
-                return number_str
+    def transform(file_info: FileInfo) -> FileInfo:
+        # 템플릿에 넣을 값: 파일명의 권수 + 메타데이터 필드
+        values = {}
+        if file_info.pattern and file_info.pattern.number:
+            values["number"] = file_info.pattern.number
+        elif not include_unnumbered:
+            # 번호가 없는 파일은 스킵
+            return file_info
+        comic_info = metadata.get(file_info.original_path)
+        if comic_info is not None:
+            values.update(comic_info.template_fields())
 
-        new_name = number_pattern.sub(replace_number, pattern_template)
-        new_info.new_name = new_name
+        new_name = render_template(pattern_template, values)
+        if new_name is None or new_name == file_info.new_name:
+            # 권수나 메타데이터가 없으면 스킵
+            return file_info
+        return FileInfo(file_info.original_path, file_info.original_name, new_name, file_info.pattern)
 
-        updated_infos.append(new_info)
+    return _transform(file_infos, transform, rows)
 
-    return updated_infos
 
+def build_custom_template(title: str, pattern: FilePattern) -> str:
+    """
+    패턴 편집 입력(제목)으로 apply_custom_pattern용 템플릿 생성
+    권수 placeholder는 선택된 패턴의 padding_width, suffix/확장자는 선택된 패턴 것을 사용
+    입력에 필드({series}, {number:02d} 등)가 있으면 입력 전체를 확장자 앞 이름으로 사용
 
-def change_padding_width(file_infos: List[FileInfo], padding_width: int) -> List[FileInfo]:
+    Args:
+        title: 사용자가 입력한 제목 (앞뒤 공백 포함)
+        pattern: 선택된 패턴
     """
-    모든 파일의 권수 자릿수를 변경
+    if pattern.padding_width == 2:
+        number_placeholder = "{number:02d}"
+    elif pattern.padding_width == 3:
+        number_placeholder = "{number:03d}"
+    else:
+        number_placeholder = "{number}"
+
+    suffix = pattern.suffix if pattern.suffix else ""
+    extension = f".{pattern.extension}" if pattern.extension else ""
+
+    if TEMPLATE_FIELD_PATTERN.search(title):
+        return title + extension
+    return title + number_placeholder + suffix + extension
+
+
+def change_padding_width(
+    file_infos: List[FileInfo],
+    padding_width: int,
+    rows: Optional[Iterable[int]] = None
+) -> List[FileInfo]:
+    """
+    모든 파일(rows를 지정하면 해당 행만)의 권수 자릿수를 변경
     padding_width: 1, 2, 3 (예: 1 → "1", 2 → "01", 3 → "001")
     """
     if padding_width not in [1, 2, 3]:
         return file_infos
 
-    updated_infos = []
-
-    for file_info in file_infos:
-        new_info = copy.deepcopy(file_info)
+    bulk = _bulk_backend(file_infos, rows)
+    if bulk is not None:
+        return bulk.bulk_change_padding_width(file_infos, padding_width)
 
+    def transform(file_info: FileInfo) -> FileInfo:
+        pattern = file_info.pattern
         # 패턴이 있고 숫자가 있는 경우에만 적용
-        if new_info.pattern and new_info.pattern.number:
-            # 패딩 자릿수 변경
-            new_info.pattern.padding_width = padding_width
-            # 새 파일명 생성
-            new_info.new_name = new_info.pattern.to_filename()
-
-        updated_infos.append(new_info)
-
-    return updated_infos
-
-
-def add_text(file_infos: List[FileInfo], text_to_add: str, position: str = "front") -> List[FileInfo]:
+        if not pattern or not pattern.number:
+            return file_info
+
+        # 패딩 자릿수 변경 후 새 파일명 생성
+        new_pattern = FilePattern(pattern.prefix, pattern.title, pattern.number, pattern.suffix,
+                                  pattern.extension, padding_width)
+        new_name = new_pattern.to_filename()
+        if padding_width == pattern.padding_width and new_name == file_info.new_name:
+            return file_info
+        return FileInfo(file_info.original_path, file_info.original_name, new_name, new_pattern)
+
+    return _transform(file_infos, transform, rows)
+
+
+def add_text(
+    file_infos: List[FileInfo],
+    text_to_add: str,
+    position: str = "front",
+    rows: Optional[Iterable[int]] = None
+) -> List[FileInfo]:
     """
-    모든 파일명에 텍스트 추가
+    모든 파일명(rows를 지정하면 해당 행만)에 텍스트 추가
     position: "front" 또는 "back"
     사용자가 입력한 텍스트를 공백 포함하여 그대로 추가
     """
     if not text_to_add:
         return file_infos
 
-    updated_infos = []
-
-    for file_info in file_infos:
-        new_info = copy.deepcopy(file_info)
+    bulk = _bulk_backend(file_infos, rows)
+    if bulk is not None:
+        return bulk.bulk_add_text(file_infos, text_to_add, position)
 
-        # 확장자 분리
-        if '.' in new_info.new_name:
-            name_part, ext_part = new_info.new_name.rsplit('.', 1)
-        else:
-            name_part = new_info.new_name
-            ext_part = ""
+    def transform(file_info: FileInfo) -> FileInfo:
+        name_part, ext_part = _split_extension(file_info.new_name)
 
         # 텍스트 추가 (사용자 입력을 그대로 사용)
         if position == "front":
@@ -207,50 +327,125 @@ def add_text(file_infos: List[FileInfo], text_to_add: str, position: str = "fron
         else:  # back
             name_part = f"{name_part}{text_to_add}"
 
-        # 중복 공백 제거 (연속된 공백을 하나로)
-        import re
-        name_part = re.sub(r'\s+', ' ', name_part).strip()
-
-        # 파일명 재결합
-        if ext_part:
-            new_info.new_name = f"{name_part}.{ext_part}"
-        else:
-            new_info.new_name = name_part
-
         # 패턴도 업데이트
-        if new_info.pattern:
+        pattern = file_info.pattern
+        if pattern:
             if position == "front":
-                if new_info.pattern.prefix:
-                    new_info.pattern.prefix = f"{text_to_add}{new_info.pattern.prefix}"
-                else:
-                    new_info.pattern.prefix = text_to_add
+                pattern = _with_pattern_fields(pattern, f"{text_to_add}{pattern.prefix}", pattern.title, pattern.suffix)
             else:  # back
-                if new_info.pattern.suffix:
-                    new_info.pattern.suffix = f"{new_info.pattern.suffix}{text_to_add}"
-                else:
-                    new_info.pattern.suffix = text_to_add
+                pattern = _with_pattern_fields(pattern, pattern.prefix, pattern.title, f"{pattern.suffix}{text_to_add}")
 
-        updated_infos.append(new_info)
+        return _with_name(file_info, name_part, ext_part, pattern)
 
-    return updated_infos
+    return _transform(file_infos, transform, rows)
+
+
+def compile_find_pattern(find_pattern: str, ignore_case: bool = False, use_regex: bool = True) -> re.Pattern:
+    """
+    찾기 패턴 컴파일 (잘못된 정규식이면 re.error 발생)
+    use_regex=False면 입력을 일반 텍스트로 취급
+    """
+    if not use_regex:
+        find_pattern = re.escape(find_pattern)
+    return re.compile(find_pattern, re.IGNORECASE if ignore_case else 0)
+
+
+def _substitute(regex: re.Pattern, replacement: str, text: str, position: str) -> str:
+    """위치에 따라 치환 ("all": 모두, "front": 첫 번째만, "back": 마지막만)"""
+    if position == "front":
+        return regex.sub(replacement, text, count=1)
+    if position == "back":
+        last_match = None
+        for last_match in regex.finditer(text):
+            pass
+        if last_match is None:
+            return text
+        return text[:last_match.start()] + last_match.expand(replacement) + text[last_match.end():]
+    return regex.sub(replacement, text)
+
+
+def regex_replace(
+    file_infos: List[FileInfo],
+    find_pattern: Union[str, re.Pattern],
+    replacement: str = "",
+    position: str = "all",
+    ignore_case: bool = False,
+    rows: Optional[Iterable[int]] = None
+) -> List[FileInfo]:
+    """
+    모든 파일명(rows를 지정하면 해당 행만)에서 정규식으로 찾아 바꾸기 (확장자는 제외)
+    바꿀 내용에 \\1, \\g<name> 형식으로 캡처 그룹 사용 가능
+
+    Args:
+        file_infos: 파일 정보 리스트
+        find_pattern: 찾을 정규식 (문자열이면 한 번만 컴파일하여 전체에 사용)
+        replacement: 바꿀 내용 (빈 문자열이면 제거)
+        position: "all" (모두), "front" (첫 번째만), "back" (마지막만)
+        ignore_case: 대소문자 무시 (find_pattern이 문자열일 때만 사용)
+        rows: 적용할 행 번호 (None이면 전체)
+
+    Returns:
+        업데이트된 파일 정보 리스트
+        (바뀌지 않은 파일은 기존 객체를 그대로 사용 - 큰 폴더의 실시간 미리보기용)
+
+    Raises:
+        re.error: 정규식 또는 바꿀 내용의 그룹 참조가 잘못된 경우
+    """
+    if not find_pattern:
+        return file_infos
+
+    regex = compile_find_pattern(find_pattern, ignore_case) if isinstance(find_pattern, str) else find_pattern
+    if '\\' in replacement:
+        # 그룹 참조 검사를 미리 한 번 수행 (잘못된 참조는 여기서 re.error)
+        regex.sub(replacement, "")
+
+    def transform(file_info: FileInfo) -> FileInfo:
+        name_part, ext_part = _split_extension(file_info.new_name)
+        name_part = _substitute(regex, replacement, name_part, position)
+
+        # 패턴에도 같은 치환 적용 (이후 자릿수 변경/패턴 편집과 일관되도록)
+        pattern = file_info.pattern
+        if pattern:
+            pattern = _with_pattern_fields(
+                pattern,
+                _substitute(regex, replacement, pattern.prefix, position),
+                _substitute(regex, replacement, pattern.title, position),
+                _substitute(regex, replacement, pattern.suffix, position),
+            )
+
+        return _with_name(file_info, name_part, ext_part, pattern)
+
+    return _transform(file_infos, transform, rows)
 
 
 def execute_rename(file_infos: List[FileInfo]) -> List[tuple[bool, str, str]]:
     """
-    실제 파일명 변경 실행
+    실제 파일명 변경 실행 (대상 파일이 이미 있으면 덮어쓰지 않음)
+    같은 폴더의 파일이 이어지는 동안 폴더를 한 번만 열어 둠 (DirectoryRenamer)
     Returns: List of (성공 여부, 원본 파일명, 에러 메시지)
     """
-    from file_system import rename_file
+    from file_system import DirectoryRenamer
 
     results = []
-
-    for file_info in file_infos:
-        # 원본과 새 이름이 같으면 스킵
-        if file_info.original_name == file_info.new_name:
-            results.append((True, file_info.original_name, "변경 불필요"))
-            continue
-
-        success, error_msg = rename_file(file_info.original_path, file_info.new_path)
-        results.append((success, file_info.original_name, error_msg))
+    renamer: Optional[DirectoryRenamer] = None
+
+    try:
+        for file_info in file_infos:
+            # 원본과 새 이름이 같으면 스킵
+            if file_info.original_name == file_info.new_name:
+                results.append((True, file_info.original_name, "변경 불필요"))
+                continue
+
+            directory, old_name = os.path.split(file_info.original_path)
+            if renamer is None or renamer.directory != directory:
+                if renamer is not None:
+                    renamer.close()
+                renamer = DirectoryRenamer(directory)
+
+            success, error_msg = renamer.rename(old_name, file_info.new_name)
+            results.append((success, file_info.original_name, error_msg))
+    finally:
+        if renamer is not None:
+            renamer.close()
 
     return results
@@ -1,10 +1,19 @@
 """
 파일 시스템 유틸리티
 """
+import ctypes
+import errno
 import os
 import re
-from typing import List, Tuple, Optional
+import sys
+from typing import Dict, List, Tuple, Optional
 from models import FileInfo
+from archive_reader import is_image_folder, is_supported_archive
+
+APP_DIR_NAME = "Enterjoy_SmartRename"
+
+# renameat2 플래그: 대상이 이미 있으면 덮어쓰지 않고 EEXIST로 실패
+RENAME_NOREPLACE = 1
 
 
 def natural_sort_key(path: str) -> List:
@@ -21,7 +30,8 @@ def natural_sort_key(path: str) -> List:
 
 def get_files_in_folder(folder_path: str) -> List[str]:
     """
-    폴더 내의 모든 파일 목록 반환 (서브 폴더 제외)
+    폴더 내의 모든 파일 목록 반환
+    서브 폴더는 이미지가 바로 아래에 있는 폴더(이미지 폴더, 한 권으로 취급)만 포함
     자연스러운 숫자 정렬 적용 (1, 2, 3, ..., 10, 11, 12)
     """
     if not os.path.exists(folder_path):
@@ -34,7 +44,7 @@ def get_files_in_folder(folder_path: str) -> List[str]:
     try:
         for item in os.listdir(folder_path):
             item_path = os.path.join(folder_path, item)
-            if os.path.isfile(item_path):
+            if os.path.isfile(item_path) or (os.path.isdir(item_path) and is_image_folder(item_path)):
                 files.append(item_path)
     except PermissionError:
         pass
@@ -98,36 +108,268 @@ def check_conflicts(file_infos: List[FileInfo]) -> Tuple[bool, List[str]]:
 def get_first_archive_file(file_paths: List[str]) -> Optional[str]:
     """
     파일 목록에서 첫 번째 압축 파일 경로 반환
+    ZIP/CBZ, RAR/CBR, 7Z/CB7 및 이미지 폴더 지원
 
     Args:
         file_paths: 파일 경로 목록 (이미 자연스럽게 정렬됨)
 
     Returns:
-        첫 번째 ZIP 파일 경로 또는 None
+        첫 번째 압축 파일 경로 또는 None
     """
     for file_path in file_paths:
-        if file_path.lower().endswith('.zip'):
+        if is_supported_archive(file_path):
             return file_path
 
     return None
 
 
+def get_cache_dir() -> str:
+    """
+    캐시 저장 폴더 경로 반환 (없으면 생성)
+    Windows: %LOCALAPPDATA%\\Enterjoy_SmartRename
+    그 외: $XDG_CACHE_HOME/Enterjoy_SmartRename (기본 ~/.cache)
+    환경 변수 SMARTRENAME_CACHE_DIR로 변경 가능
+    """
+    cache_dir = os.environ.get("SMARTRENAME_CACHE_DIR")
+    if not cache_dir:
+        if sys.platform == "win32":
+            base = os.environ.get("LOCALAPPDATA") or os.path.expanduser("~")
+        else:
+            base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+        cache_dir = os.path.join(base, APP_DIR_NAME)
+
+    os.makedirs(cache_dir, exist_ok=True)
+    return cache_dir
+
+
+def get_data_dir() -> str:
+    """
+    사용자 데이터 저장 폴더 경로 반환 (없으면 생성, 캐시와 달리 지우면 안 되는 데이터)
+    Windows: %APPDATA%\\Enterjoy_SmartRename
+    그 외: $XDG_DATA_HOME/Enterjoy_SmartRename (기본 ~/.local/share)
+    환경 변수 SMARTRENAME_DATA_DIR로 변경 가능
+    """
+    data_dir = os.environ.get("SMARTRENAME_DATA_DIR")
+    if not data_dir:
+        if sys.platform == "win32":
+            base = os.environ.get("APPDATA") or os.path.expanduser("~")
+        else:
+            base = os.environ.get("XDG_DATA_HOME") or os.path.join(os.path.expanduser("~"), ".local", "share")
+        data_dir = os.path.join(base, APP_DIR_NAME)
+
+    os.makedirs(data_dir, exist_ok=True)
+    return data_dir
+
+
+def file_signature(path: str) -> Optional[Tuple[int, int]]:
+    """
+    캐시 무효화를 위한 파일 서명 (수정 시각 ns, 크기) 반환
+    폴더는 (수정 시각 ns, 항목 수)를 사용
+    파일이 없으면 None
+    """
+    try:
+        st = os.stat(path)
+        if os.path.isdir(path):
+            return st.st_mtime_ns, len(os.listdir(path))
+        return st.st_mtime_ns, st.st_size
+    except OSError:
+        return None
+
+
+def _load_renameat2():
+    """glibc의 renameat2 (Linux 3.15+, glibc 2.28+) - 없으면 None"""
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        function = ctypes.CDLL(None, use_errno=True).renameat2
+    except (OSError, AttributeError):
+        return None
+    # argtypes는 지정하지 않음 (int/bytes는 그대로 int/char*로 전달되고, 호출마다 약 1us의 변환 비용이 없어짐)
+    function.restype = ctypes.c_int
+    return function
+
+
+_renameat2 = _load_renameat2()
+
+
+def _portable_rename(old_path: str, new_path: str):
+    """
+    renameat2를 쓸 수 없을 때의 변경
+    Windows의 os.rename은 대상이 있으면 실패하므로 그대로 사용,
+    그 외에는 대상이 있는지 확인한 뒤 변경 (확인과 변경 사이에 생긴 파일은 막지 못함)
+    """
+    if sys.platform != "win32" and os.path.lexists(new_path) and not _same_file(old_path, new_path):
+        raise FileExistsError(errno.EEXIST, os.strerror(errno.EEXIST), new_path)
+    os.rename(old_path, new_path)
+
+
+def _same_file(old_path: str, new_path: str) -> bool:
+    """대소문자를 구분하지 않는 파일 시스템에서 대소문자만 바꾸는 경우"""
+    try:
+        return os.path.samefile(old_path, new_path)
+    except OSError:
+        return False
+
+
+def _rename_error_message(error: OSError, old_path: str, new_path: str) -> str:
+    if error.errno == errno.ENOENT:
+        return f"파일을 찾을 수 없습니다: {old_path}"
+    if error.errno in (errno.EEXIST, errno.ENOTEMPTY):
+        return f"대상 파일이 이미 존재합니다: {new_path}"
+    if error.errno in (errno.EACCES, errno.EPERM):
+        return "파일 접근 권한이 없습니다."
+    return f"파일명 변경 실패: {error}"
+
+
+class DirectoryRenamer:
+    """
+    한 폴더 안의 파일명 변경 (with 문 또는 close()로 정리)
+    Linux: 폴더를 한 번 열어 두고 renameat2(RENAME_NOREPLACE)로 파일마다 시스템 호출 한 번
+           (경로를 매번 다시 찾지 않고, 확인과 변경 사이에 생긴 파일도 덮어쓰지 않음)
+    그 외 / renameat2를 지원하지 않는 파일 시스템: _portable_rename
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        self._dir_fd: Optional[int] = None
+        if _renameat2 is not None:
+            try:
+                self._dir_fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+            except OSError:
+                self._dir_fd = None
+
+    def rename(self, old_name: str, new_name: str) -> Tuple[bool, str]:
+        """
+        폴더 안의 old_name을 new_name으로 변경 (대상이 있으면 실패)
+        Returns: (성공 여부, 에러 메시지)
+        """
+        # 성공하는 경우가 대부분이므로 경로 조합은 실패/대체 경로에서만
+        if self._dir_fd is not None and _renameat2(self._dir_fd, os.fsencode(old_name),
+                                                   self._dir_fd, os.fsencode(new_name), RENAME_NOREPLACE) == 0:
+            return True, ""
+
+        old_path = os.path.join(self.directory, old_name)
+        new_path = os.path.join(self.directory, new_name)
+        try:
+            if self._dir_fd is not None:
+                error_number = ctypes.get_errno()
+                if error_number not in (errno.EINVAL, errno.ENOSYS):
+                    raise OSError(error_number, os.strerror(error_number), new_path)
+                # 파일 시스템이 RENAME_NOREPLACE를 지원하지 않음 (일부 네트워크 파일 시스템 등)
+                # → 이 폴더는 일반 방식으로 변경
+                self.close()
+
+            _portable_rename(old_path, new_path)
+            return True, ""
+
+        except OSError as e:
+            return False, _rename_error_message(e, old_path, new_path)
+        except Exception as e:
+            return False, f"파일명 변경 실패: {str(e)}"
+
+    def close(self):
+        if self._dir_fd is not None:
+            os.close(self._dir_fd)
+            self._dir_fd = None
+
+    def __enter__(self) -> "DirectoryRenamer":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
 def rename_file(old_path: str, new_path: str) -> Tuple[bool, str]:
     """
-    실제 파일명 변경
+    실제 파일명 변경 (대상 파일이 이미 있으면 덮어쓰지 않음)
+    여러 파일을 바꿀 때는 폴더를 한 번만 여는 DirectoryRenamer 사용
     Returns: (성공 여부, 에러 메시지)
     """
-    try:
-        if not os.path.exists(old_path):
-            return False, f"파일을 찾을 수 없습니다: {old_path}"
+    directory, old_name = os.path.split(os.path.abspath(old_path))
+    new_path = os.path.abspath(new_path)
+    # 같은 폴더면 이름만, 다른 폴더면 절대 경로 (renameat2는 절대 경로면 폴더 fd를 무시)
+    new_name = os.path.basename(new_path) if os.path.dirname(new_path) == directory else new_path
+    with DirectoryRenamer(directory) as renamer:
+        return renamer.rename(old_name, new_name)
 
-        if os.path.exists(new_path):
-            return False, f"대상 파일이 이미 존재합니다: {new_path}"
 
-        os.rename(old_path, new_path)
-        return True, ""
+def _benchmark(file_count: int = 5000, repeat: int = 3):
+    """
+    존재 확인 + os.rename 방식과 DirectoryRenamer의 이름 변경 속도 / 시스템 호출 수 비교
+    (python file_system.py [파일 수])
+    임시 폴더에 빈 파일을 만들어 두 이름 사이를 왕복하며 측정,
+    호출 수는 os 함수와 renameat2를 감싸 세는 별도 실행에서 계산 (감싼 비용이 시간에 섞이지 않게)
+    """
+    import tempfile
+    import time
 
-    except PermissionError:
-        return False, "파일 접근 권한이 없습니다."
-    except Exception as e:
-        return False, f"파일명 변경 실패: {str(e)}"
+    def legacy_rename(directory: str, old_name: str, new_name: str):
+        # 이전 방식: 경로 확인 2번 + 변경 (파일마다 경로를 세 번 찾음)
+        old_path = os.path.join(directory, old_name)
+        new_path = os.path.join(directory, new_name)
+        if os.path.exists(old_path) and not os.path.exists(new_path):
+            os.rename(old_path, new_path)
+
+    def directory_rename(directory: str, names: List[Tuple[str, str]]):
+        with DirectoryRenamer(directory) as renamer:
+            for old_name, new_name in names:
+                renamer.rename(old_name, new_name)
+
+    def count_calls(run, pairs) -> Dict[str, int]:
+        """run(pairs)를 한 번 실행하는 동안의 호출 수 (rename은 os.rename + renameat2, lstat은 lexists)"""
+        global _renameat2
+        counts = {"open": 0, "rename": 0, "stat": 0, "lstat": 0}
+        originals = (os.open, os.rename, os.stat, os.lstat, _renameat2)
+
+        def counted(key: str, function):
+            def wrapper(*args, **kwargs):
+                counts[key] += 1
+                return function(*args, **kwargs)
+            return wrapper
+
+        os.open = counted("open", originals[0])
+        os.rename = counted("rename", originals[1])
+        os.stat = counted("stat", originals[2])
+        os.lstat = counted("lstat", originals[3])
+        if _renameat2 is not None:
+            _renameat2 = counted("rename", originals[4])
+        try:
+            run(pairs)
+        finally:
+            os.open, os.rename, os.stat, os.lstat, _renameat2 = originals
+        return counts
+
+    backend = "renameat2(RENAME_NOREPLACE)" if _renameat2 is not None else "os.rename (renameat2 없음)"
+    print(f"파일 {file_count}개, {repeat}회 반복, DirectoryRenamer 백엔드: {backend}")
+
+    with tempfile.TemporaryDirectory() as directory:
+        names = [(f"vol{i:05d}.zip", f"renamed {i:05d}.zip") for i in range(file_count)]
+        for old_name, _ in names:
+            open(os.path.join(directory, old_name), "wb").close()
+        back = [(new_name, old_name) for old_name, new_name in names]
+
+        for label, run in (
+            ("exists + os.rename", lambda pairs: [legacy_rename(directory, *pair) for pair in pairs]),
+            # renameat2를 쓸 수 없을 때의 대체 경로 (lexists + os.rename)
+            ("portable fallback", lambda pairs: [
+                _portable_rename(os.path.join(directory, old_name), os.path.join(directory, new_name))
+                for old_name, new_name in pairs
+            ]),
+            ("DirectoryRenamer", lambda pairs: directory_rename(directory, pairs)),
+        ):
+            best = None
+            for _ in range(repeat):
+                start = time.perf_counter()
+                run(names)
+                elapsed = time.perf_counter() - start
+                run(back)
+                best = elapsed if best is None else min(best, elapsed)
+            counts = count_calls(run, names)
+            run(back)
+            calls = ", ".join(f"{key} {count / file_count:.2f}" for key, count in counts.items())
+            print(f"{label:>20}: {best * 1000:8.1f} ms ({file_count / best:,.0f} 파일/초), "
+                  f"파일당 호출 {sum(counts.values()) / file_count:.2f}회 ({calls})")
+
+
+if __name__ == "__main__":
+    _benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 5000)
@@ -0,0 +1,236 @@
+"""
+폴더 감시 모드 (GUI 없이 실행)
+새로 들어온 파일이 다 쓰여지면 폴더의 대표 패턴(또는 레시피)으로 이름 변경
+- QFileSystemWatcher 사용 (Linux: inotify, Windows: ReadDirectoryChangesW) → 대기 중 CPU 사용 없음
+- 연속으로 들어오는 파일은 한 번에 모아서 처리 (디바운스)
+- 크기/수정 시각이 연속으로 같을 때만 다 쓰여진 것으로 판단
+"""
+import os
+import time
+from typing import Dict, List, Optional, Set, Tuple
+
+from PyQt5.QtCore import QObject, QFileSystemWatcher, QTimer, pyqtSignal
+
+from models import FileInfo, RecipeStep, RenameRecipe
+from analysis_cache import analyze_folder
+from file_renamer import execute_rename
+from file_system import check_conflicts, validate_filename
+from pattern_analyzer import make_group_key
+from rename_recipe import apply_recipe, clusters_by_size, RecipeError
+
+
+# 폴더 변경 알림 후 이 시간 동안 추가 변경이 없으면 스캔
+DEBOUNCE_MS = 2000
+# 새 파일 크기 확인 주기
+STABLE_CHECK_MS = 1000
+# 크기/수정 시각이 이 횟수만큼 연속으로 같으면 다 쓰여진 것으로 판단
+STABLE_CHECKS = 2
+
+# 레시피를 지정하지 않으면 가장 파일이 많은 패턴으로 통일
+DEFAULT_RECIPE = RenameRecipe(name="대표 패턴", steps=[RecipeStep("select_pattern", {"rank": 0})])
+
+
+def list_file_names(folder: str) -> Set[str]:
+    """폴더의 파일 이름 집합 (하위 폴더 제외)"""
+    try:
+        with os.scandir(folder) as entries:
+            return {entry.name for entry in entries if entry.is_file()}
+    except OSError:
+        return set()
+
+
+def _log(message: str):
+    print(f"[{time.strftime('%Y-%m-%d %H:%M:%S')}] {message}", flush=True)
+
+
+class FolderWatcher(QObject):
+    """
+    폴더들을 감시하며 새 파일만 이름 변경
+
+    대표 그룹(레시피의 패턴 선택 순위에 해당하는 클러스터)에 속하는 새 파일만 바꾸고,
+    다른 제목의 파일이나 기존 파일은 건드리지 않음
+    """
+
+    file_renamed = pyqtSignal(str, str)   # (원본 경로, 새 경로)
+
+    def __init__(self, folders: List[str], recipe: Optional[RenameRecipe] = None, parent=None):
+        super().__init__(parent)
+        self.folders = [os.path.abspath(folder) for folder in folders]
+        self.recipe = recipe or DEFAULT_RECIPE
+
+        # 폴더 → 알고 있는 파일 이름 (이 목록에 없는 이름이 새 파일)
+        self._known: Dict[str, Set[str]] = {}
+        # 변경 알림을 받았지만 아직 스캔하지 않은 폴더
+        self._dirty: Set[str] = set()
+        # 다 쓰여지기를 기다리는 새 파일: 경로 → (마지막 서명, 연속 동일 횟수)
+        self._pending: Dict[str, Tuple[Optional[Tuple[int, int]], int]] = {}
+
+        self._watcher = QFileSystemWatcher(self)
+        self._watcher.directoryChanged.connect(self._on_directory_changed)
+
+        self._debounce_timer = QTimer(self)
+        self._debounce_timer.setSingleShot(True)
+        self._debounce_timer.setInterval(DEBOUNCE_MS)
+        self._debounce_timer.timeout.connect(self._scan_dirty_folders)
+
+        self._stable_timer = QTimer(self)
+        self._stable_timer.setInterval(STABLE_CHECK_MS)
+        self._stable_timer.timeout.connect(self._check_pending_files)
+
+    def start(self):
+        """감시 시작 (현재 있는 파일은 기존 파일로 간주)"""
+        for folder in self.folders:
+            if not os.path.isdir(folder):
+                _log(f"폴더를 찾을 수 없어 건너뜀: {folder}")
+                continue
+            self._known[folder] = list_file_names(folder)
+            self._watcher.addPath(folder)
+            _log(f"감시 시작: {folder} (기존 파일 {len(self._known[folder])}개)")
+
+    def stop(self):
+        self._debounce_timer.stop()
+        self._stable_timer.stop()
+        paths = self._watcher.directories()
+        if paths:
+            self._watcher.removePaths(paths)
+
+    def _on_directory_changed(self, folder: str):
+        self._dirty.add(os.path.abspath(folder))
+        self._debounce_timer.start()
+
+    def _scan_dirty_folders(self):
+        """변경된 폴더의 새 파일을 대기 목록에 추가"""
+        dirty, self._dirty = self._dirty, set()
+        for folder in dirty:
+            if folder not in self._known:
+                continue
+            current = list_file_names(folder)
+            for name in current - self._known[folder]:
+                self._pending.setdefault(os.path.join(folder, name), (None, 0))
+            self._known[folder] = current
+
+        if self._pending and not self._stable_timer.isActive():
+            self._stable_timer.start()
+
+    def _check_pending_files(self):
+        """크기가 더 이상 바뀌지 않는 새 파일을 모아 폴더별로 처리"""
+        ready: Dict[str, List[str]] = {}
+
+        for path, (previous, count) in list(self._pending.items()):
+            try:
+                st = os.stat(path)
+            except OSError:
+                # 다운로드 임시 파일 등 이미 사라진 파일
+                del self._pending[path]
+                continue
+
+            signature = (st.st_size, st.st_mtime_ns)
+            count = count + 1 if signature == previous else 0
+            if count >= STABLE_CHECKS:
+                del self._pending[path]
+                ready.setdefault(os.path.dirname(path), []).append(path)
+            else:
+                self._pending[path] = (signature, count)
+
+        if not self._pending:
+            self._stable_timer.stop()
+
+        for folder, paths in ready.items():
+            self._process_new_files(folder, paths)
+
+    def _select_targets(self, folder: str, new_paths: Set[str]) -> List[FileInfo]:
+        """폴더를 분석하고 레시피 적용 후, 대표 그룹에 속한 새 파일만 반환"""
+        _, file_infos, pattern_clusters = analyze_folder(folder)
+
+        rank = 0
+        for step in self.recipe.steps:
+            if step.action == "select_pattern":
+                rank = step.params.get("rank", 0)
+        ranked_clusters = clusters_by_size(pattern_clusters)
+        if rank >= len(ranked_clusters):
+            return []
+        target_keys = set(ranked_clusters[rank].group_keys)
+
+        # 레시피 적용 전 원래 패턴으로 대표 그룹 여부 판단
+        in_group = {
+            info.original_path for info in file_infos
+            if info.original_path in new_paths and info.pattern and make_group_key(info.pattern) in target_keys
+        }
+        renamed_infos = apply_recipe(file_infos, pattern_clusters, self.recipe)
+        return [info for info in renamed_infos if info.original_path in in_group]
+
+    def _process_new_files(self, folder: str, paths: List[str]):
+        """새 파일 이름 변경 (기존 파일과 충돌하거나 잘못된 이름은 건너뜀)"""
+        try:
+            targets = self._select_targets(folder, set(paths))
+        except RecipeError as e:
+            _log(f"{folder}: 레시피 적용 실패 - {e}")
+            return
+
+        skipped = len(paths) - len(targets)
+        if skipped:
+            _log(f"{folder}: 대표 패턴과 다른 새 파일 {skipped}개는 그대로 둠")
+
+        existing = {name.lower() for name in self._known.get(folder, set())}
+        valid_targets = []
+        for info in targets:
+            if info.original_name == info.new_name:
+                continue
+            valid, error_msg = validate_filename(info.new_name)
+            if not valid:
+                _log(f"건너뜀: {info.original_name} → {info.new_name} ({error_msg})")
+            elif info.new_name.lower() in existing and info.new_name.lower() != info.original_name.lower():
+                _log(f"건너뜀: {info.original_name} → {info.new_name} (같은 이름의 파일이 있음)")
+            else:
+                valid_targets.append(info)
+
+        no_conflict, conflicts = check_conflicts(valid_targets)
+        if not no_conflict:
+            _log(f"{folder}: 새 파일끼리 이름 충돌 - {', '.join(conflicts)}")
+            valid_targets = [info for info in valid_targets if info.new_name not in conflicts]
+
+        results = execute_rename(valid_targets)
+        known = self._known.setdefault(folder, set())
+        for info, (success, name, msg) in zip(valid_targets, results):
+            if success:
+                # 바뀐 이름이 다시 새 파일로 잡히지 않도록 바로 반영
+                known.discard(info.original_name)
+                known.add(info.new_name)
+                _log(f"변경: {info.original_name} → {info.new_name}")
+                self.file_renamed.emit(info.original_path, info.new_path)
+            else:
+                _log(f"실패: {name} ({msg})")
+
+
+def run_watch_mode(folders: List[str], recipe_name: Optional[str] = None) -> int:
+    """
+    GUI 없이 감시 모드 실행 (Ctrl+C로 종료)
+
+    Returns:
+        종료 코드
+    """
+    import signal
+    import sys
+    from PyQt5.QtCore import QCoreApplication
+    from rename_recipe import get_recipe
+
+    recipe = None
+    if recipe_name:
+        recipe = get_recipe(recipe_name)
+        if recipe is None:
+            print(f"레시피를 찾을 수 없습니다: {recipe_name}")
+            return 1
+
+    app = QCoreApplication(sys.argv)
+    watcher = FolderWatcher(folders, recipe)
+    watcher.start()
+
+    # Ctrl+C 처리: Qt 이벤트 루프 안에서도 파이썬 시그널 처리기가 실행되도록 주기적으로 깨움
+    signal.signal(signal.SIGINT, lambda *_: app.quit())
+    wake_timer = QTimer()
+    wake_timer.start(1000)
+    wake_timer.timeout.connect(lambda: None)
+
+    exit_code = app.exec_()
+    watcher.stop()
+    return exit_code
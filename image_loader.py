@@ -1,105 +1,194 @@
 """
-ZIP 압축 파일에서 표지 이미지 추출
+압축 파일에서 표지 이미지 추출
+ZIP/CBZ, RAR/CBR, 7Z/CB7, 이미지 폴더 지원 (archive_reader 참고)
 """
-import zipfile
 from io import BytesIO
 from PIL import Image
 from typing import Optional
-import re
 
+from archive_reader import (
+    ArchiveError, get_reader, is_supported_archive,
+    is_image_file, natural_sort_key  # noqa: F401 (기존 import 경로 유지)
+)
+from archive_cache import ThumbnailCache, get_index_cache, get_thumbnail_cache
+from file_system import file_signature
+from io_scheduler import PRIORITY_VISIBLE, io_slot
 
-def natural_sort_key(filename: str):
+
+def decode_cover(img_data: bytes, max_size: tuple) -> Image.Image:
     """
-    자연스러운 정렬을 위한 키 생성
-    예: "001.jpg", "002.jpg", "010.jpg" 순서로 정렬
+    이미지 데이터를 RGB/L 썸네일로 변환
+
+    Args:
+        img_data: 이미지 파일 데이터
+        max_size: 최대 크기 (width, height)
     """
-    parts = re.split(r'(\d+)', filename)
-    return [int(part) if part.isdigit() else part.lower() for part in parts]
+    img = Image.open(BytesIO(img_data))
 
+    # 큰 JPEG은 디코딩 단계에서 축소 (전체 해상도로 풀지 않음)
+    img.draft('RGB', max_size)
 
-def is_image_file(filename: str) -> bool:
-    """이미지 파일 여부 확인"""
-    image_extensions = ('.jpg', '.jpeg', '.png', '.gif', '.bmp', '.webp')
-    return filename.lower().endswith(image_extensions)
+    # RGB 변환 (RGBA, P 모드 등 처리)
+    if img.mode == 'RGBA':
+        # RGBA -> RGB 변환 (투명도 제거)
+        background = Image.new('RGB', img.size, (255, 255, 255))
+        background.paste(img, mask=img.split()[3])  # Alpha 채널을 마스크로 사용
+        img = background
+    elif img.mode not in ('RGB', 'L'):
+        img = img.convert('RGB')
 
+    # 썸네일 생성 (비율 유지)
+    img.thumbnail(max_size, Image.Resampling.LANCZOS)
 
-def extract_cover_from_zip(zip_path: str, max_size: tuple = (500, 700)) -> Optional[Image.Image]:
+    return img
+
+
+def extract_cover(
+    archive_path: str,
+    max_size: tuple = (500, 700),
+    priority: int = PRIORITY_VISIBLE
+) -> Optional[Image.Image]:
     """
-    ZIP 파일에서 첫 번째 이미지 추출 및 썸네일 생성
+    압축 파일(또는 이미지 폴더)에서 첫 번째 이미지 추출 및 썸네일 생성
+    형식과 관계없이 표지 항목 인덱스와 썸네일을 캐시에 저장
 
     Args:
-        zip_path: ZIP 파일 경로
+        archive_path: 압축 파일 경로
         max_size: 최대 크기 (width, height)
+        priority: 압축 파일을 읽을 때의 I/O 우선순위 (io_scheduler.PRIORITY_*)
 
     Returns:
         PIL.Image 또는 None (실패 시)
     """
+    signature = file_signature(archive_path)
+    if signature is None:
+        return None
+
+    # 1. 썸네일 캐시 확인
+    thumbnail_cache = get_thumbnail_cache()
+    thumbnail_key = ThumbnailCache.make_key(archive_path, signature, max_size)
+    cached_img = thumbnail_cache.get(thumbnail_key)
+    if cached_img is not None:
+        return cached_img
+
+    reader = get_reader(archive_path)
+    if reader is None:
+        # 지원하지 않는 형식이거나 필요한 프로그램이 없음
+        return None
+
     try:
-        with zipfile.ZipFile(zip_path, 'r') as zf:
-            # 파일 목록 가져오기 및 정렬
-            file_list = sorted(zf.namelist(), key=natural_sort_key)
-
-            # 첫 번째 이미지 파일 찾기
-            for filename in file_list:
-                # 디렉토리 제외
-                if filename.endswith('/'):
-                    continue
-
-                # 숨김 파일 제외 (맥OS의 __MACOSX 등)
-                if '/__MACOSX/' in filename or filename.startswith('.'):
-                    continue
-
-                # Thumbs.db 등 시스템 파일 제외
-                if 'Thumbs.db' in filename or '.DS_Store' in filename:
-                    continue
-
-                # 이미지 파일 확인
-                if is_image_file(filename):
-                    # 이미지 데이터 읽기
-                    img_data = zf.read(filename)
-
-                    # PIL Image 생성
-                    img = Image.open(BytesIO(img_data))
-
-                    # RGB 변환 (RGBA, P 모드 등 처리)
-                    if img.mode == 'RGBA':
-                        # RGBA -> RGB 변환 (투명도 제거)
-                        background = Image.new('RGB', img.size, (255, 255, 255))
-                        background.paste(img, mask=img.split()[3])  # Alpha 채널을 마스크로 사용
-                        img = background
-                    elif img.mode not in ('RGB', 'L'):
-                        img = img.convert('RGB')
-
-                    # 썸네일 생성 (비율 유지)
-                    img.thumbnail(max_size, Image.Resampling.LANCZOS)
-
-                    return img
-
-            # 이미지를 찾지 못함
-            return None
-
-    except zipfile.BadZipFile:
-        # 손상된 ZIP 파일
-        print(f"BadZipFile: {zip_path}")
+        # 압축 파일 읽기만 I/O 칸을 차지 (디코딩은 칸을 반납한 뒤)
+        with io_slot(archive_path, priority), reader:
+            # 2. 표지 항목 인덱스 확인 (없으면 목록을 훑어서 찾기)
+            index_cache = get_index_cache()
+            cover_member = index_cache.get_cover_member(archive_path, signature)
+            if cover_member is None:
+                cover_member = reader.first_image_member()
+                if cover_member is None:
+                    # 이미지를 찾지 못함
+                    return None
+                index_cache.set_cover_member(archive_path, signature, cover_member)
+
+            # 3. 표지 항목 하나만 읽어서 디코딩
+            img_data = reader.read_member(cover_member)
+
+        img = decode_cover(img_data, max_size)
+        thumbnail_cache.put(thumbnail_key, img)
+        return img
+
+    except ArchiveError as e:
+        # 손상된 압축 파일
+        print(f"{e}: {archive_path}")
         return None
     except Exception as e:
         # 기타 오류
-        print(f"Error loading image from {zip_path}: {e}")
+        print(f"Error loading image from {archive_path}: {e}")
         return None
 
 
+def extract_cover_from_zip(
+    zip_path: str,
+    max_size: tuple = (500, 700),
+    priority: int = PRIORITY_VISIBLE
+) -> Optional[Image.Image]:
+    """
+    압축 파일에서 첫 번째 이미지 추출 및 썸네일 생성
+    (기존 이름 유지, ZIP 외 형식도 처리)
+
+    Args:
+        zip_path: 압축 파일 경로
+        max_size: 최대 크기 (width, height)
+        priority: I/O 우선순위 (io_scheduler.PRIORITY_*)
+
+    Returns:
+        PIL.Image 또는 None (실패 시)
+    """
+    return extract_cover(zip_path, max_size, priority)
+
+
 def get_first_zip_file(file_paths: list) -> Optional[str]:
     """
-    파일 목록에서 첫 번째 ZIP 파일의 경로 반환
+    파일 목록에서 첫 번째 압축 파일의 경로 반환
 
     Args:
         file_paths: 파일 경로 목록 (이미 자연스럽게 정렬됨)
 
     Returns:
-        ZIP 파일 전체 경로 또는 None
+        압축 파일 전체 경로 또는 None
     """
     for file_path in file_paths:
-        if file_path.lower().endswith('.zip'):
+        if is_supported_archive(file_path):
             return file_path
 
     return None
+
+
+def _benchmark(folder: Optional[str] = None, archive_count: int = 300, repeat: int = 3):
+    """
+    일반 ZIP 읽기와 메모리 매핑 읽기의 표지 추출 시간 비교 (python image_loader.py [폴더])
+    폴더를 지정하지 않으면 임시 폴더에 이미지 40장짜리 ZIP을 archive_count개 만들어 측정
+    (디코딩/캐시는 제외하고 항목 목록 + 표지 항목 읽기만 측정)
+    """
+    import os
+    import tempfile
+    import time
+    import zipfile
+    from archive_reader import ZipArchiveReader, MappedZipArchiveReader
+
+    temp_dir = None
+    if folder is None:
+        temp_dir = tempfile.TemporaryDirectory()
+        folder = temp_dir.name
+        page = os.urandom(300 * 1024)
+        for i in range(archive_count):
+            with zipfile.ZipFile(os.path.join(folder, f"vol{i:03d}.zip"), "w") as zip_file:
+                for page_number in range(40):
+                    compression = zipfile.ZIP_DEFLATED if page_number % 2 else zipfile.ZIP_STORED
+                    zip_file.writestr(f"{page_number:03d}.jpg", page, compress_type=compression)
+
+    paths = [
+        os.path.join(folder, name) for name in sorted(os.listdir(folder))
+        if name.lower().endswith(ZipArchiveReader.extensions)
+    ]
+
+    print(f"압축 파일 {len(paths)}개, {repeat}회 반복")
+    for reader_cls in (ZipArchiveReader, MappedZipArchiveReader):
+        best = None
+        for _ in range(repeat):
+            start = time.perf_counter()
+            for path in paths:
+                with reader_cls(path) as reader:
+                    member = reader.first_image_member()
+                    if member is not None:
+                        reader.read_member(member)
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        print(f"{reader_cls.__name__:>24}: {best * 1000:8.1f} ms ({best / max(len(paths), 1) * 1e6:.0f} us/파일)")
+
+    if temp_dir is not None:
+        temp_dir.cleanup()
+
+
+if __name__ == "__main__":
+    import sys
+    _benchmark(sys.argv[1] if len(sys.argv) > 1 else None)
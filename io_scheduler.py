@@ -0,0 +1,252 @@
+"""
+우선순위 I/O 스케줄러 (표지 표시, 화면의 행, 미리 읽기, 전체 작업이 같은 디스크를 나눠 씀)
+- 우선순위: 대화형(선택한 표지) > 화면에 보이는 항목 > 미리 읽기 > 전체 작업(검사/해시/썸네일 생성)
+- 장치(마운트)마다 동시에 읽는 수를 제한하고, 대기 중인 요청은 높은 우선순위부터 허가
+- 대화형 요청은 장치 제한보다 한 칸 더 쓸 수 있어 전체 작업이 칸을 모두 차지해도 바로 시작
+- 오래 읽는 작업은 checkpoint()에서 더 높은 우선순위 요청이 기다리면 칸을 양보했다가 다시 받음
+- 우선순위별 대기 수, 실행 수, 대기 시간 통계 제공
+"""
+import os
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Deque, Dict, List, Optional
+
+
+PRIORITY_INTERACTIVE = 0
+PRIORITY_VISIBLE = 1
+PRIORITY_PREFETCH = 2
+PRIORITY_BULK = 3
+
+PRIORITY_NAMES = {
+    PRIORITY_INTERACTIVE: "대화형",
+    PRIORITY_VISIBLE: "화면 표시",
+    PRIORITY_PREFETCH: "미리 읽기",
+    PRIORITY_BULK: "전체 작업",
+}
+
+# 장치 하나에서 동시에 읽는 최대 수 (SSD 기준, HDD는 1~2 권장)
+DEFAULT_DEVICE_CONCURRENCY = 4
+# 대화형 요청만 쓸 수 있는 추가 칸
+INTERACTIVE_RESERVED_SLOTS = 1
+
+
+@dataclass
+class IoClassStats:
+    """우선순위 하나의 통계"""
+    waiting: int = 0           # 지금 대기 중인 요청 수
+    running: int = 0           # 지금 실행 중인 요청 수
+    granted: int = 0           # 지금까지 허가한 요청 수
+    yielded: int = 0           # 더 높은 우선순위에 양보한 횟수
+    total_wait: float = 0.0    # 누적 대기 시간 (초)
+    max_wait: float = 0.0      # 가장 오래 기다린 시간 (초)
+
+    @property
+    def average_wait(self) -> float:
+        return self.total_wait / self.granted if self.granted else 0.0
+
+
+class _Request:
+    __slots__ = ("device", "priority", "queued_at", "granted")
+
+    def __init__(self, device: object, priority: int):
+        self.device = device
+        self.priority = priority
+        self.queued_at = time.monotonic()
+        self.granted = False
+
+
+class _Device:
+    """장치 하나의 실행 수와 우선순위별 대기열"""
+
+    def __init__(self):
+        self.running = 0
+        self.waiting: List[Deque[_Request]] = [deque() for _ in PRIORITY_NAMES]
+
+    def highest_waiting(self) -> Optional[int]:
+        for priority, queue in enumerate(self.waiting):
+            if queue:
+                return priority
+        return None
+
+
+class IoTicket:
+    """
+    허가된 I/O 칸 (with 문 또는 release()로 반납)
+    """
+
+    def __init__(self, scheduler: "IoScheduler", device: object, priority: int):
+        self._scheduler = scheduler
+        self.device = device
+        self.priority = priority
+        self._released = False
+
+    def checkpoint(self):
+        """더 높은 우선순위 요청이 같은 장치에서 기다리면 칸을 양보하고 다시 받을 때까지 대기"""
+        if not self._released:
+            self._scheduler._checkpoint(self)
+
+    def release(self):
+        if not self._released:
+            self._released = True
+            self._scheduler._release(self.device, self.priority)
+
+    def __enter__(self) -> "IoTicket":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.release()
+
+
+class IoScheduler:
+    """
+    장치별 동시 I/O 수를 제한하는 우선순위 스케줄러
+    읽기 자체는 호출한 스레드가 하고, 스케줄러는 언제 시작할지만 정함
+    """
+
+    def __init__(self, device_concurrency: int = DEFAULT_DEVICE_CONCURRENCY):
+        self.device_concurrency = max(1, device_concurrency)
+        self._condition = threading.Condition()
+        self._devices: Dict[object, _Device] = {}
+        self._stats: Dict[int, IoClassStats] = {priority: IoClassStats() for priority in PRIORITY_NAMES}
+        # 폴더 -> 장치 (같은 폴더의 파일은 stat을 다시 하지 않음)
+        self._device_by_dir: Dict[str, object] = {}
+
+    def device_of(self, path: str) -> object:
+        """경로가 있는 장치 (알 수 없으면 드라이브 이름)"""
+        directory = os.path.dirname(os.path.abspath(path))
+        device = self._device_by_dir.get(directory)
+        if device is None:
+            try:
+                device = os.stat(directory).st_dev
+            except OSError:
+                device = os.path.splitdrive(directory)[0]
+            self._device_by_dir[directory] = device
+        return device
+
+    def _limit(self, priority: int) -> int:
+        if priority == PRIORITY_INTERACTIVE:
+            return self.device_concurrency + INTERACTIVE_RESERVED_SLOTS
+        return self.device_concurrency
+
+    def _can_start(self, device: _Device, request: _Request) -> bool:
+        """더 높은 우선순위 대기가 없고, 같은 우선순위에서 맨 앞이며, 칸이 남았는지"""
+        if device.running >= self._limit(request.priority):
+            return False
+        if device.waiting[request.priority][0] is not request:
+            return False
+        return all(not device.waiting[priority] for priority in range(request.priority))
+
+    def acquire(self, path: str, priority: int = PRIORITY_BULK, blocking: bool = True) -> Optional[IoTicket]:
+        """
+        I/O 칸 요청 (칸이 날 때까지 대기)
+
+        Args:
+            path: 읽을 파일 경로 (장치 구분용)
+            priority: PRIORITY_* 값
+            blocking: False이면 바로 시작할 수 없을 때 None 반환
+
+        Returns:
+            IoTicket (blocking=False에서 허가되지 않으면 None)
+        """
+        device_key = self.device_of(path)
+        with self._condition:
+            request = self._enqueue(device_key, priority)
+            if not self._wait_turn(request, blocking):
+                return None
+        return IoTicket(self, device_key, priority)
+
+    def _enqueue(self, device_key: object, priority: int) -> _Request:
+        device = self._devices.setdefault(device_key, _Device())
+        request = _Request(device_key, priority)
+        device.waiting[priority].append(request)
+        self._stats[priority].waiting += 1
+        return request
+
+    def _wait_turn(self, request: _Request, blocking: bool) -> bool:
+        """대기열의 요청이 시작할 수 있을 때까지 대기 (_condition을 잡은 상태에서 호출)"""
+        device = self._devices[request.device]
+        stats = self._stats[request.priority]
+        while not self._can_start(device, request):
+            if not blocking:
+                device.waiting[request.priority].remove(request)
+                stats.waiting -= 1
+                # 뒤에 있던 요청이 시작할 수 있게 됐을 수 있음
+                self._condition.notify_all()
+                return False
+            self._condition.wait()
+
+        device.waiting[request.priority].popleft()
+        device.running += 1
+        waited = time.monotonic() - request.queued_at
+        stats.waiting -= 1
+        stats.running += 1
+        stats.granted += 1
+        stats.total_wait += waited
+        stats.max_wait = max(stats.max_wait, waited)
+        # 같은 장치에서 다음 요청도 시작할 수 있는지 확인하도록 깨움
+        self._condition.notify_all()
+        return True
+
+    def _release(self, device_key: object, priority: int):
+        with self._condition:
+            self._devices[device_key].running -= 1
+            self._stats[priority].running -= 1
+            self._condition.notify_all()
+
+    def _checkpoint(self, ticket: IoTicket):
+        with self._condition:
+            device = self._devices[ticket.device]
+            higher = device.highest_waiting()
+            if higher is None or higher >= ticket.priority:
+                return
+            # 칸을 반납하고 같은 우선순위 대기열 맨 앞에서 다시 기다림
+            device.running -= 1
+            stats = self._stats[ticket.priority]
+            stats.running -= 1
+            stats.yielded += 1
+            request = _Request(ticket.device, ticket.priority)
+            device.waiting[ticket.priority].appendleft(request)
+            stats.waiting += 1
+            self._condition.notify_all()
+            self._wait_turn(request, True)
+
+    def snapshot(self) -> Dict[int, IoClassStats]:
+        """우선순위별 통계 복사본"""
+        with self._condition:
+            return {priority: IoClassStats(**vars(stats)) for priority, stats in self._stats.items()}
+
+    def queue_depth(self) -> int:
+        """전체 대기 중인 요청 수"""
+        with self._condition:
+            return sum(stats.waiting for stats in self._stats.values())
+
+
+def format_io_stats(stats: Dict[int, IoClassStats]) -> str:
+    """통계를 읽기 쉬운 여러 줄 문자열로 변환"""
+    lines = []
+    for priority, item in sorted(stats.items()):
+        lines.append(
+            f"{PRIORITY_NAMES[priority]}: 대기 {item.waiting}, 실행 {item.running}, 처리 {item.granted}, "
+            f"양보 {item.yielded}, 평균 대기 {item.average_wait * 1000:.1f}ms, 최대 대기 {item.max_wait * 1000:.1f}ms"
+        )
+    return "\n".join(lines)
+
+
+_scheduler: Optional[IoScheduler] = None
+_init_lock = threading.Lock()
+
+
+def get_io_scheduler() -> IoScheduler:
+    """공용 I/O 스케줄러 (프로세스당 하나)"""
+    global _scheduler
+    with _init_lock:
+        if _scheduler is None:
+            _scheduler = IoScheduler()
+        return _scheduler
+
+
+def io_slot(path: str, priority: int = PRIORITY_BULK) -> IoTicket:
+    """공용 스케줄러에서 I/O 칸 받기 (with io_slot(path, PRIORITY_VISIBLE): ...)"""
+    return get_io_scheduler().acquire(path, priority)
@@ -3,22 +3,37 @@ GUI 메인 윈도우
 """
 import os
 import copy
+import re
 from PyQt5.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
-    QLabel, QRadioButton, QButtonGroup, QTableWidget, QTableWidgetItem,
-    QFileDialog, QLineEdit, QMessageBox, QHeaderView, QSplitter, QCheckBox
+    QLabel, QRadioButton, QButtonGroup,
+    QFileDialog, QLineEdit, QMessageBox, QSplitter, QCheckBox,
+    QStackedWidget, QAction, QInputDialog
 )
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, QTimer
 from PyQt5.QtGui import QFont
-from typing import List, Optional
-
-from models import FilePattern, FileInfo
-from pattern_analyzer import analyze_files, extract_pattern
-from file_renamer import apply_pattern, remove_text, add_text, execute_rename, apply_custom_pattern
-from file_system import get_files_in_folder, check_conflicts, validate_filename, get_first_archive_file
+from typing import Dict, List, Optional, Set, Tuple
+
+from models import FilePattern, FileInfo, PatternCluster, RecipeStep, RenameRecipe, ComicMetadata, changed_rows
+from pattern_analyzer import extract_pattern, cluster_rows
+from analysis_cache import analyze_folder, analyze_paths
+from file_renamer import (
+    apply_pattern, remove_text, add_text, execute_rename, apply_custom_pattern, build_custom_template,
+    regex_replace, compile_find_pattern
+)
+from file_system import check_conflicts, validate_filename, get_first_archive_file
 from cover_image_widget import CoverImageWidget
+from cover_gallery_widget import CoverGalleryWidget
 from image_loader import extract_cover_from_zip
+from io_scheduler import PRIORITY_INTERACTIVE, get_io_scheduler, format_io_stats
+from archive_reader import is_supported_archive
 from preview_table_widget import PreviewTableWidget
+from background_tasks import TaskThread
+from numbering_analyzer import NumberingIndex
+from rename_recipe import save_recipe, load_recipes, pattern_rank
+from comic_metadata import load_comic_metadata, find_volume_mismatches
+from session_store import WorkspaceSession, save_session, load_session, clear_session, collect_edits, apply_edits
+from duplicate_finder import find_duplicates, duplicate_statuses, exclude_from_rename
 
 
 class MainWindow(QMainWindow):
@@ -26,6 +41,10 @@ class MainWindow(QMainWindow):
         super().__init__()
         self.file_infos: List[FileInfo] = []
         self.representative_patterns: List[FilePattern] = []
+        self.pattern_clusters: List[PatternCluster] = []
+        # 패턴 그룹(클러스터)별 행 번호 목록, 행 → 클러스터 번호 (선택한 파일의 그룹에만 적용할 때 사용)
+        self.cluster_row_lists: List[List[int]] = []
+        self.row_clusters: List[int] = []
         self.selected_pattern: Optional[FilePattern] = None
         self.current_folder: str = ""
 
@@ -34,12 +53,39 @@ class MainWindow(QMainWindow):
         self.previous_file_infos_add: Optional[List[FileInfo]] = None
         self.previous_file_infos_pattern: Optional[List[FileInfo]] = None
         self.previous_pattern_text: Optional[str] = None  # 패턴 편집 이전 텍스트
+        self.last_remove_action: str = "remove_text"  # 제거 취소 시 작업 기록에서 뺄 작업 종류
+
+        # 레시피 저장용 작업 기록 (적용한 순서대로)
+        self.recipe_steps: List[RecipeStep] = []
 
         # 이미지 캐시 (파일 경로 -> PIL.Image)
         self.image_cache = {}
 
+        # 파일별 상태 표시 (원본 경로 -> {검사 종류: 메시지})
+        self.file_status: Dict[str, Dict[str, str]] = {}
+
+        # 권수 번호 분석 인덱스 (누락/중복 번호)
+        self.numbering_index = NumberingIndex()
+
+        # ComicInfo.xml 메타데이터 (원본 경로 -> 메타데이터)
+        self.comic_metadata: Dict[str, ComicMetadata] = {}
+
+        # 실행 중인 백그라운드 작업
+        self.similarity_task: Optional[TaskThread] = None
+        self.verify_task: Optional[TaskThread] = None
+        self.metadata_task: Optional[TaskThread] = None
+        self.prewarm_task: Optional[TaskThread] = None
+        self.member_rename_task: Optional[TaskThread] = None
+        self.duplicate_task: Optional[TaskThread] = None
+
+        # 이름 변경에서 제외한 파일 (중복 파일 검사에서 제외를 선택한 원본 경로)
+        self.excluded_paths: Set[str] = set()
+
         self.init_ui()
 
+        # 창이 표시된 뒤 마지막 작업 상태 복원
+        QTimer.singleShot(0, self.restore_session)
+
     def init_ui(self):
         """UI 초기화"""
         self.setWindowTitle("Comic SmartRenamer v1.0")
@@ -49,6 +95,9 @@ class MainWindow(QMainWindow):
         app_font = QFont("맑은 고딕", 10)
         self.setFont(app_font)
 
+        # 메뉴 (검사/도구 기능)
+        self.create_menus()
+
         # 중앙 위젯
         central_widget = QWidget()
         self.setCentralWidget(central_widget)
@@ -121,16 +170,28 @@ class MainWindow(QMainWindow):
         self.preview_all_covers_checkbox.setChecked(True)  # 기본값: 켜짐
         self.preview_all_covers_checkbox.stateChanged.connect(self.on_preview_option_changed)
 
+        # 갤러리 보기 (폴더 전체 표지를 격자로 표시)
+        self.gallery_view_checkbox = QCheckBox("표지 갤러리 보기")
+        self.gallery_view_checkbox.setFont(QFont("맑은 고딕", 10))
+        self.gallery_view_checkbox.setChecked(False)
+        self.gallery_view_checkbox.stateChanged.connect(self.on_gallery_option_changed)
+
         preview_option_layout.addWidget(self.preview_all_covers_checkbox)
+        preview_option_layout.addWidget(self.gallery_view_checkbox)
         preview_option_layout.addStretch()
         main_layout.addLayout(preview_option_layout, 0)  # stretch=0: 고정 크기
 
         # 3. 이미지 + 컨텐츠 영역 (QSplitter 사용) - 가변 영역
         content_splitter = QSplitter(Qt.Horizontal)
 
-        # 3-1. 왼쪽: 표지 이미지
+        # 3-1. 왼쪽: 표지 이미지 / 표지 갤러리 (전환)
+        self.cover_stack = QStackedWidget()
         self.cover_image_widget = CoverImageWidget()
-        content_splitter.addWidget(self.cover_image_widget)
+        self.cover_gallery_widget = CoverGalleryWidget()
+        self.cover_gallery_widget.row_selected.connect(self.on_gallery_row_selected)
+        self.cover_stack.addWidget(self.cover_image_widget)
+        self.cover_stack.addWidget(self.cover_gallery_widget)
+        content_splitter.addWidget(self.cover_stack)
 
         # 3-2. 오른쪽: 패턴 선택 + 미리보기 테이블
         right_widget = QWidget()
@@ -170,6 +231,26 @@ class MainWindow(QMainWindow):
         preview_label = QLabel("미리보기 :")
         preview_label.setFont(QFont("맑은 고딕", 10, QFont.Bold))  # 제목 강조
         preview_header_layout.addWidget(preview_label)
+
+        # 검색 (원본/새 파일명, 입력할 때마다 바로 반영)
+        self.filter_input = QLineEdit()
+        self.filter_input.setPlaceholderText("🔍 파일명 검색")
+        self.filter_input.setClearButtonEnabled(True)
+        self.filter_input.setMinimumHeight(30)
+        self.filter_input.setMaximumWidth(300)
+        self.filter_input.setFont(QFont("맑은 고딕", 10))
+        self.filter_input.textChanged.connect(self.apply_preview_filter)
+        preview_header_layout.addWidget(self.filter_input)
+
+        self.changed_only_checkbox = QCheckBox("바뀐 파일만")
+        self.changed_only_checkbox.setFont(QFont("맑은 고딕", 10))
+        self.changed_only_checkbox.stateChanged.connect(self.apply_preview_filter)
+        preview_header_layout.addWidget(self.changed_only_checkbox)
+
+        self.filter_count_label = QLabel("")
+        self.filter_count_label.setFont(QFont("맑은 고딕", 9))
+        self.filter_count_label.setStyleSheet("color: #6c757d;")
+        preview_header_layout.addWidget(self.filter_count_label)
         preview_header_layout.addStretch()
 
         # 초기화 버튼 추가
@@ -203,20 +284,14 @@ class MainWindow(QMainWindow):
         right_layout.addLayout(preview_header_layout, 0)  # stretch=0: 고정
 
         # 드래그 앤 드롭을 지원하는 커스텀 테이블 위젯 사용
+        # (열: 원본 파일명, 변경될 파일명, 번호, 상태 - 열 제목을 누르면 정렬)
         self.preview_table = PreviewTableWidget()
-        self.preview_table.setColumnCount(2)
-        self.preview_table.setHorizontalHeaderLabels(["원본 파일명", "변경될 파일명"])
-        self.preview_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
-
-        # 테이블 편집 불가능하도록 설정
-        self.preview_table.setEditTriggers(QTableWidget.NoEditTriggers)
 
         # 개선 3: 테이블 행 높이 증가
         self.preview_table.verticalHeader().setDefaultSectionSize(35)
 
-        # 테이블 선택 이벤트 연결 (마우스 클릭 + 키보드 방향키)
-        self.preview_table.itemClicked.connect(self.on_table_item_clicked)
-        self.preview_table.currentItemChanged.connect(self.on_table_current_item_changed)
+        # 테이블 선택 이벤트 연결 (마우스 클릭 + 키보드 방향키, 정렬/검색과 무관하게 file_infos 인덱스)
+        self.preview_table.file_selected.connect(self.update_cover_for_row)
 
         # 드래그 앤 드롭 이벤트 연결
         self.preview_table.folder_dropped.connect(self.on_folder_dropped)
@@ -237,9 +312,31 @@ class MainWindow(QMainWindow):
         main_layout.addWidget(content_splitter, 1)  # stretch=1: 세로 확장
 
         # 4. 추가 편집 영역 (고정 크기)
+        edit_header_layout = QHBoxLayout()
+        edit_header_layout.setSpacing(10)
+        edit_header_layout.setContentsMargins(0, 0, 0, 0)
+
         edit_label = QLabel("추가 편집 :")
         edit_label.setFont(QFont("맑은 고딕", 10, QFont.Bold))
-        main_layout.addWidget(edit_label, 0)
+        edit_header_layout.addWidget(edit_label)
+        edit_header_layout.addStretch()
+
+        # 적용 대상 (패턴 선택/자릿수/제거/추가/패턴 편집 공통)
+        scope_label = QLabel("적용 대상 :")
+        scope_label.setFont(QFont("맑은 고딕", 10, QFont.Bold))
+        edit_header_layout.addWidget(scope_label)
+
+        self.scope_button_group = QButtonGroup()
+        self.scope_all_radio = QRadioButton("전체 파일")
+        self.scope_selected_radio = QRadioButton("선택한 파일")
+        self.scope_group_radio = QRadioButton("선택한 파일의 패턴 그룹")
+        self.scope_all_radio.setChecked(True)
+        for radio in (self.scope_all_radio, self.scope_selected_radio, self.scope_group_radio):
+            radio.setFont(QFont("맑은 고딕", 10))
+            self.scope_button_group.addButton(radio)
+            edit_header_layout.addWidget(radio)
+
+        main_layout.addLayout(edit_header_layout, 0)
 
         # 편집 영역 전체 컨테이너
         edit_container = QWidget()
@@ -423,10 +520,29 @@ class MainWindow(QMainWindow):
             }
         """)
 
+        # 바꿀 내용 (비우면 제거, 정규식이면 \1 등 캡처 그룹 사용 가능)
+        replace_label = QLabel(" → ")
+        replace_label.setFont(QFont("맑은 고딕", 10, QFont.Bold))
+        replace_label.setStyleSheet("border: none; background: transparent;")
+
+        self.replace_input = QLineEdit()
+        self.replace_input.setPlaceholderText("바꿀 내용 (비우면 제거)")
+        self.replace_input.setMinimumHeight(35)
+        self.replace_input.setFont(QFont("맑은 고딕", 10))
+        self.replace_input.setStyleSheet(self.remove_input.styleSheet())
+
         remove_input_inner_layout.addWidget(remove_label)
         remove_input_inner_layout.addWidget(self.remove_input, 1)
+        remove_input_inner_layout.addWidget(replace_label)
+        remove_input_inner_layout.addWidget(self.replace_input, 1)
         remove_input_container.setLayout(remove_input_inner_layout)
 
+        # 정규식 / 대소문자 무시 옵션
+        self.regex_checkbox = QCheckBox("정규식")
+        self.regex_checkbox.setFont(QFont("맑은 고딕", 10))
+        self.ignore_case_checkbox = QCheckBox("대소문자 무시")
+        self.ignore_case_checkbox.setFont(QFont("맑은 고딕", 10))
+
         # 전체/앞/뒤 선택
         self.remove_all_radio = QRadioButton("전체")
         self.remove_front_radio = QRadioButton("앞")
@@ -453,8 +569,23 @@ class MainWindow(QMainWindow):
         remove_position_layout.addWidget(self.remove_all_radio)
         remove_position_layout.addWidget(self.remove_front_radio)
         remove_position_layout.addWidget(self.remove_back_radio)
+        remove_position_layout.addWidget(self.regex_checkbox)
+        remove_position_layout.addWidget(self.ignore_case_checkbox)
         remove_position_widget.setLayout(remove_position_layout)
 
+        # 입력 중 실시간 미리보기 (입력이 멈추면 한 번만 계산)
+        self.replace_preview_timer = QTimer(self)
+        self.replace_preview_timer.setSingleShot(True)
+        self.replace_preview_timer.setInterval(200)
+        self.replace_preview_timer.timeout.connect(self.update_replace_preview)
+        self.remove_input.textChanged.connect(self.replace_preview_timer.start)
+        self.replace_input.textChanged.connect(self.replace_preview_timer.start)
+        self.regex_checkbox.stateChanged.connect(self.replace_preview_timer.start)
+        self.ignore_case_checkbox.stateChanged.connect(self.replace_preview_timer.start)
+        for radio in (self.remove_all_radio, self.remove_front_radio, self.remove_back_radio,
+                      self.scope_selected_radio, self.scope_group_radio):
+            radio.toggled.connect(self.replace_preview_timer.start)
+
         self.remove_button = QPushButton("✔️ 적용")
         self.remove_button.setMinimumHeight(35)
         self.remove_button.setStyleSheet("""
@@ -679,6 +810,7 @@ class MainWindow(QMainWindow):
 
         self.pattern_edit_input = QLineEdit()
         self.pattern_edit_input.setPlaceholderText("패턴 선택 후 편집")
+        self.pattern_edit_input.setToolTip("ComicInfo 메타데이터를 읽은 후에는 {series} {volume:02d}권 처럼 필드를 넣을 수 있습니다.")
         self.pattern_edit_input.setMinimumHeight(35)
         self.pattern_edit_input.setFont(QFont("맑은 고딕", 10))
         self.pattern_edit_input.setStyleSheet("""
@@ -697,8 +829,17 @@ class MainWindow(QMainWindow):
             }
         """)
 
+        # 번호가 없는 파일에도 적용 (기본은 건너뜀)
+        self.include_unnumbered_checkbox = QCheckBox("번호 없는 파일 포함")
+        self.include_unnumbered_checkbox.setFont(QFont("맑은 고딕", 10))
+        self.include_unnumbered_checkbox.setToolTip(
+            "파일명에서 번호를 찾지 못한 파일에도 패턴을 적용합니다.\n"
+            "번호나 메타데이터 필드가 없는 패턴은 모든 파일이 같은 이름이 됩니다."
+        )
+
         pattern_edit_input_inner_layout.addWidget(pattern_edit_label)
         pattern_edit_input_inner_layout.addWidget(self.pattern_edit_input, 1)
+        pattern_edit_input_inner_layout.addWidget(self.include_unnumbered_checkbox)
         pattern_edit_input_container.setLayout(pattern_edit_input_inner_layout)
 
         self.pattern_edit_button = QPushButton("✔️ 적용")
@@ -795,6 +936,167 @@ class MainWindow(QMainWindow):
         button_container.setLayout(button_layout)
         main_layout.addWidget(button_container, 0)
 
+    def create_menus(self):
+        """메뉴 생성"""
+        tools_menu = self.menuBar().addMenu("도구")
+
+        self.cover_similarity_action = QAction("표지 유사도 검사 (중복/번호 오류)", self)
+        self.cover_similarity_action.triggered.connect(self.run_cover_similarity_check)
+        tools_menu.addAction(self.cover_similarity_action)
+
+        self.duplicate_action = QAction("중복 파일 찾기 (내용 비교)", self)
+        self.duplicate_action.triggered.connect(self.run_duplicate_check)
+        tools_menu.addAction(self.duplicate_action)
+
+        self.verify_action = QAction("압축 파일 무결성 검사 (CRC)...", self)
+        self.verify_action.triggered.connect(self.run_archive_verification)
+        tools_menu.addAction(self.verify_action)
+
+        self.cancel_verify_action = QAction("무결성 검사 중지", self)
+        self.cancel_verify_action.setEnabled(False)
+        self.cancel_verify_action.triggered.connect(self.cancel_archive_verification)
+        tools_menu.addAction(self.cancel_verify_action)
+
+        self.member_rename_action = QAction("압축 내부 페이지 이름 정리 (ZIP/CBZ)...", self)
+        self.member_rename_action.triggered.connect(self.run_member_rename)
+        tools_menu.addAction(self.member_rename_action)
+
+        self.metadata_action = QAction("ComicInfo 메타데이터 읽기", self)
+        self.metadata_action.triggered.connect(self.run_metadata_load)
+        tools_menu.addAction(self.metadata_action)
+
+        self.prewarm_action = QAction("라이브러리 썸네일 미리 생성...", self)
+        self.prewarm_action.triggered.connect(self.run_thumbnail_prewarm)
+        tools_menu.addAction(self.prewarm_action)
+
+        self.cancel_prewarm_action = QAction("썸네일 미리 생성 중지", self)
+        self.cancel_prewarm_action.setEnabled(False)
+        self.cancel_prewarm_action.triggered.connect(self.cancel_thumbnail_prewarm)
+        tools_menu.addAction(self.cancel_prewarm_action)
+
+        self.io_stats_action = QAction("I/O 대기열 상태", self)
+        self.io_stats_action.triggered.connect(self.show_io_stats)
+        tools_menu.addAction(self.io_stats_action)
+
+        tools_menu.addSeparator()
+
+        self.save_recipe_action = QAction("현재 작업을 레시피로 저장...", self)
+        self.save_recipe_action.triggered.connect(self.save_recipe_action_triggered)
+        tools_menu.addAction(self.save_recipe_action)
+
+        self.batch_queue_action = QAction("일괄 작업 대기열...", self)
+        self.batch_queue_action.triggered.connect(self.open_batch_queue)
+        tools_menu.addAction(self.batch_queue_action)
+
+        tools_menu.addSeparator()
+
+        self.export_plan_action = QAction("변경 계획 내보내기 (CSV/JSONL)...", self)
+        self.export_plan_action.triggered.connect(self.export_plan_action_triggered)
+        tools_menu.addAction(self.export_plan_action)
+
+        self.import_plan_action = QAction("변경 계획 가져오기...", self)
+        self.import_plan_action.triggered.connect(self.import_plan_action_triggered)
+        tools_menu.addAction(self.import_plan_action)
+
+    def current_session(self) -> WorkspaceSession:
+        """현재 작업 상태 (이름이 바뀐 파일만 저장)"""
+        session = WorkspaceSession(
+            folder=self.current_folder,
+            paths=[] if self.current_folder else [info.original_path for info in self.file_infos],
+            selected_pattern=self.selected_pattern,
+            pattern_text=self.pattern_edit_input.text(),
+            recipe_steps=list(self.recipe_steps),
+            edits=collect_edits(self.file_infos),
+            filter_text=self.filter_input.text(),
+            changed_only=self.changed_only_checkbox.isChecked(),
+        )
+        if not self.file_infos:
+            session.folder = ""
+            return session
+
+        names = [info.original_name for info in self.file_infos]
+        session.selected_names = [names[row] for row in self.preview_table.selected_file_indices() if row >= 0]
+        current = self.preview_table.current_file_index()
+        session.current_name = names[current] if current >= 0 else ""
+        session.sort_column, session.sort_descending = self.preview_table.sort_state()
+        return session
+
+    def restore_session(self):
+        """
+        마지막 작업 상태 복원
+        폴더가 바뀌지 않았으면 분석 캐시에서 바로 다시 그리고, 바뀌었으면 새 파일만 분석하여
+        저장된 새 이름은 아직 있는 파일에만 적용
+        """
+        session = load_session()
+        if session is None or session.is_empty:
+            return
+
+        if session.folder:
+            # 없어진 폴더나 빈 폴더는 경고 없이 건너뜀
+            if not os.path.isdir(session.folder) or not os.listdir(session.folder):
+                return
+            unchanged = session.folder_unchanged()
+            self.on_folder_dropped(session.folder)
+        else:
+            paths = [path for path in session.paths if os.path.exists(path)]
+            if not paths:
+                return
+            unchanged = len(paths) == len(session.paths)
+            self.on_files_dropped(paths)
+
+        if not self.file_infos:
+            return
+
+        # 저장된 새 이름 (없어진 파일은 무시)
+        self.file_infos, applied = apply_edits(self.file_infos, session.edits)
+        self.recipe_steps = list(session.recipe_steps)
+
+        # 선택한 패턴 (같은 패턴이 아직 있을 때만)
+        if session.selected_pattern in self.representative_patterns:
+            index = self.representative_patterns.index(session.selected_pattern)
+            self.selected_pattern = self.representative_patterns[index]
+            self.pattern_button_group.button(index).setChecked(True)
+            self.update_digit_radio_constraints()
+        self.pattern_edit_input.setText(session.pattern_text)
+
+        # 미리보기 (정렬 → 검색 → 선택 순서로 복원)
+        self.refresh_preview()
+        self.preview_table.set_sort_state(session.sort_column, session.sort_descending)
+        self.filter_input.setText(session.filter_text)
+        self.changed_only_checkbox.setChecked(session.changed_only)
+        self.apply_preview_filter()
+
+        rows = {info.original_name: row for row, info in enumerate(self.file_infos)}
+        selected = [rows[name] for name in session.selected_names if name in rows]
+        self.preview_table.select_file_indices(selected, rows.get(session.current_name, -1))
+
+        if unchanged:
+            message = "마지막 작업을 복원했습니다."
+        else:
+            message = "마지막 작업을 복원했습니다. (폴더가 바뀌어 새 파일을 다시 분석했습니다)"
+        if applied < len(session.edits):
+            message += f" 없어진 파일 {len(session.edits) - applied}개의 변경은 건너뛰었습니다."
+        self.statusBar().showMessage(message, 10000)
+
+    def closeEvent(self, event):
+        """종료 시 작업 상태 저장 (다음 실행 때 복원) 후 실행 중인 백그라운드 작업을 멈추고 종료"""
+        save_session(self.current_session())
+
+        # 실행 중인 스레드가 창과 함께 삭제되면 프로그램이 비정상 종료되고,
+        # 내부 이름 정리는 압축 파일을 바꾸는 중일 수 있으므로 처리 중인 파일까지 끝나기를 기다림
+        tasks = [
+            task for task in (
+                self.similarity_task, self.verify_task, self.metadata_task,
+                self.prewarm_task, self.member_rename_task, self.duplicate_task
+            )
+            if task is not None and task.isRunning()
+        ]
+        for task in tasks:
+            task.cancel()
+        for task in tasks:
+            task.wait()
+        super().closeEvent(event)
+
     def select_folder(self):
         """폴더 선택"""
         folder = QFileDialog.getExistingDirectory(self, "폴더 선택")
@@ -829,15 +1131,17 @@ class MainWindow(QMainWindow):
         self.current_folder = ""
         self.folder_label.setText(f"{len(file_paths)}개 파일 선택됨")
 
-        # 파일명만 추출
-        filenames = [os.path.basename(path) for path in file_paths]
+        # 패턴 분석 (파일명별 캐시 사용, 유사한 제목의 그룹은 하나로 병합)
+        self.file_infos, self.pattern_clusters = analyze_paths(file_paths)
+        self.representative_patterns = [cluster.representative for cluster in self.pattern_clusters]
+        self.update_cluster_rows()
 
-        # 패턴 분석
-        self.file_infos, self.representative_patterns = analyze_files(filenames)
-
-        # 전체 경로 설정
-        for i, file_info in enumerate(self.file_infos):
-            file_info.original_path = file_paths[i]
+        # 이전 폴더의 검사 결과/작업 기록 초기화
+        self.file_status.clear()
+        self.excluded_paths.clear()
+        self.numbering_index.clear()
+        self.comic_metadata = {}
+        self.recipe_steps = []
 
         # 패턴이 없으면 경고
         if not self.representative_patterns:
@@ -858,34 +1162,37 @@ class MainWindow(QMainWindow):
         self.refresh_preview()
 
         # 테이블 선택 초기화 (첫 번째 행 선택)
-        if self.preview_table.rowCount() > 0:
+        if self.preview_table.visible_count() > 0:
             self.preview_table.selectRow(0)
 
         # 표지 이미지 로드
         self.load_cover_image(file_paths)
+        self.update_gallery_files()
 
         # 초기화 버튼 활성화
         self.reset_button.setEnabled(True)
 
     def load_files(self, folder_path: str):
         """폴더의 파일 로드 및 패턴 분석"""
-        # 파일 목록 가져오기
-        file_paths = get_files_in_folder(folder_path)
+        # 파일 목록 + 패턴 분석 (폴더가 바뀌지 않았으면 캐시에서 바로 복원)
+        file_paths, file_infos, pattern_clusters = analyze_folder(folder_path)
 
         if not file_paths:
             QMessageBox.warning(self, "경고", "폴더에 파일이 없습니다.")
             self.cover_image_widget.clear()  # 이미지 제거
             return
 
-        # 파일명만 추출
-        filenames = [os.path.basename(path) for path in file_paths]
-
-        # 패턴 분석
-        self.file_infos, self.representative_patterns = analyze_files(filenames)
+        self.file_infos = file_infos
+        self.pattern_clusters = pattern_clusters
+        self.representative_patterns = [cluster.representative for cluster in self.pattern_clusters]
+        self.update_cluster_rows()
 
-        # 전체 경로 설정
-        for i, file_info in enumerate(self.file_infos):
-            file_info.original_path = file_paths[i]
+        # 이전 폴더의 검사 결과/작업 기록 초기화
+        self.file_status.clear()
+        self.excluded_paths.clear()
+        self.numbering_index.clear()
+        self.comic_metadata = {}
+        self.recipe_steps = []
 
         # 패턴이 없으면 경고
         if not self.representative_patterns:
@@ -906,11 +1213,12 @@ class MainWindow(QMainWindow):
         self.refresh_preview()
 
         # 테이블 선택 초기화 (첫 번째 행 선택)
-        if self.preview_table.rowCount() > 0:
+        if self.preview_table.visible_count() > 0:
             self.preview_table.selectRow(0)
 
         # 표지 이미지 로드
         self.load_cover_image(file_paths)
+        self.update_gallery_files()
 
         # 초기화 버튼 활성화
         self.reset_button.setEnabled(True)
@@ -957,22 +1265,22 @@ class MainWindow(QMainWindow):
 
     def load_cover_image(self, file_paths: list):
         """
-        첫 번째 ZIP 파일에서 표지 이미지 추출 및 표시
+        첫 번째 압축 파일에서 표지 이미지 추출 및 표시
 
         Args:
             file_paths: 파일 경로 목록 (이미 정렬됨)
         """
-        # 첫 번째 ZIP 파일 찾기
+        # 첫 번째 압축 파일 찾기
         first_zip = get_first_archive_file(file_paths)
 
         if first_zip is None:
-            # ZIP 파일이 없으면 빈 공간
+            # 압축 파일이 없으면 빈 공간
             self.cover_image_widget.clear()
             return
 
         try:
-            # ZIP에서 표지 추출
-            cover_img = extract_cover_from_zip(first_zip, max_size=(500, 700))
+            # 압축 파일에서 표지 추출
+            cover_img = extract_cover_from_zip(first_zip, max_size=(500, 700), priority=PRIORITY_INTERACTIVE)
 
             # 위젯에 표시
             self.cover_image_widget.set_pil_image(cover_img)
@@ -993,7 +1301,11 @@ class MainWindow(QMainWindow):
         # 새 버튼 생성
         for i, pattern in enumerate(self.representative_patterns):
             # 패턴의 원래 padding_width 사용 (자동 조정 안 함)
-            radio = QRadioButton(str(pattern))
+            label = str(pattern)
+            if i < len(self.pattern_clusters) and self.pattern_clusters[i].is_merged:
+                cluster = self.pattern_clusters[i]
+                label += f"   (유사 패턴 {len(cluster.group_keys)}개 병합, {cluster.file_count}개 파일, 신뢰도 {cluster.confidence:.0%})"
+            radio = QRadioButton(label)
             radio.setFont(QFont("맑은 고딕", 10))
 
             # 라디오 버튼 스타일 개선
@@ -1029,10 +1341,20 @@ class MainWindow(QMainWindow):
     def on_pattern_selected(self, button):
         """패턴 선택 시 호출"""
         selected_id = self.pattern_button_group.id(button)
+        ok, rows = self.confirm_edit_rows()
+        if not ok:
+            return
         self.selected_pattern = self.representative_patterns[selected_id]
 
-        # 선택한 패턴 적용
-        self.file_infos = apply_pattern(self.file_infos, self.selected_pattern)
+        # 선택한 패턴 적용 (적용 대상 밖의 파일은 그대로)
+        self.file_infos = apply_pattern(self.file_infos, self.selected_pattern, rows)
+
+        # 패턴 선택은 파일명을 새로 만들므로 이전 작업 기록은 무효 (선택한 파일에만 적용한 경우는 제외)
+        # (다른 폴더에도 적용할 수 있도록 화면 순서 대신 파일 수 순위로 기록)
+        rank = pattern_rank(self.pattern_clusters, selected_id) if selected_id < len(self.pattern_clusters) else 0
+        if rows is None:
+            self.recipe_steps = []
+        self.record_recipe_step(RecipeStep("select_pattern", {"rank": rank}), rows)
 
         # 패턴 변경 시 자릿수 선택 초기화
         self.reset_digit_radio_buttons()
@@ -1090,34 +1412,25 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, "경고", "먼저 패턴을 선택해주세요.")
             return
 
-        # 사용자 입력을 기반으로 완전한 패턴 템플릿 생성
-        # 1. 사용자가 입력한 제목 사용
-        base = user_input
-
-        # 2. 권수 placeholder 추가 (선택된 패턴의 padding_width 사용)
-        padding_width = self.selected_pattern.padding_width
-        if padding_width == 2:
-            number_placeholder = "{number:02d}"
-        elif padding_width == 3:
-            number_placeholder = "{number:03d}"
-        else:
-            number_placeholder = "{number}"
-
-        # 3. suffix 추가 (원본 패턴의 suffix 사용)
-        suffix = self.selected_pattern.suffix if self.selected_pattern.suffix else ""
-
-        # 4. 확장자 추가 (원본 패턴의 extension 사용)
-        extension = self.selected_pattern.extension if self.selected_pattern.extension else ""
-
-        # 완전한 패턴 템플릿 생성
-        pattern_template = base + number_placeholder + suffix + extension
+        # 사용자 입력(제목) + 선택된 패턴의 권수 자릿수/suffix/확장자로 템플릿 생성
+        pattern_template = build_custom_template(user_input, self.selected_pattern)
+        ok, rows = self.confirm_edit_rows()
+        if not ok:
+            return
 
         # 이전 상태 저장 (파일 정보와 입력창 텍스트)
-        self.previous_file_infos_pattern = copy.deepcopy(self.file_infos)
+        # 변환 함수는 입력 목록을 수정하지 않고 새 목록을 반환하므로 참조만 보관
+        self.previous_file_infos_pattern = self.file_infos
         self.previous_pattern_text = self.pattern_to_string(self.selected_pattern)
 
-        # 패턴 편집 적용
-        self.file_infos = apply_custom_pattern(self.file_infos, pattern_template)
+        # 패턴 편집 적용 ({series} 등 메타데이터 필드는 읽어 둔 ComicInfo 값 사용)
+        include_unnumbered = self.include_unnumbered_checkbox.isChecked()
+        self.file_infos = apply_custom_pattern(self.file_infos, pattern_template, self.comic_metadata, rows,
+                                               include_unnumbered)
+        step_params = {"title": user_input}
+        if include_unnumbered:
+            step_params["include_unnumbered"] = True
+        self.record_recipe_step(RecipeStep("edit_pattern", step_params), rows)
 
         # 패턴 편집 취소 버튼만 활성화
         self.pattern_edit_undo_button.setEnabled(True)
@@ -1134,6 +1447,7 @@ class MainWindow(QMainWindow):
         # 이전 상태로 복원 (파일 정보와 입력창 텍스트)
         self.file_infos = self.previous_file_infos_pattern
         self.previous_file_infos_pattern = None
+        self.pop_recipe_step("edit_pattern")
 
         # 패턴 편집 입력창도 이전 텍스트로 복원
         if self.previous_pattern_text is not None:
@@ -1150,21 +1464,522 @@ class MainWindow(QMainWindow):
 
     def refresh_preview(self):
         """미리보기 테이블 업데이트"""
-        self.preview_table.setRowCount(len(self.file_infos))
+        # 번호 분석 갱신 (바뀐 파일이 속한 그룹만 다시 계산)
+        self.update_numbering_analysis()
+
+        # 바뀐 행만 다시 표시 (이름이 바뀐 경우 노란색, 검사 결과가 있으면 상태 열 강조)
+        self.preview_table.set_file_infos(self.file_infos, self.file_status)
+        self.update_filter_count()
+
+        # 갤러리 라벨도 변경될 파일명으로 갱신
+        self.cover_gallery_widget.set_labels([info.new_name for info in self.file_infos])
 
-        for i, file_info in enumerate(self.file_infos):
-            # 원본 파일명
-            original_item = QTableWidgetItem(file_info.original_name)
-            self.preview_table.setItem(i, 0, original_item)
+    def update_cluster_rows(self):
+        """분석 직후 패턴 그룹별 행 번호 계산 (편집으로 패턴이 바뀌어도 처음 그룹 유지)"""
+        self.cluster_row_lists = cluster_rows(self.file_infos, self.pattern_clusters)
+        self.row_clusters = [-1] * len(self.file_infos)
+        for index, rows in enumerate(self.cluster_row_lists):
+            for row in rows:
+                self.row_clusters[row] = index
 
-            # 변경될 파일명
-            new_item = QTableWidgetItem(file_info.new_name)
+    def edit_rows(self) -> Optional[List[int]]:
+        """
+        편집을 적용할 행 번호 (적용 대상 선택에 따라)
+
+        Returns:
+            None이면 전체 파일, 아니면 선택한 파일 또는 선택한 파일이 속한 패턴 그룹의 행 (빈 목록이면 선택 없음)
+        """
+        if self.scope_all_radio.isChecked():
+            return None
+
+        selected = self.preview_table.selected_file_indices()
+        if self.scope_selected_radio.isChecked():
+            return selected
+
+        clusters = {self.row_clusters[row] for row in selected if 0 <= row < len(self.row_clusters)}
+        clusters.discard(-1)
+        return sorted(row for index in clusters for row in self.cluster_row_lists[index])
+
+    def confirm_edit_rows(self) -> Tuple[bool, Optional[List[int]]]:
+        """편집 대상 행 확인 (선택한 파일 대상인데 선택이 없으면 경고)"""
+        rows = self.edit_rows()
+        if rows is not None and not rows:
+            QMessageBox.warning(self, "경고", "적용할 파일을 미리보기에서 먼저 선택하세요.")
+            return False, None
+        return True, rows
+
+    def apply_preview_filter(self, *_args):
+        """검색어/바뀐 파일만 보기 적용 (색인을 사용하므로 입력할 때마다 바로 반영)"""
+        self.preview_table.set_filter(self.filter_input.text(), self.changed_only_checkbox.isChecked())
+        self.update_filter_count()
+
+    def update_filter_count(self):
+        """검색 중이면 표시 중인 파일 수 표시"""
+        if self.filter_input.text().strip() or self.changed_only_checkbox.isChecked():
+            self.filter_count_label.setText(f"{self.preview_table.visible_count()} / {len(self.file_infos)}")
+        else:
+            self.filter_count_label.setText("")
+
+    def update_numbering_analysis(self):
+        """권수 누락/중복 분석 후 오버레이와 상태에 반영 (테이블은 갱신하지 않음)"""
+        changed_groups = self.numbering_index.update(self.file_infos)
+        if not changed_groups and self.file_infos:
+            return
+
+        self.replace_file_status("numbering", self.numbering_index.file_statuses())
+        self.preview_table.set_overlay_text("\n".join(self.numbering_index.summary_lines()))
 
-            # 이름이 바뀌는 경우 색상 변경
-            if file_info.original_name != file_info.new_name:
-                new_item.setBackground(Qt.yellow)
+    def replace_file_status(self, source: str, statuses: Dict[str, str]):
+        """같은 검사 종류의 이전 결과를 새 결과로 교체 (테이블은 갱신하지 않음)"""
+        for path in list(self.file_status):
+            self.file_status[path].pop(source, None)
+            if not self.file_status[path]:
+                del self.file_status[path]
 
-            self.preview_table.setItem(i, 1, new_item)
+        for path, message in statuses.items():
+            self.file_status.setdefault(path, {})[source] = message
+
+    def set_file_status(self, source: str, statuses: Dict[str, str]):
+        """
+        검사 결과를 상태 열에 반영
+
+        Args:
+            source: 검사 종류 (같은 종류의 이전 결과는 교체)
+            statuses: {원본 경로: 메시지}
+        """
+        self.replace_file_status(source, statuses)
+        self.preview_table.refresh_statuses()
+        self.update_filter_count()
+
+    def run_cover_similarity_check(self):
+        """표지 해시로 중복/번호 오류 의심 파일 검사 (백그라운드)"""
+        if not self.file_infos:
+            QMessageBox.warning(self, "경고", "먼저 폴더를 선택하세요.")
+            return
+
+        if self.similarity_task is not None and self.similarity_task.isRunning():
+            return
+
+        from cover_similarity import compute_cover_hashes
+
+        paths = [info.original_path for info in self.file_infos]
+        self.similarity_task = TaskThread(
+            lambda progress, is_cancelled: compute_cover_hashes(paths, progress, is_cancelled),
+            self
+        )
+        self.similarity_task.progress_changed.connect(
+            lambda done, total: self.statusBar().showMessage(f"표지 유사도 검사 중... {done}/{total}")
+        )
+        self.similarity_task.result_ready.connect(self.on_cover_hashes_ready)
+        self.similarity_task.task_failed.connect(
+            lambda message: QMessageBox.warning(self, "경고", f"표지 유사도 검사 실패: {message}")
+        )
+        self.cover_similarity_action.setEnabled(False)
+        self.similarity_task.finished.connect(lambda: self.cover_similarity_action.setEnabled(True))
+        self.similarity_task.start()
+
+    def current_paths(self) -> Set[str]:
+        """현재 목록의 원본 경로 (백그라운드 작업 중 다른 폴더를 열었을 때 이전 결과를 걸러내는 데 사용)"""
+        return {info.original_path for info in self.file_infos}
+
+    def on_cover_hashes_ready(self, hashes: Dict[str, int]):
+        """표지 해시 계산 완료 시 의심 파일 표시"""
+        from cover_similarity import find_cover_issues
+
+        # 검사 중 다른 폴더를 열었으면 현재 목록에 있는 파일만 반영
+        current = self.current_paths()
+        hashes = {path: value for path, value in hashes.items() if path in current}
+        issues = find_cover_issues(self.file_infos, hashes)
+        self.set_file_status("cover", issues)
+        self.statusBar().showMessage(f"표지 유사도 검사 완료: 의심 파일 {len(issues)}개", 5000)
+
+    def run_duplicate_check(self):
+        """내용이 같은 파일 검사 (크기 -> 앞/뒤 부분 해시 -> 전체 해시, 백그라운드)"""
+        if not self.file_infos:
+            QMessageBox.warning(self, "경고", "먼저 폴더를 선택하세요.")
+            return
+
+        if self.duplicate_task is not None and self.duplicate_task.isRunning():
+            return
+
+        paths = [info.original_path for info in self.file_infos]
+        self.duplicate_task = TaskThread(
+            lambda progress, is_cancelled: find_duplicates(paths, progress=progress, is_cancelled=is_cancelled),
+            self
+        )
+        self.duplicate_task.progress_changed.connect(
+            lambda done, total: self.statusBar().showMessage(f"중복 파일 검사 중... {done}/{total}")
+        )
+        self.duplicate_task.result_ready.connect(self.on_duplicates_ready)
+        self.duplicate_task.task_failed.connect(
+            lambda message: QMessageBox.warning(self, "경고", f"중복 파일 검사 실패: {message}")
+        )
+        self.duplicate_action.setEnabled(False)
+        self.duplicate_task.finished.connect(lambda: self.duplicate_action.setEnabled(True))
+        self.duplicate_task.start()
+
+    def on_duplicates_ready(self, groups: List[List[str]]):
+        """중복 파일을 상태 열에 표시하고 이름 변경에서 제외할지 확인"""
+        # 검사 중 다른 폴더를 열었으면 현재 목록에 있는 파일만 반영
+        current = {info.original_path for info in self.file_infos}
+        groups = [group for group in ([path for path in group if path in current] for group in groups)
+                  if len(group) > 1]
+
+        statuses, extras = duplicate_statuses(groups)
+        self.set_file_status("duplicate", statuses)
+        self.statusBar().showMessage(
+            f"중복 파일 검사 완료: {len(groups)}묶음, 중복 파일 {len(extras)}개", 5000
+        )
+        if not extras:
+            return
+
+        reply = QMessageBox.question(
+            self,
+            "중복 파일",
+            f"내용이 같은 파일 {len(extras)}개를 찾았습니다.\n"
+            f"각 묶음의 첫 파일만 남기고 나머지는 이름 변경에서 제외하시겠습니까?",
+            QMessageBox.Yes | QMessageBox.No
+        )
+        if reply == QMessageBox.Yes:
+            self.excluded_paths.update(extras)
+            self.set_file_status("duplicate", {
+                path: f"{message} - 이름 변경 제외" if path in self.excluded_paths else message
+                for path, message in statuses.items()
+            })
+
+    def record_recipe_step(self, step: RecipeStep, rows: Optional[List[int]] = None):
+        """
+        작업 기록에 추가
+        선택한 파일에만 적용한 작업은 다른 폴더에서 의미가 없으므로 표시만 하고 레시피 적용 시 건너뜀
+        (취소할 때 같은 종류의 마지막 작업을 빼므로 기록 자체는 남김)
+        """
+        if rows is not None:
+            step.params["scope"] = "selection"
+        self.recipe_steps.append(step)
+
+    def pop_recipe_step(self, action: str):
+        """취소한 작업을 작업 기록에서 제거 (해당 종류의 마지막 작업)"""
+        for i in range(len(self.recipe_steps) - 1, -1, -1):
+            if self.recipe_steps[i].action == action:
+                del self.recipe_steps[i]
+                return
+
+    def save_recipe_action_triggered(self):
+        """지금까지 적용한 작업 순서를 레시피로 저장"""
+        if not self.recipe_steps:
+            QMessageBox.warning(self, "경고", "저장할 작업이 없습니다.\n먼저 패턴을 선택하고 편집 작업을 적용하세요.")
+            return
+
+        name, ok = QInputDialog.getText(self, "레시피 저장", "레시피 이름:")
+        name = name.strip()
+        if not ok or not name:
+            return
+
+        if name in load_recipes():
+            reply = QMessageBox.question(
+                self, "확인", f"'{name}' 레시피가 이미 있습니다. 덮어쓰시겠습니까?",
+                QMessageBox.Yes | QMessageBox.No
+            )
+            if reply == QMessageBox.No:
+                return
+
+        save_recipe(RenameRecipe(name=name, steps=copy.deepcopy(self.recipe_steps)))
+        self.statusBar().showMessage(f"레시피 저장됨: {name} ({len(self.recipe_steps)}개 작업)", 5000)
+
+    def open_batch_queue(self):
+        """일괄 작업 대기열 창 열기"""
+        from batch_queue_dialog import BatchQueueDialog
+
+        dialog = BatchQueueDialog(self)
+        dialog.exec_()
+
+        # 현재 폴더가 일괄 작업으로 바뀌었을 수 있으므로 다시 로드
+        if self.current_folder:
+            self.load_files(self.current_folder)
+
+    def show_io_stats(self):
+        """우선순위별 I/O 대기 수/대기 시간 표시"""
+        scheduler = get_io_scheduler()
+        QMessageBox.information(
+            self,
+            "I/O 대기열 상태",
+            f"장치당 동시 읽기: {scheduler.device_concurrency}\n\n{format_io_stats(scheduler.snapshot())}"
+        )
+
+    def run_archive_verification(self):
+        """압축 파일 CRC 검사 (백그라운드, 이전에 검사한 파일은 건너뜀)"""
+        if not self.file_infos:
+            QMessageBox.warning(self, "경고", "먼저 폴더를 선택하세요.")
+            return
+
+        if self.verify_task is not None and self.verify_task.isRunning():
+            return
+
+        from archive_verifier import verify_archives, DEFAULT_IO_CONCURRENCY
+
+        io_concurrency, ok = QInputDialog.getInt(
+            self, "무결성 검사", "동시에 검사할 파일 수 (HDD는 1~2 권장):",
+            DEFAULT_IO_CONCURRENCY, 1, 16
+        )
+        if not ok:
+            return
+
+        paths = [info.original_path for info in self.file_infos]
+        self.verify_task = TaskThread(
+            lambda progress, is_cancelled: verify_archives(paths, io_concurrency, progress, is_cancelled),
+            self
+        )
+        self.verify_task.progress_changed.connect(
+            lambda done, total: self.statusBar().showMessage(f"무결성 검사 중... {done}/{total}")
+        )
+        self.verify_task.result_ready.connect(self.on_verification_ready)
+        self.verify_task.task_failed.connect(
+            lambda message: QMessageBox.warning(self, "경고", f"무결성 검사 실패: {message}")
+        )
+        self.verify_action.setEnabled(False)
+        self.cancel_verify_action.setEnabled(True)
+        self.verify_task.finished.connect(self.on_verification_finished)
+        self.verify_task.start()
+
+    def cancel_archive_verification(self):
+        """검사 중지 (검사 중인 파일까지만 처리, 결과는 저장되어 다음에 이어서 검사)"""
+        if self.verify_task is not None and self.verify_task.isRunning():
+            self.verify_task.cancel()
+            self.cancel_verify_action.setEnabled(False)
+            self.statusBar().showMessage("무결성 검사 중지 중...")
+
+    def on_verification_finished(self):
+        self.verify_action.setEnabled(True)
+        self.cancel_verify_action.setEnabled(False)
+
+    def on_verification_ready(self, results: Dict[str, tuple]):
+        """검사 결과 중 손상된 파일을 상태 열에 표시"""
+        # 검사 중 다른 폴더를 열었으면 현재 목록에 있는 파일만 반영
+        current = self.current_paths()
+        results = {path: result for path, result in results.items() if path in current}
+        issues = {path: f"손상됨: {message}" for path, (ok, message) in results.items() if not ok}
+        self.set_file_status("verify", issues)
+
+        cancelled = self.verify_task is not None and self.verify_task.is_cancelled()
+        summary = f"무결성 검사 {'중지' if cancelled else '완료'}: {len(results)}개 확인, 손상 {len(issues)}개"
+        self.statusBar().showMessage(summary, 10000)
+
+    def run_member_rename(self):
+        """목록의 ZIP/CBZ 내부 이미지 이름을 자연 정렬 순서대로 정리 (백그라운드, 압축 데이터는 그대로 복사)"""
+        if not self.file_infos:
+            QMessageBox.warning(self, "경고", "먼저 폴더를 선택하세요.")
+            return
+
+        if self.member_rename_task is not None and self.member_rename_task.isRunning():
+            return
+
+        from archive_member_renamer import (
+            rename_members_in_archives, MemberRenameOptions, MODE_RENUMBER, MODE_PADDING, DEFAULT_WORKERS
+        )
+
+        modes = {
+            "번호 다시 매기기 (001.jpg, 002.jpg, ...)": MODE_RENUMBER,
+            "번호 자릿수만 통일 (scan_1.jpg → scan_001.jpg)": MODE_PADDING,
+        }
+        mode_label, ok = QInputDialog.getItem(self, "압축 내부 이름 정리", "정리 방식:", list(modes), 0, False)
+        if not ok:
+            return
+        options = MemberRenameOptions(mode=modes[mode_label])
+
+        if options.mode == MODE_RENUMBER:
+            template, ok = QInputDialog.getText(
+                self, "압축 내부 이름 정리", "페이지 이름 (확장자 제외, {number}: 번호):", text=options.template
+            )
+            if not ok or not template.strip():
+                return
+            options.template = template.strip()
+
+        workers, ok = QInputDialog.getInt(
+            self, "압축 내부 이름 정리", "동시에 처리할 파일 수 (HDD는 1~2 권장):",
+            DEFAULT_WORKERS, 1, 16
+        )
+        if not ok:
+            return
+
+        paths = [info.original_path for info in self.file_infos]
+        reply = QMessageBox.question(
+            self, "확인",
+            f"{len(paths)}개 파일 중 ZIP 형식 압축 파일의 내부 이미지 이름을 바꾸시겠습니까?\n"
+            "(압축 파일을 다시 기록하며 되돌릴 수 없습니다)",
+            QMessageBox.Yes | QMessageBox.No
+        )
+        if reply == QMessageBox.No:
+            return
+
+        self.member_rename_task = TaskThread(
+            lambda progress, is_cancelled: rename_members_in_archives(
+                paths, options, workers, progress, is_cancelled),
+            self
+        )
+        self.member_rename_task.progress_changed.connect(
+            lambda done, total: self.statusBar().showMessage(f"압축 내부 이름 정리 중... {done}/{total}")
+        )
+        self.member_rename_task.result_ready.connect(self.on_member_rename_ready)
+        self.member_rename_task.task_failed.connect(
+            lambda message: QMessageBox.warning(self, "경고", f"압축 내부 이름 정리 실패: {message}")
+        )
+        self.member_rename_action.setEnabled(False)
+        self.member_rename_task.finished.connect(lambda: self.member_rename_action.setEnabled(True))
+        self.member_rename_task.start()
+
+    def on_member_rename_ready(self, results: Dict[str, tuple]):
+        """이름 정리에 실패한 압축 파일을 상태 열에 표시"""
+        failures = {path: f"내부 이름 정리 실패: {message}"
+                    for path, (ok, _, message) in results.items() if not ok}
+        # 처리 중 다른 폴더를 열었으면 상태 열에는 현재 목록에 있는 파일만 반영
+        # (요약은 실제로 바뀐 파일 수를 알리므로 전체 결과 기준)
+        current = self.current_paths()
+        self.set_file_status("members", {path: message for path, message in failures.items() if path in current})
+
+        changed = sum(1 for ok, count, _ in results.values() if ok and count)
+        self.statusBar().showMessage(
+            f"압축 내부 이름 정리 완료: {len(results)}개 확인, {changed}개 변경, 실패 {len(failures)}개", 10000
+        )
+
+    def run_metadata_load(self):
+        """압축 파일의 ComicInfo.xml 읽기 (백그라운드, 패턴 편집에서 {series}, {volume} 등으로 사용)"""
+        if not self.file_infos:
+            QMessageBox.warning(self, "경고", "먼저 폴더를 선택하세요.")
+            return
+
+        if self.metadata_task is not None and self.metadata_task.isRunning():
+            return
+
+        paths = [info.original_path for info in self.file_infos]
+        self.metadata_task = TaskThread(
+            lambda progress, is_cancelled: load_comic_metadata(paths, progress, is_cancelled),
+            self
+        )
+        self.metadata_task.progress_changed.connect(
+            lambda done, total: self.statusBar().showMessage(f"메타데이터 읽는 중... {done}/{total}")
+        )
+        self.metadata_task.result_ready.connect(self.on_metadata_ready)
+        self.metadata_task.task_failed.connect(
+            lambda message: QMessageBox.warning(self, "경고", f"메타데이터 읽기 실패: {message}")
+        )
+        self.metadata_action.setEnabled(False)
+        self.metadata_task.finished.connect(lambda: self.metadata_action.setEnabled(True))
+        self.metadata_task.start()
+
+    def on_metadata_ready(self, metadata: Dict[str, ComicMetadata]):
+        """메타데이터 저장 후 파일명 번호와 메타데이터 권수가 다른 파일을 상태 열에 표시"""
+        # 읽는 중 다른 폴더를 열었으면 현재 목록에 있는 파일만 반영
+        current = self.current_paths()
+        metadata = {path: value for path, value in metadata.items() if path in current}
+        self.comic_metadata = metadata
+        mismatches = find_volume_mismatches(self.file_infos, metadata)
+        self.set_file_status("metadata", mismatches)
+
+        self.statusBar().showMessage(
+            f"메타데이터 읽기 완료: {len(metadata)}개 파일에 ComicInfo 있음, 권수 불일치 {len(mismatches)}개",
+            10000
+        )
+
+    def export_plan_action_triggered(self):
+        """현재 미리보기(원본/새 이름, 패턴, 검사 상태)를 파일로 저장"""
+        if not self.file_infos:
+            QMessageBox.warning(self, "경고", "먼저 폴더를 선택하세요.")
+            return
+
+        path, _ = QFileDialog.getSaveFileName(
+            self, "변경 계획 내보내기", "rename_plan.csv", "CSV (*.csv);;JSON Lines (*.jsonl)"
+        )
+        if not path:
+            return
+
+        from rename_plan import export_plan, PlanError
+
+        try:
+            count = export_plan(self.file_infos, path, self.file_status)
+        except PlanError as e:
+            QMessageBox.critical(self, "오류", str(e))
+            return
+        self.statusBar().showMessage(f"변경 계획 {count}개 행을 저장했습니다: {path}", 5000)
+
+    def import_plan_action_triggered(self):
+        """수정한 변경 계획 파일의 새 이름을 현재 목록에 적용"""
+        if not self.file_infos:
+            QMessageBox.warning(self, "경고", "먼저 폴더를 선택하세요.")
+            return
+
+        path, _ = QFileDialog.getOpenFileName(
+            self, "변경 계획 가져오기", "", "변경 계획 (*.csv *.jsonl *.json)"
+        )
+        if not path:
+            return
+
+        from rename_plan import import_plan, PlanError
+
+        try:
+            result = import_plan(self.file_infos, path)
+        except PlanError as e:
+            QMessageBox.critical(self, "오류", str(e))
+            return
+
+        self.file_infos = result.file_infos
+        self.replace_file_status("plan", {
+            path: f"계획 오류: {message}" for path, message in result.errors.items()
+        })
+        self.refresh_preview()
+
+        message = f"{result.applied}개 파일의 새 이름을 적용했습니다."
+        if result.unmatched:
+            message += f"\n목록에 없는 파일 {len(result.unmatched)}개는 건너뛰었습니다."
+        if result.errors:
+            message += f"\n이름 오류 {len(result.errors)}개 (상태 열 참고)"
+        QMessageBox.information(self, "변경 계획 가져오기", message)
+
+    def run_thumbnail_prewarm(self):
+        """라이브러리 폴더 아래 모든 압축 파일의 표지 썸네일 생성 (백그라운드, 이미 있는 썸네일은 건너뜀)"""
+        if self.prewarm_task is not None and self.prewarm_task.isRunning():
+            return
+
+        root = QFileDialog.getExistingDirectory(self, "라이브러리 폴더 선택", self.current_folder)
+        if not root:
+            return
+
+        from thumbnail_prewarm import prewarm_thumbnails, DEFAULT_WORKERS
+
+        workers, ok = QInputDialog.getInt(
+            self, "썸네일 미리 생성", "동시에 처리할 프로세스 수:",
+            DEFAULT_WORKERS, 1, max(DEFAULT_WORKERS, os.cpu_count() or 1)
+        )
+        if not ok:
+            return
+
+        self.prewarm_task = TaskThread(
+            lambda progress, is_cancelled: prewarm_thumbnails(root, workers, 0, progress, is_cancelled),
+            self
+        )
+        self.prewarm_task.progress_changed.connect(
+            lambda done, total: self.statusBar().showMessage(f"썸네일 생성 중... {done}/{total}")
+        )
+        self.prewarm_task.result_ready.connect(
+            lambda stats: self.statusBar().showMessage(f"썸네일 미리 생성 완료 - {stats.summary()}", 10000)
+        )
+        self.prewarm_task.task_failed.connect(
+            lambda message: QMessageBox.warning(self, "경고", f"썸네일 미리 생성 실패: {message}")
+        )
+        self.prewarm_action.setEnabled(False)
+        self.cancel_prewarm_action.setEnabled(True)
+        self.prewarm_task.finished.connect(self.on_prewarm_finished)
+        self.prewarm_task.start()
+
+    def cancel_thumbnail_prewarm(self):
+        """미리 생성 중지 (처리 중인 파일까지만 저장, 다시 실행하면 이어서 생성)"""
+        if self.prewarm_task is not None and self.prewarm_task.isRunning():
+            self.prewarm_task.cancel()
+            self.cancel_prewarm_action.setEnabled(False)
+            self.statusBar().showMessage("썸네일 미리 생성 중지 중...")
+
+    def on_prewarm_finished(self):
+        self.prewarm_action.setEnabled(True)
+        self.cancel_prewarm_action.setEnabled(False)
 
     def undo_remove_action(self):
         """제거 작업 취소"""
@@ -1175,6 +1990,7 @@ class MainWindow(QMainWindow):
         # 이전 상태로 복원
         self.file_infos = self.previous_file_infos_remove
         self.previous_file_infos_remove = None
+        self.pop_recipe_step(self.last_remove_action)
 
         # 제거 취소 버튼 비활성화
         self.remove_undo_button.setEnabled(False)
@@ -1193,6 +2009,7 @@ class MainWindow(QMainWindow):
         # 이전 상태로 복원
         self.file_infos = self.previous_file_infos_add
         self.previous_file_infos_add = None
+        self.pop_recipe_step("add_text")
 
         # 추가 취소 버튼 비활성화
         self.add_undo_button.setEnabled(False)
@@ -1218,34 +2035,103 @@ class MainWindow(QMainWindow):
         else:  # digit_3_radio
             padding_width = 3
 
-        # 자릿수 변경 즉시 적용
+        # 자릿수 변경 즉시 적용 (적용 대상에 선택이 없으면 무시)
+        rows = self.edit_rows()
+        if rows is not None and not rows:
+            return
         from file_renamer import change_padding_width
-        self.file_infos = change_padding_width(self.file_infos, padding_width)
+        self.file_infos = change_padding_width(self.file_infos, padding_width, rows)
+        self.record_recipe_step(RecipeStep("padding", {"width": padding_width}), rows)
 
         # 미리보기 업데이트
         self.refresh_preview()
 
+    def remove_position(self) -> str:
+        """제거/바꾸기 위치 선택값"""
+        if self.remove_all_radio.isChecked():
+            return "all"
+        if self.remove_front_radio.isChecked():
+            return "front"
+        return "back"
+
+    def uses_find_replace(self) -> bool:
+        """단순 제거 대신 찾아 바꾸기를 사용하는지 (정규식/대소문자 무시/바꿀 내용 중 하나라도 있으면)"""
+        return (self.regex_checkbox.isChecked() or self.ignore_case_checkbox.isChecked()
+                or bool(self.replace_input.text()))
+
+    def update_replace_preview(self):
+        """
+        제거/바꾸기 입력 중 실시간 미리보기 (변경될 파일명 열만 갱신, 적용 전까지 파일 정보는 그대로)
+        정규식은 한 번만 컴파일하여 전체 파일에 사용
+        """
+        if not self.file_infos:
+            return
+
+        text = self.remove_input.text()
+        rows = self.edit_rows()
+        preview_infos = self.file_infos
+        if text and (rows is None or rows):
+            try:
+                regex = compile_find_pattern(text, self.ignore_case_checkbox.isChecked(),
+                                             self.regex_checkbox.isChecked())
+                preview_infos = regex_replace(self.file_infos, regex, self.replace_input.text(),
+                                              self.remove_position(), rows=rows)
+            except re.error as e:
+                self.statusBar().showMessage(f"정규식 오류: {e}")
+                preview_infos = self.file_infos
+
+        # 미리보기 결과를 테이블에만 표시 (바뀐 행만 갱신)
+        self.preview_table.set_file_infos(preview_infos, self.file_status)
+        self.update_filter_count()
+        changed = len(changed_rows(self.file_infos, preview_infos) or [])
+
+        if text and preview_infos is not self.file_infos:
+            self.statusBar().showMessage(f"미리보기: {changed}개 파일이 바뀝니다 (적용을 눌러 확정)")
+
     def remove_text_action(self):
-        """텍스트 제거"""
+        """텍스트 제거 (바꿀 내용/정규식 옵션이 있으면 찾아 바꾸기)"""
         text = self.remove_input.text()
 
         if not text:
             QMessageBox.warning(self, "경고", "제거할 텍스트를 입력하세요.")
             return
 
-        # 이전 상태 저장
-        self.previous_file_infos_remove = copy.deepcopy(self.file_infos)
-
         # 위치 선택에 따라 position 결정
-        if self.remove_all_radio.isChecked():
-            position = "all"
-        elif self.remove_front_radio.isChecked():
-            position = "front"
-        else:  # self.remove_back_radio.isChecked()
-            position = "back"
+        position = self.remove_position()
+        ok, rows = self.confirm_edit_rows()
+        if not ok:
+            return
+
+        if self.uses_find_replace():
+            use_regex = self.regex_checkbox.isChecked()
+            ignore_case = self.ignore_case_checkbox.isChecked()
+            replacement = self.replace_input.text()
+            try:
+                regex = compile_find_pattern(text, ignore_case, use_regex)
+                new_infos = regex_replace(self.file_infos, regex, replacement, position, rows=rows)
+            except re.error as e:
+                QMessageBox.warning(self, "경고", f"정규식 오류: {e}")
+                return
 
-        # 텍스트 제거 적용
-        self.file_infos = remove_text(self.file_infos, text, position)
+            # 이전 상태 저장 (변환 함수는 입력 목록을 수정하지 않으므로 참조만 보관)
+            self.previous_file_infos_remove = self.file_infos
+            self.file_infos = new_infos
+            self.last_remove_action = "regex_replace"
+            self.record_recipe_step(RecipeStep("regex_replace", {
+                "pattern": regex.pattern, "replacement": replacement,
+                "position": position, "ignore_case": ignore_case,
+            }), rows)
+        else:
+            # 이전 상태 저장
+            self.previous_file_infos_remove = self.file_infos
+
+            # 텍스트 제거 적용
+            self.file_infos = remove_text(self.file_infos, text, position, rows)
+            self.last_remove_action = "remove_text"
+            self.record_recipe_step(RecipeStep("remove_text", {"text": text, "position": position}), rows)
+
+        # 적용한 결과로 다시 그리므로 대기 중인 미리보기는 취소
+        self.replace_preview_timer.stop()
 
         # 제거 취소 버튼만 활성화
         self.remove_undo_button.setEnabled(True)
@@ -1261,12 +2147,17 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, "경고", "추가할 텍스트를 입력하세요.")
             return
 
+        ok, rows = self.confirm_edit_rows()
+        if not ok:
+            return
+
         # 이전 상태 저장
-        self.previous_file_infos_add = copy.deepcopy(self.file_infos)
+        self.previous_file_infos_add = self.file_infos
 
         # 텍스트 추가 적용
         position = "front" if self.add_front_radio.isChecked() else "back"
-        self.file_infos = add_text(self.file_infos, text, position)
+        self.file_infos = add_text(self.file_infos, text, position, rows)
+        self.record_recipe_step(RecipeStep("add_text", {"text": text, "position": position}), rows)
 
         # 추가 취소 버튼만 활성화
         self.add_undo_button.setEnabled(True)
@@ -1280,30 +2171,36 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, "경고", "변경할 파일이 없습니다.")
             return
 
-        # 패턴 선택 확인
-        if self.selected_pattern is None:
+        # 패턴 선택 확인 (가져온 변경 계획이 있으면 패턴 없이도 실행 가능)
+        if self.selected_pattern is None and all(
+                info.new_name == info.original_name for info in self.file_infos):
             QMessageBox.warning(self, "경고", "패턴을 먼저 선택해주세요.")
             return
 
+        # 제외한 파일(중복 파일 등)은 원래 이름 유지
+        targets = exclude_from_rename(self.file_infos, self.excluded_paths)
+
         # 유효성 검사
-        for file_info in self.file_infos:
+        for file_info in targets:
             valid, error_msg = validate_filename(file_info.new_name)
             if not valid:
                 QMessageBox.critical(self, "오류", f"잘못된 파일명: {file_info.new_name}\n{error_msg}")
                 return
 
         # 충돌 검사
-        no_conflict, conflicts = check_conflicts(self.file_infos)
+        no_conflict, conflicts = check_conflicts(targets)
         if not no_conflict:
             conflict_list = "\n".join(conflicts)
             QMessageBox.critical(self, "오류", f"파일명 충돌이 발생했습니다:\n{conflict_list}")
             return
 
         # 확인 메시지
+        excluded_count = sum(1 for info in self.file_infos if info.original_path in self.excluded_paths)
+        excluded_note = f"\n(제외한 파일 {excluded_count}개는 변경하지 않습니다)" if excluded_count else ""
         reply = QMessageBox.question(
             self,
             "확인",
-            f"{len(self.file_infos)}개 파일의 이름을 변경하시겠습니까?",
+            f"{len(self.file_infos) - excluded_count}개 파일의 이름을 변경하시겠습니까?{excluded_note}",
             QMessageBox.Yes | QMessageBox.No
         )
 
@@ -1311,7 +2208,7 @@ class MainWindow(QMainWindow):
             return
 
         # 실행
-        results = execute_rename(self.file_infos)
+        results = execute_rename(targets)
 
         # 결과 확인
         success_count = sum(1 for success, _, _ in results if success)
@@ -1338,26 +2235,31 @@ class MainWindow(QMainWindow):
                 file_paths = [info.original_path for info in self.file_infos]
                 self.load_cover_image(file_paths)
 
-    def on_table_item_clicked(self, item):
-        """테이블 아이템 클릭 시 호출 (마우스)"""
-        if item is None:
-            return
-        row = item.row()
-        self.update_cover_for_row(row)
+    def on_gallery_option_changed(self, state):
+        """갤러리 보기 옵션 변경 시 호출"""
+        if state == 0:
+            self.cover_stack.setCurrentWidget(self.cover_image_widget)
+        else:
+            self.cover_stack.setCurrentWidget(self.cover_gallery_widget)
+            self.cover_gallery_widget.select_row(self.preview_table.current_file_index())
 
-    def on_table_current_item_changed(self, current, _previous):
-        """테이블 현재 아이템 변경 시 호출 (키보드 방향키 포함)"""
-        if current is None:
-            return
-        row = current.row()
-        self.update_cover_for_row(row)
+    def update_gallery_files(self):
+        """현재 파일 목록을 갤러리에 반영"""
+        paths = [info.original_path for info in self.file_infos]
+        labels = [info.new_name for info in self.file_infos]
+        self.cover_gallery_widget.set_files(paths, labels)
+
+    def on_gallery_row_selected(self, row: int):
+        """갤러리에서 표지 선택 시 같은 행을 테이블에서 선택"""
+        if 0 <= row < len(self.file_infos):
+            self.preview_table.select_file_index(row)
 
     def update_cover_for_row(self, row: int):
         """
         지정된 행의 표지 이미지를 업데이트
 
         Args:
-            row: 테이블 행 번호
+            row: file_infos 인덱스 (정렬/검색 후에도 원본 행 번호)
         """
         # 옵션이 활성화되어 있지 않으면 무시
         if not self.preview_all_covers_checkbox.isChecked():
@@ -1371,8 +2273,8 @@ class MainWindow(QMainWindow):
         file_info = self.file_infos[row]
         file_path = file_info.original_path
 
-        # ZIP 파일이 아니면 무시
-        if not file_path.lower().endswith('.zip'):
+        # 지원하는 압축 파일이 아니면 무시
+        if not is_supported_archive(file_path):
             return
 
         # 이미지 로드 (캐시 활용)
@@ -1383,7 +2285,7 @@ class MainWindow(QMainWindow):
         파일의 표지 이미지를 로드하여 표시 (캐싱 사용)
 
         Args:
-            file_path: ZIP 파일 경로
+            file_path: 압축 파일 경로
         """
         # 캐시 확인
         if file_path in self.image_cache:
@@ -1393,8 +2295,8 @@ class MainWindow(QMainWindow):
 
         # 캐시에 없으면 로드
         try:
-            # 이미지 추출
-            img = extract_cover_from_zip(file_path, max_size=(500, 700))
+            # 이미지 추출 (선택한 행의 표지는 백그라운드 작업보다 먼저 읽음)
+            img = extract_cover_from_zip(file_path, max_size=(500, 700), priority=PRIORITY_INTERACTIVE)
 
             # 캐시에 저장
             self.image_cache[file_path] = img
@@ -1424,12 +2326,21 @@ class MainWindow(QMainWindow):
         # 모든 데이터 초기화
         self.file_infos = []
         self.representative_patterns = []
+        self.pattern_clusters = []
+        self.cluster_row_lists = []
+        self.row_clusters = []
         self.selected_pattern = None
         self.current_folder = ""
+        self.file_status.clear()
+        self.excluded_paths.clear()
+        self.numbering_index.clear()
+        self.comic_metadata = {}
+        self.recipe_steps = []
         self.previous_file_infos_remove = None
         self.previous_file_infos_add = None
         self.previous_file_infos_pattern = None
         self.previous_pattern_text = None
+        clear_session()
 
         # UI 초기화
         self.folder_label.setText("폴더를 선택하거나 드래그 앤 드롭하세요")
@@ -1441,10 +2352,14 @@ class MainWindow(QMainWindow):
                 widget.deleteLater()
 
         # 테이블 초기화
-        self.preview_table.setRowCount(0)
+        self.preview_table.clear_files()
+        self.preview_table.set_overlay_text("")
+        self.filter_input.clear()
+        self.changed_only_checkbox.setChecked(False)
 
         # 표지 이미지 제거
         self.cover_image_widget.clear()
+        self.cover_gallery_widget.clear_files()
 
         # 이미지 캐시 초기화
         self.image_cache.clear()
@@ -1454,6 +2369,7 @@ class MainWindow(QMainWindow):
 
         # 입력창 초기화
         self.remove_input.clear()
+        self.replace_input.clear()
         self.add_input.clear()
         self.pattern_edit_input.clear()
 
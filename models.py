@@ -1,8 +1,12 @@
 """
 데이터 모델 정의
 """
-from dataclasses import dataclass
-from typing import Optional
+import os
+import weakref
+from array import array
+from itertools import accumulate
+from dataclasses import dataclass, field
+from typing import Any, Dict, Hashable, Iterable, Iterator, List, Optional, Sequence, Set, Tuple, Union
 
 
 @dataclass
@@ -27,7 +31,7 @@ class FilePattern:
         if self.title:
             parts.append(self.title.strip())
 
-        # 번호와 접미사는 공백 없이 붙임
+        # 번호와 접미사는 공백 없이 붙임 (접미사에 원본의 앞 공백이 있으면 그대로)
         number_suffix = ""
         if self.number:
             # 숫자인 경우 padding_width만큼 0으로 패딩
@@ -38,7 +42,8 @@ class FilePattern:
             else:
                 number_suffix = self.number
         if self.suffix:
-            number_suffix += self.suffix.strip()
+            # 번호 뒤의 공백은 원본대로 유지 (" extra 2"), 번호가 없으면 제목과 공백으로 구분
+            number_suffix += self.suffix.rstrip() if number_suffix else self.suffix.strip()
 
         if number_suffix:
             parts.append(number_suffix)
@@ -65,6 +70,460 @@ class FileInfo:
     @property
     def new_path(self) -> str:
         """새 파일 경로 반환"""
-        import os
         directory = os.path.dirname(self.original_path)
         return os.path.join(directory, self.new_name)
+
+
+class InternTable:
+    """반복되는 값(폴더, 패턴 필드 묶음 등)을 한 번만 저장하고 번호로 참조"""
+    __slots__ = ("_values", "_ids")
+
+    def __init__(self):
+        self._values: list = []
+        self._ids: Dict[Hashable, int] = {}
+
+    def intern(self, value: Hashable) -> int:
+        value_id = self._ids.get(value)
+        if value_id is None:
+            value_id = len(self._values)
+            self._values.append(value)
+            self._ids[value] = value_id
+        return value_id
+
+    def __getitem__(self, value_id: int):
+        return self._values[value_id]
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+
+class PackedStrings:
+    """
+    서로 다른 문자열(파일명)을 UTF-8 바이트 하나에 이어 붙여 저장 (추가만 가능)
+    str 객체마다 붙는 50바이트 남짓의 헤더를 피함
+    """
+    __slots__ = ("_data", "_offsets")
+
+    def __init__(self):
+        self._data = bytearray()
+        self._offsets = array("q", [0])
+
+    def add(self, text: str) -> int:
+        # 디코딩할 수 없는 파일명(surrogateescape)도 그대로 보존
+        self._data += text.encode("utf-8", "surrogatepass")
+        self._offsets.append(len(self._data))
+        return len(self._offsets) - 2
+
+    def __getitem__(self, string_id: int) -> str:
+        return str(self._data[self._offsets[string_id]:self._offsets[string_id + 1]], "utf-8", "surrogatepass")
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def get_many(self, string_ids: Sequence[int]) -> List[str]:
+        """여러 문자열을 한 번에 디코딩 (NUL은 파일명에 쓸 수 없으므로 구분자로 사용)"""
+        if not string_ids:
+            return []
+        data = self._data
+        offsets = self._offsets
+        joined = b"\0".join([data[offsets[i]:offsets[i + 1]] for i in string_ids])
+        return str(joined, "utf-8", "surrogatepass").split("\0")
+
+    def add_many(self, texts: Sequence[str]) -> range:
+        """여러 문자열을 한 번에 추가하고 번호 범위 반환"""
+        first_id = len(self)
+        encoded = [text.encode("utf-8", "surrogatepass") for text in texts]
+        ends = accumulate(map(len, encoded), initial=len(self._data))
+        next(ends)  # 첫 값은 현재 끝 위치
+        self._offsets.extend(ends)
+        self._data += b"".join(encoded)
+        return range(first_id, first_id + len(encoded))
+
+    @property
+    def nbytes(self) -> int:
+        return len(self._data) + self._offsets.itemsize * len(self._offsets)
+
+
+_NO_PATTERN = -1
+_SAME_AS_ORIGINAL = -1
+_UNSET = object()
+# 이 자릿수 이하의 ASCII 숫자 번호는 정수로 저장 (앞자리 0은 자릿수로 복원)
+_MAX_NUMBER_DIGITS = 9
+# 열 이름 (copy()에서 복사)
+_COLUMNS = ("_folder", "_name", "_new_name", "_shape", "_number", "_number_width")
+
+
+class FileInfoRow:
+    """
+    FileInfoStore의 한 행 (FileInfo와 같은 속성을 읽기 전용으로 제공)
+    값을 바꾸려면 새 FileInfo를 만들어 store[row]에 대입
+    읽은 값은 행 객체에 보관 (변환 함수가 같은 속성을 여러 번 읽어도 한 번만 디코딩)
+    """
+    __slots__ = ("_store", "_row", "_original_name", "_new_name", "_pattern")
+
+    def __init__(self, store: "FileInfoStore", row: int):
+        self._store = store
+        self._row = row
+        self._original_name = None
+        self._new_name = None
+        self._pattern = _UNSET
+
+    @property
+    def original_path(self) -> str:
+        return self._store.original_path(self._row, self.original_name)
+
+    @property
+    def original_name(self) -> str:
+        if self._original_name is None:
+            self._original_name = self._store.original_name(self._row)
+        return self._original_name
+
+    @property
+    def new_name(self) -> str:
+        if self._new_name is None:
+            self._new_name = self._store.new_name(self._row, self._original_name)
+        return self._new_name
+
+    @property
+    def pattern(self) -> Optional[FilePattern]:
+        # 같은 행 객체에서는 같은 패턴 객체를 반환 (변경 여부를 is로 비교하는 코드를 위해)
+        if self._pattern is _UNSET:
+            self._pattern = self._store.pattern(self._row)
+        return self._pattern
+
+    @property
+    def new_path(self) -> str:
+        return os.path.join(os.path.dirname(self.original_path), self.new_name)
+
+    def to_file_info(self) -> FileInfo:
+        return FileInfo(self.original_path, self.original_name, self.new_name, self.pattern)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, (FileInfo, FileInfoRow)):
+            return NotImplemented
+        return (self.original_path == other.original_path and self.original_name == other.original_name
+                and self.new_name == other.new_name and self.pattern == other.pattern)
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return repr(self.to_file_info()).replace("FileInfo(", "FileInfoRow(", 1)
+
+
+class FileInfoStore:
+    """
+    열 단위로 저장하는 파일 정보 목록 (수십만~백만 개 파일용, 파일당 FileInfo의 1/10 정도 메모리)
+    - 파일명은 PackedStrings, 폴더와 번호를 뺀 패턴 필드 묶음(접두사/제목/접미사/확장자/자릿수)은
+      InternTable 번호로 저장 (같은 시리즈의 파일은 한 번만 저장)
+    - 번호는 정수 + 자릿수 ("007" → 7, 3)
+    - list[FileInfo]처럼 사용: len, 반복, store[row]는 FileInfoRow, store[row] = FileInfo로 변경
+    - copy()는 문자열 저장소를 공유하고 열만 복사하며, 복사 후 바뀐 행을 기록 (changed_rows)
+    """
+
+    def __init__(self):
+        self._values = InternTable()        # 폴더, 패턴 필드 묶음, 숫자가 아닌 번호
+        self._names = PackedStrings()
+        self._folder = array("i")           # 경로에서 파일명을 뺀 부분 (-1이면 _odd_paths)
+        self._name = array("i")             # 원본 파일명 (PackedStrings 번호)
+        self._new_name = array("i")         # 변경될 파일명 (-1이면 원본과 같음)
+        self._shape = array("i")            # 패턴 필드 묶음 (-1이면 패턴 없음)
+        self._number = array("i")           # 번호 값 (자릿수가 0이면 InternTable 번호)
+        self._number_width = array("b")     # 번호 자릿수
+        self._odd_paths: Dict[int, str] = {}  # 파일명으로 끝나지 않는 경로 (드문 경우)
+        self._parent: Optional[weakref.ref] = None
+        self._dirty: set = set()
+
+    @classmethod
+    def from_file_infos(cls, file_infos: Iterable[FileInfo]) -> "FileInfoStore":
+        store = cls()
+        store.extend(file_infos)
+        return store
+
+    # --- 읽기 ---
+
+    def __len__(self) -> int:
+        return len(self._name)
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[FileInfoRow, List[FileInfoRow]]:
+        if isinstance(index, slice):
+            return [FileInfoRow(self, row) for row in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("FileInfoStore index out of range")
+        return FileInfoRow(self, index)
+
+    def __iter__(self) -> Iterator[FileInfoRow]:
+        for row in range(len(self)):
+            yield FileInfoRow(self, row)
+
+    def original_name(self, row: int) -> str:
+        return self._names[self._name[row]]
+
+    def original_path(self, row: int, original_name: Optional[str] = None) -> str:
+        folder = self._folder[row]
+        if folder < 0:
+            return self._odd_paths[row]
+        return self._values[folder] + (original_name if original_name is not None else self.original_name(row))
+
+    def new_name(self, row: int, original_name: Optional[str] = None) -> str:
+        name_id = self._new_name[row]
+        if name_id != _SAME_AS_ORIGINAL:
+            return self._names[name_id]
+        return original_name if original_name is not None else self.original_name(row)
+
+    def pattern(self, row: int) -> Optional[FilePattern]:
+        shape = self._shape[row]
+        if shape == _NO_PATTERN:
+            return None
+        prefix, title, suffix, extension, padding_width = self._values[shape]
+        return FilePattern(prefix, title, self.number_text(row), suffix, extension, padding_width)
+
+    @property
+    def nbytes(self) -> int:
+        """파일명 저장소와 열이 차지하는 대략적인 메모리 (바이트, 공유 값 표 제외)"""
+        return self._names.nbytes + sum(
+            getattr(self, name).itemsize * len(getattr(self, name)) for name in _COLUMNS
+        )
+
+    # --- 쓰기 ---
+
+    def append(self, file_info: FileInfo):
+        self.append_row(file_info.original_path, file_info.original_name, file_info.new_name, file_info.pattern)
+
+    def extend(self, file_infos: Iterable[FileInfo]):
+        for file_info in file_infos:
+            self.append(file_info)
+
+    def append_row(self, original_path: str, original_name: str, new_name: str, pattern: Optional[FilePattern]):
+        """FileInfo 객체를 만들지 않고 한 행 추가"""
+        row = len(self)
+        name_id = self._names.add(original_name)
+        self._name.append(name_id)
+        if original_name and original_path.endswith(original_name):
+            self._folder.append(self._values.intern(original_path[:-len(original_name)]))
+        else:
+            self._folder.append(-1)
+            self._odd_paths[row] = original_path
+        self._new_name.append(_SAME_AS_ORIGINAL if new_name == original_name else self._names.add(new_name))
+        self._shape.append(_NO_PATTERN)
+        self._number.append(0)
+        self._number_width.append(0)
+        self._set_pattern(row, pattern)
+
+    def __setitem__(self, row: int, file_info: FileInfo):
+        """행 변경 (같은 파일의 정보여야 함 - 원본 경로/파일명은 그대로 두고 새 파일명과 패턴만 반영)"""
+        if isinstance(file_info, FileInfoRow) and file_info._store is self and file_info._row == row:
+            return
+        if row < 0:
+            row += len(self)
+        new_name = file_info.new_name
+        if new_name == file_info.original_name:
+            self._new_name[row] = _SAME_AS_ORIGINAL
+        else:
+            self._new_name[row] = self._names.add(new_name)
+        self._set_pattern(row, file_info.pattern)
+        self._dirty.add(row)
+
+    def _set_pattern(self, row: int, pattern: Optional[FilePattern]):
+        if pattern is None:
+            self._shape[row] = _NO_PATTERN
+            return
+        self._shape[row] = self._values.intern(
+            (pattern.prefix, pattern.title, pattern.suffix, pattern.extension, pattern.padding_width)
+        )
+        number = pattern.number
+        if number.isascii() and number.isdigit() and len(number) <= _MAX_NUMBER_DIGITS:
+            self._number[row] = int(number)
+            self._number_width[row] = len(number)
+        else:
+            self._number[row] = self._values.intern(number)
+            self._number_width[row] = 0
+
+    # --- 열 단위 접근 (bulk_transforms의 벡터화 변환용) ---
+
+    def new_names(self, start: int = 0, stop: Optional[int] = None) -> List[str]:
+        """start~stop 행의 새 파일명"""
+        stop = len(self) if stop is None else stop
+        return self._names.get_many([
+            name_id if new_id == _SAME_AS_ORIGINAL else new_id
+            for name_id, new_id in zip(self._name[start:stop], self._new_name[start:stop])
+        ])
+
+    def pattern_shape_ids(self) -> array:
+        """행별 패턴 필드 묶음 번호 (-1이면 패턴 없음, 읽기 전용)"""
+        return self._shape
+
+    def pattern_shape(self, shape_id: int) -> Tuple[str, str, str, str, int]:
+        """패턴 필드 묶음 (접두사, 제목, 접미사, 확장자, 자릿수)"""
+        return self._values[shape_id]
+
+    def intern_pattern_shape(self, prefix: str, title: str, suffix: str, extension: str, padding_width: int) -> int:
+        return self._values.intern((prefix, title, suffix, extension, padding_width))
+
+    def number_columns(self) -> Tuple[array, array]:
+        """행별 번호 값과 자릿수 (자릿수가 0인 행은 number_text로 조회, 읽기 전용)"""
+        return self._number, self._number_width
+
+    def number_text(self, row: int) -> str:
+        width = self._number_width[row]
+        return str(self._number[row]).zfill(width) if width else self._values[self._number[row]]
+
+    def set_new_names(self, start: int, new_names: Sequence[str], shape_ids: Optional[Sequence[int]] = None,
+                      rows: Optional[Iterable[int]] = None):
+        """
+        start부터 연속된 행의 새 파일명(과 패턴 필드 묶음)을 한 번에 변경 (번호는 그대로)
+
+        Args:
+            new_names: start부터의 새 파일명
+            shape_ids: start부터의 패턴 필드 묶음 번호 (None이면 그대로)
+            rows: 바꿀 행의 start 기준 위치 (None이면 전부)
+        """
+        offsets = list(range(len(new_names)) if rows is None else rows)
+        rows = [start + offset for offset in offsets]
+        originals = self._names.get_many([self._name[row] for row in rows])
+        changed = [(row, offset) for row, offset, original in zip(rows, offsets, originals)
+                   if new_names[offset] != original]
+        for row in rows:
+            self._new_name[row] = _SAME_AS_ORIGINAL
+        name_ids = self._names.add_many([new_names[offset] for _, offset in changed])
+        for (row, _), name_id in zip(changed, name_ids):
+            self._new_name[row] = name_id
+        if shape_ids is not None:
+            for row, offset in zip(rows, offsets):
+                self._shape[row] = shape_ids[offset]
+        self._dirty.update(rows)
+
+    # --- 복사 / 변경 추적 ---
+
+    def copy(self) -> "FileInfoStore":
+        """
+        열만 복사한 새 목록 (값 표와 파일명 저장소는 추가만 하므로 공유해도 서로 영향 없음)
+        편집을 반복해 버려진 새 파일명이 많이 쌓였으면 살아 있는 이름만 새 저장소로 옮김
+        """
+        clone = FileInfoStore.__new__(FileInfoStore)
+        clone._values = self._values
+        clone._names = self._names
+        for name in _COLUMNS:
+            setattr(clone, name, array(getattr(self, name).typecode, getattr(self, name)))
+        clone._odd_paths = dict(self._odd_paths)
+        clone._parent = weakref.ref(self)
+        clone._dirty = set()
+        if len(self._names) > 4 * len(self) + 1024:
+            clone._repack_names()
+        return clone
+
+    def _repack_names(self):
+        names = PackedStrings()
+        for row in range(len(self)):
+            new_id = self._new_name[row]
+            self._name[row] = names.add(self._names[self._name[row]])
+            if new_id != _SAME_AS_ORIGINAL:
+                self._new_name[row] = names.add(self._names[new_id])
+        self._names = names
+
+    def _lineage(self) -> Iterator[Tuple["FileInfoStore", Set[int]]]:
+        """(조상 목록, 그 조상 이후 바뀐 행) - 자기 자신부터 copy() 원본을 거슬러 올라감"""
+        rows: Set[int] = set()
+        store = self
+        while store is not None:
+            yield store, rows
+            rows = rows | store._dirty
+            store = store._parent() if store._parent is not None else None
+
+    def changed_rows(self, other: "FileInfoStore") -> Optional[List[int]]:
+        """
+        다른 목록과 비교해 바뀌었을 수 있는 행 번호
+        두 목록이 같은 목록을 copy()해서 고친 결과일 때만 알 수 있음 (모르면 None)
+        예: 미리보기용 복사본과 적용한 복사본, 되돌리기 전후
+        """
+        if other is self:
+            return []
+        ancestors = {id(store): (store, rows) for store, rows in self._lineage()}
+        for store, rows in other._lineage():
+            mine = ancestors.get(id(store))
+            if mine is not None and mine[0] is store:
+                return sorted(mine[1] | rows)
+        return None
+
+
+def changed_rows(before: Sequence[FileInfo], after: Sequence[FileInfo]) -> Optional[List[int]]:
+    """
+    같은 파일 목록에서 새 파일명/패턴이 바뀐 행 번호 (파일 목록이 다르면 None)
+    FileInfoStore끼리는 변경 기록으로 바로 찾고, 그 외에는 행마다 비교
+    """
+    if isinstance(before, FileInfoStore) and isinstance(after, FileInfoStore):
+        candidates = after.changed_rows(before)
+        if candidates is not None:
+            return [row for row in candidates if _row_changed(before[row], after[row])]
+    if len(before) != len(after):
+        return None
+
+    rows = []
+    for row, (new, old) in enumerate(zip(after, before)):
+        if new is old:
+            continue
+        if new.original_path != old.original_path:
+            return None
+        if _row_changed(old, new):
+            rows.append(row)
+    return rows
+
+
+def _row_changed(old: FileInfo, new: FileInfo) -> bool:
+    return new.new_name != old.new_name or new.pattern != old.pattern
+
+
+@dataclass
+class PatternCluster:
+    """유사한 패턴 그룹을 묶은 클러스터"""
+    representative: FilePattern                          # 대표 패턴 (파일이 가장 많은 그룹)
+    group_keys: List[str] = field(default_factory=list)  # 병합된 그룹 키들
+    file_count: int = 0                                  # 전체 파일 수
+    confidence: float = 1.0                              # 병합 신뢰도 (1.0 = 정규화 후 동일)
+
+    @property
+    def is_merged(self) -> bool:
+        return len(self.group_keys) > 1
+
+
+@dataclass
+class ComicMetadata:
+    """압축 파일 내부 ComicInfo.xml 정보 (없는 항목은 빈 문자열)"""
+    series: str = ""      # <Series> 시리즈 이름
+    volume: str = ""      # <Volume> 권
+    issue: str = ""       # <Number> 호/화 번호
+    title: str = ""       # <Title> 권 제목
+    year: str = ""        # <Year>
+    writer: str = ""      # <Writer>
+    publisher: str = ""   # <Publisher>
+
+    def template_fields(self) -> Dict[str, str]:
+        """파일명 템플릿에 쓸 수 있는 값 (비어있지 않은 항목만)"""
+        return {key: value for key, value in vars(self).items() if value}
+
+
+@dataclass
+class RecipeStep:
+    """레시피의 작업 하나 (file_renamer 함수 호출 하나에 대응)"""
+    action: str                                            # "select_pattern", "remove_text", "add_text", "padding", "edit_pattern"
+    params: Dict[str, Any] = field(default_factory=dict)   # 작업 인자: {"text": "[공금]", "position": "all"}
+
+
+@dataclass
+class RenameRecipe:
+    """저장된 파일명 변경 작업 순서"""
+    name: str
+    steps: List[RecipeStep] = field(default_factory=list)
+
+    def to_dict(self) -> dict:
+        return {
+            "name": self.name,
+            "steps": [{"action": step.action, "params": dict(step.params)} for step in self.steps]
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "RenameRecipe":
+        steps = [RecipeStep(action=step["action"], params=dict(step.get("params", {})))
+                 for step in data.get("steps", [])]
+        return cls(name=data["name"], steps=steps)
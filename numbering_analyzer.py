@@ -0,0 +1,246 @@
+"""
+권수 번호 분석 (누락/중복/이상치)
+패턴 그룹별로 정렬된 번호 인덱스를 유지하고, 파일이 바뀐 그룹만 다시 계산
+"""
+import re
+from bisect import bisect_left, insort
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Set, Tuple
+
+from models import FileInfo
+from pattern_analyzer import make_group_key
+
+
+# 이웃 번호와 이 값보다 많이 떨어진 끝 번호는 이상치로 판단 (예: 1~12권 + 1080)
+OUTLIER_MIN_GAP = 20
+# 한 그룹의 변경 항목이 이보다 많으면 개별 삽입 대신 다시 정렬
+BULK_CHANGE_THRESHOLD = 64
+
+# 합본 범위(예: 1-3)로 인정하는 최대 권수 차이 (더 크면 번호가 아닌 것으로 보고 무시)
+MAX_RANGE_SPAN = 1000
+
+# 십진수 숫자만 허용 (전각 "１２"는 int()로 변환되지만, "²" 같은 문자는 isdigit()이 True여도 변환할 수 없음)
+_NUMBER_RE = re.compile(r'^\d+$')
+_RANGE_RE = re.compile(r'^(\d+)\s*[-~]\s*(\d+)$')
+
+
+def parse_volume_numbers(number: str) -> List[int]:
+    """
+    번호 문자열을 정수 목록으로 변환
+    "06" → [6], "1-2" → [1, 2], 그 외(소수, 너무 넓은 범위 등) → []
+    """
+    if _NUMBER_RE.match(number):
+        return [int(number)]
+
+    range_match = _RANGE_RE.match(number)
+    if range_match:
+        start, end = int(range_match.group(1)), int(range_match.group(2))
+        if start <= end and end - start <= MAX_RANGE_SPAN:
+            return list(range(start, end + 1))
+
+    return []
+
+
+def get_group_key(file_info: FileInfo) -> Optional[str]:
+    """번호 분석용 그룹 키 (pattern_analyzer.group_patterns와 같은 기준)"""
+    if not file_info.pattern:
+        return None
+    return make_group_key(file_info.pattern)
+
+
+@dataclass
+class NumberingReport:
+    """그룹 하나의 번호 분석 결과"""
+    group_key: str
+    intervals: List[Tuple[int, int]] = field(default_factory=list)   # 연속 구간: [(1, 5), (7, 12)]
+    gaps: List[Tuple[int, int]] = field(default_factory=list)        # 누락 구간: [(6, 6)]
+    duplicates: Dict[int, List[str]] = field(default_factory=dict)   # 번호 → 파일 경로들
+    outliers: Dict[int, List[str]] = field(default_factory=dict)     # 번호 → 파일 경로들
+
+    @property
+    def has_issues(self) -> bool:
+        return bool(self.gaps or self.duplicates or self.outliers)
+
+    @property
+    def title(self) -> str:
+        """표시용 그룹 이름 (prefix + title)"""
+        prefix, title = self.group_key.split('|')[:2]
+        return f"{prefix} {title}".strip()
+
+
+def format_number_range(start: int, end: int) -> str:
+    """구간 표시: 6 → "06", 6~8 → "06–08" """
+    if start == end:
+        return str(start).zfill(2)
+    return f"{str(start).zfill(2)}–{str(end).zfill(2)}"
+
+
+def analyze_sorted_numbers(group_key: str, entries: List[Tuple[int, str]]) -> NumberingReport:
+    """
+    정렬된 (번호, 경로) 목록을 한 번 훑어서 구간/누락/중복/이상치 계산
+    """
+    report = NumberingReport(group_key=group_key)
+    if not entries:
+        return report
+
+    # 1. 중복 번호 + 고유 번호 목록 (정렬되어 있으므로 인접 비교만으로 충분)
+    distinct: List[int] = []
+    paths_by_number: Dict[int, List[str]] = {}
+    for number, path in entries:
+        if distinct and distinct[-1] == number:
+            paths_by_number[number].append(path)
+        else:
+            distinct.append(number)
+            paths_by_number[number] = [path]
+
+    for number, paths in paths_by_number.items():
+        if len(set(paths)) > 1:
+            report.duplicates[number] = paths
+
+    # 2. 양 끝에서 멀리 떨어진 번호는 이상치 (누락 구간 계산에서 제외)
+    start_index, end_index = 0, len(distinct)
+    if len(distinct) >= 3:
+        while end_index - start_index >= 3 and distinct[start_index + 1] - distinct[start_index] > OUTLIER_MIN_GAP:
+            report.outliers[distinct[start_index]] = paths_by_number[distinct[start_index]]
+            start_index += 1
+        while end_index - start_index >= 3 and distinct[end_index - 1] - distinct[end_index - 2] > OUTLIER_MIN_GAP:
+            report.outliers[distinct[end_index - 1]] = paths_by_number[distinct[end_index - 1]]
+            end_index -= 1
+
+    # 3. 연속 구간과 그 사이의 누락 구간
+    core = distinct[start_index:end_index]
+    interval_start = core[0]
+    previous = core[0]
+    for number in core[1:]:
+        if number != previous + 1:
+            report.intervals.append((interval_start, previous))
+            report.gaps.append((previous + 1, number - 1))
+            interval_start = number
+        previous = number
+    report.intervals.append((interval_start, previous))
+
+    return report
+
+
+class NumberingIndex:
+    """
+    그룹별 정렬 번호 인덱스
+    update()에 새 파일 목록을 넘기면 바뀐 항목만 인덱스에서 제거/삽입하고,
+    영향받은 그룹의 결과만 다시 계산
+    """
+
+    def __init__(self):
+        # 그룹 키 → 정렬된 (번호, 경로) 목록
+        self._groups: Dict[str, List[Tuple[int, str]]] = {}
+        # 경로 → (그룹 키, 번호들)
+        self._entries: Dict[str, Tuple[str, Tuple[int, ...]]] = {}
+        # 그룹 키 → 분석 결과
+        self._reports: Dict[str, NumberingReport] = {}
+
+    def clear(self):
+        self._groups.clear()
+        self._entries.clear()
+        self._reports.clear()
+
+    def _apply_changes(self, group_key: str, removed: List[Tuple[int, str]], added: List[Tuple[int, str]]):
+        """그룹 하나의 정렬 목록에 변경 사항 반영"""
+        sorted_entries = self._groups.setdefault(group_key, [])
+
+        if len(removed) + len(added) > BULK_CHANGE_THRESHOLD:
+            # 변경이 많으면 한 번에 걸러내고 다시 정렬 (O(n log n))
+            if removed:
+                removed_set = set(removed)
+                sorted_entries[:] = [entry for entry in sorted_entries if entry not in removed_set]
+            sorted_entries.extend(added)
+            sorted_entries.sort()
+        else:
+            # 변경이 적으면 이진 탐색으로 제자리 수정
+            for entry in removed:
+                position = bisect_left(sorted_entries, entry)
+                if position < len(sorted_entries) and sorted_entries[position] == entry:
+                    del sorted_entries[position]
+            for entry in added:
+                insort(sorted_entries, entry)
+
+        if not sorted_entries:
+            del self._groups[group_key]
+
+    def update(self, file_infos: List[FileInfo]) -> Set[str]:
+        """
+        파일 목록 변경 반영
+
+        Returns:
+            다시 계산된 그룹 키 집합
+        """
+        new_entries: Dict[str, Tuple[str, Tuple[int, ...]]] = {}
+        for file_info in file_infos:
+            group_key = get_group_key(file_info)
+            if group_key is None:
+                continue
+            numbers = tuple(parse_volume_numbers(file_info.pattern.number))
+            if numbers:
+                new_entries[file_info.original_path] = (group_key, numbers)
+
+        # 그룹별 (제거할 항목, 추가할 항목)
+        changes: Dict[str, Tuple[List[Tuple[int, str]], List[Tuple[int, str]]]] = {}
+
+        # 사라졌거나 바뀐 항목
+        for path, (group_key, numbers) in self._entries.items():
+            if new_entries.get(path) != (group_key, numbers):
+                removed = changes.setdefault(group_key, ([], []))[0]
+                removed.extend((number, path) for number in numbers)
+
+        # 새로 생겼거나 바뀐 항목
+        for path, (group_key, numbers) in new_entries.items():
+            if self._entries.get(path) != (group_key, numbers):
+                added = changes.setdefault(group_key, ([], []))[1]
+                added.extend((number, path) for number in numbers)
+
+        self._entries = new_entries
+
+        for group_key, (removed, added) in changes.items():
+            self._apply_changes(group_key, removed, added)
+            if group_key in self._groups:
+                self._reports[group_key] = analyze_sorted_numbers(group_key, self._groups[group_key])
+            else:
+                self._reports.pop(group_key, None)
+
+        return set(changes)
+
+    def reports(self) -> List[NumberingReport]:
+        """파일 수가 많은 그룹부터 분석 결과 반환"""
+        return sorted(self._reports.values(), key=lambda r: -len(self._groups.get(r.group_key, [])))
+
+    def file_statuses(self) -> Dict[str, str]:
+        """상태 열에 표시할 파일별 메시지 (중복/이상치)"""
+        statuses: Dict[str, str] = {}
+        for report in self._reports.values():
+            for number, paths in report.duplicates.items():
+                for path in paths:
+                    statuses[path] = f"중복 번호 {str(number).zfill(2)}"
+            for number, paths in report.outliers.items():
+                for path in paths:
+                    statuses[path] = f"번호 이상치 {number}"
+        return statuses
+
+    def summary_lines(self, max_groups: int = 3, max_items: int = 8) -> List[str]:
+        """오버레이에 표시할 요약 (문제가 있는 그룹만)"""
+        lines = []
+        for report in self.reports():
+            if not report.has_issues:
+                continue
+            parts = []
+            if report.gaps:
+                gap_text = ", ".join(format_number_range(s, e) for s, e in report.gaps[:max_items])
+                if len(report.gaps) > max_items:
+                    gap_text += f" 외 {len(report.gaps) - max_items}개"
+                parts.append(f"누락 {gap_text}")
+            if report.duplicates:
+                numbers = sorted(report.duplicates)
+                parts.append("중복 " + ", ".join(str(n).zfill(2) for n in numbers[:max_items]))
+            if report.outliers:
+                parts.append("이상치 " + ", ".join(str(n) for n in sorted(report.outliers)[:max_items]))
+            lines.append(f"{report.title}: " + " / ".join(parts))
+            if len(lines) >= max_groups:
+                break
+        return lines
@@ -0,0 +1,304 @@
+"""
+권수/화수 번호 문법
+번호 앞 표시(Vol., 제, #), 번호 뒤 단위(권, 화), 번호가 아닌 숫자(시즌2, 1080p)를
+선언적인 규칙 목록으로 정의하고, 하나의 정규식으로 컴파일하여 파일명을 한 번만 훑음
+
+- 표시/단위 목록은 트라이(접두사 트리) 형태의 정규식으로 합쳐서
+  규칙이 늘어나도 파일명 한 글자당 비교 횟수가 거의 늘지 않음
+- 사용자 규칙: 데이터 폴더의 numbering_grammar.json
+  {"units": ["챕터"], "markers": ["round"], "ignore_markers": [], "ignore_units": []}
+"""
+import hashlib
+import json
+import os
+import re
+import threading
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from file_system import get_data_dir
+
+
+GRAMMAR_FILE_NAME = "numbering_grammar.json"
+
+# 번호 바로 뒤에 붙는 단위 (점수 가장 높음)
+DEFAULT_UNITS = ["권", "화", "회", "편", "부", "장", "話", "巻", "卷", "冊", "册"]
+# 번호 앞 표시
+DEFAULT_MARKERS = ["vol", "volume", "v", "ep", "episode", "e", "ch", "chapter", "part", "pt", "no", "#", "제", "第"]
+# 뒤따르는 숫자가 권수가 아닌 표시 (시즌2, S02, x264)
+DEFAULT_IGNORE_MARKERS = ["시즌", "season", "s", "x", "h"]
+# 앞의 숫자가 권수가 아닌 단위 (1080p, 4k, 10bit) - 숫자에 바로 붙은 경우만
+DEFAULT_IGNORE_UNITS = ["p", "i", "k", "bit", "fps", "hz", "mb", "gb"]
+
+# 후보 점수: 단위가 붙은 번호 > 표시가 앞에 있는 번호 > 단독 숫자
+SCORE_UNIT = 3
+SCORE_MARKER = 2
+SCORE_PLAIN = 1
+
+_KOREAN_DIGITS = {"일": 1, "이": 2, "삼": 3, "사": 4, "오": 5, "육": 6, "칠": 7, "팔": 8, "구": 9}
+_KOREAN_UNITS = {"십": 10, "백": 100}
+_ROMAN_VALUES = {"i": 1, "v": 5, "x": 10, "l": 50, "c": 100}
+
+# 글자(숫자/밑줄 제외) 앞뒤 경계
+_NOT_AFTER_LETTER = r"(?<![^\W\d_])"
+_NOT_BEFORE_LETTER = r"(?![^\W\d_])"
+_DIGIT_RE = re.compile(r"\d")
+
+
+def _is_single_letter(word: str) -> bool:
+    """한 글자 영문 표시 (s, x, v 등 - 제목의 일반 글자와 구분하기 어려움)"""
+    return len(word) == 1 and word.isascii() and word.isalpha()
+
+
+def korean_to_int(text: str) -> Optional[int]:
+    """한글 수사 → 정수 ("삼" → 3, "이십삼" → 23). 잘못된 형식이면 None"""
+    total = 0
+    current = 0
+    for char in text:
+        if char in _KOREAN_DIGITS:
+            if current:
+                return None
+            current = _KOREAN_DIGITS[char]
+        elif char in _KOREAN_UNITS:
+            total += (current or 1) * _KOREAN_UNITS[char]
+            current = 0
+        else:
+            return None
+    total += current
+    return total or None
+
+
+def roman_to_int(text: str) -> Optional[int]:
+    """로마 숫자 → 정수 ("IV" → 4). 잘못된 형식이면 None"""
+    values = [_ROMAN_VALUES.get(char) for char in text.lower()]
+    if not values or None in values:
+        return None
+    total = 0
+    for i, value in enumerate(values):
+        if i + 1 < len(values) and value < values[i + 1]:
+            total -= value
+        else:
+            total += value
+    # "IIII", "VX" 같은 비표준 표기는 거부
+    if total <= 0 or int_to_roman(total) != text.upper():
+        return None
+    return total
+
+
+def int_to_roman(value: int) -> str:
+    result = ""
+    for number, numeral in ((100, "C"), (90, "XC"), (50, "L"), (40, "XL"), (10, "X"),
+                            (9, "IX"), (5, "V"), (4, "IV"), (1, "I")):
+        while value >= number:
+            result += numeral
+            value -= number
+    return result
+
+
+def trie_regex(words: List[str]) -> str:
+    """
+    문자열 목록을 트라이 형태의 정규식으로 변환 (대소문자 무시는 컴파일 시 지정)
+    ["vol", "volume", "v"] → "v(?:ol(?:ume)?)?"
+    분기가 많은 곳은 첫 글자 문자 집합을 먼저 확인하여, 맞지 않는 위치에서는 분기를 하나씩 시도하지 않음
+    """
+    trie: Dict[str, dict] = {}
+    for word in words:
+        if not word:
+            continue
+        node = trie
+        for char in word.lower():
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def build(node: Dict[str, dict]) -> str:
+        children = sorted(char for char in node if char)
+        if not children:
+            return ""
+        branches = [re.escape(char) + build(node[char]) for char in children]
+        if len(branches) == 1:
+            pattern = branches[0]
+        else:
+            first_chars = "".join(re.escape(char) for char in children)
+            pattern = f"(?=[{first_chars}])(?:" + "|".join(branches) + ")"
+        return f"(?:{pattern})?" if "" in node else pattern
+
+    return build(trie)
+
+
+@dataclass
+class NumberMatch:
+    """파일명에서 찾은 권수 후보"""
+    start: int          # 번호 시작 위치 (표시는 제목에 포함)
+    end: int            # 번호 끝 위치 (단위는 suffix에 포함)
+    number: str         # 번호 문자열 ("06", "1-2", "12.5", 로마/한글 수사는 아라비아 숫자로 변환)
+    score: int
+
+
+@dataclass
+class NumberingGrammar:
+    """번호 문법 규칙 목록 (compile() 후 find_number로 사용)"""
+    units: List[str] = field(default_factory=lambda: list(DEFAULT_UNITS))
+    markers: List[str] = field(default_factory=lambda: list(DEFAULT_MARKERS))
+    ignore_markers: List[str] = field(default_factory=lambda: list(DEFAULT_IGNORE_MARKERS))
+    ignore_units: List[str] = field(default_factory=lambda: list(DEFAULT_IGNORE_UNITS))
+
+    def __post_init__(self):
+        self._regex: Optional[re.Pattern] = None
+
+    def extend(self, rules: dict):
+        """사용자 규칙 추가 (중복은 무시)"""
+        for key in ("units", "markers", "ignore_markers", "ignore_units"):
+            target = getattr(self, key)
+            for word in rules.get(key, []):
+                if isinstance(word, str) and word and word not in target:
+                    target.append(word)
+        self._regex = None
+
+    @property
+    def fingerprint(self) -> str:
+        """규칙 목록 해시 (분석 캐시 무효화용)"""
+        data = json.dumps([sorted(self.units), sorted(self.markers),
+                           sorted(self.ignore_markers), sorted(self.ignore_units)], ensure_ascii=False)
+        return hashlib.sha1(data.encode("utf-8")).hexdigest()[:8]
+
+    def compile(self) -> re.Pattern:
+        """모든 규칙을 하나의 정규식으로 컴파일"""
+        if self._regex is not None:
+            return self._regex
+
+        digits = r"\d+"
+        units = trie_regex(self.units)
+        number_forms = (
+            # 합본 범위: "1-3" 또는 단위가 붙은 "1 - 3권" (띄어 쓴 "2 - 05"는 구분자로 봄)
+            rf"(?P<range>(?P<range_start>{digits})(?:[-~]|\s*[-~]\s*(?={digits}\s*(?:{units})))"
+            rf"(?P<range_end>{digits}))"
+            rf"|(?P<decimal>{digits}\.{digits})"
+            rf"|(?P<arabic>{digits})"
+            rf"|(?P<roman>{_NOT_AFTER_LETTER}[ivxlc]+{_NOT_BEFORE_LETTER})"
+            rf"|(?P<korean>[{''.join(_KOREAN_DIGITS)}{''.join(_KOREAN_UNITS)}]+)"
+        )
+        # 권수가 아닌 숫자 (해상도, 시즌 등 - 먼저 소비하여 후보에서 제외)
+        # 한 글자 표시(s, x, h)는 숫자에 바로 붙은 경우만 (띄어 쓰면 "Spy X 3"처럼 제목의 일부)
+        ignore_forms = [rf"{digits}\s*[x×]\s*{digits}"]
+        long_markers = [word for word in self.ignore_markers if not _is_single_letter(word)]
+        short_markers = [word for word in self.ignore_markers if _is_single_letter(word)]
+        if long_markers:
+            ignore_forms.append(rf"{_NOT_AFTER_LETTER}(?:{trie_regex(long_markers)})\s*{digits}")
+        if short_markers:
+            ignore_forms.append(rf"{_NOT_AFTER_LETTER}(?:{trie_regex(short_markers)}){digits}")
+        if self.ignore_units:
+            ignore_forms.append(rf"{digits}(?:{trie_regex(self.ignore_units)}){_NOT_BEFORE_LETTER}")
+        pattern = (
+            rf"(?P<ignore>{'|'.join(ignore_forms)})"
+            # [표시] 번호 [단위]
+            rf"|(?:{_NOT_AFTER_LETTER}(?P<marker>{trie_regex(self.markers)})\.?\s*)?"
+            rf"(?P<number>{number_forms})"
+            rf"(?:\s*(?P<unit>{units}))?"
+        )
+        self._regex = re.compile(pattern, re.IGNORECASE)
+        return self._regex
+
+    def find_number(self, text: str) -> Optional[NumberMatch]:
+        """
+        권수 후보 중 가장 점수가 높은 것 반환 (동점이면 가장 뒤의 것)
+        """
+        best: Optional[NumberMatch] = None
+
+        for match in self.compile().finditer(text):
+            if match.group("ignore") is not None:
+                continue
+
+            has_marker = match.group("marker") is not None
+            has_unit = match.group("unit") is not None
+            number = match.group("number")
+            start, end = match.start("number"), match.end("number")
+
+            if match.group("range") is not None and \
+                    int(match.group("range_start")) >= int(match.group("range_end")):
+                # 내림차순은 범위가 아님 ("2024-01" 같은 날짜) - 뒤의 숫자만 번호 후보로 사용
+                has_marker = False
+                number = match.group("range_end")
+                start, end = match.start("range_end"), match.end("range_end")
+
+            if has_marker and _is_single_letter(match.group("marker")) and \
+                    _DIGIT_RE.search(text, match.end()):
+                # 한 글자 표시(v, e)는 마지막 번호 앞에 있을 때만 인정 ("Title v2 03"은 03이 권수)
+                has_marker = False
+
+            if match.group("roman") is not None or match.group("korean") is not None:
+                # 수사는 표시가 앞에 있을 때만 번호로 인정 (제목의 일반 단어와 구분)
+                # 한글 수사는 단위까지 있어야 인정 ("제일 좋아", "제이슨"은 제목)
+                if not has_marker or (match.group("korean") is not None and not has_unit):
+                    continue
+                value = roman_to_int(number) if match.group("roman") is not None else korean_to_int(number)
+                if value is None:
+                    continue
+                number = str(value)
+
+            score = SCORE_UNIT if has_unit else SCORE_MARKER if has_marker else SCORE_PLAIN
+            if best is None or score >= best.score:
+                best = NumberMatch(start, end, number, score)
+
+        return best
+
+
+_grammar: Optional[NumberingGrammar] = None
+_grammar_lock = threading.Lock()
+
+
+def load_user_rules() -> dict:
+    """데이터 폴더의 사용자 규칙 (없으면 빈 dict)"""
+    path = os.path.join(get_data_dir(), GRAMMAR_FILE_NAME)
+    if not os.path.exists(path):
+        return {}
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            rules = json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"번호 문법 파일 읽기 실패: {e}")
+        return {}
+    return rules if isinstance(rules, dict) else {}
+
+
+def get_grammar() -> NumberingGrammar:
+    """공용 번호 문법 (기본 규칙 + 사용자 규칙, 프로세스당 한 번 컴파일)"""
+    global _grammar
+    with _grammar_lock:
+        if _grammar is None:
+            grammar = NumberingGrammar()
+            grammar.extend(load_user_rules())
+            grammar.compile()
+            _grammar = grammar
+        return _grammar
+
+
+def _benchmark():
+    """규칙 수에 따른 파일명당 처리 시간 측정 (python numbering_grammar.py)"""
+    import random
+    import time
+
+    names = [
+        "[공금] 사카모토 데이즈 06권", "원피스 시즌2 12화 (1080p)", "Berserk Vol.3",
+        "진격의 거인 1-2권", "나루토 12.5화", "ＯＮＥ ＰＩＥＣＥ １２권", "제삼권 해설",
+        "Title Part IV", "Some Show S02E05 1920x1080",
+    ] * 2000
+
+    random.seed(0)
+    hangul = [chr(code) for code in range(0xAC00, 0xAC00 + 2000)]
+    print(f"{'추가 규칙 수':>12} {'파일명당 시간(us)':>18}")
+    for extra in (0, 10, 100, 1000, 5000):
+        grammar = NumberingGrammar()
+        grammar.extend({
+            "units": ["".join(random.choices(hangul, k=2)) for _ in range(extra // 2)],
+            "markers": ["".join(random.choices(hangul, k=3)) for _ in range(extra // 2)],
+        })
+        grammar.compile()
+        start = time.perf_counter()
+        for name in names:
+            grammar.find_number(name)
+        elapsed = time.perf_counter() - start
+        print(f"{extra:>12} {elapsed / len(names) * 1e6:>18.2f}")
+
+
+if __name__ == "__main__":
+    _benchmark()
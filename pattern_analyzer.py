@@ -4,7 +4,13 @@
 import re
 from typing import List, Dict
 from collections import defaultdict
-from models import FilePattern, FileInfo
+from models import FilePattern, FileInfo, PatternCluster
+from title_clustering import normalize_title, cluster_keys, DEFAULT_SIMILARITY_THRESHOLD
+from numbering_grammar import get_grammar
+
+# 분석 로직 버전 (폴더 목록 규칙 포함, 바뀌면 analysis_cache의 저장된 분석 결과를 다시 계산)
+# 사용자 번호 문법 규칙이 바뀌어도 다시 계산되도록 규칙 해시 포함
+PARSER_VERSION = f"6-{get_grammar().fingerprint}"
 
 
 def extract_pattern(filename: str) -> FilePattern:
@@ -15,8 +21,9 @@ def extract_pattern(filename: str) -> FilePattern:
 
     개선된 로직:
     - 끝의 대괄호를 먼저 제거하여 선택적 부분으로 처리
-    - 마지막 숫자를 권수/화수로 인식 (제목 내 숫자와 구분)
-    - suffix는 숫자 바로 뒤의 텍스트만 (권, 화 등)
+    - 번호 문법(numbering_grammar)으로 권수/화수 인식
+      (단위가 붙은 번호 > Vol./제 등 표시 뒤 번호 > 마지막 숫자, 시즌2/1080p 등은 제외)
+    - suffix는 숫자 바로 뒤의 텍스트만 (권, 화 등, 번호와 띄어 쓴 텍스트는 앞 공백 포함: " extra 2")
     """
     # 확장자 분리
     name_without_ext = filename
@@ -46,37 +53,36 @@ def extract_pattern(filename: str) -> FilePattern:
     else:
         name_without_bracket = name_without_ext
 
-    # 모든 숫자 찾기 (마지막 숫자를 권수로 사용)
-    number_matches = list(re.finditer(r'(\d+)', name_without_bracket))
+    # 권수/화수 후보 찾기 (규칙 전체를 합친 정규식으로 한 번만 검색)
+    number_match = get_grammar().find_number(name_without_bracket)
 
     number = ""
     title = ""
     suffix = ""
 
-    if number_matches:
-        # 마지막 숫자를 권수/화수로 간주
-        last_number_match = number_matches[-1]
-        number = last_number_match.group(1)
-        number_pos = last_number_match.start()
-        number_end = last_number_match.end()
+    if number_match:
+        number = number_match.number
+        number_pos = number_match.start
+        number_end = number_match.end
 
         # 제목: 마지막 숫자 이전까지
         title = name_without_bracket[:number_pos].strip()
 
         # 접미사: 마지막 숫자 바로 뒤의 텍스트 + 대괄호
-        suffix_text = name_without_bracket[number_end:].strip()
+        # 번호 뒤의 공백은 남겨 두어 다시 조합할 때 번호와 붙지 않게 함 ("Vol 5 extra 2")
+        suffix_text = name_without_bracket[number_end:].rstrip()
+        if suffix_text and not suffix_text.strip():
+            suffix_text = ""
 
         # suffix는 텍스트 + 대괄호 결합 (원본의 공백 여부 유지)
-        if suffix_text and suffix_bracket:
+        if suffix_bracket:
             # 원본에 공백이 있었다면 공백 포함, 없었다면 공백 없이
             if has_space_before_bracket:
                 suffix = suffix_text + " " + suffix_bracket
             else:
                 suffix = suffix_text + suffix_bracket
-        elif suffix_text:
+        else:
             suffix = suffix_text
-        elif suffix_bracket:
-            suffix = suffix_bracket
     else:
         # 숫자가 없는 경우
         title = name_without_bracket.strip()
@@ -97,6 +103,11 @@ def extract_pattern(filename: str) -> FilePattern:
     )
 
 
+def make_group_key(pattern: FilePattern) -> str:
+    """그룹 키: 번호를 제외한 prefix|title|suffix|extension"""
+    return f"{pattern.prefix}|{pattern.title}|{pattern.suffix}|{pattern.extension}"
+
+
 def group_patterns(file_infos: List[FileInfo]) -> Dict[str, List[FileInfo]]:
     """
     유사한 패턴끼리 그룹화
@@ -108,8 +119,7 @@ def group_patterns(file_infos: List[FileInfo]) -> Dict[str, List[FileInfo]]:
         pattern = file_info.pattern
         if pattern:
             # 번호를 제외한 나머지로 그룹 키 생성
-            group_key = f"{pattern.prefix}|{pattern.title}|{pattern.suffix}|{pattern.extension}"
-            groups[group_key].append(file_info)
+            groups[make_group_key(pattern)].append(file_info)
 
     return dict(groups)
 
@@ -127,6 +137,77 @@ def get_representative_patterns(groups: Dict[str, List[FileInfo]]) -> List[FileP
     return representatives
 
 
+def _is_clean_pattern(pattern: FilePattern) -> bool:
+    """접두사/접미사에 대괄호 태그가 없는 패턴인지 확인"""
+    return not pattern.prefix and '[' not in pattern.suffix
+
+
+def cluster_pattern_groups(
+    groups: Dict[str, List[FileInfo]],
+    threshold: float = DEFAULT_SIMILARITY_THRESHOLD
+) -> List[PatternCluster]:
+    """
+    제목이 거의 같은 그룹끼리 병합
+    (공백, 전각 숫자, 대괄호 태그 차이 등) - 확장자가 다르면 병합하지 않음
+    """
+    group_items = [(key, files) for key, files in groups.items() if files and files[0].pattern]
+
+    cluster_inputs = []
+    for _, files in group_items:
+        pattern = files[0].pattern
+        partition = f"{pattern.extension.lower()}|{bool(pattern.number)}"
+        title = normalize_title(f"{pattern.prefix}{pattern.title}{pattern.suffix}")
+        cluster_inputs.append((partition, title))
+
+    clusters = []
+    for member_indices, confidence in cluster_keys(cluster_inputs, threshold):
+        members = [group_items[i] for i in member_indices]
+        # 파일이 가장 많은 그룹의 패턴을 대표로 사용
+        # (동률이면 대괄호 태그가 없는 그룹 → 먼저 나온 그룹)
+        _, largest_files = max(members, key=lambda item: (len(item[1]), _is_clean_pattern(item[1][0].pattern)))
+        clusters.append(PatternCluster(
+            representative=largest_files[0].pattern,
+            group_keys=[key for key, _ in members],
+            file_count=sum(len(files) for _, files in members),
+            confidence=confidence
+        ))
+
+    return clusters
+
+
+def cluster_rows(file_infos: List[FileInfo], clusters: List[PatternCluster]) -> List[List[int]]:
+    """
+    클러스터별 행 번호 목록 (clusters와 같은 순서)
+    분석 직후의 패턴 기준이므로, 편집으로 패턴이 바뀐 뒤에도 처음 분석한 그룹 그대로 사용
+    """
+    cluster_by_key = {key: index for index, cluster in enumerate(clusters) for key in cluster.group_keys}
+    rows: List[List[int]] = [[] for _ in clusters]
+    for row, file_info in enumerate(file_infos):
+        if file_info.pattern:
+            index = cluster_by_key.get(make_group_key(file_info.pattern))
+            if index is not None:
+                rows[index].append(row)
+    return rows
+
+
+def analyze_file_clusters(filenames: List[str]) -> tuple[List[FileInfo], List[PatternCluster]]:
+    """
+    파일명 리스트를 분석하여 FileInfo와 유사 패턴 클러스터 반환
+    """
+    file_infos = [
+        FileInfo(
+            original_path="",  # 나중에 설정
+            original_name=filename,
+            new_name=filename,
+            pattern=extract_pattern(filename)
+        )
+        for filename in filenames
+    ]
+
+    clusters = cluster_pattern_groups(group_patterns(file_infos))
+    return file_infos, clusters
+
+
 def analyze_files(filenames: List[str]) -> tuple[List[FileInfo], List[FilePattern]]:
     """
     파일명 리스트를 분석하여 FileInfo와 대표 패턴 반환
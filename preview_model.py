@@ -0,0 +1,499 @@
+"""
+미리보기 테이블 모델 (검색/정렬)
+- PreviewTableModel: 파일 정보 리스트를 그대로 보여주는 모델 (행 번호 = file_infos 인덱스)
+- PreviewProxyModel: 검색/바뀐 파일만/열 정렬을 적용한 표시 순서 (원본 행 번호 목록으로 대응)
+- 검색은 2글자 n-gram 색인으로 후보 행만 확인하고, 정렬 키는 열마다 한 번만 계산하여 재사용
+  → 수만 개 파일에서도 검색어를 한 글자 입력할 때마다 바로 반영
+- 페이지 수/크기/해상도 열은 백그라운드에서 읽은 값이 도착하는 대로 해당 행만 갱신
+"""
+import re
+from bisect import bisect_left, insort
+from typing import Dict, List, Optional, Set, Tuple
+
+from PyQt5.QtCore import Qt, QAbstractTableModel, QAbstractProxyModel, QModelIndex, QTimer
+from PyQt5.QtGui import QColor
+
+from models import FileInfo, FileInfoStore, changed_rows
+from file_system import natural_sort_key
+from archive_stats import ArchiveStats, format_file_size
+
+
+COLUMN_ORIGINAL = 0
+COLUMN_NEW = 1
+COLUMN_NUMBER = 2
+COLUMN_STATUS = 3
+COLUMN_PAGES = 4
+COLUMN_SIZE = 5
+COLUMN_RESOLUTION = 6
+COLUMN_HEADERS = ["원본 파일명", "변경될 파일명", "번호", "상태", "페이지", "크기", "해상도"]
+# 압축 파일 통계 열 (ArchiveStats)
+STATS_COLUMNS = (COLUMN_PAGES, COLUMN_SIZE, COLUMN_RESOLUTION)
+
+CHANGED_COLOR = QColor(Qt.yellow)
+STATUS_COLOR = QColor("#f8d7da")
+
+# 바뀐 행이 이보다 많으면 정렬 목록을 제자리 수정하지 않고 다시 정렬
+BULK_CHANGE_THRESHOLD = 64
+# 폴더를 불러온 뒤 쉬는 시간에 검색 색인을 만들 때 한 번에 처리할 행 수 (화면이 멈추지 않도록)
+INDEX_CHUNK_ROWS = 500
+
+_NUMBER_RE = re.compile(r'\d+(?:\.\d+)?')
+
+
+def _bigrams(text: str) -> Set[str]:
+    return {text[i:i + 2] for i in range(len(text) - 1)}
+
+
+def number_sort_key(number: str):
+    """번호 정렬 키 ("06" → 6, "1-2" → 1, "12.5" → 12.5, 번호 없음은 맨 뒤)"""
+    match = _NUMBER_RE.search(number)
+    if match is None:
+        return (1, 0.0, number)
+    return (0, float(match.group()), number)
+
+
+class PreviewSearchIndex:
+    """
+    파일명 검색용 2글자 n-gram 색인 ({n-gram: 행 번호 집합})
+    검색어의 n-gram 색인을 교집합하여 후보 행을 줄인 뒤 후보만 실제 문자열 확인
+    """
+
+    def __init__(self, texts: List[str]):
+        self._texts = texts
+        self._postings: Dict[str, Set[int]] = {}
+        # 앞에서부터 이 행 수만큼 색인됨 (나머지는 build_step 또는 첫 검색 때 색인)
+        self._indexed_rows = 0
+
+    @property
+    def is_built(self) -> bool:
+        return self._indexed_rows >= len(self._texts)
+
+    def build_step(self, max_rows: Optional[int] = None) -> bool:
+        """
+        아직 색인하지 않은 행을 최대 max_rows개 색인 (None이면 전부)
+
+        Returns:
+            모든 행 색인 완료 여부
+        """
+        texts = self._texts
+        postings = self._postings
+        start = self._indexed_rows
+        end = len(texts) if max_rows is None else min(len(texts), start + max_rows)
+        for row in range(start, end):
+            for gram in _bigrams(texts[row]):
+                rows = postings.get(gram)
+                if rows is None:
+                    postings[gram] = {row}
+                else:
+                    rows.add(row)
+        self._indexed_rows = end
+        return self.is_built
+
+    def update(self, row: int, text: str):
+        """행 하나의 검색 문자열 교체 (바뀐 n-gram만 갱신)"""
+        old_text = self._texts[row]
+        if old_text == text:
+            return
+        self._texts[row] = text
+        if row >= self._indexed_rows:
+            # 아직 색인하지 않은 행은 나중에 새 문자열로 색인
+            return
+        old_grams = _bigrams(old_text)
+        new_grams = _bigrams(text)
+        for gram in old_grams - new_grams:
+            rows = self._postings.get(gram)
+            if rows is not None:
+                rows.discard(row)
+        for gram in new_grams - old_grams:
+            self._postings.setdefault(gram, set()).add(row)
+
+    def search(self, query: str, within: Optional[Set[int]] = None) -> Set[int]:
+        """
+        검색어(소문자)가 포함된 행 번호 집합
+
+        Args:
+            within: 후보 행 (이전 검색어를 포함하는 검색어를 입력한 경우 이전 결과)
+        """
+        texts = self._texts
+        if within is not None:
+            candidates = within
+        elif len(query) < 2:
+            return {row for row, text in enumerate(texts) if query in text}
+        else:
+            self.build_step()
+            postings = sorted((self._postings.get(gram, set()) for gram in _bigrams(query)), key=len)
+            candidates = postings[0].intersection(*postings[1:])
+            if len(candidates) == len(texts):
+                # 모든 행이 후보 (흔한 2글자) - 집합 연산 없이 바로 확인
+                candidates = range(len(texts))
+        return {row for row in candidates if query in texts[row]}
+
+
+class PreviewTableModel(QAbstractTableModel):
+    """
+    미리보기 테이블 모델 (원본 파일명, 변경될 파일명, 번호, 상태)
+    행 번호는 항상 file_infos 인덱스와 같음 (표지 조회 등은 이 번호 사용)
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._file_infos: List[FileInfo] = []
+        self._statuses: Dict[str, Dict[str, str]] = {}
+        # 압축 파일 통계 {원본 경로: 통계} 와 경로 → 행 번호 (통계가 처음 도착할 때 생성)
+        self._stats: Dict[str, ArchiveStats] = {}
+        self._row_by_path: Optional[Dict[str, int]] = None
+        self._search_index = PreviewSearchIndex([])
+        self._changed_rows: Set[int] = set()
+        # 열별 정렬 목록 [(정렬 키, 행 번호)] 과 그 행 순서 (데이터가 바뀌면 바뀐 행만 수정)
+        self._sort_entries: Dict[int, List[Tuple[object, int]]] = {}
+        self._sort_orders: Dict[int, List[int]] = {}
+        # 파일명이 바뀔 때마다 증가 (이전 검색 결과 재사용 여부 판단)
+        self.revision = 0
+
+        # 폴더를 불러오면 쉬는 시간에 검색 색인을 조금씩 미리 생성
+        self._index_timer = QTimer(self)
+        self._index_timer.setInterval(0)
+        self._index_timer.timeout.connect(self._build_index_step)
+
+    def _build_index_step(self):
+        if self._search_index.build_step(INDEX_CHUNK_ROWS):
+            self._index_timer.stop()
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._file_infos)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(COLUMN_HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal and 0 <= section < len(COLUMN_HEADERS):
+            return COLUMN_HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def data(self, index: QModelIndex, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        file_info = self._file_infos[index.row()]
+        column = index.column()
+
+        if role == Qt.DisplayRole:
+            if column == COLUMN_ORIGINAL:
+                return file_info.original_name
+            if column == COLUMN_NEW:
+                return file_info.new_name
+            if column == COLUMN_NUMBER:
+                return file_info.pattern.number if file_info.pattern else ""
+            if column in STATS_COLUMNS:
+                return self._stats_text(column, self._stats.get(file_info.original_path))
+            return " / ".join(self._statuses.get(file_info.original_path, {}).values())
+
+        if role == Qt.TextAlignmentRole and column in STATS_COLUMNS:
+            return int(Qt.AlignRight | Qt.AlignVCenter)
+
+        if role == Qt.BackgroundRole:
+            # 이름이 바뀌는 경우 / 검사 결과가 있는 경우 강조
+            if column == COLUMN_NEW and file_info.new_name != file_info.original_name:
+                return CHANGED_COLOR
+            if column == COLUMN_STATUS and file_info.original_path in self._statuses:
+                return STATUS_COLOR
+
+        if role == Qt.ToolTipRole and column == COLUMN_STATUS:
+            statuses = self._statuses.get(file_info.original_path)
+            if statuses:
+                return "\n".join(statuses.values())
+
+        return None
+
+    @staticmethod
+    def _stats_text(column: int, stats: Optional[ArchiveStats]) -> str:
+        if stats is None:
+            return ""
+        if column == COLUMN_SIZE:
+            return format_file_size(stats.file_size)
+        if not stats.readable:
+            return "읽기 실패" if column == COLUMN_PAGES else ""
+        if column == COLUMN_PAGES:
+            return str(stats.page_count)
+        return f"{stats.width}×{stats.height}" if stats.width else ""
+
+    @staticmethod
+    def _search_text(file_info: FileInfo) -> str:
+        # 줄바꿈으로 구분하므로 원본/새 파일명에 걸친 검색어는 찾지 않음
+        if file_info.new_name == file_info.original_name:
+            return file_info.original_name.lower()
+        return f"{file_info.original_name}\n{file_info.new_name}".lower()
+
+    def _sort_key(self, column: int, file_info: FileInfo):
+        if column == COLUMN_ORIGINAL:
+            return natural_sort_key(file_info.original_name)
+        if column == COLUMN_NEW:
+            return natural_sort_key(file_info.new_name)
+        if column == COLUMN_NUMBER:
+            return number_sort_key(file_info.pattern.number if file_info.pattern else "")
+        if column in STATS_COLUMNS:
+            # 값이 없는(아직 읽지 않은) 행은 맨 뒤
+            stats = self._stats.get(file_info.original_path)
+            if stats is None or (column != COLUMN_SIZE and not stats.readable):
+                return (1, 0)
+            if column == COLUMN_PAGES:
+                return (0, stats.page_count)
+            if column == COLUMN_SIZE:
+                return (0, stats.file_size)
+            return (0, stats.width * stats.height, stats.width)
+        # 상태가 있는 행 먼저
+        statuses = self._statuses.get(file_info.original_path)
+        return (statuses is None, " / ".join(statuses.values()) if statuses else "")
+
+    def set_file_infos(self, file_infos: List[FileInfo], statuses: Dict[str, Dict[str, str]]):
+        """
+        표시할 파일 목록 설정
+        같은 파일 목록(행 수와 원본 경로가 같음)이면 바뀐 행만 색인/정렬 목록을 갱신
+        (FileInfoStore는 복사본끼리의 변경 기록으로 바뀐 행을 바로 찾음)
+        """
+        self._statuses = statuses
+        rows = changed_rows(self._file_infos, file_infos)
+        # FileInfoStore는 편집할 때마다 새 복사본이 되므로 그대로 참조 (행 객체 목록을 만들지 않음)
+        old_infos = self._file_infos
+        self._file_infos = file_infos if isinstance(file_infos, FileInfoStore) else list(file_infos)
+
+        if rows is None:
+            self.beginResetModel()
+            self._search_index = PreviewSearchIndex([self._search_text(info) for info in self._file_infos])
+            self._changed_rows = {
+                row for row, info in enumerate(self._file_infos) if info.new_name != info.original_name
+            }
+            self._sort_entries.clear()
+            self._sort_orders.clear()
+            self._stats = {}
+            self._row_by_path = None
+            self.revision += 1
+            self.endResetModel()
+            if self._file_infos:
+                self._index_timer.start()
+            return
+
+        changed: List[Tuple[int, FileInfo]] = []
+        for row in rows:
+            new = self._file_infos[row]
+            changed.append((row, old_infos[row]))
+            self._search_index.update(row, self._search_text(new))
+            if new.new_name != new.original_name:
+                self._changed_rows.add(row)
+            else:
+                self._changed_rows.discard(row)
+
+        if changed:
+            self.revision += 1
+            # 원본 파일명 정렬은 같은 파일 목록에서 바뀌지 않음
+            for column in (COLUMN_NEW, COLUMN_NUMBER):
+                self._update_sort_entries(column, changed)
+        self.refresh_statuses(bool(changed))
+
+    def _update_sort_entries(self, column: int, changed: List[Tuple[int, FileInfo]]):
+        """정렬 목록에 바뀐 행 반영 (적으면 이진 탐색으로 제자리 수정, 많으면 다시 정렬)"""
+        entries = self._sort_entries.get(column)
+        if entries is None:
+            return
+        self._sort_orders.pop(column, None)
+
+        if len(changed) > BULK_CHANGE_THRESHOLD:
+            del self._sort_entries[column]
+            return
+
+        for row, old in changed:
+            old_entry = (self._sort_key(column, old), row)
+            position = bisect_left(entries, old_entry)
+            if position < len(entries) and entries[position] == old_entry:
+                del entries[position]
+            insort(entries, (self._sort_key(column, self._file_infos[row]), row))
+
+    def refresh_statuses(self, names_changed: bool = False):
+        """상태(검사 결과)가 바뀐 뒤 화면 갱신"""
+        self._sort_entries.pop(COLUMN_STATUS, None)
+        self._sort_orders.pop(COLUMN_STATUS, None)
+        if self._file_infos:
+            first_column = COLUMN_ORIGINAL if names_changed else COLUMN_STATUS
+            self.dataChanged.emit(
+                self.index(0, first_column),
+                self.index(len(self._file_infos) - 1, len(COLUMN_HEADERS) - 1)
+            )
+
+    def set_archive_stats(self, stats: Dict[str, ArchiveStats]):
+        """백그라운드에서 읽은 압축 파일 통계 반영 (해당 행만 다시 그림)"""
+        if self._row_by_path is None:
+            self._row_by_path = {info.original_path: row for row, info in enumerate(self._file_infos)}
+        # 이전 목록에서 요청했던 파일의 값은 무시
+        stats = {path: value for path, value in stats.items() if path in self._row_by_path}
+        if not stats:
+            return
+
+        self._stats.update(stats)
+        rows = [self._row_by_path[path] for path in stats]
+        for column in STATS_COLUMNS:
+            self._sort_entries.pop(column, None)
+            self._sort_orders.pop(column, None)
+        self.dataChanged.emit(self.index(min(rows), COLUMN_PAGES), self.index(max(rows), COLUMN_RESOLUTION))
+
+    def has_archive_stats(self, row: int) -> bool:
+        return self._file_infos[row].original_path in self._stats
+
+    def path_at(self, row: int) -> str:
+        return self._file_infos[row].original_path
+
+    def clear(self):
+        self.set_file_infos([], {})
+
+    def sorted_rows(self, column: int) -> List[int]:
+        """열 기준 오름차순 행 순서 (동률은 원래 순서, 데이터가 바뀌기 전까지 캐시)"""
+        order = self._sort_orders.get(column)
+        if order is not None:
+            return order
+
+        entries = self._sort_entries.get(column)
+        if entries is None:
+            entries = sorted((self._sort_key(column, info), row) for row, info in enumerate(self._file_infos))
+            self._sort_entries[column] = entries
+        order = [row for _, row in entries]
+        self._sort_orders[column] = order
+        return order
+
+    def search(self, query: str, within: Optional[Set[int]] = None) -> Set[int]:
+        """원본/새 파일명에 검색어가 포함된 행 번호 집합 (대소문자 무시)"""
+        return self._search_index.search(query.lower(), within)
+
+    def changed_rows(self) -> Set[int]:
+        """새 파일명이 원본과 다른 행 번호 집합"""
+        return self._changed_rows
+
+
+class PreviewProxyModel(QAbstractProxyModel):
+    """
+    검색/정렬을 적용한 표시 순서
+    표시 행 → 원본 행 번호 목록(_rows)으로 대응 (역방향은 필요할 때 계산)
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows: List[int] = []
+        self._positions: Optional[Dict[int, int]] = None
+        self._query = ""
+        self._changed_only = False
+        self._sort_column = -1
+        self._sort_order = Qt.AscendingOrder
+        # 마지막 검색 결과 (revision, 검색어, 결과) - 검색어를 이어서 입력하면 이전 결과 안에서만 확인
+        self._last_search = (-1, "", set())
+
+    def setSourceModel(self, model: PreviewTableModel):
+        super().setSourceModel(model)
+        model.modelReset.connect(self._rebuild)
+        model.dataChanged.connect(self._on_source_data_changed)
+        self._rebuild()
+
+    # --- QAbstractProxyModel ---
+
+    def mapToSource(self, proxy_index: QModelIndex) -> QModelIndex:
+        if not proxy_index.isValid() or proxy_index.row() >= len(self._rows):
+            return QModelIndex()
+        return self.sourceModel().index(self._rows[proxy_index.row()], proxy_index.column())
+
+    def mapFromSource(self, source_index: QModelIndex) -> QModelIndex:
+        if not source_index.isValid():
+            return QModelIndex()
+        position = self.proxy_row(source_index.row())
+        if position < 0:
+            return QModelIndex()
+        return self.index(position, source_index.column())
+
+    def index(self, row: int, column: int, parent=QModelIndex()) -> QModelIndex:
+        if parent.isValid() or not (0 <= row < len(self._rows)) or not (0 <= column < len(COLUMN_HEADERS)):
+            return QModelIndex()
+        return self.createIndex(row, column)
+
+    def parent(self, index=QModelIndex()) -> QModelIndex:
+        return QModelIndex()
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(COLUMN_HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Vertical:
+            # 세로 헤더는 원래 순번 (정렬/검색해도 몇 번째 파일인지 보이도록)
+            if role == Qt.DisplayRole and 0 <= section < len(self._rows):
+                return self._rows[section] + 1
+            return None
+        return self.sourceModel().headerData(section, orientation, role)
+
+    def sort(self, column: int, order=Qt.AscendingOrder):
+        """열 정렬 (column이 -1이면 원래 순서)"""
+        self._sort_column = column
+        self._sort_order = order
+        self._rebuild()
+
+    # --- 검색 ---
+
+    def set_filter(self, query: str, changed_only: bool = False):
+        """검색어와 바뀐 파일만 보기 설정"""
+        query = query.strip()
+        if query == self._query and changed_only == self._changed_only:
+            return
+        self._query = query
+        self._changed_only = changed_only
+        self._rebuild()
+
+    def source_row(self, proxy_row: int) -> int:
+        """표시 행 → 원본 행 번호 (file_infos 인덱스, 없으면 -1)"""
+        return self._rows[proxy_row] if 0 <= proxy_row < len(self._rows) else -1
+
+    def proxy_row(self, source_row: int) -> int:
+        """원본 행 번호 → 표시 행 (검색으로 숨겨졌으면 -1)"""
+        if self._positions is None:
+            self._positions = {row: position for position, row in enumerate(self._rows)}
+        return self._positions.get(source_row, -1)
+
+    def _matching_rows(self, source: PreviewTableModel) -> Optional[Set[int]]:
+        matches = None
+        if self._query:
+            revision, last_query, last_result = self._last_search
+            within = last_result if revision == source.revision and last_query and last_query in self._query else None
+            matches = source.search(self._query, within)
+            self._last_search = (source.revision, self._query, matches)
+        if self._changed_only:
+            changed = source.changed_rows()
+            matches = set(changed) if matches is None else matches & changed
+        return matches
+
+    def _rebuild(self):
+        source = self.sourceModel()
+        if source is None:
+            return
+        self.beginResetModel()
+        matches = self._matching_rows(source)
+        count = source.rowCount()
+
+        if self._sort_column < 0:
+            rows = range(count) if matches is None or len(matches) == count else sorted(matches)
+        else:
+            order = source.sorted_rows(self._sort_column)
+            if self._sort_order == Qt.DescendingOrder:
+                order = order[::-1]
+            rows = order if matches is None or len(matches) == count else [row for row in order if row in matches]
+
+        self._rows = rows
+        self._positions = None
+        self.endResetModel()
+
+    def _on_source_data_changed(self, top_left: QModelIndex, bottom_right: QModelIndex, roles=()):
+        columns = range(top_left.column(), bottom_right.column() + 1)
+        names_changed = top_left.column() <= COLUMN_NEW
+        if ((self._query or self._changed_only) and names_changed) or self._sort_column in columns:
+            # 검색/정렬 결과가 달라질 수 있으므로 표시 순서 다시 계산
+            self._rebuild()
+        elif self._rows:
+            self.dataChanged.emit(
+                self.index(0, top_left.column()),
+                self.index(len(self._rows) - 1, bottom_right.column()),
+                roles
+            )
@@ -1,13 +1,123 @@
 """
 드래그 앤 드롭을 지원하는 미리보기 테이블 위젯
+검색/정렬은 PreviewProxyModel이 처리하고, 밖으로는 항상 file_infos 인덱스(원본 행 번호)로 알림
+페이지 수/크기/해상도 열은 백그라운드에서 화면에 보이는 행부터 채움
 """
-from PyQt5.QtWidgets import QTableWidget
-from PyQt5.QtCore import Qt, pyqtSignal
-from typing import List
+from PyQt5.QtWidgets import QTableView, QLabel, QAbstractItemView, QHeaderView
+from PyQt5.QtCore import Qt, QModelIndex, QItemSelection, QItemSelectionModel, QObject, QTimer, pyqtSignal
+from typing import Dict, List, Optional, Set, Tuple
 import os
+import threading
 
+from models import FileInfo
+from archive_reader import is_image_folder, is_supported_archive
+from archive_stats import ArchiveStats, compute_archive_stats, get_cached_stats, save_stats
+from io_scheduler import PRIORITY_PREFETCH, PRIORITY_VISIBLE
+from file_system import file_signature
+from preview_model import PreviewTableModel, PreviewProxyModel, COLUMN_STATUS, COLUMN_NUMBER, STATS_COLUMNS
 
-class PreviewTableWidget(QTableWidget):
+
+# 통계 읽기 스레드 개수
+STATS_THREADS = 2
+# 이 개수만큼 새로 읽으면 캐시에 저장 (할 일이 없을 때도 저장)
+STATS_SAVE_BATCH_SIZE = 64
+# 도착한 통계를 모아서 테이블에 반영하는 간격 (ms)
+STATS_FLUSH_DELAY_MS = 150
+# 스크롤이 멈춘 뒤 보이는 행을 먼저 읽도록 요청하기까지 대기 시간 (ms)
+VISIBLE_REQUEST_DELAY_MS = 40
+
+
+class ArchiveStatsLoader(QObject):
+    """
+    백그라운드 압축 파일 통계 로더
+    전체 목록을 순서대로 읽되, prioritize로 지정한 경로(화면에 보이는 행)를 먼저 처리
+    (화면에 보이는 행은 화면 표시, 나머지는 미리 읽기 I/O 우선순위)
+    캐시에 있는 값은 바로 사용하고, 새로 읽은 값은 모아서 캐시에 저장
+    """
+
+    # (파일 경로, ArchiveStats)
+    loaded = pyqtSignal(str, object)
+
+    def __init__(self, thread_count: int = STATS_THREADS):
+        super().__init__()
+        # 둘 다 뒤에서부터 pop() (앞쪽 경로부터 처리)
+        self._queue: List[str] = []
+        self._priority: List[str] = []
+        # 처리했거나 처리 중인 경로 (다시 읽지 않음)
+        self._seen: Set[str] = set()
+        self._condition = threading.Condition()
+        self._stopped = False
+
+        for _ in range(thread_count):
+            worker = threading.Thread(target=self._run, daemon=True)
+            worker.start()
+
+    def set_paths(self, paths: List[str]):
+        """읽을 전체 경로 목록 지정 (이전 목록과 우선 요청은 버림)"""
+        with self._condition:
+            self._queue = list(reversed(paths))
+            self._priority = []
+            self._seen = set()
+            self._condition.notify_all()
+
+    def prioritize(self, paths: List[str]):
+        """먼저 읽을 경로 지정 (이전 우선 요청은 버림 - 스크롤로 지나간 행은 순서대로 나중에 읽음)"""
+        with self._condition:
+            self._priority = [path for path in reversed(paths) if path not in self._seen]
+            if self._priority:
+                self._condition.notify_all()
+
+    def stop(self):
+        """읽기 스레드 종료"""
+        with self._condition:
+            self._stopped = True
+            self._queue = []
+            self._priority = []
+            self._condition.notify_all()
+
+    def _next_path(self) -> Tuple[Optional[str], int]:
+        """(다음 경로, I/O 우선순위) - 없으면 경로가 None"""
+        for pending, priority in ((self._priority, PRIORITY_VISIBLE), (self._queue, PRIORITY_PREFETCH)):
+            while pending:
+                path = pending.pop()
+                if path not in self._seen:
+                    self._seen.add(path)
+                    return path, priority
+        return None, PRIORITY_PREFETCH
+
+    def _run(self):
+        unsaved: List[Tuple[str, Tuple[int, int], ArchiveStats]] = []
+        while True:
+            with self._condition:
+                path, priority = self._next_path()
+                while path is None and not unsaved and not self._stopped:
+                    self._condition.wait()
+                    path, priority = self._next_path()
+                if self._stopped:
+                    return
+
+            if path is None or len(unsaved) >= STATS_SAVE_BATCH_SIZE:
+                save_stats(unsaved)
+                unsaved = []
+            if path is None or os.path.isdir(path) or not is_supported_archive(path):
+                continue
+
+            signature = file_signature(path)
+            if signature is None:
+                continue
+            try:
+                stats = get_cached_stats(path, signature)
+                if stats is None:
+                    stats = compute_archive_stats(path, signature[1], priority)
+                    unsaved.append((path, signature, stats))
+            except Exception as e:
+                print(f"압축 파일 통계 읽기 실패: {path}, {e}")
+                continue
+
+            self.loaded.emit(path, stats)
+
+
+class PreviewTableWidget(QTableView):
     """
     드래그 앤 드롭으로 폴더 또는 파일 선택을 지원하는 테이블 위젯
     """
@@ -16,10 +126,54 @@ class PreviewTableWidget(QTableWidget):
     folder_dropped = pyqtSignal(str)
     # 파일 목록이 드롭되었을 때 발생하는 시그널
     files_dropped = pyqtSignal(list)
+    # 파일이 선택되었을 때 발생하는 시그널 (file_infos 인덱스 - 정렬/검색과 무관)
+    file_selected = pyqtSignal(int)
 
     def __init__(self):
         super().__init__()
 
+        # 모델: 파일 목록 → 검색/정렬 프록시 → 테이블
+        self.table_model = PreviewTableModel(self)
+        self.proxy_model = PreviewProxyModel(self)
+        self.proxy_model.setSourceModel(self.table_model)
+        self.setModel(self.proxy_model)
+
+        self.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        header = self.horizontalHeader()
+        header.setSectionResizeMode(QHeaderView.Stretch)
+        header.setSectionResizeMode(COLUMN_NUMBER, QHeaderView.ResizeToContents)
+        header.setSectionResizeMode(COLUMN_STATUS, QHeaderView.ResizeToContents)
+        for column in STATS_COLUMNS:
+            header.setSectionResizeMode(column, QHeaderView.ResizeToContents)
+        # 처음에는 폴더 순서 그대로 (열 제목을 누르면 정렬)
+        header.setSortIndicator(-1, Qt.AscendingOrder)
+        self.setSortingEnabled(True)
+
+        # 검색/정렬로 표시 순서가 바뀌어도 선택한 파일 유지
+        self._selected_source_row = -1
+        self.proxy_model.modelAboutToBeReset.connect(self._remember_selection)
+        self.proxy_model.modelReset.connect(self._restore_selection)
+        self.selectionModel().currentRowChanged.connect(self._on_current_row_changed)
+        self.clicked.connect(self._on_clicked)
+
+        # 압축 파일 통계: 목록이 바뀌면 전체를 다시 요청하고, 스크롤이 멈추면 보이는 행을 먼저 읽음
+        # 도착한 값은 모아서 한 번에 테이블에 반영
+        self.stats_loader = ArchiveStatsLoader()
+        self.stats_loader.loaded.connect(self._on_stats_loaded)
+        self._arrived_stats: Dict[str, ArchiveStats] = {}
+        self._stats_flush_timer = QTimer(self)
+        self._stats_flush_timer.setSingleShot(True)
+        self._stats_flush_timer.setInterval(STATS_FLUSH_DELAY_MS)
+        self._stats_flush_timer.timeout.connect(self._flush_stats)
+        self._visible_timer = QTimer(self)
+        self._visible_timer.setSingleShot(True)
+        self._visible_timer.setInterval(VISIBLE_REQUEST_DELAY_MS)
+        self._visible_timer.timeout.connect(self.request_visible_stats)
+        self.table_model.modelReset.connect(self._restart_stats_loading)
+        self.proxy_model.modelReset.connect(self._visible_timer.start)
+        self.verticalScrollBar().valueChanged.connect(self._visible_timer.start)
+
         # 드래그 앤 드롭 활성화
         self.setAcceptDrops(True)
 
@@ -28,7 +182,7 @@ class PreviewTableWidget(QTableWidget):
 
         # 기본 스타일 저장
         self.default_style = """
-            QTableWidget {
+            QTableView {
                 gridline-color: #d0d0d0;
                 selection-background-color: #0078d4;
                 selection-color: white;
@@ -44,7 +198,7 @@ class PreviewTableWidget(QTableWidget):
 
         # 드래그 중 스타일
         self.dragging_style = """
-            QTableWidget {
+            QTableView {
                 gridline-color: #d0d0d0;
                 selection-background-color: #0078d4;
                 selection-color: white;
@@ -62,6 +216,190 @@ class PreviewTableWidget(QTableWidget):
 
         self.setStyleSheet(self.default_style)
 
+        # 번호 분석 결과 오버레이 (테이블 오른쪽 위에 반투명 표시)
+        self.overlay_label = QLabel(self.viewport())
+        self.overlay_label.setStyleSheet("""
+            QLabel {
+                background-color: rgba(255, 243, 205, 220);
+                color: #856404;
+                border: 1px solid #ffeeba;
+                border-radius: 4px;
+                padding: 6px 10px;
+            }
+        """)
+        self.overlay_label.setAttribute(Qt.WA_TransparentForMouseEvents)
+        self.overlay_label.hide()
+
+    def set_file_infos(self, file_infos: List[FileInfo], statuses: Dict[str, Dict[str, str]]):
+        """
+        표시할 파일 목록 설정 (같은 파일 목록이면 바뀐 행만 갱신)
+
+        Args:
+            file_infos: 파일 정보 리스트
+            statuses: 상태 열 내용 {원본 경로: {검사 종류: 메시지}}
+        """
+        self.table_model.set_file_infos(file_infos, statuses)
+
+    def refresh_statuses(self):
+        """상태 열만 다시 표시"""
+        self.table_model.refresh_statuses()
+
+    def clear_files(self):
+        """파일 목록 비우기 (정렬도 원래 순서로)"""
+        self.table_model.clear()
+        self.horizontalHeader().setSortIndicator(-1, Qt.AscendingOrder)
+        self.proxy_model.sort(-1)
+
+    def set_filter(self, query: str, changed_only: bool = False):
+        """검색어/바뀐 파일만 보기 적용"""
+        self.proxy_model.set_filter(query, changed_only)
+
+    def visible_count(self) -> int:
+        """검색 후 표시 중인 행 수"""
+        return self.proxy_model.rowCount()
+
+    def current_file_index(self) -> int:
+        """현재 선택된 파일의 file_infos 인덱스 (없으면 -1)"""
+        return self.proxy_model.source_row(self.currentIndex().row())
+
+    def selected_file_indices(self) -> List[int]:
+        """선택한 행들의 file_infos 인덱스 (오름차순)"""
+        return sorted(self.proxy_model.source_row(index.row()) for index in self.selectionModel().selectedRows())
+
+    def select_file_index(self, file_index: int) -> bool:
+        """file_infos 인덱스로 행 선택 (검색으로 숨겨진 파일이면 False)"""
+        row = self.proxy_model.proxy_row(file_index)
+        if row < 0:
+            return False
+        if row != self.currentIndex().row():
+            self.selectRow(row)
+        return True
+
+    def select_file_indices(self, file_indices: List[int], current: int = -1):
+        """
+        여러 파일 선택 (세션 복원용 - 연속된 행은 한 범위로 묶어 선택)
+
+        Args:
+            file_indices: 선택할 file_infos 인덱스
+            current: 현재 행으로 둘 file_infos 인덱스 (-1이면 첫 번째 선택)
+        """
+        rows = sorted(row for row in (self.proxy_model.proxy_row(index) for index in file_indices) if row >= 0)
+        current_row = self.proxy_model.proxy_row(current) if current >= 0 else -1
+        if current_row < 0 and rows:
+            current_row = rows[0]
+        if current_row < 0:
+            return
+
+        last_column = self.proxy_model.columnCount() - 1
+        selection = QItemSelection()
+        start = previous = None
+        for row in rows + [None]:
+            if start is not None and (row is None or row != previous + 1):
+                selection.select(self.proxy_model.index(start, 0), self.proxy_model.index(previous, last_column))
+                start = None
+            if row is not None and start is None:
+                start = row
+            previous = row
+
+        selection_model = self.selectionModel()
+        selection_model.setCurrentIndex(self.proxy_model.index(current_row, 0), QItemSelectionModel.NoUpdate)
+        selection_model.select(selection, QItemSelectionModel.ClearAndSelect | QItemSelectionModel.Rows)
+        self.file_selected.emit(self.proxy_model.source_row(current_row))
+        self.scrollTo(self.proxy_model.index(current_row, 0))
+
+    def sort_state(self) -> Tuple[int, bool]:
+        """현재 정렬 (열 번호 - 원래 순서면 -1, 내림차순 여부)"""
+        header = self.horizontalHeader()
+        return header.sortIndicatorSection(), header.sortIndicatorOrder() == Qt.DescendingOrder
+
+    def set_sort_state(self, column: int, descending: bool):
+        """정렬 복원"""
+        if column < 0 or column >= self.proxy_model.columnCount():
+            return
+        self.sortByColumn(column, Qt.DescendingOrder if descending else Qt.AscendingOrder)
+
+    def _restart_stats_loading(self):
+        """파일 목록이 바뀌면 전체 통계를 처음부터 요청 (캐시에 있는 값은 바로 채워짐)"""
+        self._arrived_stats.clear()
+        model = self.table_model
+        self.stats_loader.set_paths([model.path_at(row) for row in range(model.rowCount())])
+        self._visible_timer.start()
+
+    def visible_file_indices(self) -> List[int]:
+        """화면에 보이는 행의 file_infos 인덱스 (위에서부터)"""
+        row_count = self.proxy_model.rowCount()
+        if row_count == 0:
+            return []
+        first_row = max(0, self.rowAt(0))
+        last_row = self.rowAt(self.viewport().height() - 1)
+        if last_row < 0:
+            last_row = row_count - 1
+        return [self.proxy_model.source_row(row) for row in range(first_row, last_row + 1)]
+
+    def request_visible_stats(self):
+        """보이는 행 중 통계가 없는 파일을 먼저 읽도록 요청"""
+        model = self.table_model
+        self.stats_loader.prioritize([
+            model.path_at(row) for row in self.visible_file_indices() if not model.has_archive_stats(row)
+        ])
+
+    def _on_stats_loaded(self, path: str, stats: ArchiveStats):
+        self._arrived_stats[path] = stats
+        if not self._stats_flush_timer.isActive():
+            self._stats_flush_timer.start()
+
+    def _flush_stats(self):
+        if self._arrived_stats:
+            arrived, self._arrived_stats = self._arrived_stats, {}
+            self.table_model.set_archive_stats(arrived)
+
+    def _remember_selection(self):
+        self._selected_source_row = self.current_file_index()
+
+    def _restore_selection(self):
+        row = self.proxy_model.proxy_row(self._selected_source_row)
+        if row >= 0:
+            self.selectRow(row)
+            self.scrollTo(self.proxy_model.index(row, 0))
+
+    def _on_current_row_changed(self, current: QModelIndex, _previous: QModelIndex):
+        """현재 행 변경 (키보드 방향키 포함)"""
+        if current.isValid():
+            self.file_selected.emit(self.proxy_model.source_row(current.row()))
+
+    def _on_clicked(self, index: QModelIndex):
+        """마우스 클릭 (같은 행을 다시 눌러도 표지 갱신)"""
+        if index.isValid():
+            self.file_selected.emit(self.proxy_model.source_row(index.row()))
+
+    def set_overlay_text(self, text: str):
+        """
+        오버레이 문구 설정 (빈 문자열이면 숨김)
+
+        Args:
+            text: 표시할 문구 (여러 줄 가능)
+        """
+        if not text:
+            self.overlay_label.hide()
+            return
+
+        self.overlay_label.setText(text)
+        self.overlay_label.adjustSize()
+        self.position_overlay()
+        self.overlay_label.show()
+        self.overlay_label.raise_()
+
+    def position_overlay(self):
+        """오버레이를 뷰포트 오른쪽 위에 배치"""
+        margin = 8
+        x = max(margin, self.viewport().width() - self.overlay_label.width() - margin)
+        self.overlay_label.move(x, margin)
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self.position_overlay()
+        self._visible_timer.start()
+
     def dragEnterEvent(self, event):
         """드래그가 위젯 영역에 들어왔을 때"""
         # MIME 데이터 확인
@@ -102,15 +440,15 @@ class PreviewTableWidget(QTableWidget):
                 # 모든 URL을 로컬 파일 경로로 변환
                 paths = [url.toLocalFile() for url in urls]
 
-                # 첫 번째 항목이 폴더인지 확인
-                if os.path.isdir(paths[0]):
+                # 폴더 하나만 드롭했으면 폴더 열기
+                if len(paths) == 1 and os.path.isdir(paths[0]):
                     # 폴더면 folder_dropped 시그널 발생
                     self.folder_dropped.emit(paths[0])
                     event.acceptProposedAction()
                     return
                 else:
-                    # 파일이면 파일 목록만 필터링하여 files_dropped 시그널 발생
-                    file_paths = [p for p in paths if os.path.isfile(p)]
+                    # 여러 항목이면 파일과 이미지 폴더(한 권으로 취급)만 필터링하여 files_dropped 시그널 발생
+                    file_paths = [p for p in paths if os.path.isfile(p) or is_image_folder(p)]
                     if file_paths:
                         self.files_dropped.emit(file_paths)
                         event.acceptProposedAction()
@@ -0,0 +1,214 @@
+"""
+파일명 변경 계획 내보내기/가져오기 (CSV, JSONL)
+스프레드시트에서 검토/수정한 뒤 다시 가져와 적용
+- 내보내기: 파일 정보를 한 줄씩 바로 기록 (행 목록을 따로 만들지 않음)
+- 가져오기: 원본 경로 해시 인덱스로 파일을 찾고, 모든 행을 적용한 뒤 한 번에 검사
+"""
+import csv
+import json
+import os
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Optional
+
+from models import FileInfo
+from file_system import validate_filename
+
+
+PLAN_FIELDS = [
+    "original_path", "original_name", "new_name",
+    "prefix", "title", "number", "suffix", "extension", "status",
+]
+# 엑셀에서 한글이 깨지지 않도록 BOM 포함
+CSV_ENCODING = "utf-8-sig"
+
+
+class PlanError(Exception):
+    """계획 파일을 읽거나 쓸 수 없을 때 발생"""
+    pass
+
+
+@dataclass
+class PlanImportResult:
+    """계획 가져오기 결과"""
+    file_infos: List[FileInfo]
+    applied: int = 0                                        # 새 이름이 바뀐 파일 수
+    unmatched: List[str] = field(default_factory=list)      # 현재 목록에 없는 원본 경로
+    errors: Dict[str, str] = field(default_factory=dict)    # {원본 경로: 검사 오류}
+
+
+def _plan_format(path: str) -> str:
+    extension = os.path.splitext(path)[1].lower()
+    if extension == ".csv":
+        return "csv"
+    if extension in (".jsonl", ".json"):
+        return "jsonl"
+    raise PlanError(f"지원하지 않는 형식입니다: {extension or path} (CSV 또는 JSONL)")
+
+
+def _path_key(path: str) -> str:
+    """경로 비교용 키 (구분자/대소문자 차이 무시 - Windows 기준)"""
+    return os.path.normcase(os.path.normpath(path))
+
+
+def _conflict_keys(file_infos: List[FileInfo]) -> set:
+    """같은 폴더에서 새 이름이 겹치는 (폴더, 이름) 키 집합"""
+    counts = Counter(
+        (_path_key(os.path.dirname(info.original_path)), info.new_name.lower())
+        for info in file_infos
+    )
+    return {key for key, count in counts.items() if count > 1}
+
+
+def validate_plan(file_infos: List[FileInfo]) -> Dict[str, str]:
+    """
+    모든 파일의 새 이름을 한 번에 검사 (잘못된 파일명, 같은 폴더 안 이름 충돌)
+
+    Returns:
+        {원본 경로: 오류 메시지}
+    """
+    conflicts = _conflict_keys(file_infos)
+    errors: Dict[str, str] = {}
+    for info in file_infos:
+        if not info.new_name:
+            errors[info.original_path] = "새 파일명이 비어 있습니다."
+            continue
+        valid, error_msg = validate_filename(info.new_name)
+        if not valid:
+            errors[info.original_path] = error_msg
+        elif (_path_key(os.path.dirname(info.original_path)), info.new_name.lower()) in conflicts:
+            errors[info.original_path] = f"파일명 충돌: {info.new_name}"
+    return errors
+
+
+def iter_plan_rows(
+    file_infos: List[FileInfo],
+    statuses: Optional[Dict[str, Dict[str, str]]] = None
+) -> Iterator[Dict[str, str]]:
+    """
+    내보낼 행을 하나씩 생성
+
+    Args:
+        file_infos: 파일 정보 리스트
+        statuses: 화면 상태 열 내용 {원본 경로: {검사 종류: 메시지}} (검사 결과와 함께 기록)
+    """
+    errors = validate_plan(file_infos)
+    statuses = statuses or {}
+
+    for info in file_infos:
+        pattern = info.pattern
+        messages = []
+        if info.original_path in errors:
+            messages.append(errors[info.original_path])
+        messages.extend(statuses.get(info.original_path, {}).values())
+
+        yield {
+            "original_path": info.original_path,
+            "original_name": info.original_name,
+            "new_name": info.new_name,
+            "prefix": pattern.prefix if pattern else "",
+            "title": pattern.title if pattern else "",
+            "number": pattern.number if pattern else "",
+            "suffix": pattern.suffix if pattern else "",
+            "extension": pattern.extension if pattern else "",
+            "status": " / ".join(messages),
+        }
+
+
+def export_plan(
+    file_infos: List[FileInfo],
+    path: str,
+    statuses: Optional[Dict[str, Dict[str, str]]] = None
+) -> int:
+    """
+    변경 계획을 CSV 또는 JSONL 파일로 저장 (확장자로 형식 결정)
+
+    Returns:
+        기록한 행 수
+    """
+    plan_format = _plan_format(path)
+    temp_path = path + ".tmp"
+    count = 0
+
+    try:
+        if plan_format == "csv":
+            with open(temp_path, "w", encoding=CSV_ENCODING, newline="") as f:
+                writer = csv.DictWriter(f, fieldnames=PLAN_FIELDS)
+                writer.writeheader()
+                for row in iter_plan_rows(file_infos, statuses):
+                    writer.writerow(row)
+                    count += 1
+        else:
+            with open(temp_path, "w", encoding="utf-8") as f:
+                for row in iter_plan_rows(file_infos, statuses):
+                    f.write(json.dumps(row, ensure_ascii=False))
+                    f.write("\n")
+                    count += 1
+        os.replace(temp_path, path)
+    except OSError as e:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise PlanError(f"계획 파일 저장 실패: {e}")
+
+    return count
+
+
+def read_plan_rows(path: str) -> Iterator[Dict[str, str]]:
+    """계획 파일의 행을 하나씩 읽기 (파일 전체를 메모리에 올리지 않음)"""
+    plan_format = _plan_format(path)
+    try:
+        if plan_format == "csv":
+            with open(path, "r", encoding=CSV_ENCODING, newline="") as f:
+                reader = csv.DictReader(f)
+                if reader.fieldnames is None or "original_path" not in reader.fieldnames:
+                    raise PlanError("CSV에 original_path 열이 없습니다.")
+                yield from reader
+        else:
+            with open(path, "r", encoding="utf-8") as f:
+                for line_number, line in enumerate(f, start=1):
+                    if not line.strip():
+                        continue
+                    try:
+                        row = json.loads(line)
+                    except ValueError as e:
+                        raise PlanError(f"{line_number}번째 줄을 읽을 수 없습니다: {e}")
+                    if isinstance(row, dict):
+                        yield row
+    except (OSError, UnicodeDecodeError) as e:
+        raise PlanError(f"계획 파일 읽기 실패: {e}")
+
+
+def import_plan(file_infos: List[FileInfo], path: str) -> PlanImportResult:
+    """
+    수정한 계획 파일의 새 이름을 현재 파일 목록에 적용
+
+    Args:
+        file_infos: 현재 파일 정보 리스트 (변경하지 않음)
+        path: 계획 파일 경로 (CSV 또는 JSONL)
+
+    Returns:
+        새 이름이 적용된 파일 정보 리스트와 검사 결과
+        (이름이 바뀐 파일만 새 객체로 복사)
+
+    Raises:
+        PlanError: 파일을 읽을 수 없거나 형식이 잘못된 경우
+    """
+    index = {_path_key(info.original_path): i for i, info in enumerate(file_infos)}
+    updated = file_infos.copy()
+    result = PlanImportResult(file_infos=updated)
+
+    for row in read_plan_rows(path):
+        original_path = str(row.get("original_path") or "")
+        position = index.get(_path_key(original_path)) if original_path else None
+        if position is None:
+            result.unmatched.append(original_path)
+            continue
+
+        new_name = str(row.get("new_name") or "").strip()
+        if new_name != updated[position].new_name:
+            current = updated[position]
+            updated[position] = FileInfo(current.original_path, current.original_name, new_name, current.pattern)
+            result.applied += 1
+
+    result.errors = validate_plan(updated)
+    return result
@@ -0,0 +1,202 @@
+"""
+파일명 변경 레시피 (작업 순서 저장/적용)
+GUI에서 한 작업(패턴 선택, 텍스트 제거/추가, 자릿수, 패턴 편집)을 이름 붙여 저장하고
+다른 폴더에 같은 순서로 다시 적용
+"""
+import json
+import os
+import re
+from typing import Dict, List, Optional
+
+from models import FileInfo, PatternCluster, RecipeStep, RenameRecipe
+from file_renamer import (
+    apply_pattern, remove_text, add_text, change_padding_width, regex_replace,
+    apply_custom_pattern, build_custom_template, template_uses_metadata
+)
+from comic_metadata import load_comic_metadata
+from file_system import get_data_dir
+
+
+RECIPE_FILE_NAME = "recipes.json"
+
+ACTION_LABELS = {
+    "select_pattern": "패턴 선택",
+    "remove_text": "텍스트 제거",
+    "regex_replace": "찾아 바꾸기",
+    "add_text": "텍스트 추가",
+    "padding": "자릿수",
+    "edit_pattern": "패턴 편집",
+}
+
+
+class RecipeError(Exception):
+    """레시피를 폴더에 적용할 수 없을 때 발생"""
+    pass
+
+
+def describe_step(step: RecipeStep) -> str:
+    """작업 하나를 사람이 읽을 수 있는 문자열로 변환"""
+    description = _describe_action(step)
+    if is_selection_step(step):
+        description += " [선택한 파일만 - 다른 폴더에는 적용하지 않음]"
+    return description
+
+
+def is_selection_step(step: RecipeStep) -> bool:
+    """선택한 파일/패턴 그룹에만 적용한 작업인지 (레시피 적용 시 건너뜀)"""
+    return step.params.get("scope") == "selection"
+
+
+def _describe_action(step: RecipeStep) -> str:
+    label = ACTION_LABELS.get(step.action, step.action)
+    if step.action == "select_pattern":
+        return f"{label}: 파일 수 {step.params.get('rank', 0) + 1}순위 패턴"
+    if step.action in ("remove_text", "add_text"):
+        return f"{label}: '{step.params.get('text', '')}' ({step.params.get('position', '')})"
+    if step.action == "regex_replace":
+        return (f"{label}: /{step.params.get('pattern', '')}/ → '{step.params.get('replacement', '')}' "
+                f"({step.params.get('position', '')})")
+    if step.action == "padding":
+        return f"{label}: {step.params.get('width')}자리"
+    if step.action == "edit_pattern":
+        extra = " (번호 없는 파일 포함)" if step.params.get("include_unnumbered") else ""
+        return f"{label}: '{step.params.get('title', '')}'{extra}"
+    return label
+
+
+def clusters_by_size(pattern_clusters: List[PatternCluster]) -> List[PatternCluster]:
+    """
+    파일이 많은 순으로 정렬한 클러스터 (동률이면 먼저 나온 순)
+    레시피의 패턴 선택 순위(rank)는 이 순서 기준 - 폴더마다 파일 순서가 달라도 같은 의미
+    """
+    return sorted(pattern_clusters, key=lambda cluster: -cluster.file_count)
+
+
+def pattern_rank(pattern_clusters: List[PatternCluster], index: int) -> int:
+    """화면 목록의 index번째 클러스터가 파일 수 기준 몇 번째인지 반환"""
+    return clusters_by_size(pattern_clusters).index(pattern_clusters[index])
+
+
+def apply_recipe(
+    file_infos: List[FileInfo],
+    pattern_clusters: List[PatternCluster],
+    recipe: RenameRecipe
+) -> List[FileInfo]:
+    """
+    분석된 파일 목록에 레시피 작업을 순서대로 적용
+
+    Args:
+        file_infos: 패턴 분석된 파일 정보 리스트
+        pattern_clusters: 패턴 클러스터 (분석 결과 순서 그대로)
+        recipe: 적용할 레시피
+
+    Returns:
+        새 파일명이 설정된 파일 정보 리스트
+
+    Raises:
+        RecipeError: 선택할 패턴이 없거나 알 수 없는 작업인 경우
+    """
+    selected_pattern = None
+    ranked_clusters = clusters_by_size(pattern_clusters)
+
+    for step in recipe.steps:
+        params = step.params
+
+        if is_selection_step(step):
+            # 원래 폴더에서 고른 파일에만 적용한 작업
+            continue
+
+        if step.action == "select_pattern":
+            rank = params.get("rank", 0)
+            if rank >= len(ranked_clusters):
+                raise RecipeError(f"{rank + 1}번째 패턴이 없습니다 (패턴 {len(ranked_clusters)}개)")
+            selected_pattern = ranked_clusters[rank].representative
+            file_infos = apply_pattern(file_infos, selected_pattern)
+
+        elif step.action == "remove_text":
+            file_infos = remove_text(file_infos, params.get("text", ""), params.get("position", "all"))
+
+        elif step.action == "regex_replace":
+            try:
+                file_infos = regex_replace(file_infos, params.get("pattern", ""), params.get("replacement", ""),
+                                           params.get("position", "all"), params.get("ignore_case", False))
+            except re.error as e:
+                raise RecipeError(f"찾아 바꾸기 정규식 오류: {e}")
+
+        elif step.action == "add_text":
+            file_infos = add_text(file_infos, params.get("text", ""), params.get("position", "front"))
+
+        elif step.action == "padding":
+            file_infos = change_padding_width(file_infos, params.get("width", 2))
+
+        elif step.action == "edit_pattern":
+            if selected_pattern is None:
+                raise RecipeError("패턴 편집 전에 패턴 선택 작업이 필요합니다.")
+            template = build_custom_template(params.get("title", ""), selected_pattern)
+            metadata = None
+            if template_uses_metadata(template):
+                metadata = load_comic_metadata([info.original_path for info in file_infos])
+            file_infos = apply_custom_pattern(file_infos, template, metadata,
+                                              include_unnumbered=params.get("include_unnumbered", False))
+
+        else:
+            raise RecipeError(f"알 수 없는 작업: {step.action}")
+
+    return file_infos
+
+
+def _recipe_file_path() -> str:
+    return os.path.join(get_data_dir(), RECIPE_FILE_NAME)
+
+
+def load_recipes() -> Dict[str, RenameRecipe]:
+    """저장된 레시피 목록 (이름 → 레시피)"""
+    path = _recipe_file_path()
+    if not os.path.exists(path):
+        return {}
+
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"레시피 파일 읽기 실패: {e}")
+        return {}
+
+    recipes = {}
+    for item in data.get("recipes", []):
+        try:
+            recipe = RenameRecipe.from_dict(item)
+        except (KeyError, TypeError) as e:
+            print(f"잘못된 레시피 건너뜀: {e}")
+            continue
+        recipes[recipe.name] = recipe
+    return recipes
+
+
+def _write_recipes(recipes: Dict[str, RenameRecipe]):
+    path = _recipe_file_path()
+    temp_path = path + ".tmp"
+    data = {"recipes": [recipe.to_dict() for recipe in recipes.values()]}
+    with open(temp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+    os.replace(temp_path, path)
+
+
+def save_recipe(recipe: RenameRecipe):
+    """레시피 저장 (같은 이름이 있으면 덮어씀)"""
+    recipes = load_recipes()
+    recipes[recipe.name] = recipe
+    _write_recipes(recipes)
+
+
+def delete_recipe(name: str) -> bool:
+    """레시피 삭제. 삭제했으면 True"""
+    recipes = load_recipes()
+    if recipes.pop(name, None) is None:
+        return False
+    _write_recipes(recipes)
+    return True
+
+
+def get_recipe(name: str) -> Optional[RenameRecipe]:
+    return load_recipes().get(name)
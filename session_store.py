@@ -0,0 +1,182 @@
+"""
+작업 세션 저장/복원 (프로그램을 다시 시작하면 마지막 작업 상태로 복원)
+- 폴더, 선택한 패턴, 작업 기록, 바뀐 파일의 새 이름, 미리보기 선택/검색 상태를 저장
+- 이름이 바뀐 파일만 원본 파일명 기준으로 저장하고 gzip으로 압축 (수만 개 파일도 작은 크기)
+- 복원 시 폴더 서명이 같으면 분석 캐시에서 바로 다시 그리고, 바뀌었으면 새 파일만 분석
+  (저장된 새 이름은 아직 있는 파일에만 적용)
+"""
+import gzip
+import json
+import os
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from file_system import get_data_dir, file_signature
+from models import FileInfo, FilePattern, RecipeStep
+
+
+SESSION_FILE_NAME = "session.json.gz"
+# 저장 형식이 바뀌면 증가 (다른 버전의 세션은 무시)
+SESSION_VERSION = 1
+
+_PATTERN_FIELDS = ("prefix", "title", "number", "suffix", "extension", "padding_width")
+
+
+@dataclass
+class WorkspaceSession:
+    """저장된 작업 상태"""
+    folder: str = ""                                        # 폴더 (파일 목록 모드면 빈 문자열)
+    paths: List[str] = field(default_factory=list)          # 파일 목록 모드의 파일 경로
+    fingerprint: Optional[Tuple[int, int]] = None           # 저장할 때의 폴더 서명
+    selected_pattern: Optional[FilePattern] = None
+    pattern_text: str = ""                                  # 패턴 편집 입력창
+    recipe_steps: List[RecipeStep] = field(default_factory=list)
+    # {원본 파일명: (새 파일명, 패턴)} - 이름이 바뀐 파일만
+    edits: Dict[str, Tuple[str, Optional[FilePattern]]] = field(default_factory=dict)
+    selected_names: List[str] = field(default_factory=list)  # 미리보기에서 선택한 파일 (원본 파일명)
+    current_name: str = ""                                   # 현재 행 (원본 파일명)
+    filter_text: str = ""
+    changed_only: bool = False
+    sort_column: int = -1                                    # 미리보기 정렬 열 (-1이면 원래 순서)
+    sort_descending: bool = False
+
+    @property
+    def is_empty(self) -> bool:
+        return not self.folder and not self.paths
+
+    def folder_unchanged(self) -> bool:
+        """저장한 뒤 폴더가 바뀌지 않았는지 (폴더 서명 비교)"""
+        return bool(self.folder) and self.fingerprint is not None and \
+            file_signature(os.path.abspath(self.folder)) == tuple(self.fingerprint)
+
+
+def collect_edits(file_infos: List[FileInfo]) -> Dict[str, Tuple[str, Optional[FilePattern]]]:
+    """이름이 바뀐 파일의 새 이름/패턴"""
+    return {
+        info.original_name: (info.new_name, info.pattern)
+        for info in file_infos
+        if info.new_name != info.original_name
+    }
+
+
+def apply_edits(
+    file_infos: List[FileInfo],
+    edits: Dict[str, Tuple[str, Optional[FilePattern]]]
+) -> Tuple[List[FileInfo], int]:
+    """
+    저장된 새 이름을 현재 파일 목록에 적용 (없어진 파일의 편집은 무시, 새 파일은 그대로)
+
+    Returns:
+        (파일 정보 리스트, 적용한 파일 수)
+    """
+    if not edits:
+        return file_infos, 0
+
+    updated = file_infos.copy()
+    applied = 0
+    for row, info in enumerate(file_infos):
+        edit = edits.get(info.original_name)
+        if edit is not None:
+            new_name, pattern = edit
+            updated[row] = FileInfo(info.original_path, info.original_name, new_name, pattern or info.pattern)
+            applied += 1
+    return updated, applied
+
+
+def _pattern_to_list(pattern: Optional[FilePattern]) -> Optional[list]:
+    return None if pattern is None else [getattr(pattern, name) for name in _PATTERN_FIELDS]
+
+
+def _pattern_from_list(values: Optional[list]) -> Optional[FilePattern]:
+    return None if not values else FilePattern(*values)
+
+
+def session_to_dict(session: WorkspaceSession) -> dict:
+    return {
+        "version": SESSION_VERSION,
+        "folder": session.folder,
+        "paths": session.paths,
+        "fingerprint": list(session.fingerprint) if session.fingerprint else None,
+        "selected_pattern": _pattern_to_list(session.selected_pattern),
+        "pattern_text": session.pattern_text,
+        "recipe_steps": [{"action": step.action, "params": step.params} for step in session.recipe_steps],
+        # [원본, 새 이름, 패턴 필드 목록] 배열로 저장 (키 이름 반복 없음)
+        "edits": [[name, new_name, _pattern_to_list(pattern)] for name, (new_name, pattern) in session.edits.items()],
+        "selected_names": session.selected_names,
+        "current_name": session.current_name,
+        "filter_text": session.filter_text,
+        "changed_only": session.changed_only,
+        "sort": [session.sort_column, session.sort_descending],
+    }
+
+
+def session_from_dict(data: dict) -> WorkspaceSession:
+    fingerprint = data.get("fingerprint")
+    sort_column, sort_descending = data.get("sort", [-1, False])
+    return WorkspaceSession(
+        folder=data.get("folder", ""),
+        paths=list(data.get("paths", [])),
+        fingerprint=tuple(fingerprint) if fingerprint else None,
+        selected_pattern=_pattern_from_list(data.get("selected_pattern")),
+        pattern_text=data.get("pattern_text", ""),
+        recipe_steps=[RecipeStep(item["action"], dict(item.get("params", {})))
+                      for item in data.get("recipe_steps", [])],
+        edits={name: (new_name, _pattern_from_list(pattern)) for name, new_name, pattern in data.get("edits", [])},
+        selected_names=list(data.get("selected_names", [])),
+        current_name=data.get("current_name", ""),
+        filter_text=data.get("filter_text", ""),
+        changed_only=bool(data.get("changed_only", False)),
+        sort_column=int(sort_column),
+        sort_descending=bool(sort_descending),
+    )
+
+
+def _session_file_path() -> str:
+    return os.path.join(get_data_dir(), SESSION_FILE_NAME)
+
+
+def save_session(session: WorkspaceSession):
+    """세션 저장 (임시 파일에 쓴 뒤 교체 - 저장 중 종료되어도 이전 세션 유지)"""
+    path = _session_file_path()
+    if session.is_empty:
+        clear_session()
+        return
+
+    if session.folder:
+        session.fingerprint = file_signature(os.path.abspath(session.folder))
+
+    temp_path = path + ".tmp"
+    try:
+        data = json.dumps(session_to_dict(session), ensure_ascii=False, separators=(",", ":"))
+        with gzip.open(temp_path, "wt", encoding="utf-8", compresslevel=6) as f:
+            f.write(data)
+        os.replace(temp_path, path)
+    except OSError as e:
+        print(f"세션 저장 실패: {e}")
+
+
+def load_session() -> Optional[WorkspaceSession]:
+    """저장된 세션 (없거나 읽을 수 없으면 None)"""
+    path = _session_file_path()
+    if not os.path.exists(path):
+        return None
+
+    try:
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("version") != SESSION_VERSION:
+            return None
+        return session_from_dict(data)
+    except (OSError, EOFError, ValueError, KeyError, TypeError) as e:
+        print(f"세션 읽기 실패: {e}")
+        return None
+
+
+def clear_session():
+    """저장된 세션 삭제"""
+    path = _session_file_path()
+    try:
+        if os.path.exists(path):
+            os.remove(path)
+    except OSError as e:
+        print(f"세션 삭제 실패: {e}")
@@ -0,0 +1,56 @@
+"""압축 형식별 리더 / 이미지 폴더 테스트"""
+import zipfile
+
+import pytest
+
+from archive_reader import (
+    ArchiveError, FolderImageReader, ZipArchiveReader, get_reader, is_image_folder, is_supported_archive
+)
+from file_system import get_files_in_folder
+
+
+@pytest.fixture
+def library(tmp_path):
+    """이미지 폴더 하나, 이미지가 없는 폴더 하나, ZIP 하나가 있는 폴더"""
+    volume = tmp_path / "Title 02권"
+    volume.mkdir()
+    (volume / "010.jpg").write_bytes(b"page10")
+    (volume / "002.jpg").write_bytes(b"page2")
+    (volume / ".hidden.jpg").write_bytes(b"hidden")
+    (tmp_path / "extras").mkdir()
+    (tmp_path / "extras" / "note.txt").write_text("memo")
+    with zipfile.ZipFile(tmp_path / "Title 01권.zip", "w") as archive:
+        archive.writestr("001.jpg", b"page1")
+    return tmp_path
+
+
+def test_folder_listing_includes_image_folders_only(library):
+    names = [path.rsplit("/", 1)[-1] for path in get_files_in_folder(str(library))]
+    assert names == ["Title 01권.zip", "Title 02권"]
+
+
+def test_image_folder_detection(library):
+    assert is_image_folder(str(library / "Title 02권"))
+    assert not is_image_folder(str(library / "extras"))
+    assert not is_image_folder(str(library / "missing"))
+    assert is_supported_archive(str(library / "Title 02권"))
+
+
+def test_folder_reader_reads_first_image(library):
+    reader = get_reader(str(library / "Title 02권"))
+    assert isinstance(reader, FolderImageReader)
+    with reader:
+        assert reader.first_image_member() == "002.jpg"
+        assert reader.read_member("002.jpg") == b"page2"
+        assert reader.read_member_head("010.jpg", 4) == b"page"
+        with pytest.raises(ArchiveError):
+            reader.read_member("missing.jpg")
+
+
+def test_zip_missing_member_raises_archive_error(library):
+    with ZipArchiveReader(str(library / "Title 01권.zip")) as reader:
+        assert reader.read_member("001.jpg") == b"page1"
+        with pytest.raises(ArchiveError):
+            reader.read_member("missing.jpg")
+        with pytest.raises(ArchiveError):
+            reader.read_member_head("missing.jpg", 4)
@@ -0,0 +1,39 @@
+"""사용자 정의 패턴 적용 테스트"""
+from bulk_transforms import bulk_apply_template
+from file_renamer import apply_custom_pattern
+from models import ComicMetadata, FileInfo, FileInfoStore
+from pattern_analyzer import extract_pattern
+
+
+NAMES = ["Title 01.zip", "Title 02.zip", "readme.txt", "cover.jpg"]
+
+
+def make_infos():
+    return [FileInfo(f"/lib/{name}", name, name, extract_pattern(name)) for name in NAMES]
+
+
+def test_fixed_template_skips_unnumbered_files():
+    result = apply_custom_pattern(make_infos(), "fixed.zip")
+    assert [info.new_name for info in result] == ["fixed.zip", "fixed.zip", "readme.txt", "cover.jpg"]
+
+
+def test_fixed_template_with_unnumbered_opt_in():
+    result = apply_custom_pattern(make_infos(), "fixed.zip", include_unnumbered=True)
+    assert [info.new_name for info in result] == ["fixed.zip"] * 4
+
+
+def test_metadata_template_skips_unnumbered_files():
+    metadata = {"/lib/readme.txt": ComicMetadata(series="Series", volume="3")}
+    result = apply_custom_pattern(make_infos(), "{series} {volume:02d}.zip", metadata)
+    assert result[2].new_name == "readme.txt"
+    result = apply_custom_pattern(make_infos(), "{series} {volume:02d}.zip", metadata, include_unnumbered=True)
+    assert result[2].new_name == "Series 03.zip"
+
+
+def test_bulk_template_matches_row_path():
+    store = FileInfoStore.from_file_infos(make_infos())
+    for template in ("fixed.zip", "New {number:03d}.zip"):
+        for include_unnumbered in (False, True):
+            expected = apply_custom_pattern(make_infos(), template, include_unnumbered=include_unnumbered)
+            result = bulk_apply_template(store, template, include_unnumbered)
+            assert [info.new_name for info in result] == [info.new_name for info in expected]
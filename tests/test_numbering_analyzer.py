@@ -0,0 +1,53 @@
+"""권수 번호 파싱/분석 테스트"""
+import time
+
+from comic_metadata import find_volume_mismatches
+from models import ComicMetadata, FileInfo
+from numbering_analyzer import MAX_RANGE_SPAN, NumberingIndex, parse_volume_numbers
+from pattern_analyzer import extract_pattern
+
+
+def test_parse_single_and_range():
+    assert parse_volume_numbers("06") == [6]
+    assert parse_volume_numbers("1-3") == [1, 2, 3]
+    assert parse_volume_numbers("1 ~ 2") == [1, 2]
+    assert parse_volume_numbers("3-1") == []
+    assert parse_volume_numbers("1.5") == []
+
+
+def test_parse_huge_range_is_ignored():
+    assert parse_volume_numbers("1-9999999999") == []
+    assert parse_volume_numbers(f"1-{MAX_RANGE_SPAN + 1}") == list(range(1, MAX_RANGE_SPAN + 2))
+    assert parse_volume_numbers(f"1-{MAX_RANGE_SPAN + 2}") == []
+
+
+def test_parse_non_decimal_digits():
+    assert parse_volume_numbers("²") == []
+    assert parse_volume_numbers("1-²") == []
+    assert parse_volume_numbers("①") == []
+
+
+def test_parse_full_width_digits():
+    assert parse_volume_numbers("１２") == [12]
+    assert parse_volume_numbers("１-３") == [1, 2, 3]
+    assert parse_volume_numbers("٣") == [3]
+    pattern = extract_pattern("ONE PIECE １２권.zip")
+    assert parse_volume_numbers(pattern.number) == [12]
+
+
+def test_index_update_with_huge_range_file_name():
+    name = "Title 1-9999999999.zip"
+    info = FileInfo(f"/library/{name}", name, name, extract_pattern(name))
+    index = NumberingIndex()
+    start = time.perf_counter()
+    index.update([info])
+    assert time.perf_counter() - start < 1.0
+
+
+def test_volume_mismatch_with_bad_metadata_volume():
+    name = "Title 03.zip"
+    info = FileInfo(f"/library/{name}", name, name, extract_pattern(name))
+    for volume in ("²", "1-9999999999"):
+        metadata = {info.original_path: ComicMetadata(volume=volume)}
+        # 파싱할 수 없는 값은 비교하지 않음 (예외 없이 끝나야 함)
+        assert find_volume_mismatches([info], metadata) == {}
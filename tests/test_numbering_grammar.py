@@ -0,0 +1,84 @@
+"""번호 문법 테스트 (문법 도입 전 결과와 같아야 하는 파일명 포함)"""
+import pytest
+
+from numbering_analyzer import parse_volume_numbers
+from numbering_grammar import NumberingGrammar
+from pattern_analyzer import extract_pattern
+
+
+@pytest.mark.parametrize("name, title, number, suffix", [
+    # 한글 수사는 표시와 단위가 함께 있을 때만 번호
+    ("제일 좋아 05.zip", "제일 좋아", "05", ""),
+    ("제이슨 03.zip", "제이슨", "03", ""),
+    ("제삼권 해설.zip", "제", "3", "권 해설"),
+    # 한 글자 무시 표시(s, x, h)는 숫자에 붙은 경우만
+    ("Spy X 3.zip", "Spy X", "3", ""),
+    ("s 5권.zip", "s", "5", "권"),
+    ("Video x264 07.zip", "Video x264", "07", ""),
+    ("Title S02 05.zip", "Title S02", "05", ""),
+    # 여러 글자 무시 표시는 띄어 써도 무시
+    ("시즌 2 05화.zip", "시즌 2", "05", "화"),
+    ("Season 2 05.zip", "Season 2", "05", ""),
+    # v는 마지막 번호 앞에 있을 때만 표시
+    ("Title v2 03.zip", "Title v2", "03", ""),
+    ("Title v3.zip", "Title v", "3", ""),
+    ("Title Vol.3.zip", "Title Vol.", "3", ""),
+    ("제3권.zip", "제", "3", "권"),
+])
+def test_extract_pattern_baseline(name, title, number, suffix):
+    pattern = extract_pattern(name)
+    assert (pattern.title, pattern.number, pattern.suffix) == (title, number, suffix)
+
+
+@pytest.mark.parametrize("name, title, number, suffix", [
+    # 띄어 쓴 대시는 구분자 (시즌 - 화)
+    ("Kaguya-sama 2 - 05.zip", "Kaguya-sama 2 -", "05", ""),
+    # 날짜(내림차순)는 범위가 아님
+    ("월간 잡지 2024-01.zip", "월간 잡지 2024-", "01", ""),
+    ("file-2024-01.zip", "file-2024-", "01", ""),
+    # 합본 범위는 붙여 쓰거나 단위가 있을 때만
+    ("진격의 거인 1-2권.zip", "진격의 거인", "1-2", "권"),
+    ("Title 1-3.zip", "Title", "1-3", ""),
+    ("Title 1 ~ 3화.zip", "Title", "1 ~ 3", "화"),
+])
+def test_range_requires_unit_or_no_spaces(name, title, number, suffix):
+    pattern = extract_pattern(name)
+    assert (pattern.title, pattern.number, pattern.suffix) == (title, number, suffix)
+
+
+def test_spaced_dash_is_not_expanded_to_range():
+    assert parse_volume_numbers(extract_pattern("Kaguya-sama 2 - 05.zip").number) == [5]
+    assert parse_volume_numbers(extract_pattern("월간 잡지 2024-01.zip").number) == [1]
+
+
+def test_korean_numeral_requires_unit():
+    grammar = NumberingGrammar()
+    assert grammar.find_number("제일 좋아") is None
+    assert grammar.find_number("제이슨") is None
+    assert grammar.find_number("제이십삼화").number == "23"
+
+
+def test_empty_ignore_lists():
+    grammar = NumberingGrammar(ignore_markers=[], ignore_units=[])
+    assert grammar.find_number("Title 12").number == "12"
+
+
+@pytest.mark.parametrize("name", [
+    "Vol 5 extra 2.zip",
+    "Title 05 [tag].zip",
+    "Title 05[tag].zip",
+    "사카모토 06 권.zip",
+    "[공금] 사카모토 데이즈 05권 [절공].cbr",
+])
+def test_round_trip_keeps_separator_after_number(name):
+    assert extract_pattern(name).to_filename() == name
+
+
+def test_padding_keeps_separator_after_number():
+    pattern = extract_pattern("Vol 5 extra 2.zip")
+    pattern.padding_width = 3
+    assert pattern.to_filename() == "Vol 005 extra 2.zip"
+
+    pattern = extract_pattern("Some Show S02E05 1920x1080.mkv")
+    assert (pattern.number, pattern.suffix) == ("05", " 1920x1080")
+    assert pattern.to_filename().endswith(" 05 1920x1080.mkv")
@@ -0,0 +1,302 @@
+"""
+라이브러리 전체 표지 썸네일 미리 생성
+- 라이브러리 폴더 아래 모든 압축 파일의 표지를 프로세스 풀에서 디코딩 (CPU 코어 수만큼 병렬)
+- 디코딩한 픽셀은 공유 메모리로 전달 (큰 이미지를 pickle로 복사하지 않음)
+  메인 프로세스가 작업 수만큼 공유 메모리 칸을 만들어 두고 작업마다 빈 칸 이름을 넘겨 재사용
+- 썸네일 캐시 저장은 메인 프로세스 한 곳에서만 수행, 초당 처리 수 제한 가능
+- 제출 전에 전체 작업 I/O 우선순위로 차례를 기다림 (선택한 표지 등 급한 읽기가 있으면 제출을 멈춤)
+- 이미 썸네일이 있는 파일은 건너뛰므로 중단 후 다시 실행하면 이어서 생성
+"""
+import os
+import signal
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from dataclasses import dataclass
+from multiprocessing.shared_memory import SharedMemory
+from typing import Callable, Iterator, List, Optional, Tuple
+
+from PIL import Image
+
+from archive_cache import ThumbnailCache, get_index_cache, get_thumbnail_cache
+from archive_reader import get_reader, get_supported_extensions
+from file_system import file_signature
+from image_loader import decode_cover
+from io_scheduler import PRIORITY_BULK, get_io_scheduler
+
+
+# 미리 생성할 썸네일 크기 (main_window 표지 미리보기, cover_gallery_widget.THUMBNAIL_SIZE)
+PREWARM_SIZES = ((500, 700), (140, 196))
+# 기본 작업 프로세스 수
+DEFAULT_WORKERS = max(1, (os.cpu_count() or 2) - 1)
+# 이 개수만큼 결과가 모이면 표지 항목 이름을 인덱스 캐시에 저장
+SAVE_BATCH_SIZE = 64
+# 공유 메모리 칸 하나의 크기 (decode_cover 결과는 RGB 또는 L → 픽셀당 최대 3바이트)
+SLOT_SIZE = sum(width * height * 3 for width, height in PREWARM_SIZES)
+
+# 작업 결과: (표지 항목 이름, [(모드, 크기, 위치, 길이)], 오류 메시지) - 실패하면 표지 항목 이름이 None
+RenderResult = Tuple[Optional[str], List[Tuple[str, Tuple[int, int], int, int]], str]
+
+
+@dataclass
+class PrewarmStats:
+    """미리 생성 결과"""
+    total: int = 0          # 찾은 압축 파일 수
+    skipped: int = 0        # 이미 썸네일이 있어 건너뜀
+    created: int = 0        # 새로 생성
+    failed: int = 0         # 표지를 읽지 못함
+
+    def summary(self) -> str:
+        return (f"압축 파일 {self.total}개: 생성 {self.created}개, "
+                f"이미 있음 {self.skipped}개, 실패 {self.failed}개")
+
+
+def iter_library_archives(root: str) -> Iterator[str]:
+    """라이브러리 폴더 아래 모든 압축 파일 경로 (하위 폴더 포함, 이미지 폴더는 제외)"""
+    extensions = get_supported_extensions()
+    for folder, dir_names, file_names in os.walk(root):
+        dir_names.sort()
+        for name in sorted(file_names):
+            if name.lower().endswith(extensions):
+                yield os.path.join(folder, name)
+
+
+def _init_worker():
+    """
+    작업 프로세스 초기화
+    - Ctrl+C는 메인 프로세스만 처리 (진행 중인 파일은 끝까지 처리하고 저장)
+    - 우선순위를 낮춤 (밤새 실행해도 다른 작업을 방해하지 않도록)
+    """
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    try:
+        if sys.platform == "win32":
+            import ctypes
+            below_normal_priority_class = 0x4000
+            kernel32 = ctypes.windll.kernel32
+            kernel32.SetPriorityClass(kernel32.GetCurrentProcess(), below_normal_priority_class)
+        else:
+            os.nice(10)
+    except (OSError, AttributeError):
+        pass
+
+
+def _ordered_sizes() -> List[Tuple[int, int]]:
+    """큰 크기부터 (가장 큰 크기로 한 번만 디코딩하고 작은 크기는 그 결과를 축소)"""
+    return sorted(PREWARM_SIZES, key=lambda size: size[0] * size[1], reverse=True)
+
+
+def render_cover(path: str, slot_name: str) -> RenderResult:
+    """
+    표지 하나를 PREWARM_SIZES 크기들로 디코딩하여 공유 메모리 칸에 기록 (프로세스 풀에서 실행)
+    공유 메모리 칸은 메인 프로세스 소유 - 여기서는 열어서 쓰기만 함
+    """
+    reader = get_reader(path)
+    if reader is None:
+        return None, [], "지원하지 않는 형식이거나 압축 프로그램이 없습니다."
+
+    try:
+        with reader:
+            member = reader.first_image_member()
+            if member is None:
+                return None, [], "이미지를 찾을 수 없습니다."
+            img_data = reader.read_member(member)
+
+        ordered_sizes = _ordered_sizes()
+        largest = decode_cover(img_data, ordered_sizes[0])
+        images = [largest]
+        for size in ordered_sizes[1:]:
+            smaller = largest.copy()
+            smaller.thumbnail(size, Image.Resampling.LANCZOS)
+            images.append(smaller)
+
+        shared = SharedMemory(name=slot_name)
+        try:
+            layouts = []
+            offset = 0
+            for img in images:
+                raw = img.tobytes()
+                if offset + len(raw) > shared.size:
+                    return None, [], f"지원하지 않는 이미지 모드: {img.mode}"
+                shared.buf[offset:offset + len(raw)] = raw
+                layouts.append((img.mode, img.size, offset, len(raw)))
+                offset += len(raw)
+        finally:
+            shared.close()
+        return member, layouts, ""
+    except Exception as e:
+        return None, [], f"{type(e).__name__}: {e}"
+
+
+def _missing_sizes(thumbnail_cache: ThumbnailCache, path: str, signature: Tuple[int, int]) -> bool:
+    return any(
+        not thumbnail_cache.contains(ThumbnailCache.make_key(path, signature, size))
+        for size in PREWARM_SIZES
+    )
+
+
+def _store_result(
+    thumbnail_cache: ThumbnailCache,
+    path: str,
+    signature: Tuple[int, int],
+    slot: SharedMemory,
+    layouts: List[Tuple[str, Tuple[int, int], int, int]]
+):
+    """공유 메모리 칸의 픽셀을 읽어 썸네일 캐시에 저장"""
+    # 작업 프로세스는 큰 크기부터 기록하므로 크기 순서로 대응
+    for size, (mode, image_size, offset, length) in zip(_ordered_sizes(), layouts):
+        with slot.buf[offset:offset + length] as view:
+            img = Image.frombytes(mode, image_size, view)
+        key = ThumbnailCache.make_key(path, signature, size)
+        thumbnail_cache.put(key, img, remember=False)
+
+
+def prewarm_thumbnails(
+    root: str,
+    workers: int = DEFAULT_WORKERS,
+    max_rate: float = 0,
+    progress: Optional[Callable[[int, int], None]] = None,
+    is_cancelled: Optional[Callable[[], bool]] = None
+) -> PrewarmStats:
+    """
+    라이브러리 폴더 아래 모든 압축 파일의 표지 썸네일 생성
+
+    Args:
+        root: 라이브러리 폴더
+        workers: 디코딩 프로세스 수
+        max_rate: 초당 최대 처리 파일 수 (0이면 제한 없음)
+        progress: progress(완료 수, 생성할 전체 수)
+        is_cancelled: 취소 여부 (취소되면 진행 중인 파일까지만 처리)
+
+    Returns:
+        처리 결과 통계
+    """
+    thumbnail_cache = get_thumbnail_cache()
+    index_cache = get_index_cache()
+    stats = PrewarmStats()
+
+    # 1. 생성할 파일 목록 (썸네일이 모두 있는 파일은 건너뜀 → 이어서 생성)
+    todo: List[Tuple[str, Tuple[int, int]]] = []
+    for path in iter_library_archives(root):
+        if is_cancelled and is_cancelled():
+            return stats
+        stats.total += 1
+        signature = file_signature(path)
+        if signature is None:
+            stats.failed += 1
+        elif _missing_sizes(thumbnail_cache, path, signature):
+            todo.append((path, signature))
+        else:
+            stats.skipped += 1
+
+    total = len(todo)
+    if progress:
+        progress(0, total)
+    if not todo:
+        return stats
+
+    workers = max(1, workers)
+    pending = iter(todo)
+    running = {}
+    cover_members: List[Tuple[str, Tuple[int, int], str]] = []
+    done_count = 0
+    started = time.monotonic()
+    submitted = 0
+
+    # 작업 프로세스를 만들기 전에 공유 메모리 칸 생성 (작업 프로세스가 같은 자원 추적기를 사용하도록)
+    # 작업 프로세스가 쉬지 않도록 프로세스 수의 2배만큼 동시에 제출
+    free_slots = [SharedMemory(create=True, size=SLOT_SIZE) for _ in range(workers * 2)]
+    all_slots = list(free_slots)
+
+    try:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as executor:
+
+            def submit_next():
+                nonlocal submitted
+                item = next(pending, None)
+                if item is None:
+                    return
+                if max_rate > 0:
+                    # 초당 처리 수 제한: 다음 제출 시각까지 대기
+                    delay = started + submitted / max_rate - time.monotonic()
+                    if delay > 0:
+                        time.sleep(delay)
+                # 대부분 CPU 디코딩이므로 칸을 잡고 있지 않고 차례만 기다림
+                get_io_scheduler().acquire(item[0], PRIORITY_BULK).release()
+                slot = free_slots.pop()
+                running[executor.submit(render_cover, item[0], slot.name)] = (item, slot)
+                submitted += 1
+
+            for _ in range(len(free_slots)):
+                submit_next()
+
+            while running:
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    (path, signature), slot = running.pop(future)
+                    done_count += 1
+                    try:
+                        member, layouts, message = future.result()
+                    except Exception as e:
+                        # 작업 프로세스가 비정상 종료된 경우 등
+                        member, layouts, message = None, [], str(e)
+
+                    if member is None:
+                        print(f"썸네일 생성 실패 {path}: {message}")
+                        stats.failed += 1
+                    else:
+                        _store_result(thumbnail_cache, path, signature, slot, layouts)
+                        cover_members.append((path, signature, member))
+                        stats.created += 1
+                    free_slots.append(slot)
+
+                    if len(cover_members) >= SAVE_BATCH_SIZE:
+                        index_cache.set_cover_members(cover_members)
+                        cover_members.clear()
+
+                    if not (is_cancelled and is_cancelled()):
+                        submit_next()
+
+                if progress:
+                    progress(done_count, total)
+    finally:
+        index_cache.set_cover_members(cover_members)
+        for slot in all_slots:
+            slot.close()
+            slot.unlink()
+
+    return stats
+
+
+def run_prewarm(root: str, workers: int = DEFAULT_WORKERS, max_rate: float = 0) -> int:
+    """
+    GUI 없이 미리 생성 실행 (Ctrl+C로 중지, 다시 실행하면 이어서 생성)
+
+    Returns:
+        종료 코드
+    """
+    if not os.path.isdir(root):
+        print(f"폴더를 찾을 수 없습니다: {root}")
+        return 1
+
+    cancelled = False
+
+    def on_interrupt(*_):
+        nonlocal cancelled
+        if not cancelled:
+            print("중지 중... (진행 중인 파일까지 저장)", flush=True)
+        cancelled = True
+
+    signal.signal(signal.SIGINT, on_interrupt)
+
+    last_report = 0.0
+
+    def report(done: int, total: int):
+        nonlocal last_report
+        now = time.monotonic()
+        if done == total or now - last_report >= 5:
+            last_report = now
+            print(f"[{time.strftime('%H:%M:%S')}] 썸네일 생성 {done}/{total}", flush=True)
+
+    stats = prewarm_thumbnails(root, workers, max_rate, report, lambda: cancelled)
+    print(stats.summary() + (" (중지됨)" if cancelled else ""))
+    return 130 if cancelled else 0
@@ -0,0 +1,165 @@
+"""
+제목 정규화 및 유사 패턴 그룹 병합
+"사카모토 데이즈" / "사카모토데이즈" / "사카모토 데이즈 " 처럼 거의 같은 제목을 하나로 묶음
+"""
+import re
+import unicodedata
+from collections import defaultdict
+from typing import Dict, List, Tuple
+
+
+# 유사 제목으로 병합하는 최소 유사도 (0~1)
+DEFAULT_SIMILARITY_THRESHOLD = 0.85
+# 이보다 많은 제목에 나오는 n-gram은 후보 탐색에서 제외 (흔한 글자 조합)
+MAX_POSTING_LENGTH = 200
+NGRAM_SIZE = 2
+
+_BRACKET_TAG_RE = re.compile(r'\[[^\]]*\]|\([^)]*\)|\{[^}]*\}|【[^】]*】|〔[^〕]*〕')
+_SEPARATOR_RE = re.compile(r'[\s_\-.·:~]+')
+
+
+def normalize_title(text: str) -> str:
+    """
+    비교용 제목 정규화
+    - 유니코드 NFKC (전각 숫자/문자 → 반각, 호환 문자 통일)
+    - 대괄호/괄호 태그 제거 ([공금], (완결) 등)
+    - 공백/구분 기호 제거, 대소문자 무시
+    """
+    normalized = unicodedata.normalize('NFKC', text)
+    normalized = _BRACKET_TAG_RE.sub('', normalized)
+    normalized = _SEPARATOR_RE.sub('', normalized)
+    return normalized.casefold()
+
+
+def ngrams(text: str, n: int = NGRAM_SIZE) -> set:
+    """문자 n-gram 집합 (짧은 문자열은 자체를 하나의 n-gram으로)"""
+    if len(text) <= n:
+        return {text}
+    return {text[i:i + n] for i in range(len(text) - n + 1)}
+
+
+def edit_distance(a: str, b: str, max_distance: int) -> int:
+    """
+    레벤슈타인 거리 (max_distance를 넘으면 max_distance + 1 반환)
+    """
+    if abs(len(a) - len(b)) > max_distance:
+        return max_distance + 1
+    if len(a) < len(b):
+        a, b = b, a
+
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, start=1):
+        current = [i]
+        row_min = i
+        for j, char_b in enumerate(b, start=1):
+            cost = 0 if char_a == char_b else 1
+            value = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            current.append(value)
+            if value < row_min:
+                row_min = value
+        if row_min > max_distance:
+            return max_distance + 1
+        previous = current
+    return previous[-1]
+
+
+def similarity(a: str, b: str, threshold: float = 0.0) -> float:
+    """편집 거리 기반 유사도 (1.0 = 동일). threshold 미만이면 0.0"""
+    if a == b:
+        return 1.0
+    longest = max(len(a), len(b))
+    if longest == 0:
+        return 1.0
+    max_distance = int(longest * (1.0 - threshold))
+    distance = edit_distance(a, b, max_distance)
+    if distance > max_distance:
+        return 0.0
+    return 1.0 - distance / longest
+
+
+class _UnionFind:
+    def __init__(self, size: int):
+        self.parent = list(range(size))
+
+    def find(self, x: int) -> int:
+        while self.parent[x] != x:
+            self.parent[x] = self.parent[self.parent[x]]
+            x = self.parent[x]
+        return x
+
+    def union(self, a: int, b: int) -> bool:
+        root_a, root_b = self.find(a), self.find(b)
+        if root_a == root_b:
+            return False
+        # 작은 번호(먼저 나온 그룹)를 대표로 유지
+        if root_b < root_a:
+            root_a, root_b = root_b, root_a
+        self.parent[root_b] = root_a
+        return True
+
+
+def cluster_keys(
+    keys: List[Tuple[str, str]],
+    threshold: float = DEFAULT_SIMILARITY_THRESHOLD
+) -> List[Tuple[List[int], float]]:
+    """
+    (구분값, 정규화 제목) 목록을 유사한 것끼리 묶음
+    구분값(확장자 등)이 다르면 병합하지 않음
+
+    Returns:
+        [(원래 인덱스 목록, 신뢰도)] - 첫 인덱스 순서대로 정렬
+    """
+    union_find = _UnionFind(len(keys))
+    # 클러스터 대표 → 병합에 사용된 가장 낮은 유사도
+    weakest_link: Dict[int, float] = {}
+
+    def merge(a: int, b: int, score: float):
+        root_a, root_b = union_find.find(a), union_find.find(b)
+        if root_a == root_b:
+            return
+        confidence = min(score, weakest_link.pop(root_a, 1.0), weakest_link.pop(root_b, 1.0))
+        union_find.union(a, b)
+        weakest_link[union_find.find(a)] = confidence
+
+    # 1. 정규화 결과가 완전히 같으면 바로 병합
+    exact: Dict[Tuple[str, str], int] = {}
+    for i, key in enumerate(keys):
+        if key in exact:
+            merge(exact[key], i, 1.0)
+        else:
+            exact[key] = i
+
+    # 2. n-gram 역색인으로 후보만 골라 편집 거리 비교 (전체 쌍 비교 없음)
+    unique_indices = list(exact.values())
+    postings: Dict[Tuple[str, str], List[int]] = defaultdict(list)
+    for i in unique_indices:
+        partition, title = keys[i]
+        for gram in ngrams(title):
+            postings[(partition, gram)].append(i)
+
+    for i in unique_indices:
+        partition, title = keys[i]
+        grams = ngrams(title)
+        shared_counts: Dict[int, int] = defaultdict(int)
+        for gram in grams:
+            posting = postings[(partition, gram)]
+            if len(posting) > MAX_POSTING_LENGTH:
+                continue
+            for j in posting:
+                if j > i:
+                    shared_counts[j] += 1
+
+        for j, shared in shared_counts.items():
+            other_title = keys[j][1]
+            # n-gram 공유 비율이 낮으면 편집 거리 계산 생략
+            if shared < (min(len(grams), len(ngrams(other_title))) * threshold) - 1:
+                continue
+            score = similarity(title, other_title, threshold)
+            if score >= threshold:
+                merge(i, j, score)
+
+    clusters: Dict[int, List[int]] = defaultdict(list)
+    for i in range(len(keys)):
+        clusters[union_find.find(i)].append(i)
+
+    return [(members, weakest_link.get(root, 1.0)) for root, members in sorted(clusters.items())]